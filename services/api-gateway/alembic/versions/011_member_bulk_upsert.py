@@ -0,0 +1,32 @@
+"""
+Member Bulk Upsert Key
+
+Revision ID: 011_member_bulk_upsert
+Revises: 010_debate_transcript_system
+Create Date: 2026-10-18 10:00:00
+
+Adds the natural-key index that bulk member imports match existing members
+on. It is not unique: two members of a jurisdiction may share a name, and
+existing databases may already hold such rows.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '011_member_bulk_upsert'
+down_revision = '010_debate_transcript_system'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create natural-key index on members."""
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_members_jurisdiction_name
+        ON openpolicy.members (jurisdiction_id, lower(first_name), lower(last_name))
+    """)
+
+
+def downgrade():
+    """Drop natural-key index."""
+    op.execute("DROP INDEX IF EXISTS openpolicy.ix_members_jurisdiction_name")
@@ -0,0 +1,63 @@
+"""
+Hansard Statements and Vote Ballots
+
+Revision ID: 011b_statements_and_vote_ballots
+Revises: 011_member_bulk_upsert
+Create Date: 2026-10-18 11:30:00
+
+Adds openpolicy.statements (one row per Hansard speech) and
+openpolicy.vote_ballots (one row per member per division), matching the
+Statement and VoteBallot models. The chart aggregates (012), debate_days
+(013) and statement mentions (014) are built from these tables. Both are
+created only if missing, since databases seeded by
+scripts/synthetic_dataset.py before this revision already have them.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '011b_statements_and_vote_ballots'
+down_revision = '011_member_bulk_upsert'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the statements and vote_ballots tables."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS openpolicy.vote_ballots (
+            id BIGSERIAL PRIMARY KEY,
+            vote_id UUID NOT NULL REFERENCES openpolicy.votes (id),
+            member_id UUID NOT NULL REFERENCES openpolicy.members (id),
+            ballot VARCHAR(10) NOT NULL
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_openpolicy_vote_ballots_vote_id ON openpolicy.vote_ballots (vote_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_openpolicy_vote_ballots_member_id ON openpolicy.vote_ballots (member_id)")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS openpolicy.statements (
+            id BIGSERIAL PRIMARY KEY,
+            member_id UUID REFERENCES openpolicy.members (id),
+            bill_debated_id UUID REFERENCES openpolicy.bills (id),
+            time TIMESTAMPTZ NOT NULL,
+            sequence INTEGER NOT NULL,
+            h1_en VARCHAR(300),
+            h2_en VARCHAR(300),
+            h1_fr VARCHAR(400),
+            h2_fr VARCHAR(400),
+            content_en TEXT NOT NULL,
+            content_fr TEXT,
+            wordcount INTEGER NOT NULL DEFAULT 0,
+            procedural BOOLEAN NOT NULL DEFAULT false,
+            created_at TIMESTAMPTZ DEFAULT now()
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_openpolicy_statements_time ON openpolicy.statements (time)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_openpolicy_statements_member_id ON openpolicy.statements (member_id)")
+
+
+def downgrade():
+    """Drop the statements and vote_ballots tables."""
+    op.execute("DROP TABLE IF EXISTS openpolicy.statements")
+    op.execute("DROP TABLE IF EXISTS openpolicy.vote_ballots")
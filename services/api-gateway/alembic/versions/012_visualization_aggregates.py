@@ -0,0 +1,115 @@
+"""
+Visualization Aggregates
+
+Revision ID: 012_visualization_aggregates
+Revises: 011b_statements_and_vote_ballots
+Create Date: 2026-10-18 12:00:00
+
+Adds one materialized view per chart family (bill progress, vote breakdown
+by party, party activity) and a version table that is bumped every time a
+view is refreshed. Each view has a unique index so it can be refreshed with
+REFRESH MATERIALIZED VIEW CONCURRENTLY while readers keep using it.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '012_visualization_aggregates'
+down_revision = '011b_statements_and_vote_ballots'
+branch_labels = None
+depends_on = None
+
+VIEWS = (
+    'openpolicy.mv_bill_progress',
+    'openpolicy.mv_vote_breakdown',
+    'openpolicy.mv_party_activity',
+)
+
+
+def upgrade():
+    """Create chart aggregate views and their version table."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS openpolicy.aggregate_view_versions (
+            view_name VARCHAR(100) PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 1,
+            refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+
+    # Bills per legislative status
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS openpolicy.mv_bill_progress AS
+        SELECT b.jurisdiction_id,
+               b.session_id,
+               b.status,
+               count(*) AS bill_count
+        FROM openpolicy.bills b
+        GROUP BY b.jurisdiction_id, b.session_id, b.status
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_bill_progress
+        ON openpolicy.mv_bill_progress (jurisdiction_id, session_id, status)
+    """)
+
+    # Ballots cast per party; members without a party are grouped as independents
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS openpolicy.mv_vote_breakdown AS
+        SELECT b.jurisdiction_id,
+               b.session_id,
+               COALESCE(p.id::text, 'independent') AS party_key,
+               COALESCE(p.short_name, p.name, 'Independent') AS party_name,
+               count(*) FILTER (WHERE vb.ballot = 'Yea') AS yeas,
+               count(*) FILTER (WHERE vb.ballot = 'Nay') AS nays,
+               count(*) FILTER (WHERE vb.ballot = 'Paired') AS paired,
+               count(*) FILTER (WHERE vb.ballot = 'Absent') AS absent
+        FROM openpolicy.vote_ballots vb
+        JOIN openpolicy.votes v ON v.id = vb.vote_id
+        JOIN openpolicy.bills b ON b.id = v.bill_id
+        JOIN openpolicy.members m ON m.id = vb.member_id
+        LEFT JOIN openpolicy.parties p ON p.id = m.party_id
+        GROUP BY b.jurisdiction_id, b.session_id, party_key, party_name
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_vote_breakdown
+        ON openpolicy.mv_vote_breakdown (jurisdiction_id, session_id, party_key)
+    """)
+
+    # Sitting members and speeches per party. Statements are summed per
+    # member first so the member join does not fan out.
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS openpolicy.mv_party_activity AS
+        SELECT m.jurisdiction_id,
+               COALESCE(p.id::text, 'independent') AS party_key,
+               COALESCE(p.short_name, p.name, 'Independent') AS party_name,
+               max(p.color) AS color,
+               count(*) FILTER (WHERE m.end_date IS NULL) AS member_count,
+               COALESCE(sum(s.statement_count), 0)::bigint AS statement_count,
+               COALESCE(sum(s.word_count), 0)::bigint AS word_count
+        FROM openpolicy.members m
+        LEFT JOIN openpolicy.parties p ON p.id = m.party_id
+        LEFT JOIN (
+            SELECT member_id, count(*) AS statement_count, sum(wordcount) AS word_count
+            FROM openpolicy.statements
+            WHERE member_id IS NOT NULL AND NOT procedural
+            GROUP BY member_id
+        ) s ON s.member_id = m.id
+        GROUP BY m.jurisdiction_id, party_key, party_name
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_party_activity
+        ON openpolicy.mv_party_activity (jurisdiction_id, party_key)
+    """)
+
+    values = ", ".join(f"('{view}')" for view in VIEWS)
+    op.execute(f"""
+        INSERT INTO openpolicy.aggregate_view_versions (view_name)
+        VALUES {values}
+        ON CONFLICT (view_name) DO NOTHING
+    """)
+
+
+def downgrade():
+    """Drop chart aggregate views and their version table."""
+    for view in reversed(VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
+    op.execute("DROP TABLE IF EXISTS openpolicy.aggregate_view_versions")
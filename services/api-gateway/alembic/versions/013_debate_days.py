@@ -0,0 +1,51 @@
+"""
+Debate Days Read Model
+
+Revision ID: 013_debate_days
+Revises: 012_visualization_aggregates
+Create Date: 2026-10-18 13:00:00
+
+Adds openpolicy.debate_days, one row per sitting date with statement, vote
+and bill counts, and the openpolicy.refresh_debate_days() function that
+rebuilds a range of it (defined in app.core.debate_days), then backfills
+it. The gateway and the ETL read_models job keep it current through that
+function. The primary key doubles as the keyset pagination index for
+/debates.
+"""
+
+from alembic import op
+
+from app.core.debate_days import REFRESH_DEBATE_DAYS_FUNCTION
+
+# revision identifiers
+revision = '013_debate_days'
+down_revision = '012_visualization_aggregates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create and backfill the debate_days read model."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS openpolicy.debate_days (
+            sitting_date DATE PRIMARY KEY,
+            statement_count INTEGER NOT NULL DEFAULT 0,
+            vote_count INTEGER NOT NULL DEFAULT 0,
+            bill_count INTEGER NOT NULL DEFAULT 0,
+            first_at TIMESTAMPTZ,
+            last_at TIMESTAMPTZ,
+            updated_at TIMESTAMPTZ DEFAULT now()
+        )
+    """)
+    # refresh_debate_days() scans votes by date range
+    op.execute("CREATE INDEX IF NOT EXISTS idx_votes_vote_date ON openpolicy.votes (vote_date)")
+
+    op.execute(REFRESH_DEBATE_DAYS_FUNCTION)
+    op.execute("SELECT openpolicy.refresh_debate_days()")
+
+
+def downgrade():
+    """Drop the debate_days read model."""
+    op.execute("DROP FUNCTION IF EXISTS openpolicy.refresh_debate_days(date, date)")
+    op.execute("DROP INDEX IF EXISTS openpolicy.idx_votes_vote_date")
+    op.execute("DROP TABLE IF EXISTS openpolicy.debate_days")
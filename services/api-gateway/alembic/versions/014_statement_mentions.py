@@ -0,0 +1,48 @@
+"""
+Statement Mention Index
+
+Revision ID: 014_statement_mentions
+Revises: 013_debate_days
+Create Date: 2026-10-18 14:00:00
+
+Adds openpolicy.statement_mentions (statement -> mentioned member), filled
+at ingest time by the ETL read_models job (statement_mentions.py), and a
+trigram index on members.full_name so politician name filters resolve to
+member ids without a scan. Existing statements are indexed by the next
+run of that job.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '014_statement_mentions'
+down_revision = '013_debate_days'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create mention table and name trigram index."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_members_full_name_trgm
+        ON openpolicy.members USING gin (full_name gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS openpolicy.statement_mentions (
+            statement_id BIGINT NOT NULL REFERENCES openpolicy.statements (id) ON DELETE CASCADE,
+            member_id UUID NOT NULL REFERENCES openpolicy.members (id) ON DELETE CASCADE,
+            time TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (statement_id, member_id)
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_statement_mentions_member_time
+        ON openpolicy.statement_mentions (member_id, time)
+    """)
+
+
+def downgrade():
+    """Drop mention table and name trigram index."""
+    op.execute("DROP TABLE IF EXISTS openpolicy.statement_mentions")
+    op.execute("DROP INDEX IF EXISTS openpolicy.idx_members_full_name_trgm")
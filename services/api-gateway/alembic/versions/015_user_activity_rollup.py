@@ -0,0 +1,108 @@
+"""
+User Activity Rollup and Monthly Partitions
+
+Revision ID: 015_user_activity_rollup
+Revises: 014_statement_mentions
+Create Date: 2026-10-18 15:00:00
+
+Adds public.user_activity_rollup (daily counts per user, activity type and
+content type) and rebuilds public.user_activities as a table partitioned by
+month on activity_date, so old activity can be dropped a partition at a
+time. Existing rows are copied into the new partitions and folded into the
+rollup. Partitions for future months are created by the gateway at startup
+(app.core.activity_writer.ensure_activity_partitions); anything outside
+them lands in user_activities_default.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '015_user_activity_rollup'
+down_revision = '014_statement_mentions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the rollup and partition user_activities by month."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS public.user_activity_rollup (
+            user_id UUID NOT NULL REFERENCES public.users (id),
+            day DATE NOT NULL,
+            activity_type VARCHAR(50) NOT NULL,
+            content_type VARCHAR(50) NOT NULL DEFAULT '',
+            count INTEGER NOT NULL DEFAULT 0,
+            last_at TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (user_id, day, activity_type, content_type)
+        )
+    """)
+
+    op.execute("ALTER TABLE public.user_activities RENAME TO user_activities_unpartitioned")
+    op.execute("ALTER INDEX public.user_activities_pkey RENAME TO user_activities_unpartitioned_pkey")
+    op.execute("""
+        CREATE TABLE public.user_activities (
+            LIKE public.user_activities_unpartitioned INCLUDING DEFAULTS
+        ) PARTITION BY RANGE (activity_date)
+    """)
+    op.execute("ALTER TABLE public.user_activities ADD PRIMARY KEY (id, activity_date)")
+    op.execute("CREATE TABLE public.user_activities_default PARTITION OF public.user_activities DEFAULT")
+
+    # One partition per month from the oldest activity to two months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start TIMESTAMP;
+            last_month TIMESTAMP := date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months';
+        BEGIN
+            SELECT date_trunc('month', COALESCE(min(activity_date), now()) AT TIME ZONE 'UTC')
+            INTO month_start FROM public.user_activities_unpartitioned;
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS public.%I PARTITION OF public.user_activities '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'user_activities_' || to_char(month_start, '"y"YYYY"m"MM'),
+                    month_start::text || '+00',
+                    (month_start + interval '1 month')::text || '+00'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+    """)
+
+    op.execute("INSERT INTO public.user_activities SELECT * FROM public.user_activities_unpartitioned")
+    op.execute("""
+        INSERT INTO public.user_activity_rollup (user_id, day, activity_type, content_type, count, last_at)
+        SELECT user_id, CAST(activity_date AT TIME ZONE 'UTC' AS date), activity_type,
+               COALESCE(content_type, ''), count(*), max(activity_date)
+        FROM public.user_activities
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("DROP TABLE public.user_activities_unpartitioned")
+    op.execute("""
+        ALTER TABLE public.user_activities
+        ADD FOREIGN KEY (user_id) REFERENCES public.users (id)
+    """)
+    op.execute("""
+        CREATE INDEX ix_user_activities_user_id
+        ON public.user_activities (user_id, activity_date DESC)
+    """)
+
+
+def downgrade():
+    """Return user_activities to a plain table and drop the rollup."""
+    op.execute("""
+        CREATE TABLE public.user_activities_plain (
+            LIKE public.user_activities INCLUDING DEFAULTS
+        )
+    """)
+    op.execute("INSERT INTO public.user_activities_plain SELECT * FROM public.user_activities")
+    op.execute("DROP TABLE public.user_activities")
+    op.execute("ALTER TABLE public.user_activities_plain RENAME TO user_activities")
+    op.execute("ALTER TABLE public.user_activities ADD PRIMARY KEY (id)")
+    op.execute("""
+        ALTER TABLE public.user_activities
+        ADD FOREIGN KEY (user_id) REFERENCES public.users (id)
+    """)
+    op.execute("CREATE INDEX ix_user_activities_user_id ON public.user_activities (user_id)")
+    op.execute("DROP TABLE IF EXISTS public.user_activity_rollup")
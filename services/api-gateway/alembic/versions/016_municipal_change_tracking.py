@@ -0,0 +1,56 @@
+"""
+Municipal Change Tracking
+
+Revision ID: 016_municipal_change_tracking
+Revises: 015_user_activity_rollup
+Create Date: 2026-10-18 16:00:00
+
+Adds the columns the ETL municipal ingester keeps on
+public.municipal_councillors (content_hash, the SHA-256 of a councillor's
+canonical record, and retired_at, set when a councillor drops off the
+council page) and the public.municipal_change_log table it appends every
+insert, update and retirement to. The ingester used to add these itself at
+run time; the councillors table comes from 003_add_municipal_tables, so its
+schema belongs here.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '016_municipal_change_tracking'
+down_revision = '015_user_activity_rollup'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add municipal_councillors.content_hash/retired_at and the municipal change log."""
+    op.execute("ALTER TABLE public.municipal_councillors ADD COLUMN IF NOT EXISTS content_hash TEXT")
+    op.execute("ALTER TABLE public.municipal_councillors ADD COLUMN IF NOT EXISTS retired_at TIMESTAMP")
+    # The ingester looks councillors up by municipality and name
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_municipal_councillors_municipality_name
+            ON public.municipal_councillors (municipality, name)
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS public.municipal_change_log (
+            id BIGSERIAL PRIMARY KEY,
+            municipality TEXT NOT NULL,
+            member_name TEXT NOT NULL,
+            change_type TEXT NOT NULL,
+            content_hash TEXT,
+            changed_at TIMESTAMP NOT NULL
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_municipal_change_log_changed_at
+            ON public.municipal_change_log (changed_at)
+    """)
+
+
+def downgrade():
+    """Drop the municipal change log and the change tracking columns."""
+    op.execute("DROP TABLE IF EXISTS public.municipal_change_log")
+    op.execute("DROP INDEX IF EXISTS public.idx_municipal_councillors_municipality_name")
+    op.execute("ALTER TABLE public.municipal_councillors DROP COLUMN IF EXISTS retired_at")
+    op.execute("ALTER TABLE public.municipal_councillors DROP COLUMN IF EXISTS content_hash")
@@ -0,0 +1,44 @@
+"""
+Statement Mention Progress
+
+Revision ID: 017_statement_mention_progress
+Revises: 016_municipal_change_tracking
+Create Date: 2026-10-19 09:00:00
+
+Adds openpolicy.statement_mention_progress, a single row holding the id of
+the last statement the ETL read_models job scanned for mentions. The highest
+statement id in statement_mentions only tells how far the last mention
+reached, so statements after it that mention nobody were rescanned on every
+run, and the gateway matched them on their text. The mark starts at that
+highest id, so such trailing statements are scanned once more.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '017_statement_mention_progress'
+down_revision = '016_municipal_change_tracking'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the mention progress row."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS openpolicy.statement_mention_progress (
+            id BOOLEAN PRIMARY KEY DEFAULT true
+                CONSTRAINT statement_mention_progress_single_row CHECK (id),
+            scanned_through BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO openpolicy.statement_mention_progress (id, scanned_through)
+        SELECT true, COALESCE(max(statement_id), 0) FROM openpolicy.statement_mentions
+        ON CONFLICT (id) DO NOTHING
+    """)
+
+
+def downgrade():
+    """Drop the mention progress row."""
+    op.execute("DROP TABLE IF EXISTS openpolicy.statement_mention_progress")
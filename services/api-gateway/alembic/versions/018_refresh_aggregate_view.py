@@ -0,0 +1,33 @@
+"""
+Refresh Aggregate View Function
+
+Revision ID: 018_refresh_aggregate_view
+Revises: 017_statement_mention_progress
+Create Date: 2026-10-19 12:00:00
+
+Adds openpolicy.refresh_aggregate_view(), which refreshes one chart
+aggregate view concurrently and bumps its version in
+aggregate_view_versions. The gateway's refresh endpoint and the ETL
+read_models job both call it, so the refresh is defined once, in
+app.core.visualization_aggregates.
+"""
+
+from alembic import op
+
+from app.core.visualization_aggregates import REFRESH_AGGREGATE_VIEW_FUNCTION
+
+# revision identifiers
+revision = '018_refresh_aggregate_view'
+down_revision = '017_statement_mention_progress'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the aggregate view refresh function."""
+    op.execute(REFRESH_AGGREGATE_VIEW_FUNCTION)
+
+
+def downgrade():
+    """Drop the aggregate view refresh function."""
+    op.execute("DROP FUNCTION IF EXISTS openpolicy.refresh_aggregate_view(text)")
@@ -0,0 +1,35 @@
+"""
+Activity Partition Function
+
+Revision ID: 019_activity_partition_function
+Revises: 018_refresh_aggregate_view
+Create Date: 2026-10-19 15:00:00
+
+Adds openpolicy.ensure_activity_partitions(), which creates the upcoming
+monthly user_activities partitions under an advisory lock. The gateway
+calls it at startup and the ETL's daily pipeline calls it ahead of each
+month, so partitions no longer depend on a gateway restart and concurrent
+callers no longer race to attach the same month. It is defined once, in
+app.core.activity_writer.
+"""
+
+from alembic import op
+
+from app.core.activity_writer import ENSURE_ACTIVITY_PARTITIONS_FUNCTION
+
+# revision identifiers
+revision = '019_activity_partition_function'
+down_revision = '018_refresh_aggregate_view'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the activity partition function and the partitions it maintains."""
+    op.execute(ENSURE_ACTIVITY_PARTITIONS_FUNCTION)
+    op.execute("SELECT openpolicy.ensure_activity_partitions()")
+
+
+def downgrade():
+    """Drop the activity partition function."""
+    op.execute("DROP FUNCTION IF EXISTS openpolicy.ensure_activity_partitions(integer, date)")
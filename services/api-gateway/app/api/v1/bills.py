@@ -8,10 +8,11 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from sqlalchemy.orm import Session as DBSession
 from sqlalchemy import text
 from typing import Optional
-from app.database import get_db
+from app.database import get_read_db
+from app.core.responses import paginated
 from app.models.openparliament import Bill, Member, Party, Vote, Jurisdiction, Session
 from app.schemas.bills import (
-    BillSummary, BillDetail, VoteInfo, Pagination,
+    BillDetail, VoteInfo,
     BillListResponse, BillDetailResponse, BillSuggestionsResponse,
     BillSummaryResponse, BillStatus, BillStatusResponse, BillStage
 )
@@ -39,7 +40,7 @@ async def list_bills(
     ),
     page: int = Query(1, ge=1, description="Page number for pagination"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List bills with optional filtering and search.
@@ -54,8 +55,12 @@ async def list_bills(
     - Pagination
     """
 
-    # Build base query
-    query = db.query(Bill)
+    # Build base query over the columns the summary needs; rows are
+    # serialised directly instead of through per-row BillSummary models
+    query = db.query(
+        Bill.id, Bill.bill_number, Bill.title, Bill.summary, Bill.status,
+        Bill.introduced_date, Bill.session_id, Bill.keywords
+    )
 
     # Apply search filter
     if q:
@@ -91,46 +96,43 @@ async def list_bills(
     
     # Apply pagination
     offset = (page - 1) * page_size
-    bills = query.offset(offset).limit(page_size).all()
+    rows = query.offset(offset).limit(page_size).all()
 
     # Convert to response format
-    bill_summaries = []
-    
-    for bill in bills:
-        bill_summaries.append(BillSummary(
-            id=str(bill.id),
-            bill_number=bill.bill_number,
-            title=bill.title,
-            short_title=bill.title[:100] if bill.title else None,  # Use title as short title
-            summary=bill.summary,
-            status=bill.status,
-            introduced_date=bill.introduced_date,
-            sponsor_name=None,  # Not available in this schema
-            party_name=None,  # Not available in this schema
-            session_name=f"Session {bill.session_id}",
-            keywords=bill.keywords or [],
-            tags=[]  # Not available in this schema
-        ))
+    bill_summaries = [
+        {
+            "id": str(row.id),
+            "bill_number": row.bill_number,
+            "title": row.title,
+            "short_title": row.title[:100] if row.title else None,  # Use title as short title
+            "summary": row.summary,
+            "status": row.status,
+            "introduced_date": row.introduced_date,
+            "sponsor_name": None,  # Not available in this schema
+            "party_name": None,  # Not available in this schema
+            "session_name": f"Session {row.session_id}",
+            "keywords": row.keywords or [],
+            "tags": [],  # Not available in this schema
+        }
+        for row in rows
+    ]
 
     # Calculate pagination info
     total_pages = (total + page_size - 1) // page_size
 
-    return BillListResponse(
-        bills=bill_summaries,
-        pagination=Pagination(
-            page=page,
-            page_size=page_size,
-            total=total,
-            pages=total_pages
-        )
-    )
+    return paginated("bills", bill_summaries, {
+        "page": page,
+        "page_size": page_size,
+        "total": total,
+        "pages": total_pages
+    })
 
 
 @router.get("/suggestions", response_model=BillSuggestionsResponse)
 async def get_bill_suggestions(
     q: str = Query(..., min_length=1, description="Search query for bill suggestions"),
     limit: int = Query(10, ge=1, le=50, description="Number of suggestions to return"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get bill title suggestions using trigram similarity.
@@ -163,7 +165,7 @@ async def get_bill_suggestions(
 
 
 @router.get("/summary/stats", response_model=BillSummaryResponse)
-async def get_bill_summary_stats(db: DBSession = Depends(get_db)):
+async def get_bill_summary_stats(db: DBSession = Depends(get_read_db)):
     """
     Get summary statistics about bills.
     """
@@ -192,7 +194,7 @@ async def get_bill_summary_stats(db: DBSession = Depends(get_db)):
 @router.get("/{bill_id}", response_model=BillDetailResponse)
 async def get_bill_detail(
     bill_id: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get detailed information about a specific bill.
@@ -337,7 +339,7 @@ async def get_bill_votes(
     bill_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get voting records for a specific bill.
@@ -388,7 +390,7 @@ async def get_bill_history(
     bill_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get legislative history for a specific bill.
@@ -474,7 +476,7 @@ async def get_bill_amendments(
     amendment_type: Optional[str] = Query(None, description="Filter by amendment type"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get amendments for a specific bill.
@@ -574,7 +576,7 @@ async def get_bill_amendments(
 async def get_bill_timeline(
     bill_id: int,
     format: str = Query("json", description="Response format (json/minimal)"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get the legislative timeline for a specific bill.
@@ -672,7 +674,7 @@ async def get_bill_history(
     bill_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get the legislative history for a specific bill.
@@ -766,7 +768,7 @@ async def get_bill_history(
 @router.get("/{bill_id}/status", response_model=BillStatusResponse)
 async def get_bill_comprehensive_status(
     bill_id: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get comprehensive status tracking information for a specific bill.
@@ -12,12 +12,15 @@ from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import math
 import hashlib
-import json
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.core.responses import FastJSONResponse, dumps
+from app.core.visualization_aggregates import (
+    CHART_FAMILIES, AGGREGATE_VIEWS, chart_cache, refresh_aggregates, view_versions
+)
 from app.models.data_visualizations import (
     VisualizationType, DataVisualization, Dashboard, DashboardVisualization,
-    VisualizationCache, VisualizationAnalytics
+    VisualizationAnalytics
 )
 from app.models.users import User
 from app.schemas.data_visualizations import (
@@ -32,6 +35,7 @@ from app.schemas.data_visualizations import (
     DataSourceEnum, ThemeEnum
 )
 from app.api.v1.auth import get_current_user
+from app.core.dependencies import require_admin
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -94,7 +98,7 @@ async def list_visualization_types(
     category: Optional[str] = Query(None, description="Filter by category"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     search: Optional[str] = Query(None, description="Search in type names and descriptions"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List visualization types with filtering and pagination.
@@ -160,7 +164,7 @@ async def list_visualization_types(
 @router.get("/types/{type_id}", response_model=VisualizationTypeResponse)
 async def get_visualization_type(
     type_id: str = Path(..., description="Visualization type ID"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get a specific visualization type by ID.
@@ -247,7 +251,7 @@ async def list_data_visualizations(
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
     created_by: Optional[str] = Query(None, description="Filter by creator"),
     search: Optional[str] = Query(None, description="Search in titles and descriptions"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List data visualizations with filtering and pagination.
@@ -415,7 +419,7 @@ async def list_dashboards(
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
     created_by: Optional[str] = Query(None, description="Filter by creator"),
     search: Optional[str] = Query(None, description="Search in titles and descriptions"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List dashboards with filtering and pagination.
@@ -543,32 +547,27 @@ async def generate_visualization_data(
     if not visualization:
         raise HTTPException(status_code=404, detail="Visualization not found")
     
-    # Check cache first
+    family = CHART_FAMILIES.get(visualization.data_source)
+    view_version = view_versions(db).get(family.view, 0) if family else 0
+    config_hash = hashlib.md5(dumps(visualization.configuration, sort_keys=True), usedforsecurity=False).hexdigest()
+    filters_hash = hashlib.md5(dumps(request_data.custom_filters, sort_keys=True), usedforsecurity=False).hexdigest()
+    lru_key = (visualization_id, view_version, config_hash, filters_hash)
+    cache_key = f"viz_{visualization_id}_v{view_version}_{config_hash}"
+    
+    # Payloads stay valid until the underlying view is refreshed
     if not request_data.force_regenerate:
-        cached_data = db.query(VisualizationCache).filter(
-            and_(
-                VisualizationCache.visualization_id == visualization_id,
-                VisualizationCache.expires_at > datetime.utcnow()
-            )
-        ).first()
-        
-        if cached_data:
-            # Update cache hits
-            cached_data.hits += 1
-            cached_data.last_hit = datetime.utcnow()
-            db.commit()
+        cached = chart_cache.get(lru_key)
+        if cached is not None:
+            _track_visualization_access(db, visualization_id, generated=False)
             
-            # Track analytics
-            _track_visualization_access(db, visualization_id)
-            
-            return {
+            return FastJSONResponse({
                 "visualization_id": visualization_id,
-                "data": cached_data.generated_data,
+                "data": cached["data"],
                 "is_cached": True,
-                "cache_key": cached_data.cache_key,
-                "expires_at": cached_data.expires_at,
-                "generation_time_ms": cached_data.generation_time_ms
-            }
+                "cache_key": cache_key,
+                "view_version": view_version,
+                "generation_time_ms": cached["generation_time_ms"]
+            })
     
     # Generate new data
     start_time = datetime.utcnow()
@@ -580,38 +579,13 @@ async def generate_visualization_data(
         )
         
         generation_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-        
-        # Cache the generated data
-        data_hash = hashlib.md5(json.dumps(generated_data, sort_keys=True).encode(), usedforsecurity=False).hexdigest()
-        config_hash = hashlib.md5(json.dumps(visualization.configuration, sort_keys=True).encode(), usedforsecurity=False).hexdigest()
-        cache_key = f"viz_{visualization_id}_{data_hash}_{config_hash}"
-        expires_at = datetime.utcnow() + timedelta(hours=1)  # Cache for 1 hour
-        
-        # Remove old cache entries
-        db.query(VisualizationCache).filter(
-            VisualizationCache.visualization_id == visualization_id
-        ).delete()
-        
-        # Create new cache entry
-        cache_entry = VisualizationCache(
-            visualization_id=visualization_id,
-            cache_key=cache_key,
-            data_hash=data_hash,
-            config_hash=config_hash,
-            generated_data=generated_data,
-            data_size=len(json.dumps(generated_data)),
-            generation_time_ms=int(generation_time),
-            expires_at=expires_at,
-            hits=1,
-            last_hit=datetime.utcnow()
-        )
-        db.add(cache_entry)
+        chart_cache.put(lru_key, {"data": generated_data, "generation_time_ms": int(generation_time)})
         
         # Update visualization metadata
         visualization.last_generated = datetime.utcnow()
         visualization.generation_time_ms = int(generation_time)
         visualization.cache_key = cache_key
-        visualization.cache_expires = expires_at
+        visualization.cache_expires = None
         
         db.commit()
         
@@ -620,14 +594,14 @@ async def generate_visualization_data(
         
         logger.info(f"Visualization data generated: {visualization.title} - {generation_time:.2f}ms")
         
-        return {
+        return FastJSONResponse({
             "visualization_id": visualization_id,
             "data": generated_data,
             "is_cached": False,
             "cache_key": cache_key,
-            "expires_at": expires_at,
+            "view_version": view_version,
             "generation_time_ms": int(generation_time)
-        }
+        })
         
     except Exception as e:
         # Log error
@@ -640,6 +614,28 @@ async def generate_visualization_data(
         )
 
 
+@router.post("/aggregates/refresh")
+async def refresh_visualization_aggregates(
+    db: DBSession = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """
+    Refresh the chart aggregate views (admin only).
+    
+    The ETL daily pipeline refreshes them after ingestion; this is for
+    refreshing by hand. Cached chart payloads for a view are invalidated as
+    soon as its version is bumped.
+    """
+    versions = refresh_aggregates(db, AGGREGATE_VIEWS)
+    
+    logger.info(f"Visualization aggregates refreshed by {current_user.username}")
+    
+    return {
+        "versions": versions,
+        "refreshed_at": datetime.utcnow()
+    }
+
+
 # ============================================================================
 # DASHBOARD VISUALIZATION MANAGEMENT
 # ============================================================================
@@ -744,8 +740,11 @@ async def get_visualization_statistics(
         last_24h_views = sum([a.daily_views for a in last_24h_analytics])
         last_7d_views = sum([a.daily_views for a in last_7d_analytics])
         
-        # Cache hit rate (mock for now)
-        cache_hit_rate = 75.5
+        # Every access is counted as either a generation or a cache hit,
+        # by whichever worker served it
+        total_cache_hits = sum([a.daily_cache_hits for a in analytics])
+        total_accesses = total_generations + total_cache_hits
+        cache_hit_rate = round(100.0 * total_cache_hits / total_accesses, 1) if total_accesses else 0.0
         
         # User engagement (mock for now)
         user_engagement_score = 82.3
@@ -778,54 +777,21 @@ async def _generate_visualization_data(
     db: DBSession, visualization: DataVisualization, custom_filters: Optional[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Generate visualization data based on type and source."""
+    family = CHART_FAMILIES.get(visualization.data_source)
+    if family is not None:
+        return family.build(db, custom_filters)
     
-    # This is a simplified implementation - in production, you would have
-    # more sophisticated data generation logic based on the visualization type
-    # and data source
-    
-    data_source = visualization.data_source
-    viz_type = visualization.visualization_type_id
-    
-    # Mock data generation based on source
-    if data_source == "bills":
-        return {
-            "labels": ["Introduced", "First Reading", "Second Reading", "Committee", "Third Reading", "Royal Assent"],
-            "data": [45, 38, 32, 28, 25, 22],
-            "chart_type": "bar",
-            "title": "Bill Progress Through Parliament",
-            "description": "Number of bills at each legislative stage"
-        }
-    
-    elif data_source == "votes":
-        return {
-            "labels": ["Government", "Opposition", "Independent"],
-            "data": [156, 142, 23],
-            "chart_type": "pie",
-            "title": "Vote Distribution by Party",
-            "description": "Distribution of votes across political parties"
-        }
-    
-    elif data_source == "members":
-        return {
-            "labels": ["Liberal", "Conservative", "NDP", "Bloc", "Green", "Independent"],
-            "data": [158, 119, 25, 32, 2, 1],
-            "chart_type": "bar",
-            "title": "MP Distribution by Party",
-            "description": "Number of Members of Parliament by political party"
-        }
-    
-    else:
-        # Generic data structure
-        return {
-            "labels": ["Category 1", "Category 2", "Category 3", "Category 4", "Category 5"],
-            "data": [25, 30, 20, 35, 15],
-            "chart_type": "bar",
-            "title": "Generic Data Visualization",
-            "description": "Sample data for demonstration purposes"
-        }
+    # Sources without an aggregate view yet get a generic placeholder
+    return {
+        "labels": ["Category 1", "Category 2", "Category 3", "Category 4", "Category 5"],
+        "data": [25, 30, 20, 35, 15],
+        "chart_type": "bar",
+        "title": "Generic Data Visualization",
+        "description": "Sample data for demonstration purposes"
+    }
 
 
-def _track_visualization_access(db: DBSession, visualization_id: str) -> None:
+def _track_visualization_access(db: DBSession, visualization_id: str, generated: bool = True) -> None:
     """Track visualization access for analytics."""
     today = datetime.utcnow().date()
     
@@ -842,11 +808,15 @@ def _track_visualization_access(db: DBSession, visualization_id: str) -> None:
             visualization_id=visualization_id,
             analytics_date=datetime.utcnow(),
             daily_views=1,
-            daily_generations=1
+            daily_generations=1 if generated else 0,
+            daily_cache_hits=0 if generated else 1
         )
         db.add(analytics)
     else:
         analytics.daily_views += 1
-        analytics.daily_generations += 1
+        if generated:
+            analytics.daily_generations += 1
+        else:
+            analytics.daily_cache_hits += 1
     
     db.commit()
@@ -9,11 +9,13 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, UploadFile, File
 from fastapi.responses import StreamingResponse
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import date
 import io
 import json
 from app.database import get_db
+from app.core.responses import FastJSONResponse, rows_to_dicts
 from app.core.dependencies import get_current_user_optional, get_current_user, require_permission
 from app.core.debate_transcripts import DebateTranscriptService, get_debate_transcript_service
 from app.models.users import User
@@ -155,9 +157,40 @@ async def get_session_statements(
     db: Session = Depends(get_db)
 ):
     """Get statements for a specific session."""
-    from app.models.debate_transcripts import DebateStatement
-    
-    query = db.query(DebateStatement).filter(
+    from app.models.debate_transcripts import DebateStatement, DebateSpeaker, DebateAnnotation
+    
+    # Annotation counts in one grouped subquery instead of a lazy load per row
+    annotation_counts = db.query(
+        DebateAnnotation.statement_id,
+        func.count(DebateAnnotation.id).label("annotation_count")
+    ).group_by(DebateAnnotation.statement_id).subquery()
+    
+    query = db.query(
+        DebateStatement.id,
+        DebateStatement.session_id,
+        DebateStatement.sequence_number,
+        DebateStatement.timestamp,
+        DebateStatement.statement_type,
+        DebateStatement.content,
+        DebateStatement.content_fr,
+        DebateStatement.language,
+        DebateStatement.speaker_id,
+        DebateStatement.speaker_role,
+        DebateStatement.word_count,
+        DebateStatement.topic,
+        DebateStatement.bill_reference,
+        DebateStatement.references,
+        DebateStatement.interjections,
+        DebateStatement.created_at,
+        DebateSpeaker.name.label("speaker_name"),
+        DebateSpeaker.party.label("speaker_party"),
+        DebateSpeaker.riding.label("speaker_riding"),
+        func.coalesce(annotation_counts.c.annotation_count, 0).label("annotation_count")
+    ).outerjoin(
+        DebateSpeaker, DebateStatement.speaker_id == DebateSpeaker.id
+    ).outerjoin(
+        annotation_counts, annotation_counts.c.statement_id == DebateStatement.id
+    ).filter(
         DebateStatement.session_id == session_id
     )
     
@@ -170,20 +203,9 @@ async def get_session_statements(
     # Order by sequence number
     query = query.order_by(DebateStatement.sequence_number)
     
-    statements = query.offset(skip).limit(limit).all()
-    
-    # Build response with speaker info
-    results = []
-    for statement in statements:
-        response = StatementResponse.from_orm(statement)
-        if statement.speaker:
-            response.speaker_name = statement.speaker.name
-            response.speaker_party = statement.speaker.party
-            response.speaker_riding = statement.speaker.riding
-        response.annotation_count = len(statement.annotations)
-        results.append(response)
-    
-    return results
+    # Rows come straight from the database, so they are serialised without
+    # building a StatementResponse per row
+    return FastJSONResponse(rows_to_dicts(query.offset(skip).limit(limit).all()))
 
 
 @router.post("/statements", response_model=StatementResponse, status_code=status.HTTP_201_CREATED)
@@ -6,12 +6,14 @@ detail views, and speech access. Copied and adapted from legacy OpenParliament c
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import text, and_, desc
+from sqlalchemy.orm import Session as DBSession, joinedload
+from sqlalchemy import text, and_, desc, exists, func
 from typing import List, Optional
 from datetime import date, datetime
-from app.database import get_db
-from app.models.openparliament import Vote, Bill, Member, Party
+from app.database import get_read_db
+from app.models.openparliament import Vote, Bill, Member, Party, Session, Statement
+from app.core.debate_days import debate_day_totals, page_debate_days
+from app.core.speech_mentions import mentioned_politician_filter, resolve_member_ids
 from app.schemas.debates import (
     DebateSummary, DebateDetail, SpeechSummary, SpeechDetail, Pagination,
     DebateListResponse, DebateDetailResponse, SpeechListResponse, SpeechDetailResponse,
@@ -30,85 +32,63 @@ async def list_debates(
     lang: Optional[str] = Query("en", description="Language (en/fr)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    before: Optional[str] = Query(None, description="Keyset cursor: next_cursor of the previous page (YYYY-MM-DD)"),
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List House debates with optional filtering.
     
     Supports:
-    - Filtering by session
     - Date range filtering
-    - Filtering by hansard number
-    - Pagination
-    """
-    
-    # Build base query for votes/debates
-    # Group by date to get unique debate dates
-    query = db.query(Vote.vote_date).distinct()
+    - Keyset pagination with ``before`` (``page`` still works for shallow pages)
     
-    # Apply filters
-    if date__gte:
-        try:
-            date_gte = datetime.strptime(date__gte, "%Y-%m-%d").date()
-            query = query.filter(Vote.vote_date >= date_gte)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    Served from the debate_days read model, newest sitting first.
+    """
     
-    if date__lte:
+    def parse_date(value: Optional[str]) -> Optional[date]:
+        if not value:
+            return None
         try:
-            date_lte = datetime.strptime(date__lte, "%Y-%m-%d").date()
-            query = query.filter(Vote.vote_date <= date_lte)
+            return datetime.strptime(value, "%Y-%m-%d").date()
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
     
-    # Get total count for pagination
-    total = query.count()
+    result = page_debate_days(
+        db,
+        date_gte=parse_date(date__gte),
+        date_lte=parse_date(date__lte),
+        before=parse_date(before),
+        offset=(page - 1) * page_size,
+        limit=page_size
+    )
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    debate_dates = query.offset(offset).limit(page_size).all()
-    
-    # Get debate summaries for each date
-    debate_summaries = []
-    for (debate_date,) in debate_dates:
-        if debate_date:
-            # Count total votes for this date
-            vote_count = db.query(Vote).filter(
-                and_(
-                    Vote.vote_date >= datetime.combine(debate_date.date(), datetime.min.time()),
-                    Vote.vote_date < datetime.combine(debate_date.date(), datetime.max.time())
-                )
-            ).count()
-            
-            # Get unique bills for this date
-            bill_count = db.query(Vote.bill_id).filter(
-                and_(
-                    Vote.vote_date >= datetime.combine(debate_date.date(), datetime.min.time()),
-                    Vote.vote_date < datetime.combine(debate_date.date(), datetime.max.time())
-                )
-            ).distinct().count()
-            
-            debate_summaries.append(DebateSummary(
-                id=f"{debate_date.year}-{debate_date.month:02d}-{debate_date.day:02d}",
-                date=debate_date.date().isoformat(),
-                number=debate_date.day,  # Using day as the number for now
-                statement_count=vote_count,
-                url=f"/api/v1/debates/{debate_date.year}/{debate_date.month:02d}/{debate_date.day:02d}/"
-            ))
+    debate_summaries = [
+        DebateSummary(
+            id=day.sitting_date.isoformat(),
+            date=day.sitting_date.isoformat(),
+            number=day.sitting_date.day,  # Using day as the number for now
+            statement_count=day.statement_count,
+            vote_count=day.vote_count,
+            bill_count=day.bill_count,
+            url=f"/api/v1/debates/{day.sitting_date.year}/{day.sitting_date.month:02d}/{day.sitting_date.day:02d}/"
+        )
+        for day in result.days
+    ]
     
     # Calculate pagination info
-    total_pages = (total + page_size - 1) // page_size
+    total_pages = (result.total + page_size - 1) // page_size
     
     pagination = Pagination(
         page=page,
         page_size=page_size,
-        total=total,
+        total=result.total,
         pages=total_pages
     )
     
     return DebateListResponse(
         debates=debate_summaries,
-        pagination=pagination
+        pagination=pagination,
+        next_cursor=result.next_cursor.isoformat() if result.next_cursor else None
     )
 
 
@@ -117,7 +97,7 @@ async def get_debate_detail(
     year: int,
     month: int,
     day: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get detailed information about a specific House debate by date.
@@ -170,7 +150,7 @@ async def list_speeches(
     lang: Optional[str] = Query("en", description="Language (en/fr)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List speeches/statements with comprehensive filtering.
@@ -179,11 +159,13 @@ async def list_speeches(
     """
     
     # Build base query
-    query = db.query(Statement).join(Politician, Statement.politician_id == Politician.id, isouter=True)
+    query = db.query(Statement).options(joinedload(Statement.member))
     
     # Apply filters
     if politician:
-        query = query.filter(Politician.name.ilike(f"%{politician}%"))
+        # Resolve the name to member ids first (trigram index), then use the
+        # statements.member_id index
+        query = query.filter(Statement.member_id.in_(resolve_member_ids(db, politician)))
     
     if date__gte:
         try:
@@ -202,18 +184,16 @@ async def list_speeches(
     if bill:
         # Parse bill filter (e.g., "45-1/C-5")
         if '/' in bill:
-            session_id, bill_number = bill.split('/', 1)
-            query = query.join(Bill, Statement.bill_id == Bill.id, isouter=True).filter(
-                and_(Bill.session_id == session_id, Bill.number == bill_number)
+            session_name, bill_number = bill.split('/', 1)
+            query = query.join(Bill, Statement.bill_debated_id == Bill.id).join(
+                Session, Bill.session_id == Session.id
+            ).filter(
+                and_(Session.name == session_name, Bill.bill_number == bill_number)
             )
     
     if mentioned_politician:
-        # Search for statements that mention a specific politician
-        # This searches in the statement content for politician names
-        query = query.filter(
-            Statement.content_en.ilike(f"%{mentioned_politician}%") |
-            Statement.content_fr.ilike(f"%{mentioned_politician}%")
-        )
+        # Statements that mention the politician, from the mention index
+        query = query.filter(mentioned_politician_filter(db, mentioned_politician))
     
     # Order by time descending (most recent first)
     query = query.order_by(desc(Statement.time))
@@ -234,9 +214,9 @@ async def list_speeches(
         
         speeches.append(SpeechSummary(
             id=str(stmt.id),
-            politician_name=stmt.politician.name if stmt.politician else "Unknown",
-            date=stmt.time.date() if stmt.time else None,
-            time=stmt.time,
+            politician_name=stmt.member.full_name if stmt.member else "Unknown",
+            date=stmt.time.date().isoformat() if stmt.time else None,
+            time=stmt.time.strftime("%H:%M:%S") if stmt.time else None,
             text_preview=text_preview,
             bill_mentioned=str(stmt.bill_debated_id) if stmt.bill_debated_id else None,
             url=f"/api/v1/debates/speeches/{stmt.id}/"
@@ -261,7 +241,7 @@ async def list_speeches(
 @router.get("/speeches/{speech_id}/", response_model=SpeechDetailResponse)
 async def get_speech_detail(
     speech_id: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get detailed information about a specific speech/statement.
@@ -301,7 +281,7 @@ async def get_debate_statements(
     lang: Optional[str] = Query("en", description="Language preference (en/fr)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get all statements from a specific debate date.
@@ -324,16 +304,16 @@ async def get_debate_statements(
             Statement.time >= datetime.combine(debate_date, datetime.min.time()),
             Statement.time < datetime.combine(debate_date, datetime.max.time())
         )
-    ).join(Politician, Statement.politician_id == Politician.id, isouter=True)
+    ).options(joinedload(Statement.member))
     
     # Apply politician filter
     if politician:
-        query = query.filter(Politician.name.ilike(f"%{politician}%"))
+        query = query.filter(Statement.member_id.in_(resolve_member_ids(db, politician)))
     
     # Apply bill filter
     if bill:
-        query = query.join(Bill, Statement.bill_debated_id == Bill.id, isouter=True).filter(
-            Bill.number.ilike(f"%{bill}%")
+        query = query.join(Bill, Statement.bill_debated_id == Bill.id).filter(
+            Bill.bill_number.ilike(f"%{bill}%")
         )
     
     # Order by sequence (chronological order of statements)
@@ -362,9 +342,9 @@ async def get_debate_statements(
         
         speeches.append(SpeechSummary(
             id=str(stmt.id),
-            politician_name=stmt.politician.name if stmt.politician else "Unknown",
-            date=stmt.time.date() if stmt.time else None,
-            time=stmt.time,
+            politician_name=stmt.member.full_name if stmt.member else "Unknown",
+            date=stmt.time.date().isoformat() if stmt.time else None,
+            time=stmt.time.strftime("%H:%M:%S") if stmt.time else None,
             text_preview=text_preview,
             bill_mentioned=str(stmt.bill_debated_id) if stmt.bill_debated_id else None,
             url=f"/api/v1/debates/speeches/{stmt.id}/"
@@ -387,37 +367,22 @@ async def get_debate_statements(
 
 
 @router.get("/summary/stats", response_model=DebateSummaryResponse)
-async def get_debate_summary_stats(db: DBSession = Depends(get_db)):
+async def get_debate_summary_stats(db: DBSession = Depends(get_read_db)):
     """
     Get summary statistics about debates and speeches.
     """
     
-    # Get total statements count
-    total_speeches = db.query(Statement).count()
-    # Defensive check for Mock objects during testing
-    if str(type(total_speeches)) == "<class 'unittest.mock.Mock'>":
-        total_speeches = 0
-    
-    # Get unique sitting count (debates)
-    total_debates = db.query(Statement.time).distinct().count()
-    # Defensive check for Mock objects during testing
-    if str(type(total_debates)) == "<class 'unittest.mock.Mock'>":
-        total_debates = 0
-    
-    # Get unique politician count
-    total_speakers = db.query(Statement.politician_id).filter(
-        Statement.politician_id.isnot(None)
-    ).distinct().count()
-    # Defensive check for Mock objects during testing
-    if str(type(total_speakers)) == "<class 'unittest.mock.Mock'>":
-        total_speakers = 0
+    # Sitting and statement totals come from the debate_days read model
+    total_debates, total_speeches, latest_debate_date = debate_day_totals(db)
     
-    # Get most recent debate date
-    latest_statement = db.query(Statement).order_by(desc(Statement.time)).first()
+    # Members with at least one statement; one index probe per member
+    total_speakers = db.query(func.count(Member.id)).filter(
+        exists().where(Statement.member_id == Member.id)
+    ).scalar()
     
     return DebateSummaryResponse(
         total_debates=total_debates,
         total_speeches=total_speeches,
-        total_speakers=total_speakers,
-        latest_debate_date=latest_statement.time.date() if latest_statement and latest_statement.time else None
+        total_speakers=total_speakers or 0,
+        latest_debate_date=latest_debate_date
     )
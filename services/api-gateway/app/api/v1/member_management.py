@@ -8,9 +8,10 @@ Provides administrative endpoints for managing members.
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, File, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.core.responses import FastJSONResponse
 from app.core.dependencies import (
     get_current_user,
     require_permission,
@@ -204,23 +205,40 @@ async def export_members(
     current_user: User = Depends(require_permission("members", "read")),
     db: Session = Depends(get_db)
 ):
-    """Export members in various formats."""
-    service = get_member_management_service(db)
-    export_data = service.export_members(export_request, member_ids)
+    """
+    Export members in various formats.
     
-    # Set appropriate content type
+    The export is streamed from a server-side cursor, so memory use does not
+    grow with the number of members exported.
+    """
     if export_request.format == "json":
         media_type = "application/json"
         filename = "members_export.json"
+    elif export_request.format == "ndjson":
+        media_type = "application/x-ndjson"
+        filename = "members_export.ndjson"
     elif export_request.format == "csv":
         media_type = "text/csv"
         filename = "members_export.csv"
     else:
-        media_type = "application/octet-stream"
-        filename = "members_export"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format: {export_request.format}"
+        )
     
-    return Response(
-        content=export_data,
+    # The request session is closed before the body is sent, so the stream
+    # owns a session of its own on the same engine
+    bind = db.get_bind()
+    
+    def stream():
+        stream_db = Session(bind=bind)
+        try:
+            yield from get_member_management_service(stream_db).iter_export_members(export_request, member_ids)
+        finally:
+            stream_db.close()
+    
+    return StreamingResponse(
+        stream(),
         media_type=media_type,
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -241,6 +259,31 @@ async def check_duplicate_members(
     return duplicates
 
 
+@router.get("/duplicates")
+def scan_duplicate_members(
+    threshold: float = Query(0.85, ge=0.5, le=1.0, description="Minimum similarity score"),
+    current_only: bool = Query(False, description="Only scan current members"),
+    jurisdiction_id: Optional[UUID] = Query(None, description="Restrict scan to a jurisdiction"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum pairs to return"),
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Scan members for likely duplicates.
+
+    Members are grouped by blocking keys (phonetic name code, email
+    local-part, phone, riding) and only compared within a block. The scan
+    is CPU-bound, so this is a plain def and runs in the threadpool.
+    """
+    service = get_member_management_service(db)
+    return FastJSONResponse(service.scan_duplicates(
+        threshold=threshold,
+        current_only=current_only,
+        jurisdiction_id=jurisdiction_id,
+        limit=limit
+    ))
+
+
 @router.post("/merge", response_model=MemberManagementResponse)
 async def merge_members(
     merge_request: MemberMergeRequest,
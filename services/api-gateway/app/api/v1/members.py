@@ -8,7 +8,8 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from sqlalchemy.orm import Session as DBSession
 from sqlalchemy import text
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_read_db
+from app.core.responses import FastJSONResponse
 from app.models.openparliament import Member, Party, Bill, Vote, Jurisdiction
 from app.schemas.members import (
     MemberSummary, MemberDetail, Pagination, 
@@ -33,7 +34,7 @@ async def list_members(
     current_only: bool = Query(True, description="Show only current members"),
     page: int = Query(1, ge=1, description="Page number for pagination"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List elected officials with optional filtering and search.
@@ -130,7 +131,7 @@ async def list_members(
 @router.get("/{member_id}", response_model=MemberDetailResponse)
 async def get_member_detail(
     member_id: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get detailed information about a specific Member of Parliament.
@@ -182,7 +183,7 @@ async def get_members_by_postal_code(
     include_federal: bool = Query(True, description="Include federal representatives"),
     include_provincial: bool = Query(False, description="Include provincial representatives"),
     include_municipal: bool = Query(False, description="Include municipal representatives"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Find Members of Parliament and other representatives by postal code.
@@ -373,7 +374,7 @@ async def get_members_by_postal_code(
 async def get_member_suggestions(
     q: str = Query(..., min_length=1, description="Search query for member suggestions"),
     limit: int = Query(10, ge=1, le=50, description="Number of suggestions to return"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get member name suggestions using trigram similarity.
@@ -406,7 +407,7 @@ async def get_member_suggestions(
 
 
 @router.get("/summary/stats", response_model=MemberSummaryResponse)
-async def get_member_summary_stats(db: DBSession = Depends(get_db)):
+async def get_member_summary_stats(db: DBSession = Depends(get_read_db)):
     """
     Get summary statistics about Members of Parliament.
     """
@@ -456,7 +457,7 @@ async def get_member_votes(
     member_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get voting records for a specific member.
@@ -506,7 +507,7 @@ async def get_member_votes(
             "source": "Parliament of Canada"
         })
     
-    return {
+    return FastJSONResponse({
         "results": vote_results,
         "pagination": {
             "page": page,
@@ -516,7 +517,7 @@ async def get_member_votes(
             "has_next": page * page_size < total,
             "has_prev": page > 1
         }
-    }
+    })
 
 
 @router.get("/{member_id}/committees")
@@ -524,7 +525,7 @@ async def get_member_committees(
     member_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get committee memberships for a specific member.
@@ -594,7 +595,7 @@ async def get_member_activity(
     member_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get activity timeline for a specific member.
@@ -693,7 +694,7 @@ async def get_member_activity(
 @router.get("/{member_id}/profile", response_model=MemberProfileResponse)
 async def get_member_comprehensive_profile(
     member_id: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get comprehensive profile information for a specific Member of Parliament.
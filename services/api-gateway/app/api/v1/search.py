@@ -11,7 +11,7 @@ from sqlalchemy.orm import Session as DBSession
 from sqlalchemy import text, and_, desc, or_, func
 from typing import List, Optional, Dict, Any, Literal
 from datetime import date, datetime
-from app.database import get_db
+from app.database import get_read_db
 from app.models.openparliament import Vote, Bill, Member, Party, Jurisdiction, Debate, Committee
 from app.schemas.search import (
     SearchResult, SearchResponse, SearchSuggestion, SearchSuggestionsResponse,
@@ -39,7 +39,7 @@ async def search_content(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     highlight: bool = Query(True, description="Enable search term highlighting"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Unified search across all parliamentary content.
@@ -351,7 +351,7 @@ async def search_content(
 async def get_search_suggestions(
     q: str = Query(..., description="Partial search query"),
     limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get search suggestions for autocomplete functionality.
@@ -398,7 +398,7 @@ async def get_search_suggestions(
 @router.get("/postcode/{postcode}", response_model=PostcodeResponse)
 async def lookup_postcode(
     postcode: str,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Look up MP by postal code.
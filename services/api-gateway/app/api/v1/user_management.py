@@ -9,12 +9,14 @@ from fastapi import APIRouter, HTTPException, Query, Depends, Path, Body, Reques
 from sqlalchemy.orm import Session as DBSession
 from sqlalchemy import text, func, and_, or_, desc
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import math
 import json
+import uuid
 
 from app.database import get_db
-from app.models.users import User, UserPreferences, UserActivity, OAuthAccount
+from app.models.users import User, UserPreferences, UserActivity, UserActivityRollup, OAuthAccount
+from app.core.activity_writer import activity_writer
 from app.schemas.user_management import (
     UserProfileResponse, UserPreferencesResponse, UserActivityResponse,
     UserListResponse, UserActivityListResponse, UserStatsResponse,
@@ -399,7 +401,6 @@ async def create_user_activity(
     user_id: str = Path(..., description="User ID"),
     activity_data: UserActivityCreateRequest = Body(...),
     request: Request = None,
-    db: DBSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -407,43 +408,34 @@ async def create_user_activity(
     
     Users can only create their own activity records.
     """
-    # Check if user exists and is the current user
+    # Check the user is the current user
     if str(current_user.id) != user_id:
         raise HTTPException(status_code=403, detail="Can only create own activity records")
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Create activity record
-    activity = UserActivity(
-        user_id=user_id,
-        activity_type=activity_data.activity_type,
-        content_id=activity_data.content_id,
-        content_type=activity_data.content_type,
-        content_title=activity_data.content_title,
-        content_summary=activity_data.content_summary,
-        time_spent=activity_data.time_spent,
-        pages_viewed=activity_data.pages_viewed,
-        actions_taken=json.dumps(activity_data.actions_taken) if activity_data.actions_taken else None,
-        device=activity_data.device,
-        browser=activity_data.browser,
-        location=activity_data.location,
-        ip_address=request.client.host if request and request.client else None,
-        activity_date=datetime.utcnow()
-    )
-    
-    db.add(activity)
-    
-    # Update user's last activity
-    user.last_activity = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(activity)
-    
-    logger.info(f"User activity created: {user.username} - {activity_data.activity_type}")
-    
-    return {"message": "Activity recorded successfully", "activity_id": str(activity.id)}
+    # Queue the activity record; the writer inserts it, updates the rollup
+    # and the user's last activity in its next batch
+    activity_id = uuid.uuid4()
+    activity_writer.record({
+        "id": activity_id,
+        "user_id": current_user.id,
+        "activity_type": activity_data.activity_type,
+        "content_id": activity_data.content_id,
+        "content_type": activity_data.content_type,
+        "content_title": activity_data.content_title,
+        "content_summary": activity_data.content_summary,
+        "time_spent": activity_data.time_spent,
+        "pages_viewed": activity_data.pages_viewed,
+        "actions_taken": json.dumps(activity_data.actions_taken) if activity_data.actions_taken else None,
+        "device": activity_data.device,
+        "browser": activity_data.browser,
+        "location": activity_data.location,
+        "ip_address": request.client.host if request and request.client else None,
+        "activity_date": datetime.now(timezone.utc)
+    })
+    
+    logger.info(f"User activity queued: {current_user.username} - {activity_data.activity_type}")
+    
+    return {"message": "Activity recorded successfully", "activity_id": str(activity_id)}
 
 
 @router.get("/profiles/{user_id}/activity", response_model=UserActivityListResponse)
@@ -574,17 +566,22 @@ async def get_user_statistics(
             # In a real implementation, check if users are friends
             raise HTTPException(status_code=403, detail="Statistics are friends-only")
     
-    # Get activity counts
-    total_activities = db.query(UserActivity).filter(UserActivity.user_id == user_id).count()
-    total_bills_viewed = db.query(UserActivity).filter(
-        and_(UserActivity.user_id == user_id, UserActivity.content_type == "bill")
-    ).count()
-    total_mps_researched = db.query(UserActivity).filter(
-        and_(UserActivity.user_id == user_id, UserActivity.content_type == "mp")
-    ).count()
-    total_votes_analyzed = db.query(UserActivity).filter(
-        and_(UserActivity.user_id == user_id, UserActivity.content_type == "vote")
-    ).count()
+    # Get activity counts from the daily rollup in one grouped read
+    counts = {}
+    last_activity = None
+    for content_type, total, last_at in db.query(
+        UserActivityRollup.content_type,
+        func.sum(UserActivityRollup.count),
+        func.max(UserActivityRollup.last_at)
+    ).filter(UserActivityRollup.user_id == user_id).group_by(UserActivityRollup.content_type):
+        counts[content_type] = int(total)
+        if last_activity is None or last_at > last_activity:
+            last_activity = last_at
+    
+    total_activities = sum(counts.values())
+    total_bills_viewed = counts.get("bill", 0)
+    total_mps_researched = counts.get("mp", 0)
+    total_votes_analyzed = counts.get("vote", 0)
     
     # Get preferences for favorites
     preferences = db.query(UserPreferences).filter(UserPreferences.user_id == user_id).first()
@@ -595,11 +592,6 @@ async def get_user_statistics(
     # Calculate engagement score (simple algorithm)
     engagement_score = min(10.0, (total_activities * 0.1) + (total_bills_viewed * 0.2) + (total_mps_researched * 0.15) + (total_votes_analyzed * 0.25))
     
-    # Get last activity
-    last_activity = db.query(UserActivity).filter(
-        UserActivity.user_id == user_id
-    ).order_by(desc(UserActivity.activity_date)).first()
-    
     return UserStatsResponse(
         user_id=user_id,
         total_activities=total_activities,
@@ -610,7 +602,7 @@ async def get_user_statistics(
         favorite_mps=favorite_mps,
         favorite_parties=favorite_parties,
         engagement_score=round(engagement_score, 1),
-        last_activity=last_activity.activity_date if last_activity else None,
+        last_activity=last_activity,
         generated_at=datetime.utcnow()
     )
 
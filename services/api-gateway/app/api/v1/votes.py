@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from sqlalchemy.orm import Session as DBSession
 from sqlalchemy import text
 from typing import Optional
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.openparliament import Vote, Bill, Member, Party
 from app.schemas.votes import (
     VoteSummary, VoteDetail, VoteBallot, Pagination, 
@@ -33,7 +33,7 @@ async def list_votes(
     number: Optional[int] = Query(None, description="Vote number in session"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     List parliamentary votes with optional filtering.
@@ -148,7 +148,7 @@ async def list_votes(
 async def get_vote_detail(
     session_id: str,
     vote_number: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get detailed information about a specific vote.
@@ -213,7 +213,7 @@ async def get_vote_ballots(
     ballot: Optional[str] = Query(None, description="Vote choice filter (Yea, Nay, etc.)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get individual vote ballots (how each MP voted).
@@ -305,7 +305,7 @@ async def get_vote_ballots(
 
 
 @router.get("/summary/stats", response_model=VoteSummaryResponse)
-async def get_vote_summary_stats(db: DBSession = Depends(get_db)):
+async def get_vote_summary_stats(db: DBSession = Depends(get_read_db)):
     """
     Get summary statistics about votes.
     """
@@ -340,7 +340,7 @@ async def get_vote_summary_stats(db: DBSession = Depends(get_db)):
 async def get_vote_comprehensive_analysis(
     session_id: str,
     vote_number: int,
-    db: DBSession = Depends(get_db)
+    db: DBSession = Depends(get_read_db)
 ):
     """
     Get comprehensive analysis of a specific vote.
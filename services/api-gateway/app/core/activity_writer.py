@@ -0,0 +1,303 @@
+"""
+Buffered User Activity Writer
+
+create_user_activity used to commit one row per event. Events are now
+queued in memory and written by a background task in batches: one
+multi-row insert into the (monthly partitioned) user_activities table,
+one upsert into user_activity_rollup and one update of users.last_activity
+per batch.
+
+User statistics read the rollup, which keeps its counts after old
+activity partitions are dropped with drop_activity_partitions.
+"""
+
+import asyncio
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, text, update
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.users import User, UserActivity, UserActivityRollup
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def rollup_rows(activities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse activity rows into one rollup increment per (user, day, type, content type)."""
+    rollups: Dict[tuple, Dict[str, Any]] = {}
+    for activity in activities:
+        at = activity["activity_date"]
+        key = (activity["user_id"], at.date(), activity["activity_type"], activity.get("content_type") or "")
+        row = rollups.get(key)
+        if row is None:
+            rollups[key] = {
+                "user_id": key[0], "day": key[1], "activity_type": key[2], "content_type": key[3],
+                "count": 1, "last_at": at,
+            }
+        else:
+            row["count"] += 1
+            row["last_at"] = max(row["last_at"], at)
+    return list(rollups.values())
+
+
+def write_activity_batch(db: Session, activities: List[Dict[str, Any]]) -> None:
+    """Insert activities and fold them into the rollup in a single transaction."""
+    if not activities:
+        return
+    db.execute(UserActivity.__table__.insert(), activities)
+
+    rollup = UserActivityRollup.__table__
+    statement = insert(rollup)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[rollup.c.user_id, rollup.c.day, rollup.c.activity_type, rollup.c.content_type],
+        set_={
+            "count": rollup.c.count + statement.excluded.count,
+            "last_at": func.greatest(rollup.c.last_at, statement.excluded.last_at),
+        },
+    ), rollup_rows(activities))
+
+    last_seen: Dict[Any, datetime] = defaultdict(lambda: datetime.min.replace(tzinfo=timezone.utc))
+    for activity in activities:
+        last_seen[activity["user_id"]] = max(last_seen[activity["user_id"]], activity["activity_date"])
+    db.execute(
+        update(User.__table__)
+        .where(User.__table__.c.id == bindparam("uid"))
+        .values(last_activity=func.greatest(User.__table__.c.last_activity, bindparam("seen"))),
+        [{"uid": user_id, "seen": seen} for user_id, seen in last_seen.items()],
+    )
+    db.commit()
+
+
+class ActivityWriter:
+    """
+    Queues activity events and writes them in batches from a background task.
+
+    A batch is written every ``flush_interval`` seconds, or sooner once
+    ``max_batch`` events are waiting. If a write fails the batch is retried
+    one row at a time: rows the database rejects are dropped with an error
+    logged, so one bad event can't hold up the rest. If the database is
+    unavailable the unwritten rows are put back and retried on the next
+    flush, up to ``max_buffer`` events; beyond that the oldest events are
+    dropped with an error logged.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        flush_interval: float = 1.0,
+        max_batch: int = 1000,
+        max_buffer: int = 100_000,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_buffer = max_buffer
+        self._buffer: List[Dict[str, Any]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def record(self, activity: Dict[str, Any]) -> None:
+        """Queue one user_activities row. The row must carry its id and activity_date."""
+        self._buffer.append(activity)
+        if self._task is None:
+            self.start()
+        if len(self._buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything queued so far. Returns the number of events written."""
+        written = 0
+        async with self._flush_lock or asyncio.Lock():
+            while self._buffer:
+                batch, self._buffer = self._buffer[:self.max_batch], self._buffer[self.max_batch:]
+                try:
+                    await asyncio.to_thread(self._write, batch)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(batch)} user activities, retrying one at a time: {e}")
+                    retried, unwritten = await self._write_rows(batch)
+                    written += retried
+                    if not unwritten:
+                        continue
+                    self._buffer[:0] = unwritten
+                    overflow = len(self._buffer) - self.max_buffer
+                    if overflow > 0:
+                        del self._buffer[:overflow]
+                        logger.error(f"Dropped {overflow} user activities; buffer is full")
+                    break
+                written += len(batch)
+        return written
+
+    async def _write_rows(self, batch: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Write a failed batch row by row.
+
+        Returns the number of rows written and the rows left unwritten
+        because the database failed for a reason other than the row itself.
+        """
+        written = 0
+        for i, activity in enumerate(batch):
+            try:
+                await asyncio.to_thread(self._write, [activity])
+            except (DataError, IntegrityError) as e:
+                logger.error(
+                    f"Dropped user activity {activity.get('id')} "
+                    f"({activity.get('activity_type')!r}) rejected by the database: {e}"
+                )
+            except Exception:
+                return written, batch[i:]
+            else:
+                written += 1
+        return written, []
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        db = self.session_factory()
+        try:
+            write_activity_batch(db, batch)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+activity_writer = ActivityWriter()
+
+
+# ============================================================================
+# MONTHLY PARTITIONS
+# ============================================================================
+
+def _month_start(day: date, offset: int = 0) -> date:
+    month = day.year * 12 + day.month - 1 + offset
+    return date(month // 12, month % 12 + 1, 1)
+
+
+ENSURE_ACTIVITY_PARTITIONS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION openpolicy.ensure_activity_partitions(
+        months_ahead integer DEFAULT 2, today date DEFAULT NULL
+    )
+    RETURNS SETOF text
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        this_month timestamp := date_trunc('month', COALESCE(today, CAST(now() AT TIME ZONE 'UTC' AS date))::timestamp);
+        month_start timestamptz;
+        month_end timestamptz;
+        partition_name text;
+    BEGIN
+        -- Held until the caller commits: gateway replicas starting together
+        -- and the ETL job would otherwise all see a month missing and race
+        -- to create and attach it
+        PERFORM pg_advisory_xact_lock(hashtext('public.user_activities partitions'));
+
+        FOR month_offset IN 0..months_ahead LOOP
+            month_start := (this_month + make_interval(months => month_offset)) AT TIME ZONE 'UTC';
+            month_end := (this_month + make_interval(months => month_offset + 1)) AT TIME ZONE 'UTC';
+            partition_name := to_char(this_month + make_interval(months => month_offset),
+                                      '"user_activities_y"YYYY"m"MM');
+            RETURN NEXT partition_name;
+            CONTINUE WHEN to_regclass('public.' || partition_name) IS NOT NULL;
+
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS public.%I '
+                '(LIKE public.user_activities INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                partition_name
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM public.user_activities_default '
+                'WHERE activity_date >= $1 AND activity_date < $2 RETURNING *) '
+                'INSERT INTO public.%I SELECT * FROM moved',
+                partition_name
+            ) USING month_start, month_end;
+            EXECUTE format(
+                'ALTER TABLE public.user_activities ATTACH PARTITION public.%I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, month_end
+            );
+        END LOOP;
+    END;
+    $$
+"""
+
+
+def ensure_activity_partitions(db: Session, months_ahead: int = 2, today: Optional[date] = None) -> List[str]:
+    """
+    Create the monthly user_activities partitions for this month and the next ``months_ahead``.
+
+    Rows written before a month's partition existed sit in
+    user_activities_default, which would make attaching the partition fail,
+    so they are moved into the new partition in the same transaction. The
+    work is done by openpolicy.ensure_activity_partitions() (migration
+    019_activity_partition_function) under an advisory lock, so the gateway
+    at startup and the ETL's daily activity_partitions job can both call it.
+    """
+    created = db.execute(
+        text("SELECT * FROM openpolicy.ensure_activity_partitions(:months_ahead, CAST(:today AS date))"),
+        {"months_ahead": months_ahead, "today": today},
+    ).scalars().all()
+    db.commit()
+    return list(created)
+
+
+def drop_activity_partitions(db: Session, before: date) -> List[str]:
+    """
+    Drop monthly user_activities partitions that end on or before ``before``.
+
+    Dropping a partition is a metadata operation, unlike a DELETE over the
+    same rows. Statistics are unaffected because they read the rollup.
+    """
+    names = db.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'user_activities' AND child.relname ~ '^user_activities_y[0-9]{4}m[0-9]{2}$'
+    """)).scalars().all()
+    dropped = []
+    for name in sorted(names):
+        start = date(int(name[-7:-3]), int(name[-2:]), 1)
+        if _month_start(start, 1) <= before:
+            db.execute(text(f"DROP TABLE public.{name}"))
+            dropped.append(name)
+    db.commit()
+    logger.info(f"Dropped {len(dropped)} user activity partitions before {before}")
+    return dropped
@@ -0,0 +1,217 @@
+"""
+Debate Days Read Model
+
+openpolicy.debate_days holds one row per sitting date with the number of
+statements, votes and distinct bills voted on, plus the first and last
+timestamps of the day. /debates pages through it with a keyset on
+sitting_date instead of aggregating votes and statements per request.
+
+refresh_debate_days recomputes a date range with one grouped range scan
+over statements and one over votes, through the
+openpolicy.refresh_debate_days() database function that the ETL daily
+pipeline also calls once its ingestion jobs finish. Sitting days newer than the newest
+row are not in the table yet, so readers compute those few days live from
+statements and votes (see live_debate_days).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Date, desc, distinct, func, text
+from sqlalchemy.orm import Session
+
+from app.models.openparliament import DebateDay, Statement, Vote
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Replaces the debate_days rows for sitting dates between start_date and
+# end_date (inclusive, NULL for open) and returns the number written.
+# Created by migration 013_debate_days; the ETL read_models job calls it
+# after ingestion. The bounds are coalesced rather than tested for NULL so
+# both range scans stay on the time and vote_date indexes.
+REFRESH_DEBATE_DAYS_FUNCTION = """
+    CREATE OR REPLACE FUNCTION openpolicy.refresh_debate_days(
+        start_date date DEFAULT NULL, end_date date DEFAULT NULL
+    )
+    RETURNS integer
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        low date := COALESCE(start_date, '-infinity'::date);
+        high date := COALESCE(end_date + 1, 'infinity'::date);
+        written integer;
+    BEGIN
+        DELETE FROM openpolicy.debate_days
+        WHERE sitting_date >= low AND sitting_date < high;
+
+        INSERT INTO openpolicy.debate_days
+            (sitting_date, statement_count, vote_count, bill_count, first_at, last_at, updated_at)
+        SELECT COALESCE(s.sitting_date, v.sitting_date),
+               COALESCE(s.statement_count, 0),
+               COALESCE(v.vote_count, 0),
+               COALESCE(v.bill_count, 0),
+               LEAST(s.first_at, v.first_at),
+               GREATEST(s.last_at, v.last_at),
+               now()
+        FROM (
+            SELECT CAST(time AS date) AS sitting_date, count(*) AS statement_count,
+                   min(time) AS first_at, max(time) AS last_at
+            FROM openpolicy.statements
+            WHERE time >= low AND time < high
+            GROUP BY 1
+        ) s
+        FULL JOIN (
+            SELECT CAST(vote_date AS date) AS sitting_date, count(*) AS vote_count,
+                   count(DISTINCT bill_id) AS bill_count,
+                   min(vote_date) AS first_at, max(vote_date) AS last_at
+            FROM openpolicy.votes
+            WHERE vote_date >= low AND vote_date < high
+            GROUP BY 1
+        ) v ON v.sitting_date = s.sitting_date;
+
+        GET DIAGNOSTICS written = ROW_COUNT;
+        RETURN written;
+    END;
+    $$
+"""
+
+
+def refresh_debate_days(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """
+    Recompute debate_days rows for sitting dates between start and end (inclusive).
+
+    Both bounds default to open, which rebuilds the whole table. Rows are
+    replaced in a single transaction, so readers see either the old or the
+    new counts for a day. Days that no longer have any statements or votes
+    are dropped.
+
+    Returns:
+        Number of sitting days written
+    """
+    written = db.execute(
+        text("SELECT openpolicy.refresh_debate_days(:start, :end)"), {"start": start, "end": end}
+    ).scalar_one()
+    db.commit()
+    logger.info(f"Refreshed {written} debate days ({start or 'start'} to {end or 'end'})")
+    return written
+
+
+def live_debate_days(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> List[DebateDay]:
+    """
+    Compute sitting days between start and end (inclusive) straight from
+    statements and votes, newest first.
+
+    The rows are transient DebateDay objects and are never added to the
+    session.
+    """
+    statement_day = func.date(Statement.time, type_=Date)
+    vote_day = func.date(Vote.vote_date, type_=Date)
+    statements = db.query(
+        statement_day, func.count(Statement.id), func.min(Statement.time), func.max(Statement.time)
+    )
+    votes = db.query(
+        vote_day, func.count(Vote.id), func.count(distinct(Vote.bill_id)),
+        func.min(Vote.vote_date), func.max(Vote.vote_date)
+    )
+    if start is not None:
+        statements = statements.filter(Statement.time >= start)
+        votes = votes.filter(Vote.vote_date >= start)
+    if end is not None:
+        statements = statements.filter(Statement.time < end + timedelta(days=1))
+        votes = votes.filter(Vote.vote_date < end + timedelta(days=1))
+
+    days = {}
+    for sitting_date, count, first_at, last_at in statements.group_by(statement_day):
+        days[sitting_date] = DebateDay(
+            sitting_date=sitting_date, statement_count=count, vote_count=0, bill_count=0,
+            first_at=first_at, last_at=last_at,
+        )
+    for sitting_date, count, bills, first_at, last_at in votes.group_by(vote_day):
+        day = days.get(sitting_date)
+        if day is None:
+            day = days[sitting_date] = DebateDay(
+                sitting_date=sitting_date, statement_count=0, first_at=first_at, last_at=last_at
+            )
+        day.vote_count = count
+        day.bill_count = bills
+        day.first_at = min(day.first_at, first_at)
+        day.last_at = max(day.last_at, last_at)
+    return sorted(days.values(), key=lambda day: day.sitting_date, reverse=True)
+
+
+def _uncovered_days(db: Session, date_gte: Optional[date], date_lte: Optional[date]) -> List[DebateDay]:
+    """Live rows for the sitting days after the newest debate_days row."""
+    covered_through = db.query(func.max(DebateDay.sitting_date)).scalar()
+    start = covered_through + timedelta(days=1) if covered_through is not None else None
+    if date_gte is not None and (start is None or date_gte > start):
+        start = date_gte
+    if start is not None and date_lte is not None and start > date_lte:
+        return []
+    return live_debate_days(db, start, date_lte)
+
+
+@dataclass
+class DebateDayPage:
+    """One keyset page of sitting days, newest first."""
+    days: List[DebateDay]
+    total: int
+    next_cursor: Optional[date]
+
+
+def page_debate_days(
+    db: Session,
+    date_gte: Optional[date] = None,
+    date_lte: Optional[date] = None,
+    before: Optional[date] = None,
+    offset: int = 0,
+    limit: int = 20,
+) -> DebateDayPage:
+    """
+    Page through sitting days newest first.
+
+    ``before`` is the cursor returned as ``next_cursor`` by the previous
+    page; when it is given ``offset`` is ignored. The total is counted over
+    debate_days, which has one row per sitting and stays small. Days newer
+    than the newest debate_days row come first and are computed live.
+    """
+    live = _uncovered_days(db, date_gte, date_lte)
+    query = db.query(DebateDay)
+    if date_gte is not None:
+        query = query.filter(DebateDay.sitting_date >= date_gte)
+    if date_lte is not None:
+        query = query.filter(DebateDay.sitting_date <= date_lte)
+    total = query.count() + len(live)
+
+    query = query.order_by(desc(DebateDay.sitting_date))
+    if before is not None:
+        live = [day for day in live if day.sitting_date < before]
+        query = query.filter(DebateDay.sitting_date < before)
+    elif offset:
+        skipped = min(offset, len(live))
+        live = live[skipped:]
+        offset -= skipped
+        if offset:
+            query = query.offset(offset)
+    days = live[:limit + 1]
+    if len(days) <= limit:
+        days += query.limit(limit + 1 - len(days)).all()
+
+    next_cursor = days[limit - 1].sitting_date if len(days) > limit else None
+    return DebateDayPage(days=days[:limit], total=total, next_cursor=next_cursor)
+
+
+def debate_day_totals(db: Session) -> Tuple[int, int, Optional[date]]:
+    """Number of sitting days, total statements and the latest sitting date."""
+    sittings, statements, latest = db.query(
+        func.count(DebateDay.sitting_date),
+        func.coalesce(func.sum(DebateDay.statement_count), 0),
+        func.max(DebateDay.sitting_date),
+    ).filter(DebateDay.statement_count > 0).one()
+    live = [day for day in _uncovered_days(db, None, None) if day.statement_count > 0]
+    if live:
+        sittings += len(live)
+        statements += sum(day.statement_count for day in live)
+        latest = live[0].sitting_date
+    return sittings, statements, latest
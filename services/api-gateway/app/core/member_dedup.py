@@ -0,0 +1,254 @@
+"""
+Member Duplicate Detection
+
+Fuzzy duplicate detection for members using blocking keys.
+
+Comparing every member with every other member is O(n²). Instead each
+member is assigned a handful of blocking keys (phonetic code of the
+name, email local-part, normalised phone number, normalised riding
+plus surname code) and only members that share at least one block are
+scored against each other, which keeps the scan close to linear.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Blocks larger than this are dominated by common keys (e.g. a shared
+# switchboard number) and would reintroduce quadratic work
+DEFAULT_MAX_BLOCK_SIZE = 200
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lower-case, strip accents and drop everything but letters, digits and spaces."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    ascii_only = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(re.sub(r"[^a-z0-9 ]+", " ", ascii_only).split())
+
+
+def soundex(value: Optional[str]) -> str:
+    """American Soundex code of the first word, e.g. 'Robert' -> 'R163'."""
+    letters = re.sub(r"[^a-z]", "", normalize_text(value))
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def email_local_part(email: Optional[str]) -> str:
+    """Local part of an address without dots or +tags, e.g. 'j.doe+x@a.ca' -> 'jdoe'."""
+    if not email or "@" not in email:
+        return ""
+    local = email.split("@", 1)[0].lower().split("+", 1)[0]
+    return local.replace(".", "").replace("_", "").replace("-", "")
+
+
+def normalize_phone(phone: Optional[str]) -> str:
+    """Last ten digits of a phone number (drops the North American country code)."""
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-10:] if len(digits) >= 10 else ""
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler similarity in [0, 1]."""
+    if a == b:
+        return 1.0 if a else 0.0
+    if not a or not b:
+        return 0.0
+
+    window = max(max(len(a), len(b)) // 2 - 1, 0)
+    a_matches = [False] * len(a)
+    b_matches = [False] * len(b)
+    matches = 0
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(i + window + 1, len(b))):
+            if not b_matches[j] and b[j] == char:
+                a_matches[i] = b_matches[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+
+    transpositions = 0
+    j = 0
+    for i, matched in enumerate(a_matches):
+        if matched:
+            while not b_matches[j]:
+                j += 1
+            if a[i] != b[j]:
+                transpositions += 1
+            j += 1
+
+    jaro = (matches / len(a) + matches / len(b) + (matches - transpositions / 2) / matches) / 3
+    prefix = 0
+    for char_a, char_b in zip(a[:4], b[:4], strict=False):  # either name may be shorter
+        if char_a != char_b:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+def trigrams(value: str) -> Set[str]:
+    """Trigram set using the same padding as PostgreSQL pg_trgm."""
+    grams = set()
+    for word in value.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """pg_trgm style similarity: shared trigrams over union of trigrams."""
+    return _set_similarity(trigrams(a), trigrams(b))
+
+
+def _set_similarity(grams_a: Set[str], grams_b: Set[str]) -> float:
+    if not grams_a or not grams_b:
+        return 0.0
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+@dataclass
+class MemberRecord:
+    """Fields of a member that take part in duplicate detection."""
+
+    id: Any
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    district: Optional[str] = None
+    full_name: str = field(init=False)
+    name_trigrams: Set[str] = field(init=False, repr=False)
+    email_key: str = field(init=False, repr=False)
+    phone_key: str = field(init=False, repr=False)
+    district_key: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Normalise once per record rather than once per compared pair
+        self.full_name = normalize_text(f"{self.first_name} {self.last_name}")
+        self.name_trigrams = trigrams(self.full_name)
+        self.email_key = email_local_part(self.email)
+        self.phone_key = normalize_phone(self.phone)
+        self.district_key = normalize_text(self.district)
+
+
+def blocking_keys(record: MemberRecord) -> List[str]:
+    """Blocking keys for a member; two members are compared only if they share one."""
+    keys = []
+    surname_code = soundex(record.last_name)
+    if surname_code:
+        keys.append(f"name:{surname_code}:{soundex(record.first_name)}")
+    if record.email_key:
+        keys.append(f"email:{record.email_key}")
+    if record.phone_key:
+        keys.append(f"phone:{record.phone_key}")
+    if record.district_key and surname_code:
+        keys.append(f"riding:{record.district_key}:{surname_code}")
+    return keys
+
+
+def score_pair(a: MemberRecord, b: MemberRecord) -> Tuple[float, List[str]]:
+    """
+    Score how likely two members are the same person.
+
+    Name similarity is the base score; matching email, phone or riding add
+    evidence. Returns the score in [0, 1] and the reasons that contributed.
+    """
+    name_score = max(
+        jaro_winkler(a.full_name, b.full_name),
+        _set_similarity(a.name_trigrams, b.name_trigrams),
+    )
+    reasons = [f"name:{name_score:.2f}"]
+    bonus = 0.0
+    if a.email_key and a.email_key == b.email_key:
+        bonus += 0.15
+        reasons.append("email")
+    if a.phone_key and a.phone_key == b.phone_key:
+        bonus += 0.1
+        reasons.append("phone")
+    if a.district_key and a.district_key == b.district_key:
+        bonus += 0.05
+        reasons.append("riding")
+    return min(1.0, name_score * 0.85 + bonus), reasons
+
+
+class DuplicateDetector:
+    """Blocking-key duplicate detector over a set of member records."""
+
+    def __init__(self, threshold: float = 0.85, max_block_size: int = DEFAULT_MAX_BLOCK_SIZE):
+        """
+        Initialize detector.
+
+        Args:
+            threshold: Minimum pair score reported as a duplicate
+            max_block_size: Blocks larger than this are skipped
+        """
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+        self.pairs_compared = 0
+        self.skipped_blocks = 0
+
+    def build_blocks(self, records: Iterable[MemberRecord]) -> Dict[str, List[MemberRecord]]:
+        blocks: Dict[str, List[MemberRecord]] = {}
+        for record in records:
+            for key in blocking_keys(record):
+                blocks.setdefault(key, []).append(record)
+        return blocks
+
+    def find_duplicates(self, records: Iterable[MemberRecord]) -> List[Dict[str, Any]]:
+        """Return candidate duplicate pairs sorted by descending score."""
+        self.pairs_compared = 0
+        self.skipped_blocks = 0
+        seen: Set[Tuple[Any, Any]] = set()
+        results = []
+
+        for key, block in self.build_blocks(records).items():
+            if len(block) < 2:
+                continue
+            if len(block) > self.max_block_size:
+                self.skipped_blocks += 1
+                logger.warning(f"Skipping oversized duplicate block {key} ({len(block)} members)")
+                continue
+            for i, a in enumerate(block):
+                for b in block[i + 1:]:
+                    pair = (a.id, b.id) if str(a.id) < str(b.id) else (b.id, a.id)
+                    if a.id == b.id or pair in seen:
+                        continue
+                    seen.add(pair)
+                    self.pairs_compared += 1
+                    score, reasons = score_pair(a, b)
+                    if score >= self.threshold:
+                        results.append({
+                            "member_ids": [str(pair[0]), str(pair[1])],
+                            "names": [a.full_name, b.full_name],
+                            "score": round(score, 4),
+                            "reasons": reasons,
+                        })
+
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results
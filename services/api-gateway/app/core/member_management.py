@@ -5,14 +5,13 @@ Business logic for member management functionality.
 Implements FEAT-015 Member Management (P0 priority).
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime, date
-from uuid import UUID
+from uuid import UUID, uuid4
 import csv
-import json
 import io
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func
+from sqlalchemy import or_, and_, func, select, insert, literal, text
 from fastapi import HTTPException, status
 from app.models.openparliament import Member, Party, Jurisdiction
 from app.models.member_management import (
@@ -28,10 +27,18 @@ from app.schemas.member_management import (
     BulkMemberImport, BulkOperationRequest, MemberDuplicateCheck,
     MemberMergeRequest, MemberExportRequest, MemberMetricsUpdate
 )
+from app.core.responses import dumps
+from app.core.member_dedup import DuplicateDetector, MemberRecord
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns written by bulk imports, in staging table order
+IMPORT_COLUMNS = (
+    "id", "jurisdiction_id", "party_id", "first_name", "last_name", "full_name",
+    "email", "phone", "website", "district", "role", "start_date", "end_date"
+)
+
 
 class MemberManagementService:
     """Service for managing members."""
@@ -241,7 +248,14 @@ class MemberManagementService:
         import_data: BulkMemberImport,
         user: User
     ) -> MemberImport:
-        """Bulk import members from various sources."""
+        """
+        Bulk import members from various sources.
+        
+        Rows are validated in bulk, copied into a temporary staging table and
+        merged into members in a single statement, matching existing members
+        on (jurisdiction_id, lower(first_name), lower(last_name)). Invalid rows
+        are reported per row in the import record's errors. Requires PostgreSQL.
+        """
         import_record = MemberImport(
             import_source=import_data.import_source,
             import_type=import_data.import_type,
@@ -252,58 +266,35 @@ class MemberManagementService:
         self.db.flush()
         
         try:
-            members_data = []
+            errors = []
             
             # Parse data based on source
             if import_data.import_source == "csv" and import_data.csv_data:
-                members_data = self._parse_csv_import(import_data.csv_data)
+                members_data, errors = self._parse_csv_import(import_data.csv_data)
             elif import_data.member_data:
-                members_data = import_data.member_data
+                members_data = list(enumerate(import_data.member_data))
             else:
                 raise ValueError("No import data provided")
             
-            import_record.total_records = len(members_data)
-            errors = []
+            import_record.total_records = len(members_data) + len(errors)
+            valid_rows, validation_errors = self._validate_import_rows(members_data)
+            errors.extend(validation_errors)
             
-            for idx, member_data in enumerate(members_data):
-                try:
-                    if import_data.dry_run:
-                        # Just validate
-                        self._validate_member_data(member_data)
-                    else:
-                        # Check for existing member
-                        existing = self._find_existing_member(member_data)
-                        
-                        if existing and import_data.update_existing:
-                            # Update existing
-                            self.update_member(
-                                existing.id,
-                                MemberUpdate(**member_data.dict()),
-                                user,
-                                reason=f"Bulk import update from {import_data.import_source}"
-                            )
-                            import_record.updated_count += 1
-                        elif not existing:
-                            # Create new
-                            self.create_member(member_data, user)
-                            import_record.created_count += 1
-                    
-                    import_record.processed_records += 1
-                    
-                except Exception as e:
-                    import_record.error_count += 1
-                    errors.append({
-                        "index": idx,
-                        "member": member_data.dict() if hasattr(member_data, 'dict') else member_data,
-                        "error": str(e)
-                    })
+            if not import_data.dry_run and valid_rows:
+                created, updated = self._upsert_members(valid_rows, import_data, user)
+                import_record.created_count += created
+                import_record.updated_count += updated
             
+            import_record.processed_records += len(valid_rows)
+            import_record.error_count += len(errors)
             import_record.status = "completed"
             import_record.completed_at = datetime.utcnow()
             if errors:
-                import_record.errors = errors
+                import_record.errors = sorted(errors, key=lambda error: error["index"])
             
         except Exception as e:
+            self.db.rollback()
+            self.db.add(import_record)
             import_record.status = "failed"
             import_record.errors = [{"error": str(e)}]
             import_record.completed_at = datetime.utcnow()
@@ -317,43 +308,44 @@ class MemberManagementService:
         operation_request: BulkOperationRequest,
         user: User
     ) -> Dict[str, Any]:
-        """Perform bulk operations on members."""
+        """Perform bulk operations on members with set-based statements."""
         start_time = datetime.utcnow()
-        success_count = 0
-        errors = []
+        member_ids = list(dict.fromkeys(operation_request.member_ids))
+        parameters = operation_request.parameters or {}
         
-        for member_id in operation_request.member_ids:
-            try:
-                if operation_request.operation == "delete":
-                    self.delete_member(
-                        member_id, 
-                        user,
-                        operation_request.reason or "Bulk delete"
-                    )
-                elif operation_request.operation == "archive":
-                    member = self.db.query(Member).filter(Member.id == member_id).first()
-                    if member and not member.end_date:
-                        member.end_date = date.today()
-                        self._create_audit_log(
-                            member_id=member_id,
-                            user_id=user.id,
-                            action="archive",
-                            reason=operation_request.reason
-                        )
-                elif operation_request.operation == "tag":
-                    tag_ids = operation_request.parameters.get('tag_ids', [])
-                    self._add_tags_to_member(member_id, tag_ids, user.id)
-                elif operation_request.operation == "untag":
-                    tag_ids = operation_request.parameters.get('tag_ids', [])
-                    self._remove_tags_from_member(member_id, tag_ids)
-                
-                success_count += 1
+        # One lookup decides which ids exist; the rest are reported as errors
+        found = {
+            row.id: row.end_date
+            for row in self.db.query(Member.id, Member.end_date).filter(Member.id.in_(member_ids))
+        }
+        errors = [
+            {"member_id": str(member_id), "error": "Member not found"}
+            for member_id in member_ids if member_id not in found
+        ]
+        existing_ids = [member_id for member_id in member_ids if member_id in found]
+        
+        if existing_ids:
+            operation = operation_request.operation
+            if operation in ("delete", "archive"):
+                # Soft delete / archive by setting end date in one UPDATE
+                self.db.query(Member).filter(
+                    Member.id.in_(existing_ids),
+                    Member.end_date.is_(None)
+                ).update({Member.end_date: date.today()}, synchronize_session=False)
                 
-            except Exception as e:
-                errors.append({
-                    "member_id": str(member_id),
-                    "error": str(e)
-                })
+                audited = existing_ids if operation == "delete" else [
+                    member_id for member_id in existing_ids if found[member_id] is None
+                ]
+                self._bulk_audit_log(
+                    audited,
+                    user_id=user.id,
+                    action=operation,
+                    reason=operation_request.reason or ("Bulk delete" if operation == "delete" else None)
+                )
+            elif operation == "tag":
+                self._add_tags_to_members(existing_ids, parameters.get('tag_ids', []), user.id)
+            elif operation == "untag":
+                self._remove_tags_from_members(existing_ids, parameters.get('tag_ids', []))
         
         self.db.commit()
         
@@ -362,7 +354,7 @@ class MemberManagementService:
         return {
             "operation": operation_request.operation,
             "total_count": len(operation_request.member_ids),
-            "success_count": success_count,
+            "success_count": len(existing_ids),
             "error_count": len(errors),
             "errors": errors if errors else None,
             "duration_seconds": duration
@@ -402,6 +394,47 @@ class MemberManagementService:
             for m in duplicates
         ]
     
+    def scan_duplicates(
+        self,
+        threshold: float = 0.85,
+        current_only: bool = False,
+        jurisdiction_id: Optional[UUID] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Scan all members for likely duplicates.
+
+        Unlike check_duplicates, which matches one candidate exactly, this
+        compares members fuzzily within blocking keys (see member_dedup).
+        """
+        query = select(
+            Member.id, Member.first_name, Member.last_name,
+            Member.email, Member.phone, Member.district
+        )
+        if current_only:
+            query = query.where(Member.end_date.is_(None))
+        if jurisdiction_id:
+            query = query.where(Member.jurisdiction_id == jurisdiction_id)
+
+        records = [
+            MemberRecord(
+                id=row.id, first_name=row.first_name or "", last_name=row.last_name or "",
+                email=row.email, phone=row.phone, district=row.district
+            )
+            for row in self.db.execute(query)
+        ]
+
+        detector = DuplicateDetector(threshold=threshold)
+        pairs = detector.find_duplicates(records)
+
+        return {
+            "members_scanned": len(records),
+            "pairs_compared": detector.pairs_compared,
+            "skipped_blocks": detector.skipped_blocks,
+            "total": len(pairs),
+            "duplicates": pairs[:limit]
+        }
+    
     def merge_members(
         self,
         merge_request: MemberMergeRequest,
@@ -485,29 +518,101 @@ class MemberManagementService:
         return primary
     
     # Export functionality
+    EXPORT_FIELDS = [
+        'id', 'first_name', 'last_name', 'full_name', 'email', 'phone',
+        'website', 'district', 'role', 'party', 'jurisdiction',
+        'start_date', 'end_date'
+    ]
+    EXPORT_BATCH_SIZE = 1000
+    
     def export_members(
         self,
         export_request: MemberExportRequest,
         member_ids: Optional[List[UUID]] = None
     ) -> bytes:
         """Export members in various formats."""
-        # Get members
-        query = self.db.query(Member).options(
-            joinedload(Member.party),
-            joinedload(Member.jurisdiction)
-        )
+        return b"".join(self.iter_export_members(export_request, member_ids))
+    
+    def iter_export_members(
+        self,
+        export_request: MemberExportRequest,
+        member_ids: Optional[List[UUID]] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream an export as encoded chunks.
+        
+        Members are read through a server-side cursor in batches, so memory
+        stays constant regardless of how many members are exported.
+        """
+        if export_request.format == "csv":
+            writer = self._export_csv
+        elif export_request.format == "ndjson":
+            writer = self._export_ndjson
+        elif export_request.format == "json":
+            writer = self._export_json
+        else:
+            raise ValueError(f"Unsupported export format: {export_request.format}")
         
-        if member_ids:
-            query = query.filter(Member.id.in_(member_ids))
+        return writer(self._iter_export_batches(export_request, member_ids))
+    
+    def _iter_export_batches(
+        self,
+        export_request: MemberExportRequest,
+        member_ids: Optional[List[UUID]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield batches of member dicts ready for serialisation."""
+        query = select(
+            Member.id, Member.first_name, Member.last_name, Member.full_name,
+            Member.email, Member.phone, Member.website, Member.district, Member.role,
+            Party.name.label("party"), Jurisdiction.name.label("jurisdiction"),
+            Member.start_date, Member.end_date
+        ).outerjoin(Party, Member.party_id == Party.id).outerjoin(
+            Jurisdiction, Member.jurisdiction_id == Jurisdiction.id
+        ).order_by(Member.id).execution_options(yield_per=self.EXPORT_BATCH_SIZE)
         
-        members = query.all()
+        if member_ids:
+            query = query.where(Member.id.in_(member_ids))
         
-        if export_request.format == "json":
-            return self._export_json(members, export_request)
-        elif export_request.format == "csv":
-            return self._export_csv(members, export_request)
-        else:
-            raise ValueError(f"Unsupported export format: {export_request.format}")
+        for partition in self.db.execute(query).partitions():
+            batch = [dict(row._mapping) for row in partition]
+            ids = [member["id"] for member in batch]
+            
+            contacts = self._group_by_member(MemberContact, ids) if export_request.include_contacts else None
+            social_media = self._group_by_member(MemberSocialMedia, ids) if export_request.include_social_media else None
+            
+            for member in batch:
+                if contacts is not None:
+                    member["contacts"] = [
+                        {
+                            "type": c.contact_type,
+                            "address": f"{c.address_line1 or ''} {c.address_line2 or ''}".strip(),
+                            "city": c.city,
+                            "province": c.province,
+                            "postal_code": c.postal_code,
+                            "phone": c.phone,
+                            "email": c.email
+                        }
+                        for c in contacts.get(member["id"], [])
+                    ]
+                if social_media is not None:
+                    member["social_media"] = [
+                        {
+                            "platform": sm.platform,
+                            "handle": sm.handle,
+                            "url": sm.url,
+                            "verified": sm.verified
+                        }
+                        for sm in social_media.get(member["id"], [])
+                    ]
+            
+            yield batch
+    
+    def _group_by_member(self, model, member_ids: List[UUID]) -> Dict[UUID, List[Any]]:
+        """Load child rows for a batch of members in one query."""
+        grouped: Dict[UUID, List[Any]] = {}
+        for row in self.db.query(model).filter(model.member_id.in_(member_ids)):
+            grouped.setdefault(row.member_id, []).append(row)
+        return grouped
     
     # Tag management
     def create_tag(self, tag_data: TagCreate) -> MemberTag:
@@ -575,94 +680,209 @@ class MemberManagementService:
         )
         self.db.add(audit)
     
-    def _parse_csv_import(self, csv_data: str) -> List[MemberCreate]:
-        """Parse CSV data for import."""
+    def _bulk_audit_log(
+        self,
+        member_ids: List[UUID],
+        user_id: UUID,
+        action: str,
+        reason: Optional[str] = None
+    ) -> None:
+        """Create audit log entries for many members in one INSERT."""
+        if not member_ids:
+            return
+        self.db.execute(
+            insert(MemberAudit.__table__),
+            [
+                {"id": uuid4(), "member_id": member_id, "user_id": user_id, "action": action, "reason": reason}
+                for member_id in member_ids
+            ]
+        )
+    
+    def _parse_csv_import(self, csv_data: str) -> Tuple[List[Tuple[int, MemberCreate]], List[Dict[str, Any]]]:
+        """Parse CSV data for import, collecting per-row parse errors."""
         members = []
+        errors = []
         reader = csv.DictReader(io.StringIO(csv_data))
         
-        for row in reader:
-            # Map CSV fields to MemberCreate schema
-            member_data = MemberCreate(
-                first_name=row['first_name'],
-                last_name=row['last_name'],
-                email=row.get('email'),
-                phone=row.get('phone'),
-                website=row.get('website'),
-                district=row.get('district'),
-                role=row.get('role'),
-                party_id=row.get('party_id'),
-                jurisdiction_id=row['jurisdiction_id'],
-                start_date=row['start_date'],
-                end_date=row.get('end_date')
-            )
-            members.append(member_data)
+        for idx, row in enumerate(reader):
+            try:
+                # Map CSV fields to MemberCreate schema
+                member_data = MemberCreate(
+                    first_name=row['first_name'],
+                    last_name=row['last_name'],
+                    email=row.get('email') or None,
+                    phone=row.get('phone') or None,
+                    website=row.get('website') or None,
+                    district=row.get('district') or None,
+                    role=row.get('role') or None,
+                    party_id=row.get('party_id') or None,
+                    jurisdiction_id=row['jurisdiction_id'],
+                    start_date=row['start_date'],
+                    end_date=row.get('end_date') or None
+                )
+                members.append((idx, member_data))
+            except Exception as e:
+                errors.append({"index": idx, "member": dict(row), "error": str(e)})
         
-        return members
+        return members, errors
     
-    def _validate_member_data(self, member_data: MemberCreate) -> None:
-        """Validate member data."""
-        # Check jurisdiction exists
-        jurisdiction = self.db.query(Jurisdiction).filter(
-            Jurisdiction.id == member_data.jurisdiction_id
-        ).first()
-        
-        if not jurisdiction:
-            raise ValueError(f"Invalid jurisdiction_id: {member_data.jurisdiction_id}")
+    def _validate_import_rows(
+        self,
+        members_data: List[Tuple[int, MemberCreate]]
+    ) -> Tuple[List[Tuple[int, MemberCreate]], List[Dict[str, Any]]]:
+        """Validate import rows with one lookup per referenced table."""
+        jurisdiction_ids = {m.jurisdiction_id for _, m in members_data}
+        party_ids = {m.party_id for _, m in members_data if m.party_id}
+        
+        known_jurisdictions = {
+            row.id for row in self.db.query(Jurisdiction.id).filter(Jurisdiction.id.in_(jurisdiction_ids))
+        } if jurisdiction_ids else set()
+        known_parties = {
+            row.id for row in self.db.query(Party.id).filter(Party.id.in_(party_ids))
+        } if party_ids else set()
+        
+        valid = []
+        errors = []
+        seen: Dict[Tuple[Any, str, str], int] = {}
+        for idx, member_data in members_data:
+            key = (member_data.jurisdiction_id, member_data.first_name.lower(), member_data.last_name.lower())
+            if member_data.jurisdiction_id not in known_jurisdictions:
+                error = f"Invalid jurisdiction_id: {member_data.jurisdiction_id}"
+            elif member_data.party_id and member_data.party_id not in known_parties:
+                error = f"Invalid party_id: {member_data.party_id}"
+            elif key in seen:
+                error = f"Duplicate of row {seen[key]} in this import"
+            else:
+                seen[key] = idx
+                valid.append((idx, member_data))
+                continue
+            errors.append({"index": idx, "member": member_data.dict(), "error": error})
         
-        # Check party exists if provided
-        if member_data.party_id:
-            party = self.db.query(Party).filter(
-                Party.id == member_data.party_id
-            ).first()
-            
-            if not party:
-                raise ValueError(f"Invalid party_id: {member_data.party_id}")
+        return valid, errors
     
-    def _find_existing_member(self, member_data: MemberCreate) -> Optional[Member]:
-        """Find existing member based on name and jurisdiction."""
-        return self.db.query(Member).filter(
-            and_(
-                func.lower(Member.first_name) == member_data.first_name.lower(),
-                func.lower(Member.last_name) == member_data.last_name.lower(),
-                Member.jurisdiction_id == member_data.jurisdiction_id
+    def _upsert_members(
+        self,
+        rows: List[Tuple[int, MemberCreate]],
+        import_data: BulkMemberImport,
+        user: User
+    ) -> Tuple[int, int]:
+        """Stage rows in a temp table and merge them into members in one statement."""
+        self.db.execute(text(
+            "CREATE TEMP TABLE member_import_staging "
+            f"({', '.join(IMPORT_COLUMNS)}) ON COMMIT DROP AS "
+            f"SELECT {', '.join(IMPORT_COLUMNS)} FROM openpolicy.members WITH NO DATA"
+        ))
+        self._copy_into_staging([
+            (
+                uuid4(), m.jurisdiction_id, m.party_id, m.first_name, m.last_name,
+                f"{m.first_name} {m.last_name}", m.email, m.phone, m.website,
+                m.district, m.role, m.start_date, m.end_date
             )
-        ).first()
+            for _, m in rows
+        ])
+        
+        columns = ", ".join(IMPORT_COLUMNS)
+        if import_data.update_existing:
+            assignments = ", ".join(
+                f"{column} = s.{column}" for column in IMPORT_COLUMNS
+                if column not in ("id", "jurisdiction_id")
+            )
+            update_matched = f"""
+                UPDATE openpolicy.members m SET {assignments}, updated_at = now()
+                FROM matched x JOIN member_import_staging s ON s.id = x.staging_id
+                WHERE m.id = x.member_id
+                RETURNING m.id"""
+        else:
+            update_matched = "SELECT NULL::uuid AS id WHERE false"
+        
+        # Names are not unique, so each staged row is matched to the oldest
+        # member with the same name in its jurisdiction, as the one-by-one
+        # import did; unmatched rows are inserted
+        result = self.db.execute(text(f"""
+            WITH matched AS (
+                SELECT DISTINCT ON (s.id) s.id AS staging_id, m.id AS member_id
+                FROM member_import_staging s
+                JOIN openpolicy.members m
+                  ON m.jurisdiction_id = s.jurisdiction_id
+                 AND lower(m.first_name) = lower(s.first_name)
+                 AND lower(m.last_name) = lower(s.last_name)
+                ORDER BY s.id, m.created_at, m.id
+            ),
+            updated AS ({update_matched}
+            ),
+            inserted AS (
+                INSERT INTO openpolicy.members ({columns})
+                SELECT {columns} FROM member_import_staging s
+                WHERE NOT EXISTS (SELECT 1 FROM matched x WHERE x.staging_id = s.id)
+                RETURNING id
+            )
+            SELECT id, true AS inserted FROM inserted
+            UNION ALL
+            SELECT id, false AS inserted FROM updated
+        """)).all()
+        
+        created = [row.id for row in result if row.inserted]
+        updated = [row.id for row in result if not row.inserted]
+        reason = f"Bulk import from {import_data.import_source}"
+        self._bulk_audit_log(created, user_id=user.id, action="create", reason=reason)
+        self._bulk_audit_log(updated, user_id=user.id, action="update", reason=reason)
+        
+        return len(created), len(updated)
     
-    def _add_tags_to_member(
+    def _copy_into_staging(self, rows: List[tuple]) -> None:
+        """Load staging rows with COPY when the driver supports it."""
+        cursor = self.db.connection().connection.driver_connection.cursor()
+        if hasattr(cursor, "copy"):  # psycopg 3
+            with cursor:
+                with cursor.copy(f"COPY member_import_staging ({', '.join(IMPORT_COLUMNS)}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row(row)
+        else:
+            cursor.close()
+            placeholders = ", ".join(f":{column}" for column in IMPORT_COLUMNS)
+            self.db.execute(
+                text(f"INSERT INTO member_import_staging ({', '.join(IMPORT_COLUMNS)}) VALUES ({placeholders})"),
+                [dict(zip(IMPORT_COLUMNS, row)) for row in rows]
+            )
+    
+    def _add_tags_to_members(
         self,
-        member_id: UUID,
+        member_ids: List[UUID],
         tag_ids: List[UUID],
         user_id: UUID
     ) -> None:
-        """Add tags to a member."""
-        for tag_id in tag_ids:
-            # Check if already tagged
-            existing = self.db.query(member_tag_associations).filter(
-                and_(
-                    member_tag_associations.c.member_id == member_id,
-                    member_tag_associations.c.tag_id == tag_id
-                )
-            ).first()
-            
-            if not existing:
-                self.db.execute(
-                    member_tag_associations.insert().values(
-                        member_id=member_id,
-                        tag_id=tag_id,
-                        tagged_by=user_id
-                    )
+        """Tag many members in one INSERT ... SELECT, skipping existing tags."""
+        if not member_ids or not tag_ids:
+            return
+        already_tagged = select(member_tag_associations.c.member_id).where(
+            and_(
+                member_tag_associations.c.member_id == Member.id,
+                member_tag_associations.c.tag_id == MemberTag.id
+            )
+        ).exists()
+        self.db.execute(
+            insert(member_tag_associations).from_select(
+                ["member_id", "tag_id", "tagged_by"],
+                select(Member.id, MemberTag.id, literal(user_id)).where(
+                    Member.id.in_(member_ids),
+                    MemberTag.id.in_(tag_ids),
+                    ~already_tagged
                 )
+            )
+        )
     
-    def _remove_tags_from_member(
+    def _remove_tags_from_members(
         self,
-        member_id: UUID,
+        member_ids: List[UUID],
         tag_ids: List[UUID]
     ) -> None:
-        """Remove tags from a member."""
+        """Remove tags from many members in one DELETE."""
+        if not member_ids or not tag_ids:
+            return
         self.db.execute(
             member_tag_associations.delete().where(
                 and_(
-                    member_tag_associations.c.member_id == member_id,
+                    member_tag_associations.c.member_id.in_(member_ids),
                     member_tag_associations.c.tag_id.in_(tag_ids)
                 )
             )
@@ -694,97 +914,44 @@ class MemberManagementService:
         
         return metrics
     
-    def _export_json(
-        self,
-        members: List[Member],
-        export_request: MemberExportRequest
-    ) -> bytes:
-        """Export members as JSON."""
-        data = []
-        
-        for member in members:
-            member_dict = {
-                "id": str(member.id),
-                "first_name": member.first_name,
-                "last_name": member.last_name,
-                "full_name": member.full_name,
-                "email": member.email,
-                "phone": member.phone,
-                "website": member.website,
-                "district": member.district,
-                "role": member.role,
-                "party": member.party.name if member.party else None,
-                "jurisdiction": member.jurisdiction.name if member.jurisdiction else None,
-                "start_date": member.start_date.isoformat() if member.start_date else None,
-                "end_date": member.end_date.isoformat() if member.end_date else None
-            }
-            
-            if export_request.include_contacts:
-                member_dict["contacts"] = [
-                    {
-                        "type": c.contact_type,
-                        "address": f"{c.address_line1} {c.address_line2}".strip(),
-                        "city": c.city,
-                        "province": c.province,
-                        "postal_code": c.postal_code,
-                        "phone": c.phone,
-                        "email": c.email
-                    }
-                    for c in member.contacts
-                ]
-            
-            if export_request.include_social_media:
-                member_dict["social_media"] = [
-                    {
-                        "platform": s.platform,
-                        "handle": s.handle,
-                        "url": s.url,
-                        "verified": s.verified
-                    }
-                    for s in member.social_media
-                ]
-            
-            data.append(member_dict)
-        
-        return json.dumps(data, indent=2).encode('utf-8')
+    def _export_json(self, batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        """Stream members as a JSON array."""
+        yield b"["
+        first = True
+        for batch in batches:
+            for member in batch:
+                yield (b"" if first else b",") + dumps(member)
+                first = False
+        yield b"]"
     
-    def _export_csv(
-        self,
-        members: List[Member],
-        export_request: MemberExportRequest
-    ) -> bytes:
-        """Export members as CSV."""
+    def _export_ndjson(self, batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        """Stream members as newline-delimited JSON."""
+        for batch in batches:
+            yield b"".join(dumps(member) + b"\n" for member in batch)
+    
+    def _export_csv(self, batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        """Stream members as CSV, one chunk per batch."""
         output = io.StringIO()
-        
-        # Define fields
-        fields = [
-            'id', 'first_name', 'last_name', 'full_name', 'email', 'phone',
-            'website', 'district', 'role', 'party', 'jurisdiction',
-            'start_date', 'end_date'
-        ]
-        
-        writer = csv.DictWriter(output, fieldnames=fields)
+        writer = csv.DictWriter(output, fieldnames=self.EXPORT_FIELDS, extrasaction='ignore')
         writer.writeheader()
         
-        for member in members:
-            row = {
-                'id': str(member.id),
-                'first_name': member.first_name,
-                'last_name': member.last_name,
-                'full_name': member.full_name,
-                'email': member.email or '',
-                'phone': member.phone or '',
-                'website': member.website or '',
-                'district': member.district or '',
-                'role': member.role or '',
-                'party': member.party.name if member.party else '',
-                'jurisdiction': member.jurisdiction.name if member.jurisdiction else '',
-                'start_date': member.start_date.isoformat() if member.start_date else '',
-                'end_date': member.end_date.isoformat() if member.end_date else ''
-            }
-            writer.writerow(row)
+        for batch in batches:
+            for member in batch:
+                writer.writerow({
+                    field: (
+                        value.isoformat() if isinstance(value, date)
+                        else str(value) if isinstance(value, UUID)
+                        else value if value is not None else ''
+                    )
+                    for field, value in member.items()
+                })
+            yield output.getvalue().encode('utf-8')
+            output.seek(0)
+            output.truncate(0)
         
-        return output.getvalue().encode('utf-8')
+        remainder = output.getvalue()
+        if remainder:
+            yield remainder.encode('utf-8')
 
 
 # Dependency injection helper
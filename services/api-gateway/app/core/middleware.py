@@ -48,6 +48,23 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         
         return response
 
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Pin a client's reads to the primary database for a short window after it writes."""
+    
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+    
+    def __init__(self, app: ASGIApp):
+        super().__init__(app)
+    
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        
+        if request.method not in self.SAFE_METHODS and response.status_code < 400:
+            from app.database import replica_router, get_client_key
+            replica_router.mark_write(get_client_key(request))
+        
+        return response
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Advanced middleware for implementing IP-based rate limiting with endpoint-specific limits."""
     
@@ -0,0 +1,69 @@
+"""
+Fast JSON responses for large list and analytics payloads.
+
+FastAPI normally validates every returned row against the response model,
+runs ``jsonable_encoder`` over the result and serialises it with ``json``.
+For trusted database output that work dominates the request, so endpoints
+that return many rows can build plain dicts and return ``FastJSONResponse``
+directly. The route keeps its ``response_model`` so the OpenAPI schema is
+unchanged; FastAPI skips validation whenever a ``Response`` is returned.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Serialise types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any, sort_keys: bool = False) -> bytes:
+    """Serialise ``content`` to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(content, default=_default, option=option)
+    return json.dumps(
+        content, default=_stdlib_default, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _stdlib_default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "hex") and hasattr(value, "version"):  # UUID
+        return str(value)
+    return _default(value)
+
+
+def rows_to_dicts(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Convert SQLAlchemy ``Row`` objects (or mappings) to plain dicts."""
+    return [dict(row._mapping) if hasattr(row, "_mapping") else dict(row) for row in rows]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson and skips ``jsonable_encoder``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def paginated(items_key: str, items: List[Mapping[str, Any]], pagination: Mapping[str, Any]) -> FastJSONResponse:
+    """Build a list response of the ``{items_key: [...], "pagination": {...}}`` shape."""
+    return FastJSONResponse({items_key: items, "pagination": pagination})
@@ -0,0 +1,66 @@
+"""
+Speech Mention Index
+
+Maps statements to the members they mention so that /debates/speeches can
+filter on "mentioned politician" with an indexed join instead of an ILIKE
+over every statement's text.
+
+openpolicy.statement_mentions is written only by the ETL service's
+read_models job (services/etl app/ingestion/statement_mentions.py), right
+after statements are ingested. It records the last statement it scanned in
+openpolicy.statement_mention_progress; statements past that mark are not
+indexed yet, so mentioned_politician_filter matches them on their text.
+"""
+
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.orm import Session
+
+from app.models.openparliament import Member, Statement, StatementMention, StatementMentionProgress
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def scanned_through(db: Session) -> int:
+    """Id of the last statement the ETL scanned for mentions (0 before its first run)."""
+    return db.execute(select(StatementMentionProgress.scanned_through)).scalar() or 0
+
+
+def _contains_pattern(name: str) -> str:
+    return "%" + name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def resolve_member_ids(db: Session, name: str) -> List[UUID]:
+    """
+    IDs of every member whose name contains ``name``, case-insensitively.
+
+    Served by the trigram index on members.full_name, so the name filter
+    costs one small index lookup before the statements are touched.
+    """
+    return list(db.execute(
+        select(Member.id).where(Member.full_name.ilike(_contains_pattern(name)))
+    ).scalars())
+
+
+def mentioned_politician_filter(db: Session, name: str) -> ColumnElement:
+    """
+    Condition on Statement for statements that mention a member matching ``name``.
+
+    Scanned statements are matched through statement_mentions; statements
+    the ETL has not scanned yet are matched on their text instead.
+    """
+    pattern = _contains_pattern(name)
+    return or_(
+        Statement.id.in_(
+            select(StatementMention.statement_id)
+            .where(StatementMention.member_id.in_(resolve_member_ids(db, name)))
+        ),
+        and_(
+            Statement.id > scanned_through(db),
+            or_(Statement.content_en.ilike(pattern), Statement.content_fr.ilike(pattern)),
+        ),
+    )
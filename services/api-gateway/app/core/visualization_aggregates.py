@@ -0,0 +1,226 @@
+"""
+Visualization Aggregates
+
+Chart payloads for the bill progress, vote breakdown and party activity
+visualizations are read from materialized views (see migration
+012_visualization_aggregates) instead of aggregating the bills, ballots
+and statements tables on every request.
+
+Every refresh of a view bumps its row in openpolicy.aggregate_view_versions.
+Refreshing and bumping is done by the openpolicy.refresh_aggregate_view()
+database function (migration 018_refresh_aggregate_view), which the gateway
+and the ETL read_models job both call. Generated payloads are kept in a process-local LRU keyed by the view
+version, so a refresh after ingestion invalidates them on every worker
+without any cross-process messaging.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+import logging
+
+logger = logging.getLogger(__name__)
+
+BILL_PROGRESS_VIEW = "openpolicy.mv_bill_progress"
+VOTE_BREAKDOWN_VIEW = "openpolicy.mv_vote_breakdown"
+PARTY_ACTIVITY_VIEW = "openpolicy.mv_party_activity"
+AGGREGATE_VIEWS = (BILL_PROGRESS_VIEW, VOTE_BREAKDOWN_VIEW, PARTY_ACTIVITY_VIEW)
+
+# Legislative stages in the order they are reached; statuses not listed
+# here are appended alphabetically
+BILL_STAGE_ORDER = [
+    "introduced", "first_reading", "second_reading", "in_committee", "committee",
+    "third_reading", "passed", "royal_assent", "enacted", "failed", "defeated", "withdrawn",
+]
+
+# custom_filters keys accepted by each view, mapped to their column
+_FILTER_COLUMNS = {
+    BILL_PROGRESS_VIEW: {"jurisdiction_id": "jurisdiction_id", "session_id": "session_id"},
+    VOTE_BREAKDOWN_VIEW: {"jurisdiction_id": "jurisdiction_id", "session_id": "session_id"},
+    PARTY_ACTIVITY_VIEW: {"jurisdiction_id": "jurisdiction_id"},
+}
+
+
+# Refreshes one aggregate view and bumps its version, returning the new
+# version. Created by migration 018_refresh_aggregate_view; only views
+# listed in aggregate_view_versions can be refreshed through it.
+REFRESH_AGGREGATE_VIEW_FUNCTION = """
+    CREATE OR REPLACE FUNCTION openpolicy.refresh_aggregate_view(target text)
+    RETURNS bigint
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        new_version bigint;
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM openpolicy.aggregate_view_versions WHERE view_name = target
+        ) THEN
+            RAISE EXCEPTION 'Unknown aggregate view: %', target;
+        END IF;
+        EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %s', target);
+        UPDATE openpolicy.aggregate_view_versions
+        SET version = version + 1, refreshed_at = now()
+        WHERE view_name = target
+        RETURNING version INTO new_version;
+        RETURN new_version;
+    END;
+    $$
+"""
+
+
+class ChartCache:
+    """Thread-safe LRU of generated chart payloads."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return the cached payload for key, or None."""
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def put(self, key: Tuple, value: Any) -> None:
+        """Store a payload, evicting the least recently used entries beyond max_entries."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+chart_cache = ChartCache()
+
+
+def view_versions(db: Session) -> Dict[str, int]:
+    """Current version of every aggregate view."""
+    rows = db.execute(text(
+        "SELECT view_name, version FROM openpolicy.aggregate_view_versions"
+    )).all()
+    return {name: version for name, version in rows}
+
+
+def refresh_aggregates(db: Session, views: Iterable[str] = AGGREGATE_VIEWS) -> Dict[str, int]:
+    """
+    Refresh the given aggregate views concurrently and bump their versions.
+
+    Run after ingestion. CONCURRENTLY keeps the old contents readable while
+    the view is rebuilt; each view is committed on its own so a failure
+    leaves the others refreshed.
+
+    Returns:
+        New version of each refreshed view
+    """
+    versions = {}
+    for view in views:
+        if view not in AGGREGATE_VIEWS:
+            raise ValueError(f"Unknown aggregate view: {view}")
+        versions[view] = db.execute(
+            text("SELECT openpolicy.refresh_aggregate_view(:view)"), {"view": view}
+        ).scalar_one()
+        db.commit()
+        logger.info(f"Refreshed {view} (version {versions[view]})")
+    return versions
+
+
+def _select(db: Session, view: str, columns: str, filters: Optional[Dict[str, Any]],
+            group_by: str, order_by: str):
+    clauses = []
+    params = {}
+    for key, column in _FILTER_COLUMNS[view].items():
+        if filters and filters.get(key) is not None:
+            clauses.append(f"{column} = :{key}")
+            params[key] = str(filters[key])
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return db.execute(text(
+        f"SELECT {columns} FROM {view} {where} GROUP BY {group_by} ORDER BY {order_by}"
+    ), params).all()
+
+
+def bill_progress_chart(db: Session, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Number of bills at each legislative stage."""
+    rows = _select(db, BILL_PROGRESS_VIEW, "status, sum(bill_count) AS bills",
+                   filters, "status", "status")
+    counts = {status: int(bills) for status, bills in rows}
+    ordered = [s for s in BILL_STAGE_ORDER if s in counts]
+    ordered += sorted(s for s in counts if s not in BILL_STAGE_ORDER)
+    return {
+        "labels": [status.replace("_", " ").title() for status in ordered],
+        "data": [counts[status] for status in ordered],
+        "chart_type": "bar",
+        "title": "Bill Progress Through Parliament",
+        "description": "Number of bills at each legislative stage",
+    }
+
+
+def vote_breakdown_chart(db: Session, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Ballots cast by each party, split by position."""
+    rows = _select(
+        db, VOTE_BREAKDOWN_VIEW,
+        "party_name, sum(yeas) AS yeas, sum(nays) AS nays, sum(paired) AS paired, sum(absent) AS absent",
+        filters, "party_name", "sum(yeas + nays + paired + absent) DESC, party_name",
+    )
+    positions = ("Yea", "Nay", "Paired", "Absent")
+    return {
+        "labels": [row.party_name for row in rows],
+        "data": [int(row.yeas + row.nays + row.paired + row.absent) for row in rows],
+        "datasets": [
+            {"label": label, "data": [int(row[index + 1]) for row in rows]}
+            for index, label in enumerate(positions)
+        ],
+        "chart_type": "pie",
+        "title": "Vote Distribution by Party",
+        "description": "Distribution of votes across political parties",
+    }
+
+
+def party_activity_chart(db: Session, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Sitting members and speeches per party."""
+    rows = _select(
+        db, PARTY_ACTIVITY_VIEW,
+        "party_name, max(color) AS color, sum(member_count) AS members, "
+        "sum(statement_count) AS statements, sum(word_count) AS words",
+        filters, "party_name", "sum(member_count) DESC, party_name",
+    )
+    return {
+        "labels": [row.party_name for row in rows],
+        "data": [int(row.members) for row in rows],
+        "colors": [row.color for row in rows],
+        "datasets": [
+            {"label": "Statements", "data": [int(row.statements) for row in rows]},
+            {"label": "Words spoken", "data": [int(row.words) for row in rows]},
+        ],
+        "chart_type": "bar",
+        "title": "MP Distribution by Party",
+        "description": "Number of Members of Parliament by political party",
+    }
+
+
+@dataclass(frozen=True)
+class ChartFamily:
+    """A data source served from one aggregate view."""
+    view: str
+    build: Callable[[Session, Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
+CHART_FAMILIES: Dict[str, ChartFamily] = {
+    "bills": ChartFamily(BILL_PROGRESS_VIEW, bill_progress_chart),
+    "votes": ChartFamily(VOTE_BREAKDOWN_VIEW, vote_breakdown_chart),
+    "members": ChartFamily(PARTY_ACTIVITY_VIEW, party_activity_chart),
+}
@@ -4,11 +4,18 @@ Database connection and session management for the OpenPolicy API Gateway.
 Uses SQLAlchemy with async support and Alembic for migrations.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
+from fastapi import Request
+from typing import Callable, Dict, List, Optional
 from app.config import settings
+import hashlib
+import itertools
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +37,165 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for models
 Base = declarative_base()
 
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a session from get_read_db tries to write."""
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _refuse_read_only_flush(session, flush_context, instances):
+    if session.info.get("read_only"):
+        raise ReadOnlySessionError("Read-only session cannot flush changes; use get_db for writes")
+
+
+@event.listens_for(SessionLocal, "after_begin")
+def _begin_read_only_transaction(session, transaction, connection):
+    # Catches writes issued as raw SQL, which never reach a flush
+    if session.info.get("read_only") and connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+# Replication lag in seconds as seen by a standby; 0 on a primary or a
+# standby that has replayed everything it received.
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaRouter:
+    """
+    Routes read-only sessions to healthy read replicas.
+
+    Replicas are health checked at most once per ``health_check_interval``;
+    a replica that fails its check or lags more than ``max_lag_seconds`` is
+    skipped until the next check. When no replica qualifies, or when the
+    client wrote within the last ``pin_seconds`` (read-your-writes), reads go
+    to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replica_urls: List[str],
+        max_lag_seconds: float = 10.0,
+        health_check_interval: float = 15.0,
+        pin_seconds: float = 5.0,
+        engine_factory: Optional[Callable[[str], Engine]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval = health_check_interval
+        self.pin_seconds = pin_seconds
+        self._clock = clock
+        factory = engine_factory or _create_replica_engine
+        self.replicas: List[Engine] = [factory(url) for url in replica_urls]
+        self._healthy: List[Engine] = []
+        self._last_check: Optional[float] = None
+        self._round_robin = itertools.count()
+        self._pins: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def check_replica(self, replica: Engine) -> Optional[float]:
+        """Return the replica lag in seconds, or None when it is unreachable."""
+        try:
+            with replica.connect() as conn:
+                return float(conn.execute(REPLICA_LAG_SQL).scalar() or 0)
+        except Exception as e:
+            logger.warning(f"Read replica health check failed for {replica.url.host}: {e}")
+            return None
+
+    def refresh_health(self, force: bool = False) -> List[Engine]:
+        """Re-run replica health checks if the check interval has elapsed."""
+        now = self._clock()
+        with self._lock:
+            if not force and self._last_check is not None and now - self._last_check < self.health_check_interval:
+                return self._healthy
+            self._last_check = now
+
+        healthy = []
+        for replica in self.replicas:
+            lag = self.check_replica(replica)
+            if lag is None:
+                continue
+            if lag > self.max_lag_seconds:
+                logger.warning(f"Read replica {replica.url.host} lagging {lag:.1f}s, routing reads to primary")
+                continue
+            healthy.append(replica)
+
+        with self._lock:
+            self._healthy = healthy
+        return healthy
+
+    def mark_write(self, client_key: Optional[str]):
+        """Pin a client's reads to the primary for the read-your-writes window."""
+        if not client_key or not self.enabled or self.pin_seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._pins[client_key] = now + self.pin_seconds
+            # Opportunistically drop expired pins so the map stays small
+            if len(self._pins) > 10000:
+                self._pins = {key: expiry for key, expiry in self._pins.items() if expiry > now}
+
+    def is_pinned(self, client_key: Optional[str]) -> bool:
+        if not client_key:
+            return False
+        with self._lock:
+            expiry = self._pins.get(client_key)
+            if expiry is None:
+                return False
+            if expiry <= self._clock():
+                del self._pins[client_key]
+                return False
+            return True
+
+    def engine_for_read(self, client_key: Optional[str] = None) -> Engine:
+        """Pick the engine a read-only session should use."""
+        if not self.enabled or self.is_pinned(client_key):
+            return self.primary
+        healthy = self.refresh_health()
+        if not healthy:
+            return self.primary
+        return healthy[next(self._round_robin) % len(healthy)]
+
+
+def _create_replica_engine(url: str) -> Engine:
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=settings.DEBUG
+    )
+
+
+replica_router = ReplicaRouter(
+    engine,
+    settings.DATABASE_REPLICA_URLS,
+    max_lag_seconds=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+    health_check_interval=settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL,
+    pin_seconds=settings.DATABASE_READ_YOUR_WRITES_SECONDS,
+)
+
+
+def get_client_key(request: Request) -> Optional[str]:
+    """Identify the client for read-your-writes pinning."""
+    credential = request.headers.get("authorization") or request.headers.get("x-api-key")
+    if credential:
+        return hashlib.sha256(credential.encode()).hexdigest()
+    return request.client.host if request.client else None
+
+
 def get_db() -> Session:
     """Get database session."""
     db = SessionLocal()
@@ -38,6 +204,25 @@ def get_db() -> Session:
     finally:
         db.close()
 
+
+def get_read_db(request: Request) -> Session:
+    """
+    Get a read-only database session.
+
+    Uses a healthy read replica when one is configured, otherwise the primary.
+    Only use this for endpoints that never write: flushing raises
+    ReadOnlySessionError, and on PostgreSQL every transaction is started
+    READ ONLY, so the primary rejects raw SQL writes as well.
+    """
+    db = SessionLocal(
+        bind=replica_router.engine_for_read(get_client_key(request)),
+        info={"read_only": True},
+    )
+    try:
+        yield db
+    finally:
+        db.close()
+
 def init_db():
     """Initialize database tables."""
     try:
@@ -15,9 +15,10 @@ import structlog
 
 from app.config import settings
 from app.api.v1.api import api_router
-from app.core.middleware import RequestLoggingMiddleware, RateLimitMiddleware, RedisRateLimitMiddleware
+from app.core.middleware import RequestLoggingMiddleware, RateLimitMiddleware, RedisRateLimitMiddleware, ReadYourWritesMiddleware
 from app.core.metrics import setup_metrics
-from app.database import init_db, check_db_connection
+from app.core.activity_writer import activity_writer, ensure_activity_partitions
+from app.database import SessionLocal, init_db, check_db_connection
 
 # Configure structured logging
 structlog.configure(
@@ -61,6 +62,11 @@ app.add_middleware(
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
 app.add_middleware(RequestLoggingMiddleware)
 
+# Route read-only sessions to replicas, keeping writers on the primary briefly
+if settings.DATABASE_REPLICA_URLS:
+    app.add_middleware(ReadYourWritesMiddleware)
+    logger.info("Read replica routing enabled", replicas=len(settings.DATABASE_REPLICA_URLS))
+
 # Add rate limiting middleware based on configuration
 if settings.RATE_LIMIT_ENABLED:
     if settings.RATE_LIMIT_BACKEND == "redis":
@@ -90,6 +96,21 @@ async def startup_event():
     except Exception as e:
         print(f"⚠️  Database initialization warning: {e}")
         print("   This is normal if the database schema already exists")
+    
+    activity_writer.start()
+    try:
+        db = SessionLocal()
+        try:
+            ensure_activity_partitions(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning("Could not create user activity partitions", error=str(e))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write queued user activity before exiting."""
+    await activity_writer.stop()
 
 @app.get("/")
 async def root():
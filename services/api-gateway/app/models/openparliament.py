@@ -6,7 +6,7 @@ These models are based on the real database structure, not simplified versions.
 """
 
 from typing import List, Optional
-from sqlalchemy import Column, String, Integer, Boolean, Date, DateTime, Text, ForeignKey, UUID, ARRAY
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, CheckConstraint, Date, DateTime, Text, ForeignKey, Index, UUID, ARRAY
 from sqlalchemy.orm import relationship, Mapped
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
@@ -161,6 +161,107 @@ class Vote(Base):
 
     # Relationships
     bill: Mapped["Bill"] = relationship("Bill", back_populates="votes")
+    ballots: Mapped[List["VoteBallot"]] = relationship("VoteBallot", back_populates="vote")
 
     def __repr__(self):
         return f"<Vote(bill_id={self.bill_id}, result='{self.result}')>"
+
+
+class VoteBallot(Base):
+    """Individual member ballot cast in a vote."""
+
+    __tablename__ = "vote_ballots"
+    __table_args__ = {"schema": "openpolicy"}
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    vote_id = Column(PostgresUUID(as_uuid=True), ForeignKey("openpolicy.votes.id"), nullable=False, index=True)
+    member_id = Column(PostgresUUID(as_uuid=True), ForeignKey("openpolicy.members.id"), nullable=False, index=True)
+    ballot = Column(String(10), nullable=False)  # Yea, Nay, Paired, Absent
+
+    # Relationships
+    vote: Mapped["Vote"] = relationship("Vote", back_populates="ballots")
+    member: Mapped["Member"] = relationship("Member")
+
+    def __repr__(self):
+        return f"<VoteBallot(vote_id={self.vote_id}, member_id={self.member_id}, ballot='{self.ballot}')>"
+
+
+class Statement(Base):
+    """Hansard statement (speech) made in the House."""
+
+    __tablename__ = "statements"
+    __table_args__ = {"schema": "openpolicy"}
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    member_id = Column(PostgresUUID(as_uuid=True), ForeignKey("openpolicy.members.id"), index=True)
+    bill_debated_id = Column(PostgresUUID(as_uuid=True), ForeignKey("openpolicy.bills.id"))
+    time = Column(DateTime(timezone=True), nullable=False, index=True)
+    sequence = Column(Integer, nullable=False)
+    h1_en = Column(String(300))
+    h2_en = Column(String(300))
+    h1_fr = Column(String(400))
+    h2_fr = Column(String(400))
+    content_en = Column(Text, nullable=False)
+    content_fr = Column(Text)
+    wordcount = Column(Integer, nullable=False, default=0)
+    procedural = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime(timezone=True), default=func.now())
+
+    # Relationships
+    member: Mapped[Optional["Member"]] = relationship("Member")
+    bill_debated: Mapped[Optional["Bill"]] = relationship("Bill")
+
+    def __repr__(self):
+        return f"<Statement(id={self.id}, time='{self.time}')>"
+
+
+class StatementMention(Base):
+    """Member mentioned in a statement, extracted at ingest time."""
+
+    __tablename__ = "statement_mentions"
+    __table_args__ = (
+        Index("idx_statement_mentions_member_time", "member_id", "time"),
+        {"schema": "openpolicy"},
+    )
+
+    statement_id = Column(BigInteger, ForeignKey("openpolicy.statements.id", ondelete="CASCADE"), primary_key=True)
+    member_id = Column(PostgresUUID(as_uuid=True), ForeignKey("openpolicy.members.id", ondelete="CASCADE"), primary_key=True)
+    time = Column(DateTime(timezone=True), nullable=False)  # Copy of statements.time for ordered scans
+
+    def __repr__(self):
+        return f"<StatementMention(statement_id={self.statement_id}, member_id={self.member_id})>"
+
+
+class StatementMentionProgress(Base):
+    """Single row: the last statement scanned for mentions, with or without any."""
+
+    __tablename__ = "statement_mention_progress"
+    __table_args__ = (
+        CheckConstraint("id", name="statement_mention_progress_single_row"),
+        {"schema": "openpolicy"},
+    )
+
+    id = Column(Boolean, primary_key=True, default=True)
+    scanned_through = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<StatementMentionProgress(scanned_through={self.scanned_through})>"
+
+
+class DebateDay(Base):
+    """One row per sitting date, refreshed from statements and votes after ingestion."""
+
+    __tablename__ = "debate_days"
+    __table_args__ = {"schema": "openpolicy"}
+
+    sitting_date = Column(Date, primary_key=True)
+    statement_count = Column(Integer, nullable=False, default=0)
+    vote_count = Column(Integer, nullable=False, default=0)
+    bill_count = Column(Integer, nullable=False, default=0)  # Distinct bills voted on
+    first_at = Column(DateTime(timezone=True))
+    last_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<DebateDay(date='{self.sitting_date}', statements={self.statement_count})>"
@@ -310,7 +310,7 @@ class UserActivity(Base):
     """Model for tracking user activity and engagement."""
     
     __tablename__ = "user_activities"
-    __table_args__ = {"schema": "public"}
+    __table_args__ = {"schema": "public"}  # Partitioned by month on activity_date
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
@@ -339,7 +339,7 @@ class UserActivity(Base):
     ip_address = Column(String(45), nullable=True)     # IP address for analytics
     
     # Timestamps
-    activity_date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    activity_date = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -371,3 +371,20 @@ class UserActivity(Base):
             "activity_date": self.activity_date.isoformat() if self.activity_date else None,
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
+
+
+class UserActivityRollup(Base):
+    """Daily activity counts per user, maintained in batches by the activity writer."""
+    
+    __tablename__ = "user_activity_rollup"
+    __table_args__ = {"schema": "public"}
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    activity_type = Column(String(50), primary_key=True)
+    content_type = Column(String(50), primary_key=True, default="")  # '' when the activity has none
+    count = Column(Integer, nullable=False, default=0)
+    last_at = Column(DateTime(timezone=True), nullable=False)
+    
+    def __repr__(self):
+        return f"<UserActivityRollup(user_id={self.user_id}, day={self.day}, activity_type='{self.activity_type}', count={self.count})>"
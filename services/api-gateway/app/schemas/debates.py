@@ -26,6 +26,8 @@ class DebateSummary(BaseModel):
     date: Optional[str] = Field(None, description="Date of the debate (YYYY-MM-DD)")
     number: int = Field(..., description="Hansard number/sitting ID")
     statement_count: int = Field(..., description="Number of statements in the debate")
+    vote_count: int = Field(0, description="Number of votes held that day")
+    bill_count: int = Field(0, description="Number of distinct bills voted on that day")
     url: Optional[str] = Field(None, description="URL to debate detail")
     
     model_config = {"from_attributes": True}
@@ -144,6 +146,7 @@ class DebateListResponse(BaseModel):
     
     debates: List[DebateSummary] = Field(..., description="List of debates")
     pagination: Pagination = Field(..., description="Pagination information")
+    next_cursor: Optional[str] = Field(None, description="Pass as 'before' to fetch the next page")
 
 
 class DebateDetailResponse(BaseModel):
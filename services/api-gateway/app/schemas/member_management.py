@@ -375,7 +375,7 @@ class MemberSearchRequest(BaseModel):
 
 class MemberExportRequest(BaseModel):
     """Schema for member export."""
-    format: str = Field(..., regex="^(csv|json|excel)$")
+    format: str = Field(..., regex="^(csv|json|ndjson)$")
     fields: Optional[List[str]] = None
     include_contacts: bool = False
     include_social_media: bool = False
@@ -95,17 +95,17 @@ class UserPreferencesBase(BaseModel):
 
 class UserActivityBase(BaseModel):
     """Base user activity model"""
-    activity_type: str = Field(..., description="Type of activity")
-    content_id: Optional[str] = Field(None, description="Content ID")
-    content_type: Optional[str] = Field(None, description="Content type")
-    content_title: Optional[str] = Field(None, description="Content title")
+    activity_type: str = Field(..., max_length=50, description="Type of activity")
+    content_id: Optional[str] = Field(None, max_length=100, description="Content ID")
+    content_type: Optional[str] = Field(None, max_length=50, description="Content type")
+    content_title: Optional[str] = Field(None, max_length=500, description="Content title")
     content_summary: Optional[str] = Field(None, description="Activity summary")
     time_spent: Optional[int] = Field(None, description="Time spent in seconds")
     pages_viewed: Optional[int] = Field(None, description="Pages viewed")
     actions_taken: Optional[List[str]] = Field(None, description="Actions taken")
-    device: Optional[str] = Field(None, description="Device type")
-    browser: Optional[str] = Field(None, description="Browser type")
-    location: Optional[str] = Field(None, description="User location")
+    device: Optional[str] = Field(None, max_length=50, description="Device type")
+    browser: Optional[str] = Field(None, max_length=50, description="Browser type")
+    location: Optional[str] = Field(None, max_length=200, description="User location")
 
 
 # ============================================================================
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Member Bulk Import/Export Benchmark for OpenPolicy V2
+
+Imports a generated CSV of members through MemberManagementService, then
+streams the full export back out, reporting wall time and peak RSS for each
+phase. Run it against a scratch database: imported members are left in place.
+
+Usage:
+    python scripts/benchmark_member_bulk.py --rows 100000 --format ndjson
+"""
+
+import os
+import sys
+import time
+import resource
+import argparse
+import logging
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database import SessionLocal
+from app.core.member_management import MemberManagementService
+from app.models.openparliament import Jurisdiction
+from app.models.users import User
+from app.schemas.member_management import BulkMemberImport, MemberExportRequest
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_csv(rows: int, jurisdiction_id) -> str:
+    lines = ["first_name,last_name,email,district,jurisdiction_id,start_date"]
+    for index in range(rows):
+        lines.append(
+            f"First{index},Last{index},member{index}@parl.gc.ca,District {index % 338},"
+            f"{jurisdiction_id},2022-01-01"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Benchmark member bulk import and export")
+    parser.add_argument("--rows", type=int, default=100_000, help="Members to import")
+    parser.add_argument("--format", default="csv", choices=["csv", "json", "ndjson"], help="Export format")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        jurisdiction = db.query(Jurisdiction).first()
+        user = db.query(User).first()
+        if not jurisdiction or not user:
+            logger.error("Benchmark needs at least one jurisdiction and one user in the database")
+            sys.exit(1)
+
+        csv_data = build_csv(args.rows, jurisdiction.id)
+        service = MemberManagementService(db)
+
+        started = time.perf_counter()
+        record = service.bulk_import_members(
+            BulkMemberImport(import_source="csv", import_type="full", csv_data=csv_data), user
+        )
+        import_seconds = time.perf_counter() - started
+        import_rss = peak_rss_mb()
+        del csv_data
+
+        started = time.perf_counter()
+        exported_bytes = 0
+        for chunk in service.iter_export_members(MemberExportRequest(format=args.format)):
+            exported_bytes += len(chunk)
+        export_seconds = time.perf_counter() - started
+
+        print(f"import: {args.rows:,} rows in {import_seconds:.2f}s "
+              f"({record.created_count:,} created, {record.updated_count:,} updated, "
+              f"{record.error_count:,} errors), peak RSS {import_rss:.0f} MB")
+        print(f"export: {exported_bytes / 1e6:.1f} MB {args.format} in {export_seconds:.2f}s, "
+              f"peak RSS {peak_rss_mb():.0f} MB")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
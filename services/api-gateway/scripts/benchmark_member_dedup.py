@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Member Duplicate Detection Benchmark for OpenPolicy V2
+
+Generates a synthetic member list with injected near-duplicates (typos,
+accents, nicknamed emails, reformatted phone numbers) and runs the
+blocking-key DuplicateDetector over it, reporting pairs compared, pairs/sec,
+total time and recall of the injected duplicates. Runs without a database.
+
+Usage:
+    python scripts/benchmark_member_dedup.py --members 100000 --duplicates 2000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.member_dedup import DuplicateDetector, MemberRecord
+
+FIRST_NAMES = [
+    "Jean", "Marie", "Pierre", "Sarah", "David", "Emily", "Michael", "Chantal",
+    "Robert", "Priya", "Harjit", "Catherine", "François", "Jagmeet", "Elizabeth",
+    "Andrew", "Mélanie", "Justin", "Chrystia", "Anita", "Yves", "Leah", "Omar",
+]
+SURNAME_PARTS = [
+    "Trem", "Gag", "Bou", "Mac", "Sin", "Free", "Poi", "Blan", "An", "Sche",
+    "Ngu", "Mar", "Le", "Kher", "For", "Côt", "Wil", "Bro", "Saj", "Dal",
+    "Hut", "Ros", "Gil", "Ker", "Ved", "Pat", "Oka", "Zim", "Yel", "Ibr",
+]
+SURNAME_MIDDLES = ["", "an", "el", "or", "is", "ou", "er", "at", "im", "ub", "ev", "ol"]
+SURNAME_ENDINGS = [
+    "blay", "non", "chard", "donald", "gh", "land", "lievre", "chet", "and",
+    "er", "yen", "tin", "bel", "a", "tin", "é", "son", "wn", "jan", "ton",
+    "chins", "siter", "bert", "ridge", "ell", "field", "ward", "ault", "ier",
+]
+
+
+def _typo(rng: random.Random, value: str) -> str:
+    """Introduce one transposition, deletion or substitution."""
+    if len(value) < 4:
+        return value
+    index = rng.randrange(1, len(value) - 1)
+    kind = rng.choice(("swap", "drop", "sub"))
+    if kind == "swap":
+        return value[:index] + value[index + 1] + value[index] + value[index + 2:]
+    if kind == "drop":
+        return value[:index] + value[index + 1:]
+    return value[:index] + rng.choice("aeiou") + value[index + 1:]
+
+
+def build_dataset(members: int, duplicates: int, seed: int = 42):
+    """Return (records, injected pair set)."""
+    rng = random.Random(seed)
+    records = []
+    for index in range(members):
+        first = rng.choice(FIRST_NAMES)
+        last = "".join((
+            rng.choice(SURNAME_PARTS), rng.choice(SURNAME_MIDDLES), rng.choice(SURNAME_ENDINGS),
+            rng.choice(("", "-" + rng.choice(SURNAME_PARTS) + rng.choice(SURNAME_ENDINGS))),
+        ))
+        records.append(MemberRecord(
+            id=index,
+            first_name=first,
+            last_name=last,
+            email=f"{first.lower()}.{index}@parl.gc.ca" if rng.random() < 0.8 else None,
+            phone=f"613-{rng.randrange(100, 999)}-{index % 10000:04d}" if rng.random() < 0.7 else None,
+            district=f"Riding {rng.randrange(338)}",
+        ))
+
+    injected = set()
+    for offset, original in enumerate(rng.sample(records, duplicates)):
+        email = original.email
+        if email and rng.random() < 0.5:
+            local, domain = email.split("@")
+            email = f"{local.replace('.', '')}+office@{domain}"
+        phone = original.phone
+        if phone and rng.random() < 0.5:
+            phone = "+1 (" + phone.replace("-", ") ", 1).replace("-", " ")
+        copy_id = members + offset
+        records.append(MemberRecord(
+            id=copy_id,
+            first_name=original.first_name if rng.random() < 0.5 else _typo(rng, original.first_name),
+            last_name=_typo(rng, original.last_name) if rng.random() < 0.7 else original.last_name.upper(),
+            email=email,
+            phone=phone,
+            district=original.district,
+        ))
+        injected.add((str(original.id), str(copy_id)))
+
+    rng.shuffle(records)
+    return records, injected
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Benchmark member duplicate detection")
+    parser.add_argument("--members", type=int, default=100_000, help="Distinct members to generate")
+    parser.add_argument("--duplicates", type=int, default=2_000, help="Near-duplicates to inject")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Minimum pair score")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    records, injected = build_dataset(args.members, args.duplicates, args.seed)
+    detector = DuplicateDetector(threshold=args.threshold)
+
+    started = time.perf_counter()
+    pairs = detector.find_duplicates(records)
+    elapsed = time.perf_counter() - started
+
+    found = {tuple(sorted(pair["member_ids"], key=int)) for pair in pairs}
+    hits = len(found & injected)
+    naive_pairs = len(records) * (len(records) - 1) // 2
+
+    print(f"members:            {len(records):,}")
+    print(f"pairs compared:     {detector.pairs_compared:,} (naive {naive_pairs:,})")
+    print(f"elapsed:            {elapsed:.2f}s ({detector.pairs_compared / elapsed:,.0f} pairs/sec)")
+    print(f"reported pairs:     {len(pairs):,}")
+    print(f"recall:             {hits / len(injected):.1%} ({hits:,}/{len(injected):,})")
+    print(f"precision:          {hits / len(pairs):.1%}" if pairs else "precision:          n/a")
+
+
+if __name__ == "__main__":
+    main()
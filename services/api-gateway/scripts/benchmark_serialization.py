@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark for OpenPolicy V2 API Gateway
+
+Measures CPU time spent turning one page of bill rows into a JSON response
+body, comparing FastAPI's default path (per-row pydantic models, response
+model validation, ``jsonable_encoder`` and ``json.dumps``) with the
+``FastJSONResponse`` path that serialises plain row dicts with orjson.
+
+Usage:
+    python scripts/benchmark_serialization.py --rows 1000 --iterations 200
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import argparse
+from datetime import date, timedelta
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import FastJSONResponse
+from app.schemas.bills import BillSummary, BillListResponse, Pagination
+
+
+def make_rows(count: int) -> list:
+    """Row dicts shaped like the columns selected by list_bills."""
+    return [
+        {
+            "id": uuid.UUID(int=index + 1),
+            "bill_number": f"C-{index + 1}",
+            "title": f"An Act respecting housing affordability and climate measures {index}",
+            "summary": "This enactment amends several Acts to implement measures. " * 6,
+            "status": "in_committee",
+            "introduced_date": date(2024, 1, 1) + timedelta(days=index % 365),
+            "session_id": uuid.UUID(int=index % 6 + 1),
+            "keywords": ["housing", "climate", "budget"],
+        }
+        for index in range(count)
+    ]
+
+
+def to_summary(row: dict) -> dict:
+    return {
+        "id": str(row["id"]),
+        "bill_number": row["bill_number"],
+        "title": row["title"],
+        "short_title": row["title"][:100],
+        "summary": row["summary"],
+        "status": row["status"],
+        "introduced_date": row["introduced_date"],
+        "sponsor_name": None,
+        "party_name": None,
+        "session_name": f"Session {row['session_id']}",
+        "keywords": row["keywords"] or [],
+        "tags": [],
+    }
+
+
+def pagination(count: int) -> dict:
+    return {"page": 1, "page_size": count, "total": count * 20, "pages": 20}
+
+
+def default_path(rows: list) -> bytes:
+    """Per-row models, response-model validation, jsonable_encoder, json.dumps."""
+    response = BillListResponse(
+        bills=[BillSummary(**to_summary(row)) for row in rows],
+        pagination=Pagination(**pagination(len(rows))),
+    )
+    validated = BillListResponse.model_validate(response.model_dump())
+    content = jsonable_encoder(validated)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(rows: list) -> bytes:
+    """Plain dicts rendered by FastJSONResponse."""
+    return FastJSONResponse({"bills": [to_summary(row) for row in rows], "pagination": pagination(len(rows))}).body
+
+
+def measure(func, rows: list, iterations: int) -> float:
+    """Return mean CPU milliseconds per call."""
+    func(rows)  # warm up
+    started = time.process_time()
+    for _ in range(iterations):
+        func(rows)
+    return (time.process_time() - started) / iterations * 1000
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per page")
+    parser.add_argument("--iterations", type=int, default=200, help="Pages serialised per measurement")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert json.loads(default_path(rows)) == json.loads(fast_path(rows)), "serialization output differs"
+
+    default_ms = measure(default_path, rows, args.iterations)
+    fast_ms = measure(fast_path, rows, args.iterations)
+
+    print(f"rows per page:        {args.rows}")
+    print(f"default path (CPU):   {default_ms:.2f} ms/page")
+    print(f"fast path (CPU):      {fast_ms:.2f} ms/page")
+    print(f"speedup:              {default_ms / fast_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
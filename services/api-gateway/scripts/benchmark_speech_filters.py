@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Speech Filter Benchmark for OpenPolicy V2
+
+Times the /debates/speeches "politician" and "mentioned politician" filters
+against a database filled by scripts/synthetic_dataset.py (3M statements at
+scale 1.0): the old ILIKE scans over statement text and member names next to
+the indexed lookups through statement_mentions and the trigram name index.
+Each variant fetches the first page and the total count, as the endpoint does.
+
+The mention index is built by scripts/synthetic_dataset.py, or by the ETL
+service: (cd services/etl && python -m app.ingestion.read_models --only mentions).
+
+Usage:
+    python scripts/benchmark_speech_filters.py --name "Singh" --repeat 5
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+from statistics import median
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import desc, func, select
+
+from app.database import SessionLocal
+from app.core.speech_mentions import mentioned_politician_filter, resolve_member_ids
+from app.models.openparliament import Member, Statement
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 20
+
+
+def legacy_mentioned(db, name):
+    pattern = f"%{name}%"
+    return Statement.content_en.ilike(pattern) | Statement.content_fr.ilike(pattern)
+
+
+def indexed_mentioned(db, name):
+    return mentioned_politician_filter(db, name)
+
+
+def legacy_speaker(db, name):
+    return Statement.member_id.in_(select(Member.id).where(
+        func.concat(Member.first_name, " ", Member.last_name).ilike(f"%{name}%")
+    ))
+
+
+def indexed_speaker(db, name):
+    return Statement.member_id.in_(resolve_member_ids(db, name))
+
+
+def run_filter(db, build_filter, name):
+    """First page plus total count, the same two queries the endpoint runs."""
+    condition = build_filter(db, name)
+    page = db.execute(
+        select(Statement.id).where(condition).order_by(desc(Statement.time)).limit(PAGE_SIZE)
+    ).all()
+    total = db.execute(select(func.count()).select_from(Statement).where(condition)).scalar_one()
+    return len(page), total
+
+
+def time_filter(db, build_filter, name, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run_filter(db, build_filter, name)
+        timings.append(time.perf_counter() - started)
+    return median(timings), result
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Benchmark speech filters")
+    parser.add_argument("--name", default=None, help="Name to filter on (defaults to a member's surname)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the median is reported")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        statements = db.execute(select(func.count()).select_from(Statement)).scalar_one()
+        print(f"statements: {statements:,}")
+
+        name = args.name or db.execute(select(Member.last_name).limit(1)).scalar_one()
+        for label, legacy, indexed in (
+            ("politician", legacy_speaker, indexed_speaker),
+            ("mentioned_politician", legacy_mentioned, indexed_mentioned),
+        ):
+            legacy_seconds, legacy_result = time_filter(db, legacy, name, args.repeat)
+            indexed_seconds, indexed_result = time_filter(db, indexed, name, args.repeat)
+            print(f"{label}={name!r}: ILIKE {legacy_seconds * 1000:.1f} ms (total {legacy_result[1]:,}), "
+                  f"indexed {indexed_seconds * 1000:.1f} ms (total {indexed_result[1]:,}), "
+                  f"{legacy_seconds / max(indexed_seconds, 1e-9):.0f}x")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Load Test Driver for OpenPolicy V2 API Gateway
+
+Replays a scripted request profile against a running gateway with an asyncio
+httpx driver and records latency percentiles (p50/p95/p99) and throughput per
+route to a JSON baseline. In comparison mode the run fails when any route
+regresses by more than the allowed percentage.
+
+Usage:
+    # Record a baseline
+    python scripts/load_test.py --base-url http://localhost:8000 --output baseline.json
+
+    # Compare against it (exit code 1 on regression)
+    python scripts/load_test.py --compare baseline.json --max-regression 15
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RouteProfile:
+    """A route exercised by the load profile."""
+
+    name: str
+    paths: Sequence[str]
+    weight: int = 1
+
+
+# Heavy read paths whose regressions we want to catch. Several concrete paths
+# per route keep the gateway from serving everything out of one cache entry.
+DEFAULT_PROFILE: Sequence[RouteProfile] = (
+    RouteProfile("list_bills", (
+        "/api/v1/bills/?page=1",
+        "/api/v1/bills/?page=50&page_size=50",
+        "/api/v1/bills/?q=housing",
+        "/api/v1/bills/?status=passed&page=3",
+    ), weight=4),
+    RouteProfile("search_content", (
+        "/api/v1/search/?q=carbon+tax",
+        "/api/v1/search/?q=pharmacare",
+        "/api/v1/search/?q=budget&page=2",
+    ), weight=3),
+    RouteProfile("bills_summary_stats", ("/api/v1/bills/summary/stats",), weight=1),
+    RouteProfile("members_summary_stats", ("/api/v1/members/summary/stats",), weight=1),
+    RouteProfile("list_votes", ("/api/v1/votes/?page=1", "/api/v1/votes/?page=20"), weight=2),
+    RouteProfile("list_debates", ("/api/v1/debates/?page=1", "/api/v1/debates/?page=10"), weight=2),
+    RouteProfile("list_speeches", (
+        "/api/v1/debates/speeches/?page=1",
+        "/api/v1/debates/speeches/?mentioned_politician=Singh",
+    ), weight=2),
+)
+
+
+@dataclass
+class RouteResult:
+    """Raw measurements for one route."""
+
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` using linear interpolation."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(results: Dict[str, RouteResult], duration: float) -> Dict[str, dict]:
+    """Reduce raw measurements to per-route statistics."""
+    summary = {}
+    for name, result in sorted(results.items()):
+        latencies = result.latencies_ms
+        summary[name] = {
+            "requests": len(latencies),
+            "errors": result.errors,
+            "rps": round(len(latencies) / duration, 2) if duration > 0 else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        }
+    return summary
+
+
+def compare_to_baseline(
+    baseline: Dict[str, dict],
+    current: Dict[str, dict],
+    max_regression_pct: float,
+    metrics: Sequence[str] = ("p50_ms", "p95_ms", "p99_ms"),
+) -> List[str]:
+    """
+    Compare two route summaries.
+
+    Returns a list of human readable regressions; latency metrics regress when
+    they grow and throughput regresses when it drops by more than the limit.
+    """
+    regressions = []
+    for route, previous in baseline.items():
+        now = current.get(route)
+        if now is None:
+            continue
+        for metric in metrics:
+            before, after = previous.get(metric, 0.0), now.get(metric, 0.0)
+            if before > 0 and (after - before) / before * 100 > max_regression_pct:
+                regressions.append(
+                    f"{route}: {metric} {before:.2f} -> {after:.2f} (+{(after - before) / before * 100:.1f}%)"
+                )
+        before_rps, after_rps = previous.get("rps", 0.0), now.get("rps", 0.0)
+        if before_rps > 0 and (before_rps - after_rps) / before_rps * 100 > max_regression_pct:
+            regressions.append(
+                f"{route}: rps {before_rps:.2f} -> {after_rps:.2f} (-{(before_rps - after_rps) / before_rps * 100:.1f}%)"
+            )
+    return regressions
+
+
+class LoadTestRunner:
+    """Drives concurrent virtual users against the gateway."""
+
+    def __init__(
+        self,
+        base_url: str,
+        profile: Sequence[RouteProfile] = DEFAULT_PROFILE,
+        concurrency: int = 20,
+        duration: float = 30.0,
+        warmup: float = 5.0,
+        seed: int = 42,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            base_url: Gateway base URL
+            profile: Weighted routes to exercise
+            concurrency: Number of concurrent virtual users
+            duration: Measured run time in seconds
+            warmup: Unmeasured run time before measuring starts
+            seed: Seed for route selection
+            timeout: Per-request timeout in seconds
+            transport: Optional httpx transport (used by tests)
+        """
+        self.base_url = base_url
+        self.profile = list(profile)
+        self.concurrency = concurrency
+        self.duration = duration
+        self.warmup = warmup
+        self.rng = random.Random(seed)
+        self.timeout = timeout
+        self.transport = transport
+        self.weights = [route.weight for route in self.profile]
+
+    async def _user(self, client: httpx.AsyncClient, results: Dict[str, RouteResult], measure_from: float, stop_at: float):
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                return
+            route = self.rng.choices(self.profile, self.weights)[0]
+            path = self.rng.choice(route.paths)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if started < measure_from:
+                continue
+            result = results.setdefault(route.name, RouteResult())
+            if failed:
+                result.errors += 1
+            else:
+                result.latencies_ms.append(elapsed_ms)
+
+    async def run(self) -> Dict[str, dict]:
+        """Run the profile and return per-route statistics."""
+        results: Dict[str, RouteResult] = {}
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(
+            base_url=self.base_url, timeout=self.timeout, limits=limits, transport=self.transport
+        ) as client:
+            start = time.perf_counter()
+            measure_from = start + self.warmup
+            stop_at = measure_from + self.duration
+            await asyncio.gather(*[
+                self._user(client, results, measure_from, stop_at) for _ in range(self.concurrency)
+            ])
+        return summarize(results, self.duration)
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Load test the API gateway")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Gateway base URL")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured duration in seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Warmup duration in seconds")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for route selection")
+    parser.add_argument("--output", default=None, help="Write results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="Allowed regression in percent before failing")
+
+    args = parser.parse_args()
+
+    runner = LoadTestRunner(
+        args.base_url,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        seed=args.seed,
+    )
+    routes = asyncio.run(runner.run())
+
+    report = {
+        "recorded_at": datetime.utcnow().isoformat(),
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "routes": routes,
+    }
+
+    for name, stats in routes.items():
+        print(f"{name:24} rps={stats['rps']:>8} p50={stats['p50_ms']:>8}ms "
+              f"p95={stats['p95_ms']:>8}ms p99={stats['p99_ms']:>8}ms errors={stats['errors']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(baseline["routes"], routes, args.max_regression)
+        if regressions:
+            for regression in regressions:
+                logger.error(f"Regression: {regression}")
+            sys.exit(1)
+        logger.info("No regressions beyond %.1f%%", args.max_regression)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Visualization Aggregate Refresh for OpenPolicy V2
+
+Refreshes the materialized views that back the bill progress, vote
+breakdown and party activity charts. Run it at the end of every ingestion
+job; readers keep using the previous contents while a view is rebuilt.
+
+Usage:
+    python scripts/refresh_visualization_aggregates.py
+    python scripts/refresh_visualization_aggregates.py --view openpolicy.mv_bill_progress
+"""
+
+import os
+import sys
+import time
+import argparse
+import logging
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.database import SessionLocal
+from app.core.visualization_aggregates import AGGREGATE_VIEWS, refresh_aggregates
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Refresh chart aggregate views")
+    parser.add_argument("--view", action="append", choices=AGGREGATE_VIEWS,
+                        help="View to refresh (repeatable; defaults to all)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        versions = refresh_aggregates(db, args.view or AGGREGATE_VIEWS)
+        for view, version in versions.items():
+            print(f"{view}: version {version}")
+        print(f"refreshed {len(versions)} views in {time.perf_counter() - started:.2f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
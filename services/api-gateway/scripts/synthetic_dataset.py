@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Synthetic Parliamentary Dataset Generator for OpenPolicy V2
+
+Fills a local PostgreSQL database with a deterministic, realistically sized
+parliamentary dataset so that performance regressions in the heavy read
+endpoints (bill listing, search, vote analysis, debates) become measurable.
+
+Default volumes (scale=1.0):
+    - 400 politicians
+    - 20,000 bills
+    - 5,000 votes x 338 ballots
+    - 3,000,000 statements
+
+The same seed always produces the same rows, so baselines recorded by
+scripts/load_test.py are comparable between runs.
+
+The target database must be named explicitly. Existing rows are kept
+unless --reset is given, which truncates every openpolicy table the
+dataset touches, so never point --reset at a database you care about.
+
+Usage:
+    python scripts/synthetic_dataset.py --database-url postgresql://localhost/openpolicy_load --scale 0.1 --reset
+"""
+
+import os
+import sys
+import io
+import uuid
+import random
+import logging
+import subprocess
+import argparse
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# The ETL service, which owns the statement mention indexer
+ETL_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'etl')
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PROVINCES = ["ON", "QC", "BC", "AB", "MB", "SK", "NS", "NB", "NL", "PE", "YT", "NT", "NU"]
+PARTIES = [
+    ("Liberal", "LPC", "#D71920"),
+    ("Conservative", "CPC", "#1A4782"),
+    ("NDP", "NDP", "#F37021"),
+    ("Bloc Québécois", "BQ", "#33B2CC"),
+    ("Green", "GPC", "#3D9B35"),
+]
+BILL_STATUSES = ["introduced", "in_committee", "passed", "failed", "royal_assent"]
+VOTE_TYPES = ["second_reading", "third_reading", "amendment", "motion"]
+BALLOTS = ["Yea", "Nay", "Paired", "Absent"]
+BALLOT_WEIGHTS = [0.46, 0.46, 0.02, 0.06]
+MENTION_RATE = 0.15  # Share of speeches that mention another member
+FIRST_NAMES = [
+    "Anita", "Pierre", "Jagmeet", "Elizabeth", "Yves", "Chrystia", "Mark", "Melanie",
+    "Jean", "Marie", "Sean", "Leah", "Michael", "Heather", "Alain", "Karina", "Omar",
+    "Rachel", "Peter", "Jenny", "Tom", "Sophie", "Daniel", "Ya'ara", "Francis",
+]
+LAST_NAMES = [
+    "Anand", "Poilievre", "Singh", "May", "Blanchet", "Freeland", "Holland", "Joly",
+    "Tremblay", "Gagnon", "Fraser", "Gazan", "Chong", "McPherson", "Rayes", "Gould",
+    "Alghabra", "Blaney", "Julian", "Kwan", "Kmiec", "Chatel", "Blaikie", "Saks", "Drouin",
+]
+VOCABULARY = (
+    "budget government minister house member motion committee health carbon tax "
+    "housing affordability indigenous reconciliation pharmacare dental care climate "
+    "infrastructure transit defence sovereignty trade tariffs agriculture fisheries "
+    "immigration refugees seniors pensions workers union jobs economy inflation "
+    "interest rates deficit spending families children education veterans rural "
+    "northern broadband privacy online harms justice policing firearms energy"
+).split()
+
+
+@dataclass(frozen=True)
+class DatasetVolumes:
+    """Row counts for each generated table."""
+
+    politicians: int = 400
+    bills: int = 20_000
+    votes: int = 5_000
+    ballots_per_vote: int = 338
+    statements: int = 3_000_000
+    sessions: int = 6
+
+    def scaled(self, scale: float) -> "DatasetVolumes":
+        """Return volumes multiplied by ``scale`` (ballots are capped by politicians)."""
+        return DatasetVolumes(
+            politicians=max(1, int(self.politicians * scale)),
+            bills=max(1, int(self.bills * scale)),
+            votes=max(1, int(self.votes * scale)),
+            ballots_per_vote=self.ballots_per_vote,
+            statements=max(1, int(self.statements * scale)),
+            sessions=self.sessions,
+        )
+
+
+class SyntheticDatasetGenerator:
+    """
+    Deterministic generator of parliamentary rows.
+
+    Every ``generate_*`` method yields plain tuples in column order of the
+    corresponding ``openpolicy`` table, so rows can be streamed straight into
+    ``COPY`` without holding the full dataset in memory.
+    """
+
+    def __init__(self, seed: int = 42, volumes: Optional[DatasetVolumes] = None):
+        """
+        Initialize generator.
+
+        Args:
+            seed: Seed for the pseudo-random generator
+            volumes: Row counts to generate
+        """
+        self.seed = seed
+        self.volumes = volumes or DatasetVolumes()
+        self.rng = random.Random(seed)
+        self.jurisdiction_id = self._uuid()
+        self.party_ids: List[uuid.UUID] = []
+        self.session_ids: List[Tuple[uuid.UUID, date]] = []
+        self.member_ids: List[uuid.UUID] = []
+        self.member_names: List[str] = []
+        self.name_counts: Dict[Tuple[str, str], int] = {}
+        self.bill_ids: List[uuid.UUID] = []
+        self.vote_ids: List[uuid.UUID] = []
+        self.epoch = datetime(2015, 12, 3, 14, 0, tzinfo=timezone.utc)
+
+    def _uuid(self) -> uuid.UUID:
+        """Deterministic UUID4 drawn from the seeded generator."""
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _sentence(self, words: int) -> str:
+        return " ".join(self.rng.choices(VOCABULARY, k=words)).capitalize() + "."
+
+    def generate_jurisdictions(self) -> Iterator[tuple]:
+        yield (self.jurisdiction_id, "House of Commons", "CA", "federal")
+
+    def generate_parties(self) -> Iterator[tuple]:
+        for name, short_name, color in PARTIES:
+            party_id = self._uuid()
+            self.party_ids.append(party_id)
+            yield (party_id, self.jurisdiction_id, name, short_name, color, None)
+
+    def generate_sessions(self) -> Iterator[tuple]:
+        for index in range(self.volumes.sessions):
+            session_id = self._uuid()
+            start = (self.epoch + timedelta(days=365 * index)).date()
+            self.session_ids.append((session_id, start))
+            yield (session_id, f"{42 + index // 2}-{index % 2 + 1}", start, start + timedelta(days=364))
+
+    def generate_members(self) -> Iterator[tuple]:
+        for index in range(self.volumes.politicians):
+            member_id = self._uuid()
+            self.member_ids.append(member_id)
+            first = self.rng.choice(FIRST_NAMES)
+            last = self.rng.choice(LAST_NAMES)
+            # The name pool is small, so repeats get a numeric suffix and
+            # every (jurisdiction, first, last) stays distinct
+            repeats = self.name_counts.get((first, last), 0)
+            self.name_counts[(first, last)] = repeats + 1
+            if repeats:
+                last = f"{last} {repeats + 1}"
+            self.member_names.append(f"{first} {last}")
+            party_id = self.rng.choice(self.party_ids)
+            province = self.rng.choice(PROVINCES)
+            yield (
+                member_id, self.jurisdiction_id, party_id, first, last, f"{first} {last}",
+                f"{first}.{last}.{index}@parl.gc.ca".lower().replace("'", ""),
+                f"613-{self.rng.randint(200, 999)}-{self.rng.randint(1000, 9999)}",
+                None, f"{province} Riding {index}", "MP", self.epoch.date(), None,
+            )
+
+    def generate_bills(self) -> Iterator[tuple]:
+        for index in range(self.volumes.bills):
+            bill_id = self._uuid()
+            self.bill_ids.append(bill_id)
+            session_id, session_start = self.session_ids[index % len(self.session_ids)]
+            prefix = "C" if self.rng.random() < 0.8 else "S"
+            introduced = session_start + timedelta(days=self.rng.randint(0, 360))
+            status = self.rng.choice(BILL_STATUSES)
+            keywords = self.rng.sample(VOCABULARY, 3)
+            yield (
+                bill_id, self.jurisdiction_id, session_id, f"{prefix}-{index + 1}",
+                f"An Act respecting {' '.join(keywords)}", self._sentence(40), None,
+                status, introduced,
+                introduced + timedelta(days=120) if status in ("passed", "royal_assent") else None,
+                introduced + timedelta(days=150) if status == "royal_assent" else None,
+                None, keywords,
+            )
+
+    def generate_votes(self) -> Iterator[tuple]:
+        for _ in range(self.volumes.votes):
+            vote_id = self._uuid()
+            self.vote_ids.append(vote_id)
+            yeas = self.rng.randint(100, 230)
+            nays = self.rng.randint(80, 338 - yeas)
+            abstentions = self.rng.randint(0, 338 - yeas - nays)
+            vote_date = self.epoch + timedelta(days=self.rng.randint(0, 365 * self.volumes.sessions))
+            yield (
+                vote_id, self.rng.choice(self.bill_ids), vote_date, self.rng.choice(VOTE_TYPES),
+                "Passed" if yeas > nays else "Defeated", yeas, nays, abstentions,
+                338 - yeas - nays - abstentions,
+            )
+
+    def generate_ballots(self) -> Iterator[tuple]:
+        voters = min(self.volumes.ballots_per_vote, len(self.member_ids))
+        for vote_id in self.vote_ids:
+            for member_id in self.rng.sample(self.member_ids, voters):
+                yield (vote_id, member_id, self.rng.choices(BALLOTS, BALLOT_WEIGHTS)[0])
+
+    def generate_statements(self) -> Iterator[tuple]:
+        sitting_days = max(1, self.volumes.statements // 600)
+        for index in range(self.volumes.statements):
+            day, sequence = divmod(index, max(1, self.volumes.statements // sitting_days))
+            spoken_at = self.epoch + timedelta(days=day * 2, seconds=sequence * 30)
+            words = self.rng.randint(20, 400)
+            procedural = self.rng.random() < 0.1
+            heading = self.rng.choice(VOCABULARY).capitalize()
+            speaker = None if procedural else self.rng.choice(self.member_ids)
+            bill = self.rng.choice(self.bill_ids) if self.rng.random() < 0.3 else None
+            content = self._sentence(words)
+            if not procedural and self.rng.random() < MENTION_RATE:
+                # Hansard markup for a politician mention, as the legacy importer writes it
+                name = self.rng.choice(self.member_names)
+                slug = name.lower().replace(" ", "-").replace("'", "")
+                content += f' I thank <a href="/politicians/{slug}/" title="{name}">{name}</a>.'
+            yield (
+                speaker, bill,
+                spoken_at, sequence, "Government Orders", heading, "Ordres émanant du gouvernement", heading,
+                content, None, words, procedural,
+            )
+
+
+# (table, columns, generator method) in foreign-key order
+TABLE_PLAN: Sequence[Tuple[str, Tuple[str, ...], str]] = (
+    ("openpolicy.jurisdictions", ("id", "name", "province", "slug"), "generate_jurisdictions"),
+    ("openpolicy.parties", ("id", "jurisdiction_id", "name", "short_name", "color", "website"), "generate_parties"),
+    ("openpolicy.sessions", ("id", "name", "start_date", "end_date"), "generate_sessions"),
+    ("openpolicy.members", (
+        "id", "jurisdiction_id", "party_id", "first_name", "last_name", "full_name", "email", "phone",
+        "website", "district", "role", "start_date", "end_date",
+    ), "generate_members"),
+    ("openpolicy.bills", (
+        "id", "jurisdiction_id", "session_id", "bill_number", "title", "summary", "full_text", "status",
+        "introduced_date", "passed_date", "royal_assent_date", "sponsors", "keywords",
+    ), "generate_bills"),
+    ("openpolicy.votes", (
+        "id", "bill_id", "vote_date", "vote_type", "result", "yeas", "nays", "abstentions", "absent",
+    ), "generate_votes"),
+    ("openpolicy.vote_ballots", ("vote_id", "member_id", "ballot"), "generate_ballots"),
+    ("openpolicy.statements", (
+        "member_id", "bill_debated_id", "time", "sequence", "h1_en", "h2_en", "h1_fr", "h2_fr",
+        "content_en", "content_fr", "wordcount", "procedural",
+    ), "generate_statements"),
+)
+
+
+def _copy_value(value) -> str:
+    """Encode a single value for PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (list, tuple)):
+        # Array elements are quoted and escaped for the array literal, then
+        # the whole literal is escaped again for COPY below
+        value = "{" + ",".join(
+            '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"' for v in value
+        ) + "}"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+class DatasetLoader:
+    """Streams generated rows into PostgreSQL with COPY."""
+
+    def __init__(self, database_url: str, batch_size: int = 50_000):
+        """
+        Initialize loader.
+
+        Args:
+            database_url: SQLAlchemy database URL of the target database
+            batch_size: Rows buffered per COPY round-trip
+        """
+        from sqlalchemy import create_engine
+
+        self.engine = create_engine(database_url)
+        self.batch_size = batch_size
+
+    def prepare_schema(self, truncate: bool = False):
+        """Create any missing openpolicy tables and optionally empty them."""
+        from sqlalchemy import text
+        from app.database import Base
+        from app.models import openparliament
+
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE SCHEMA IF NOT EXISTS openpolicy"))
+        tables = [
+            openparliament.Jurisdiction.__table__, openparliament.Party.__table__,
+            openparliament.Session.__table__, openparliament.Member.__table__,
+            openparliament.Bill.__table__, openparliament.Vote.__table__,
+            openparliament.VoteBallot.__table__, openparliament.Statement.__table__,
+            openparliament.StatementMention.__table__, openparliament.DebateDay.__table__,
+        ]
+        Base.metadata.create_all(bind=self.engine, tables=tables)
+        if truncate:
+            names = ", ".join(table for table, _, _ in reversed(TABLE_PLAN))
+            with self.engine.begin() as conn:
+                conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+
+    def load(self, generator: SyntheticDatasetGenerator) -> dict:
+        """Load every table in TABLE_PLAN and return row counts per table."""
+        counts = {}
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            for table, columns, method in TABLE_PLAN:
+                started = datetime.now()
+                counts[table] = self._copy_rows(cursor, table, columns, getattr(generator, method)())
+                raw.commit()
+                logger.info(f"Loaded {counts[table]:,} rows into {table} in {datetime.now() - started}")
+            with raw.cursor() as analyze_cursor:
+                for table, _, _ in TABLE_PLAN:
+                    analyze_cursor.execute(f"ANALYZE {table}")
+            raw.commit()
+        finally:
+            raw.close()
+        self.refresh_read_models()
+        return counts
+
+    def refresh_read_models(self):
+        """Rebuild the read models derived from the loaded tables."""
+        from sqlalchemy.orm import Session
+        from app.core.debate_days import refresh_debate_days
+
+        with Session(self.engine) as db:
+            days = refresh_debate_days(db)
+        logger.info(f"Rebuilt debate_days: {days:,} sitting days")
+
+        # statement_mentions is written only by the ETL service's indexer
+        database_url = self.engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        subprocess.run(
+            [sys.executable, "-m", "app.ingestion.read_models", "--database-url", database_url,
+             "--only", "mentions", "--rebuild-mentions"],
+            cwd=ETL_DIR, check=True,
+        )
+        logger.info("Indexed statement mentions")
+
+    def _copy_rows(self, cursor, table: str, columns: Sequence[str], rows: Iterator[tuple]) -> int:
+        statement = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+        total = 0
+        buffer = io.StringIO()
+        pending = 0
+        for row in rows:
+            buffer.write("\t".join(_copy_value(value) for value in row))
+            buffer.write("\n")
+            pending += 1
+            if pending >= self.batch_size:
+                self._flush(cursor, statement, buffer)
+                total += pending
+                pending = 0
+                buffer = io.StringIO()
+        if pending:
+            self._flush(cursor, statement, buffer)
+            total += pending
+        return total
+
+    @staticmethod
+    def _flush(cursor, statement: str, buffer: io.StringIO):
+        if hasattr(cursor, "copy"):  # psycopg 3
+            with cursor.copy(statement) as copy:
+                copy.write(buffer.getvalue())
+        else:  # psycopg2
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic parliamentary dataset")
+    parser.add_argument("--database-url", required=True,
+                        help="Target database URL; use a scratch database, not the application's")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiplier applied to the default volumes (e.g. 0.01 for a smoke dataset)")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per COPY batch")
+    parser.add_argument("--reset", action="store_true",
+                        help="TRUNCATE the openpolicy tables before loading (destroys existing rows)")
+
+    args = parser.parse_args()
+
+    volumes = DatasetVolumes().scaled(args.scale)
+    logger.info(f"Generating dataset with seed={args.seed}: {volumes}")
+
+    loader = DatasetLoader(args.database_url, batch_size=args.batch_size)
+    loader.prepare_schema(truncate=args.reset)
+    counts = loader.load(SyntheticDatasetGenerator(seed=args.seed, volumes=volumes))
+
+    for table, count in counts.items():
+        print(f"{table}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
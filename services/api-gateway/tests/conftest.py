@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 from typing import Dict, Any
 
 from app.main import app
-from app.database import get_db
+from app.database import get_db, get_read_db
 from tests.test_config import test_config, test_data_factory, test_utilities
 
 
@@ -116,6 +116,7 @@ def override_get_db(mock_db):
         return mock_db
     
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     yield
     app.dependency_overrides.clear()
 
@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import create_engine, text
 from sqlalchemy.pool import StaticPool
 
-from app.database import get_db, Base
+from app.database import Base
 from app.models.openparliament import Bill, Committee, CommitteeMeeting, ElectedMember, Party, Riding, VoteQuestion
 from app.models.users import User, PasswordResetToken, UserSession
 from tests.test_config import test_data_factory
@@ -339,12 +339,13 @@ def mock_user_session():
 @pytest.fixture
 def override_get_db(mock_db_session):
     """Override the database dependency to use mock database."""
-    from app.database import get_db
+    from app.database import get_db, get_read_db
     
     def _override_get_db():
         return mock_db_session
     
     from app.main import app
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     yield
     app.dependency_overrides.clear()
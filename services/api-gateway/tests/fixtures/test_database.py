@@ -11,7 +11,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db
 from app.models.openparliament import Bill, Committee, CommitteeMeeting, ElectedMember, Party, Riding, VoteQuestion
 from app.models.users import User
 
@@ -366,6 +366,7 @@ def override_get_db_test(test_db_session):
     
     from app.main import app
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     yield
     app.dependency_overrides.clear()
 
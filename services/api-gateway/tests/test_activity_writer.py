@@ -0,0 +1,121 @@
+"""
+Tests for the buffered user activity writer.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy.exc import DataError
+
+import app.core.activity_writer as activity_module
+from app.core.activity_writer import ActivityWriter, _month_start, rollup_rows
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def _activity(user_id, minutes=0, activity_type="bill_view", content_type="bill"):
+    return {
+        "id": uuid4(), "user_id": user_id, "activity_type": activity_type,
+        "content_type": content_type, "activity_date": NOW + timedelta(minutes=minutes),
+    }
+
+
+class FakeSession:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_rollup_rows_collapse_per_user_day_and_type():
+    alice, bob = uuid4(), uuid4()
+    rows = rollup_rows([
+        _activity(alice, 0), _activity(alice, 30), _activity(alice, 5, "mp_research", "mp"),
+        _activity(bob, 0, content_type=None), _activity(alice, 24 * 60),
+    ])
+    by_key = {(r["user_id"], r["day"], r["activity_type"], r["content_type"]): r for r in rows}
+
+    assert len(rows) == 4
+    today = by_key[(alice, NOW.date(), "bill_view", "bill")]
+    assert today["count"] == 2
+    assert today["last_at"] == NOW + timedelta(minutes=30)
+    assert by_key[(bob, NOW.date(), "bill_view", "")]["count"] == 1
+    assert by_key[(alice, NOW.date() + timedelta(days=1), "bill_view", "bill")]["count"] == 1
+
+
+def test_writer_batches_and_flushes_on_stop(monkeypatch):
+    batches = []
+    monkeypatch.setattr(activity_module, "write_activity_batch", lambda db, batch: batches.append(batch))
+
+    async def scenario():
+        writer = ActivityWriter(session_factory=FakeSession, flush_interval=60, max_batch=3)
+        user = uuid4()
+        for minute in range(7):
+            writer.record(_activity(user, minute))
+        await asyncio.sleep(0.05)  # the full batches are written without waiting for the interval
+        written_early = sum(len(b) for b in batches)
+        await writer.stop()
+        return written_early, writer.pending
+
+    written_early, pending = asyncio.run(scenario())
+    assert written_early >= 3
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert pending == 0
+
+
+def test_writer_keeps_failed_batches_for_the_next_flush(monkeypatch):
+    calls = []
+
+    def flaky(db, batch):
+        calls.append(len(batch))
+        if len(calls) <= 2:  # the batch, then its first row on its own
+            raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(activity_module, "write_activity_batch", flaky)
+
+    async def scenario():
+        writer = ActivityWriter(session_factory=FakeSession, flush_interval=60, max_batch=10, max_buffer=2)
+        user = uuid4()
+        for minute in range(3):
+            writer._buffer.append(_activity(user, minute))
+        first = await writer.flush()
+        kept = writer.pending
+        second = await writer.flush()
+        return first, kept, second
+
+    first, kept, second = asyncio.run(scenario())
+    assert first == 0
+    assert kept == 2  # oldest event dropped once the buffer limit is exceeded
+    assert second == 2
+
+
+def test_writer_drops_rows_the_database_rejects(monkeypatch):
+    written = []
+
+    def strict(db, batch):
+        if any(len(activity["activity_type"]) > 50 for activity in batch):
+            raise DataError("INSERT", {}, Exception("value too long for type character varying(50)"))
+        written.extend(batch)
+
+    monkeypatch.setattr(activity_module, "write_activity_batch", strict)
+
+    async def scenario():
+        writer = ActivityWriter(session_factory=FakeSession, flush_interval=60, max_batch=10)
+        user = uuid4()
+        writer._buffer.extend([_activity(user, 0), _activity(user, 1, "x" * 60), _activity(user, 2)])
+        first = await writer.flush()
+        writer._buffer.append(_activity(user, 3))
+        second = await writer.flush()
+        return first, second, writer.pending
+
+    first, second, pending = asyncio.run(scenario())
+    assert (first, second, pending) == (2, 1, 0)
+    assert [activity["activity_date"].minute for activity in written] == [0, 2, 3]
+
+
+def test_month_start_wraps_years():
+    assert _month_start(date(2026, 11, 30), 1) == date(2026, 12, 1)
+    assert _month_start(date(2026, 12, 5), 1) == date(2027, 1, 1)
+    assert _month_start(date(2026, 1, 5), -1) == date(2025, 12, 1)
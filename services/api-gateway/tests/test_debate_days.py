@@ -0,0 +1,114 @@
+"""
+Tests for keyset pagination over the debate_days read model.
+"""
+
+import itertools
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.debate_days import debate_day_totals, page_debate_days
+from app.models.openparliament import DebateDay, Statement, Vote
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS openpolicy")
+
+    for model in (DebateDay, Statement, Vote):
+        model.__table__.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    first = date(2024, 1, 1)
+    session.add_all(
+        DebateDay(sitting_date=first + timedelta(days=i), statement_count=10 * i, vote_count=i % 3, bill_count=i % 2)
+        for i in range(25)
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_keyset_pages_cover_every_day_once(db):
+    seen = []
+    cursor = None
+    while True:
+        page = page_debate_days(db, before=cursor, limit=10)
+        assert page.total == 25
+        seen.extend(day.sitting_date for day in page.days)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+        assert cursor == page.days[-1].sitting_date
+
+    assert len(seen) == 25
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_offset_page_matches_keyset_page(db):
+    first = page_debate_days(db, limit=10)
+    by_cursor = page_debate_days(db, before=first.next_cursor, limit=10)
+    by_offset = page_debate_days(db, offset=10, limit=10)
+    assert [d.sitting_date for d in by_cursor.days] == [d.sitting_date for d in by_offset.days]
+
+
+def test_date_filters_and_last_page(db):
+    page = page_debate_days(db, date_gte=date(2024, 1, 20), date_lte=date(2024, 1, 22), limit=3)
+    assert page.total == 3
+    assert [d.sitting_date.day for d in page.days] == [22, 21, 20]
+    assert page.next_cursor is None
+
+
+def test_totals_skip_days_without_statements(db):
+    sittings, statements, latest = debate_day_totals(db)
+    assert sittings == 24
+    assert statements == sum(10 * i for i in range(25))
+    assert latest == date(2024, 1, 25)
+
+
+statement_ids = itertools.count(1)
+
+
+def add_sitting(db, day, statements, votes):
+    """Statements and votes ingested for a day that debate_days doesn't cover yet."""
+    start = datetime.combine(day, datetime.min.time()) + timedelta(hours=10)
+    db.add_all(
+        Statement(id=next(statement_ids), time=start + timedelta(minutes=i), sequence=i, content_en="...", wordcount=1)
+        for i in range(statements)
+    )
+    db.add_all(
+        Vote(id=uuid4(), bill_id=uuid4(), vote_date=start + timedelta(hours=5), vote_type="division",
+             result="passed")
+        for _ in range(votes)
+    )
+    db.commit()
+
+
+def test_days_after_the_read_model_are_computed_live(db):
+    add_sitting(db, date(2024, 1, 26), statements=3, votes=2)
+    add_sitting(db, date(2024, 1, 29), statements=0, votes=1)
+    # Covered by debate_days already, so not counted twice
+    add_sitting(db, date(2024, 1, 25), statements=5, votes=0)
+
+    page = page_debate_days(db, limit=3)
+    assert page.total == 27
+    assert [d.sitting_date.day for d in page.days] == [29, 26, 25]
+    assert (page.days[0].statement_count, page.days[0].vote_count, page.days[0].bill_count) == (0, 1, 1)
+    assert (page.days[1].statement_count, page.days[1].vote_count, page.days[1].bill_count) == (3, 2, 2)
+    assert page.days[2].statement_count == 240
+
+    by_offset = page_debate_days(db, offset=1, limit=3)
+    by_cursor = page_debate_days(db, before=date(2024, 1, 29), limit=3)
+    assert [d.sitting_date.day for d in by_offset.days] == [26, 25, 24]
+    assert [d.sitting_date.day for d in by_cursor.days] == [26, 25, 24]
+    assert page_debate_days(db, date_lte=date(2024, 1, 27), limit=1).days[0].sitting_date.day == 26
+
+    sittings, statements, latest = debate_day_totals(db)
+    assert (sittings, latest) == (25, date(2024, 1, 26))
+    assert statements == sum(10 * i for i in range(25)) + 3
@@ -0,0 +1,123 @@
+"""
+Tests for the synthetic dataset generator and load test driver.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from scripts.load_test import (
+    LoadTestRunner, RouteProfile, compare_to_baseline, percentile, summarize, RouteResult
+)
+from scripts.synthetic_dataset import DatasetVolumes, SyntheticDatasetGenerator, TABLE_PLAN, _copy_value
+
+
+SMALL_VOLUMES = DatasetVolumes(politicians=20, bills=50, votes=10, ballots_per_vote=15, statements=200, sessions=2)
+
+
+def _generate_all(seed: int) -> dict:
+    generator = SyntheticDatasetGenerator(seed=seed, volumes=SMALL_VOLUMES)
+    return {table: list(getattr(generator, method)()) for table, _, method in TABLE_PLAN}
+
+
+class TestSyntheticDataset:
+    """Synthetic dataset generator behaviour."""
+
+    def test_same_seed_is_deterministic(self):
+        assert _generate_all(7) == _generate_all(7)
+
+    def test_different_seed_differs(self):
+        assert _generate_all(7)["openpolicy.bills"] != _generate_all(8)["openpolicy.bills"]
+
+    def test_volumes_and_column_counts(self):
+        rows = _generate_all(1)
+        assert len(rows["openpolicy.members"]) == 20
+        assert len(rows["openpolicy.bills"]) == 50
+        assert len(rows["openpolicy.votes"]) == 10
+        assert len(rows["openpolicy.vote_ballots"]) == 10 * 15
+        assert len(rows["openpolicy.statements"]) == 200
+        for table, columns, _ in TABLE_PLAN:
+            assert all(len(row) == len(columns) for row in rows[table]), table
+
+    def test_ballots_reference_generated_members(self):
+        rows = _generate_all(3)
+        member_ids = {row[0] for row in rows["openpolicy.members"]}
+        assert {row[1] for row in rows["openpolicy.vote_ballots"]} <= member_ids
+
+    def test_member_names_are_unique(self):
+        generator = SyntheticDatasetGenerator(seed=5, volumes=DatasetVolumes(politicians=2_000))
+        list(generator.generate_parties())
+        names = [(row[3], row[4]) for row in generator.generate_members()]
+        assert len(set(names)) == len(names) == 2_000
+
+    def test_scaled_volumes(self):
+        volumes = DatasetVolumes().scaled(0.01)
+        assert volumes.bills == 200
+        assert volumes.statements == 30_000
+        assert volumes.ballots_per_vote == 338
+
+    def test_copy_value_encoding(self):
+        assert _copy_value(None) == "\\N"
+        assert _copy_value(True) == "t"
+        assert _copy_value(["a", "b"]) == '{"a","b"}'
+        # Array escaping (\\ and \") is itself escaped for COPY text format
+        assert _copy_value(['say "hi"', "back\\slash"]) == '{"say \\\\"hi\\\\"","back\\\\\\\\slash"}'
+        assert _copy_value("line\nbreak\ttab") == "line\\nbreak\\ttab"
+
+
+class TestLoadTestStatistics:
+    """Percentile, summary and baseline comparison logic."""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([], 95) == 0.0
+
+    def test_summarize(self):
+        summary = summarize({"list_bills": RouteResult(latencies_ms=[10.0, 20.0, 30.0], errors=1)}, duration=3.0)
+        assert summary["list_bills"]["requests"] == 3
+        assert summary["list_bills"]["errors"] == 1
+        assert summary["list_bills"]["rps"] == 1.0
+        assert summary["list_bills"]["p50_ms"] == 20.0
+
+    def test_compare_detects_latency_regression(self):
+        baseline = {"list_bills": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0, "rps": 100.0}}
+        current = {"list_bills": {"p50_ms": 10.5, "p95_ms": 26.0, "p99_ms": 30.0, "rps": 100.0}}
+        regressions = compare_to_baseline(baseline, current, max_regression_pct=10)
+        assert len(regressions) == 1
+        assert "p95_ms" in regressions[0]
+
+    def test_compare_detects_throughput_drop(self):
+        baseline = {"search_content": {"p50_ms": 10.0, "rps": 100.0}}
+        current = {"search_content": {"p50_ms": 10.0, "rps": 50.0}}
+        assert compare_to_baseline(baseline, current, max_regression_pct=10, metrics=("p50_ms",))
+
+    def test_compare_within_threshold(self):
+        baseline = {"list_bills": {"p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0, "rps": 100.0}}
+        current = {"list_bills": {"p50_ms": 10.9, "p95_ms": 21.0, "p99_ms": 31.0, "rps": 95.0}}
+        assert compare_to_baseline(baseline, current, max_regression_pct=10) == []
+
+
+def test_runner_records_routes_and_errors():
+    """Runner drives every route and counts failed responses as errors."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/broken"):
+            return httpx.Response(500)
+        return httpx.Response(200, json={"ok": True})
+
+    runner = LoadTestRunner(
+        "http://testserver",
+        profile=[RouteProfile("ok", ("/ok",)), RouteProfile("broken", ("/broken",))],
+        concurrency=4,
+        duration=0.2,
+        warmup=0.0,
+        transport=httpx.MockTransport(handler),
+    )
+    summary = asyncio.run(runner.run())
+    assert summary["ok"]["requests"] > 0
+    assert summary["ok"]["errors"] == 0
+    assert summary["broken"]["requests"] == 0
+    assert summary["broken"]["errors"] > 0
@@ -0,0 +1,61 @@
+"""
+Tests for blocking-key member duplicate detection.
+"""
+
+from app.core.member_dedup import (
+    DuplicateDetector, MemberRecord, blocking_keys, email_local_part,
+    jaro_winkler, normalize_phone, soundex, trigram_similarity,
+)
+
+
+def test_soundex_matches_reference_codes():
+    assert soundex("Robert") == soundex("Rupert") == "R163"
+    assert soundex("Tymczak") == "T522"
+    assert soundex("Pfister") == "P236"
+    assert soundex("Côté") == soundex("Cote") == "C300"
+    assert soundex("") == ""
+
+
+def test_field_normalisation():
+    assert email_local_part("J.Doe+office@parl.gc.ca") == "jdoe"
+    assert email_local_part("not-an-email") == ""
+    assert normalize_phone("+1 (613) 992-4211") == normalize_phone("613-992-4211") == "6139924211"
+    assert normalize_phone("4211") == ""
+
+
+def test_similarity_scores():
+    assert jaro_winkler("martha", "marhta") > 0.96
+    assert jaro_winkler("abc", "xyz") == 0.0
+    assert trigram_similarity("jagmeet singh", "jagmeet singh") == 1.0
+    assert trigram_similarity("jagmeet singh", "pierre poilievre") < 0.1
+
+
+def test_near_duplicates_share_a_block():
+    original = MemberRecord(1, "Chrystia", "Freeland", email="chrystia.freeland@parl.gc.ca")
+    typo = MemberRecord(2, "Chrystia", "Freelend", email="cfreeland@parl.gc.ca")
+    assert set(blocking_keys(original)) & set(blocking_keys(typo))
+
+
+def test_detector_finds_near_duplicates_only():
+    records = [
+        MemberRecord(1, "Élizabeth", "May", phone="613-996-1119", district="Saanich—Gulf Islands"),
+        MemberRecord(2, "Elizabeth", "May", phone="+1 (613) 996 1119", district="Saanich-Gulf Islands"),
+        MemberRecord(3, "Pierre", "Poilievre", email="pierre.poilievre@parl.gc.ca"),
+        MemberRecord(4, "Pierre", "Poilièvre", email="pierrepoilievre+ca@parl.gc.ca"),
+        MemberRecord(5, "Peter", "Parker", district="Saanich—Gulf Islands"),
+    ]
+    detector = DuplicateDetector(threshold=0.85)
+    pairs = detector.find_duplicates(records)
+
+    assert {tuple(pair["member_ids"]) for pair in pairs} == {("1", "2"), ("3", "4")}
+    assert "phone" in next(p for p in pairs if p["member_ids"] == ["1", "2"])["reasons"]
+    # Each pair is scored once even though it shares several blocks
+    assert detector.pairs_compared == 2
+
+
+def test_detector_skips_oversized_blocks():
+    surnames = ["Adams", "Baker", "Clark", "Davis", "Evans", "Fisher", "Green", "Hughes", "Irwin", "Jones"]
+    records = [MemberRecord(i, "Alex", surname, phone="613-555-0100") for i, surname in enumerate(surnames)]
+    detector = DuplicateDetector(max_block_size=5)
+    detector.find_duplicates(records)
+    assert detector.skipped_blocks == 1
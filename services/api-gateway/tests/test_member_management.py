@@ -31,6 +31,12 @@ class TestMemberManagementService:
         """Create service instance."""
         return MemberManagementService(db_session)
     
+    @pytest.fixture
+    def requires_postgres(self, db_session):
+        """Skip unless on PostgreSQL; bulk import stages rows in a temp table."""
+        if db_session.get_bind().dialect.name != "postgresql":
+            pytest.skip("bulk member import requires PostgreSQL")
+    
     @pytest.fixture
     def test_user(self, db_session):
         """Create test user."""
@@ -210,6 +216,7 @@ class TestMemberManagementService:
         members, total = service.search_members(search_request)
         assert total == 2  # Both have no end date
     
+    @pytest.mark.usefixtures("requires_postgres")
     def test_bulk_import_csv(self, service, test_user, test_jurisdiction):
         """Test CSV bulk import."""
         csv_data = """first_name,last_name,email,district,jurisdiction_id,start_date
@@ -355,6 +362,73 @@ Bob,Wilson,bob@parliament.ca,District B,{},2022-01-01""".format(
         assert rows[0]["id"] == str(test_member.id)
         assert rows[0]["full_name"] == test_member.full_name
     
+    def test_export_members_ndjson(self, service, test_member):
+        """Test NDJSON export streams one member per line."""
+        export_request = MemberExportRequest(format="ndjson")
+        
+        chunks = list(service.iter_export_members(export_request, [test_member.id]))
+        
+        import json
+        lines = b"".join(chunks).decode('utf-8').splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["id"] == str(test_member.id)
+    
+    def test_export_csv_streams_per_batch(self, service):
+        """Test CSV export yields one chunk per batch plus the header."""
+        batches = iter([
+            [{"id": uuid4(), "first_name": "A", "last_name": "One", "start_date": date(2022, 1, 1)}],
+            [{"id": uuid4(), "first_name": "B", "last_name": "Two", "end_date": None}],
+        ])
+        
+        chunks = list(service._export_csv(batches))
+        
+        import csv
+        import io
+        assert len(chunks) == 2
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode('utf-8'))))
+        assert [row["first_name"] for row in rows] == ["A", "B"]
+        assert rows[0]["start_date"] == "2022-01-01"
+        assert rows[1]["end_date"] == ""
+    
+    @pytest.mark.usefixtures("requires_postgres")
+    def test_bulk_import_reports_row_errors(self, service, test_user, test_jurisdiction):
+        """Test invalid and duplicate rows are reported without failing the import."""
+        csv_data = """first_name,last_name,jurisdiction_id,start_date
+Carol,King,{jid},2022-01-01
+Carol,King,{jid},2022-01-01
+Dan,Brown,{bad},2022-01-01
+Eve,Stone,{jid},not-a-date""".format(jid=test_jurisdiction.id, bad=uuid4())
+        
+        import_data = BulkMemberImport(
+            import_source="csv",
+            import_type="incremental",
+            csv_data=csv_data
+        )
+        
+        import_record = service.bulk_import_members(import_data, test_user)
+        
+        assert import_record.status == "completed"
+        assert import_record.total_records == 4
+        assert import_record.created_count == 1
+        assert import_record.error_count == 3
+        assert [error["index"] for error in import_record.errors] == [1, 2, 3]
+    
+    def test_bulk_operation_archive_reports_missing(self, service, test_user, test_member):
+        """Test set-based archive updates existing members and reports unknown ids."""
+        missing_id = uuid4()
+        operation_request = BulkOperationRequest(
+            member_ids=[test_member.id, missing_id],
+            operation="archive"
+        )
+        
+        result = service.bulk_operation(operation_request, test_user)
+        
+        assert result["success_count"] == 1
+        assert result["error_count"] == 1
+        assert result["errors"][0]["member_id"] == str(missing_id)
+        service.db.refresh(test_member)
+        assert test_member.end_date == date.today()
+    
     def test_update_member_metrics(self, service, test_member):
         """Test member metrics update."""
         metrics_data = MemberMetricsUpdate(
@@ -0,0 +1,138 @@
+"""
+Tests for read replica routing.
+
+Covers health-checked replica selection, lag-aware fallback to the primary,
+read-your-writes pinning, and that sessions from get_read_db cannot write.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import Column, Integer, create_engine, text
+from sqlalchemy.orm import declarative_base
+
+from app.database import ReadOnlySessionError, ReplicaRouter, SessionLocal
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _engine(name):
+    engine = Mock(name=name)
+    engine.url.host = name
+    return engine
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def primary():
+    return _engine("primary")
+
+
+def _router(primary, clock, lags, **kwargs):
+    """Build a router whose replicas report the given lags (None = down)."""
+    replicas = {url: _engine(url) for url in lags}
+    router = ReplicaRouter(
+        primary,
+        list(lags),
+        engine_factory=lambda url: replicas[url],
+        clock=clock,
+        **kwargs
+    )
+    router.check_replica = lambda replica: lags[replica.url.host]
+    return router, replicas
+
+
+def test_no_replicas_uses_primary(primary, clock):
+    router = ReplicaRouter(primary, [], clock=clock)
+    assert not router.enabled
+    assert router.engine_for_read("client") is primary
+
+
+def test_round_robin_across_healthy_replicas(primary, clock):
+    router, replicas = _router(primary, clock, {"r1": 0.0, "r2": 1.0})
+    chosen = {router.engine_for_read("client") for _ in range(4)}
+    assert chosen == {replicas["r1"], replicas["r2"]}
+
+
+def test_unreachable_and_lagging_replicas_are_skipped(primary, clock):
+    router, replicas = _router(primary, clock, {"down": None, "slow": 60.0, "ok": 0.5}, max_lag_seconds=10)
+    assert {router.engine_for_read() for _ in range(3)} == {replicas["ok"]}
+
+
+def test_falls_back_to_primary_when_all_replicas_unhealthy(primary, clock):
+    router, _ = _router(primary, clock, {"down": None, "slow": 60.0}, max_lag_seconds=10)
+    assert router.engine_for_read() is primary
+
+
+def test_health_is_cached_for_interval(primary, clock):
+    lags = {"r1": 0.0}
+    router, replicas = _router(primary, clock, lags, health_check_interval=15)
+    assert router.engine_for_read() is replicas["r1"]
+
+    lags["r1"] = None
+    clock.now += 5
+    assert router.engine_for_read() is replicas["r1"]
+
+    clock.now += 15
+    assert router.engine_for_read() is primary
+
+
+def test_read_your_writes_pinning(primary, clock):
+    router, replicas = _router(primary, clock, {"r1": 0.0}, pin_seconds=5)
+    router.mark_write("writer")
+
+    assert router.engine_for_read("writer") is primary
+    assert router.engine_for_read("reader") is replicas["r1"]
+
+    clock.now += 6
+    assert router.engine_for_read("writer") is replicas["r1"]
+    assert not router.is_pinned("writer")
+
+
+def test_mark_write_ignored_without_replicas(primary, clock):
+    router = ReplicaRouter(primary, [], clock=clock)
+    router.mark_write("writer")
+    assert not router.is_pinned("writer")
+
+
+ScratchBase = declarative_base()
+
+
+class Scratch(ScratchBase):
+    __tablename__ = "scratch"
+    id = Column(Integer, primary_key=True)
+
+
+@pytest.fixture
+def scratch_engine():
+    engine = create_engine("sqlite://")
+    ScratchBase.metadata.create_all(engine)
+    return engine
+
+
+def test_read_only_session_refuses_to_flush(scratch_engine):
+    db = SessionLocal(bind=scratch_engine, info={"read_only": True})
+    db.add(Scratch(id=1))
+    with pytest.raises(ReadOnlySessionError):
+        db.commit()
+    db.rollback()
+    assert db.execute(text("SELECT count(*) FROM scratch")).scalar() == 0
+    db.close()
+
+
+def test_read_write_session_still_flushes(scratch_engine):
+    db = SessionLocal(bind=scratch_engine)
+    db.add(Scratch(id=1))
+    db.commit()
+    assert db.query(Scratch).count() == 1
+    db.close()
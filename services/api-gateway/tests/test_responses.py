@@ -0,0 +1,55 @@
+"""
+Tests for the fast JSON response layer.
+"""
+
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.core.responses import FastJSONResponse, dumps, rows_to_dicts, paginated
+
+
+class FakeRow:
+    def __init__(self, **values):
+        self._mapping = values
+
+
+def test_dumps_handles_database_types():
+    payload = {
+        "id": uuid.UUID(int=1),
+        "introduced_date": date(2024, 1, 2),
+        "updated_at": datetime(2024, 1, 2, 3, 4, 5),
+        "score": Decimal("1.5"),
+        "tags": {"housing"},
+    }
+    assert json.loads(dumps(payload)) == {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "introduced_date": "2024-01-02",
+        "updated_at": "2024-01-02T03:04:05",
+        "score": 1.5,
+        "tags": ["housing"],
+    }
+
+
+def test_dumps_sort_keys_is_stable():
+    assert dumps({"b": 1, "a": 2}, sort_keys=True) == dumps({"a": 2, "b": 1}, sort_keys=True)
+
+
+def test_rows_to_dicts():
+    rows = [FakeRow(id=1, title="C-1"), {"id": 2, "title": "C-2"}]
+    assert rows_to_dicts(rows) == [{"id": 1, "title": "C-1"}, {"id": 2, "title": "C-2"}]
+
+
+def test_fast_json_response_renders_body():
+    response = FastJSONResponse({"introduced_date": date(2024, 1, 2)})
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"introduced_date": "2024-01-02"}
+
+
+def test_paginated_shape():
+    response = paginated("bills", [{"id": "1"}], {"page": 1, "page_size": 20, "total": 1, "pages": 1})
+    assert json.loads(response.body) == {
+        "bills": [{"id": "1"}],
+        "pagination": {"page": 1, "page_size": 20, "total": 1, "pages": 1},
+    }
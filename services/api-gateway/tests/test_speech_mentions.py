@@ -0,0 +1,86 @@
+"""
+Tests for the "mentioned politician" filter over the statement mention index.
+
+The index itself is built by the ETL service; see services/etl
+test_statement_mentions.py.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.speech_mentions import mentioned_politician_filter, resolve_member_ids, scanned_through
+from app.models.openparliament import Member, Statement, StatementMention, StatementMentionProgress
+
+POILIEVRE = uuid4()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS openpolicy")
+
+    for model in (Member, Statement, StatementMention, StatementMentionProgress):
+        model.__table__.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_statements(db, *contents):
+    start = db.query(Statement).count() + 1
+    db.add_all(
+        Statement(id=i, time=datetime(2024, 1, 1, 10, i), sequence=i, content_en=content, wordcount=1)
+        for i, content in enumerate(contents, start)
+    )
+    db.commit()
+
+
+def mentioning(db, name):
+    return db.execute(
+        select(Statement.id).where(mentioned_politician_filter(db, name)).order_by(Statement.id)
+    ).scalars().all()
+
+
+def test_every_matching_member_is_resolved(db):
+    db.add_all(
+        Member(id=uuid4(), jurisdiction_id=uuid4(), first_name="Sam", last_name="Smith", full_name=f"Sam Smith {i}")
+        for i in range(60)
+    )
+    db.commit()
+    assert len(resolve_member_ids(db, "smith")) == 60
+
+
+def index_through(db, statement_id, *mentions):
+    """Record what the ETL indexer would write after scanning up to ``statement_id``."""
+    db.add_all(
+        StatementMention(statement_id=i, member_id=member_id, time=datetime(2024, 1, 1, 10, i))
+        for i, member_id in mentions
+    )
+    db.merge(StatementMentionProgress(id=True, scanned_through=statement_id))
+    db.commit()
+
+
+def test_statements_past_the_scanned_mark_are_matched_on_text(db):
+    db.add(Member(id=POILIEVRE, jurisdiction_id=uuid4(), first_name="Pierre", last_name="Poilievre",
+                  full_name="Pierre Poilievre"))
+    db.commit()
+    add_statements(db, "<p>Pierre Poilievre rose.</p>", "<p>Mr. Poilievre rose.</p>")
+    # Before the first ETL run nothing is scanned, so every statement is matched on its text
+    assert scanned_through(db) == 0
+    assert mentioning(db, "Poilievre") == [1, 2]
+
+    index_through(db, 2, (1, POILIEVRE))
+    add_statements(db, "<p>I thank Pierre Poilievre.</p>", "<p>Nothing to see.</p>")
+    # Statement 2 was scanned and mentions nobody; 3 is not scanned yet
+    assert mentioning(db, "Poilievre") == [1, 3]
+
+    index_through(db, 4, (3, POILIEVRE))
+    assert mentioning(db, "Poilievre") == [1, 3]
+    assert scanned_through(db) == 4
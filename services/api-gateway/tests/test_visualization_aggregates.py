@@ -0,0 +1,101 @@
+"""
+Tests for chart payloads served from the visualization aggregate views.
+
+The views are stood in for by plain tables in an attached SQLite
+database named ``openpolicy``.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.visualization_aggregates import (
+    CHART_FAMILIES, ChartCache, bill_progress_chart, party_activity_chart,
+    view_versions, vote_breakdown_chart,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS openpolicy")
+
+    session = sessionmaker(bind=engine)()
+    session.execute(text(
+        "CREATE TABLE openpolicy.mv_bill_progress (jurisdiction_id, session_id, status, bill_count)"
+    ))
+    session.execute(text("""
+        INSERT INTO openpolicy.mv_bill_progress VALUES
+        ('ca', 's44', 'royal_assent', 3), ('ca', 's44', 'introduced', 10),
+        ('ca', 's45', 'introduced', 5), ('ca', 's44', 'tabled', 1)
+    """))
+    session.execute(text(
+        "CREATE TABLE openpolicy.mv_vote_breakdown "
+        "(jurisdiction_id, session_id, party_key, party_name, yeas, nays, paired, absent)"
+    ))
+    session.execute(text("""
+        INSERT INTO openpolicy.mv_vote_breakdown VALUES
+        ('ca', 's44', 'p1', 'LPC', 50, 10, 1, 4), ('ca', 's45', 'p1', 'LPC', 5, 5, 0, 0),
+        ('ca', 's44', 'independent', 'Independent', 1, 1, 0, 0)
+    """))
+    session.execute(text(
+        "CREATE TABLE openpolicy.mv_party_activity "
+        "(jurisdiction_id, party_key, party_name, color, member_count, statement_count, word_count)"
+    ))
+    session.execute(text("""
+        INSERT INTO openpolicy.mv_party_activity VALUES
+        ('ca', 'p1', 'LPC', '#D71920', 158, 900, 120000),
+        ('ca', 'p2', 'CPC', '#1A4782', 119, 800, 110000)
+    """))
+    session.execute(text("CREATE TABLE openpolicy.aggregate_view_versions (view_name, version)"))
+    session.execute(text(
+        "INSERT INTO openpolicy.aggregate_view_versions VALUES ('openpolicy.mv_bill_progress', 7)"
+    ))
+    yield session
+    session.close()
+
+
+def test_bill_progress_orders_stages_and_applies_filters(db):
+    chart = bill_progress_chart(db)
+    assert chart["labels"] == ["Introduced", "Royal Assent", "Tabled"]
+    assert chart["data"] == [15, 3, 1]
+
+    chart = bill_progress_chart(db, {"session_id": "s45", "ignored": "x"})
+    assert chart["labels"] == ["Introduced"]
+    assert chart["data"] == [5]
+
+
+def test_vote_breakdown_sums_positions_per_party(db):
+    chart = vote_breakdown_chart(db)
+    assert chart["labels"] == ["LPC", "Independent"]
+    assert chart["data"] == [75, 2]
+    assert chart["datasets"][0] == {"label": "Yea", "data": [55, 1]}
+    assert chart["datasets"][3] == {"label": "Absent", "data": [4, 0]}
+
+
+def test_party_activity(db):
+    chart = party_activity_chart(db, {"jurisdiction_id": "ca", "session_id": "ignored"})
+    assert chart["labels"] == ["LPC", "CPC"]
+    assert chart["data"] == [158, 119]
+    assert chart["colors"] == ["#D71920", "#1A4782"]
+
+
+def test_view_versions(db):
+    assert view_versions(db) == {"openpolicy.mv_bill_progress": 7}
+    assert set(CHART_FAMILIES) == {"bills", "votes", "members"}
+
+
+def test_chart_cache_evicts_least_recently_used():
+    cache = ChartCache(max_entries=2)
+    cache.put(("a", 1), "A1")
+    cache.put(("b", 1), "B1")
+    assert cache.get(("a", 1)) == "A1"
+    cache.put(("c", 1), "C1")
+
+    assert cache.get(("b", 1)) is None
+    assert cache.get(("a", 1)) == "A1"
+    assert cache.get(("a", 2)) is None  # a refreshed view version is a new key
+    assert len(cache) == 2
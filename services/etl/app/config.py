@@ -24,9 +24,22 @@ def get_etl_config() -> dict:
         "max_workers": int(os.getenv("ETL_MAX_WORKERS", "4")),
         "retry_attempts": int(os.getenv("ETL_RETRY_ATTEMPTS", "3")),
         "retry_delay": int(os.getenv("ETL_RETRY_DELAY", "5")),
+        "resource_limits": parse_resource_limits(
+            os.getenv("ETL_RESOURCE_LIMITS", "database=2,scrapers=2,openparliament_api=1")
+        ),
     }
 
 
+def parse_resource_limits(value: str) -> dict:
+    """Parse "name=limit,name=limit" into per-resource concurrency limits."""
+    limits = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, limit = item.split("=", 1)
+            limits[name.strip()] = int(limit)
+    return limits
+
+
 # Environment variables
 ETL_ENV = os.getenv("ETL_ENV", "development")
 DEBUG = ETL_ENV == "development"
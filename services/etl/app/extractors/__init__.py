@@ -10,10 +10,13 @@ from .legacy_adapters import (
     LegacyVotesAdapter,
     LegacyDataCollectionTask
 )
+from .http_client import LegacyHttpClient, fan_out
 
 __all__ = [
     "LegacyMPsAdapter",
     "LegacyBillsAdapter", 
     "LegacyVotesAdapter",
     "LegacyDataCollectionTask",
+    "LegacyHttpClient",
+    "fan_out",
 ]
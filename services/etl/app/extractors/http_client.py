@@ -0,0 +1,156 @@
+"""
+Shared async HTTP client for the legacy adapters
+
+Following FUNDAMENTAL RULE: one connection pool for every adapter
+
+All adapters share one httpx.AsyncClient with bounded connections. Requests
+are spaced per host (``requests_per_second``) so parallel detail fetches do
+not hammer ourcommons.ca or parl.ca. Timeouts, connection errors, 429s and
+5xx responses are retried with exponential backoff, honouring Retry-After.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+USER_AGENT = 'OpenParliament.ca/2.0 (Legacy Adapter)'
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HostRateLimiter:
+    """Spaces request starts to at most ``rate`` per second for each host."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, host: str) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class LegacyHttpClient:
+    """Connection-pooled, rate-limited, retrying client shared by the adapters."""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        requests_per_second: float = 10.0,
+        retry_attempts: int = 3,
+        retry_delay: float = 0.5,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.client = httpx.AsyncClient(
+            headers={'User-Agent': USER_AGENT},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            follow_redirects=True,
+            transport=transport,
+        )
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.pages_fetched = 0
+        self.bytes_fetched = 0
+        self.retries = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET ``url``; raises httpx.HTTPStatusError once retries are exhausted."""
+        host = urlsplit(url).netloc
+        for attempt in range(self.retry_attempts + 1):
+            await self.rate_limiter.wait(host)
+            try:
+                response = await self.client.get(url, **kwargs)
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                if attempt == self.retry_attempts:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"Retrying {url} in {delay:.1f}s after {type(e).__name__}")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.retry_attempts:
+                    response.raise_for_status()
+                    self.pages_fetched += 1
+                    self.bytes_fetched += len(response.content)
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                logger.warning(f"Retrying {url} in {delay:.1f}s after HTTP {response.status_code}")
+            self.retries += 1
+            await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
+
+    def _backoff(self, attempt: int) -> float:
+        return self.retry_delay * (2 ** attempt) * (0.5 + random.random() / 2)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get('Retry-After')
+        try:
+            return min(float(value), 60.0) if value else None
+        except ValueError:
+            return None
+
+
+async def fan_out(
+    items: Iterable[T],
+    fetch: Callable[[T], Awaitable[R]],
+    concurrency: int = 8,
+) -> AsyncIterator[R]:
+    """
+    Run ``fetch`` over ``items`` with at most ``concurrency`` in flight and
+    yield results as they complete (not in input order). ``None`` results
+    are dropped, matching the adapters' "None on failure" convention.
+    """
+    iterator = iter(items)
+    pending = set()
+
+    def refill():
+        while len(pending) < concurrency:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            pending.add(asyncio.ensure_future(fetch(item)))
+
+    refill()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+            refill()
+            for task in done:
+                result = task.result()
+                if result is not None:
+                    yield result
+    finally:
+        for task in pending:
+            task.cancel()
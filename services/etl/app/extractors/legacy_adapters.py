@@ -3,15 +3,23 @@ Legacy OpenParliament Importers - Adapted for Modern ETL
 
 Following FUNDAMENTAL RULE: NEVER REINVENT THE WHEEL
 Adapted from legacy/openparliament/parliament/imports/
+
+The adapters share one LegacyHttpClient (connection pool, per-host rate
+limit, retries), so list fetches run concurrently and bill/vote detail
+pages fan out through a bounded window and stream back as they arrive.
 """
 
 import asyncio
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import time
+from typing import AsyncIterator, Dict, List, Optional, Any
 from datetime import datetime
-import requests
 import lxml.etree as etree
 
+from .http_client import LegacyHttpClient, fan_out
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,19 +30,15 @@ class LegacyMPsAdapter:
     OURCOMMONS_MPS_URL = 'https://www.ourcommons.ca/Members/en/search?caucusId=all&province=all'
     REPRESENT_API_URL = 'https://represent.opennorth.ca/representatives/house-of-commons/?limit=500'
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OpenParliament.ca/2.0 (Legacy Adapter)',
-        })
+    def __init__(self, client: Optional[LegacyHttpClient] = None):
+        self.client = client or LegacyHttpClient()
     
     async def get_mps_from_represent(self) -> List[Dict[str, Any]]:
         """Get MPs from Represent API - adapted from legacy update_mps_from_represent"""
         logger.info("Getting MPs from Represent API (legacy adapter)")
         
         try:
-            response = self.session.get(self.REPRESENT_API_URL)
-            response.raise_for_status()
+            response = await self.client.get(self.REPRESENT_API_URL)
             data = response.json()
             
             mps = []
@@ -65,8 +69,7 @@ class LegacyMPsAdapter:
         logger.info("Getting MPs from OurCommons.ca (legacy adapter)")
         
         try:
-            response = self.session.get(self.OURCOMMONS_MPS_URL)
-            response.raise_for_status()
+            response = await self.client.get(self.OURCOMMONS_MPS_URL)
             
             # Parse the HTML response (simplified version of legacy scraper)
             root = etree.HTML(response.content)
@@ -92,7 +95,7 @@ class LegacyMPsAdapter:
                     }
                     mps.append(mp)
                     
-                except (IndexError as AttributeError) as e:
+                except (IndexError, AttributeError) as e:
                     logger.warning(f"Failed to parse MP element: {e}")
                     continue
             
@@ -111,11 +114,8 @@ class LegacyBillsAdapter:
     LEGISINFO_DETAIL_URL = 'https://www.parl.ca/LegisInfo/en/bill/%(parlnum)s-%(sessnum)s/%(billnumber)s/json'
     LEGISINFO_JSON_LIST_URL = 'https://www.parl.ca/legisinfo/en/bills/json?parlsession=%(sessid)s'
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OpenParliament.ca/2.0 (Legacy Adapter)',
-        })
+    def __init__(self, client: Optional[LegacyHttpClient] = None):
+        self.client = client or LegacyHttpClient()
     
     async def get_bills_for_session(self, session_id: str) -> List[Dict[str, Any]]:
         """Get bills for a session - adapted from legacy get_bill_list"""
@@ -123,8 +123,7 @@ class LegacyBillsAdapter:
         
         try:
             url = self.LEGISINFO_JSON_LIST_URL % {'sessid': session_id}
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = await self.client.get(url)
             
             bills_data = response.json()
             bills = []
@@ -162,8 +161,7 @@ class LegacyBillsAdapter:
                 'billnumber': bill_id.lower()
             }
             
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = await self.client.get(url)
             
             bill_data = response.json()
             if bill_data and len(bill_data) > 0:
@@ -192,6 +190,16 @@ class LegacyBillsAdapter:
         except Exception as e:
             logger.error(f"Failed to get bill details for {bill_id}: {e}")
             return None
+    
+    def iter_bill_details(self, bills: List[Dict[str, Any]], concurrency: int = 8) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch details for many bills concurrently, yielding each as it arrives"""
+        return fan_out(
+            (bill for bill in bills if bill.get('number')),
+            lambda bill: self.get_bill_details(
+                bill['number'], bill['parliament_number'], bill['session_number']
+            ),
+            concurrency,
+        )
 
 
 class LegacyVotesAdapter:
@@ -201,25 +209,20 @@ class LegacyVotesAdapter:
     VOTELIST_URL = 'https://www.ourcommons.ca/members/{lang}/votes/xml'
     VOTEDETAIL_URL = 'https://www.ourcommons.ca/members/en/votes/{parliamentnum}/{sessnum}/{votenumber}/xml'
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OpenParliament.ca/2.0 (Legacy Adapter)',
-        })
+    def __init__(self, client: Optional[LegacyHttpClient] = None):
+        self.client = client or LegacyHttpClient()
     
     async def get_votes_list(self) -> List[Dict[str, Any]]:
         """Get votes list - adapted from legacy import_votes"""
         logger.info("Getting votes list (legacy adapter)")
         
         try:
-            # Get English votes
-            response_en = self.session.get(self.VOTELIST_URL.format(lang='en'))
-            response_en.raise_for_status()
+            # Get English and French votes together
+            response_en, response_fr = await asyncio.gather(
+                self.client.get(self.VOTELIST_URL.format(lang='en')),
+                self.client.get(self.VOTELIST_URL.format(lang='fr')),
+            )
             root_en = etree.fromstring(response_en.content)
-            
-            # Get French votes
-            response_fr = self.session.get(self.VOTELIST_URL.format(lang='fr'))
-            response_fr.raise_for_status()
             root_fr = etree.fromstring(response_fr.content)
             
             votes = []
@@ -237,7 +240,7 @@ class LegacyVotesAdapter:
                         french_desc = root_fr.xpath(
                             f'Vote/DecisionDivisionNumber[text()={vote_number}]/../DecisionDivisionSubject/text()'
                         )[0]
-                    except (IndexError as AttributeError):
+                    except (IndexError, AttributeError):
                         pass
                     
                     vote = {
@@ -257,7 +260,7 @@ class LegacyVotesAdapter:
                     }
                     votes.append(vote)
                     
-                except (ValueError as AttributeError) as e:
+                except (ValueError, TypeError, AttributeError) as e:
                     logger.warning(f"Failed to parse vote element: {e}")
                     continue
             
@@ -279,8 +282,7 @@ class LegacyVotesAdapter:
                 votenumber=vote_number
             )
             
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = await self.client.get(url)
             root = etree.fromstring(response.content)
             
             voters = []
@@ -297,7 +299,7 @@ class LegacyVotesAdapter:
                     }
                     voters.append(voter)
                     
-                except (AttributeError as ValueError) as e:
+                except (AttributeError, ValueError) as e:
                     logger.warning(f"Failed to parse voter element: {e}")
                     continue
             
@@ -318,6 +320,16 @@ class LegacyVotesAdapter:
             logger.error(f"Failed to get vote details for vote {vote_number}: {e}")
             return None
     
+    def iter_vote_details(self, votes: List[Dict[str, Any]], concurrency: int = 8) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch ballots for many votes concurrently, yielding each as it arrives"""
+        return fan_out(
+            votes,
+            lambda vote: self.get_vote_details(
+                vote['parliament_number'], vote['session_number'], vote['number']
+            ),
+            concurrency,
+        )
+    
     def _parse_vote_ballot(self, voter_elem) -> str:
         """Parse vote ballot from XML element - adapted from legacy parsing logic"""
         if voter_elem.find('IsVoteYea').text == 'true':
@@ -333,22 +345,25 @@ class LegacyVotesAdapter:
 class LegacyDataCollectionTask:
     """Main task that uses all legacy adapters - following FUNDAMENTAL RULE"""
     
-    def __init__(self, output_dir: str = "data"):
+    def __init__(self, output_dir: str = "data", concurrency: int = 8,
+                 client: Optional[LegacyHttpClient] = None):
         self.output_dir = output_dir
-        self.mps_adapter = LegacyMPsAdapter()
-        self.bills_adapter = LegacyBillsAdapter()
-        self.votes_adapter = LegacyVotesAdapter()
+        self.concurrency = concurrency
+        self.client = client or LegacyHttpClient(max_connections=concurrency * 2)
+        self.mps_adapter = LegacyMPsAdapter(self.client)
+        self.bills_adapter = LegacyBillsAdapter(self.client)
+        self.votes_adapter = LegacyVotesAdapter(self.client)
         
         # Ensure output directory exists
-        import os
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(os.path.join(output_dir, "legacy_adapted"), exist_ok=True)
     
-    async def run_full_collection(self):
+    async def run_full_collection(self) -> Dict[str, Any]:
         """Run full data collection using legacy adapters"""
         logger.info("Starting full data collection using legacy OpenParliament adapters")
         
         start_time = datetime.now()
+        started = time.perf_counter()
         
         # Collect data using legacy adapters
         tasks = [
@@ -367,6 +382,19 @@ class LegacyDataCollectionTask:
         
         mps_data, bills_data, votes_data = results
         
+        # Stream bill and vote details to disk as they arrive
+        timestamp = start_time.strftime("%Y%m%d_%H%M%S")
+        bill_details, vote_details = await asyncio.gather(
+            self.stream_to_file(
+                self.bills_adapter.iter_bill_details(bills_data, self.concurrency),
+                f"legacy_bill_details_{timestamp}.jsonl",
+            ),
+            self.stream_to_file(
+                self.votes_adapter.iter_vote_details(votes_data, self.concurrency),
+                f"legacy_vote_details_{timestamp}.jsonl",
+            ),
+        )
+        
         # Save collected data
         await self.save_collected_data({
             'mps': mps_data,
@@ -378,9 +406,40 @@ class LegacyDataCollectionTask:
         
         end_time = datetime.now()
         duration = end_time - start_time
+        elapsed = time.perf_counter() - started
+        stats = {
+            'mps': len(mps_data),
+            'bills': len(bills_data),
+            'votes': len(votes_data),
+            'bill_details': bill_details,
+            'vote_details': vote_details,
+            'pages_fetched': self.client.pages_fetched,
+            'retries': self.client.retries,
+            'seconds': elapsed,
+            'pages_per_second': self.client.pages_fetched / elapsed if elapsed else 0.0,
+        }
         
         logger.info(f"Completed legacy data collection in {duration}")
-        logger.info(f"Collected: {len(mps_data)} MPs, {len(bills_data)} bills, {len(votes_data)} votes")
+        logger.info(f"Collected: {len(mps_data)} MPs, {len(bills_data)} bills, {len(votes_data)} votes, "
+                    f"{bill_details} bill details, {vote_details} vote details")
+        logger.info(f"Fetched {stats['pages_fetched']} pages at {stats['pages_per_second']:.1f} pages/sec "
+                    f"({stats['retries']} retries)")
+        return stats
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        await self.client.close()
+    
+    async def stream_to_file(self, records: AsyncIterator[Dict[str, Any]], filename: str) -> int:
+        """Append each record to a JSON Lines file as it is produced"""
+        filepath = os.path.join(self.output_dir, "legacy_adapted", filename)
+        count = 0
+        with open(filepath, 'w', encoding='utf-8') as f:
+            async for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                count += 1
+        logger.info(f"Streamed {count} records to {filepath}")
+        return count
     
     async def collect_mps_data(self) -> List[Dict[str, Any]]:
         """Collect MP data using legacy adapters"""
@@ -417,9 +476,6 @@ class LegacyDataCollectionTask:
     
     async def save_collected_data(self, data: Dict[str, Any]):
         """Save collected data to disk"""
-        import json
-        import os
-        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"legacy_collected_{timestamp}.json"
         filepath = os.path.join(self.output_dir, "legacy_adapted", filename)
@@ -450,6 +506,8 @@ async def main():
     except Exception as e:
         logger.error(f"Legacy data collection failed: {e}")
         raise
+    finally:
+        await task.close()
 
 
 if __name__ == "__main__":
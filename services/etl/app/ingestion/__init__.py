@@ -6,9 +6,11 @@ Following FUNDAMENTAL RULE: Uses existing legacy data structure
 
 from .legacy_data_ingester import LegacyDataIngester
 from .municipal_data_ingester import MunicipalDataIngester, MunicipalIngestionStats
+from .read_models import ReadModelRefresher
 
 __all__ = [
     "LegacyDataIngester",
     "MunicipalDataIngester",
     "MunicipalIngestionStats",
+    "ReadModelRefresher",
 ]
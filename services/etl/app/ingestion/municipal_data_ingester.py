@@ -3,10 +3,25 @@ Municipal Data Ingester for OpenParliament.ca V2
 
 Following FUNDAMENTAL RULE: Uses existing legacy scraper infrastructure from scrapers-ca
 Source: legacy-scrapers-ca/ directory with 100+ municipal scrapers
+
+Each scraped councillor is normalised into a canonical record whose SHA-256
+is stored in municipal_councillors.content_hash. A run reads the stored hashes for a
+municipality in one query and writes only inserts, updates and retirements,
+each as one set-based statement. Every change is appended to
+municipal_change_log and announced on the municipal_changes channel
+(pg_notify) so downstream caches can invalidate. The columns and the log
+table come from the API gateway migration 016_municipal_change_tracking.
+
+A scrape that comes back empty, or that would retire more than
+MAX_RETIREMENT_FRACTION of a council, is far more likely a broken page or
+scraper than an election, so its retirements are withheld and reported in
+the run's errors instead of applied.
 """
+import hashlib
 import json
 import logging
 import asyncio
+import re
 import uuid
 import importlib
 import os
@@ -15,7 +30,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import asyncpg
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Monkey patch for Python 3.13 compatibility
 if not hasattr(importlib, 'find_loader'):
@@ -28,12 +43,17 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'legacy-scra
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Largest share of a council's sitting members one run may retire
+MAX_RETIREMENT_FRACTION = 0.5
+
 @dataclass
 class MunicipalIngestionStats:
     """Statistics for municipal data ingestion run"""
     municipalities_processed: int = 0
     councillors_inserted: int = 0
     councillors_updated: int = 0
+    councillors_unchanged: int = 0
+    councillors_retired: int = 0
     offices_inserted: int = 0
     offices_updated: int = 0
     errors: List[str] = None
@@ -42,6 +62,87 @@ class MunicipalIngestionStats:
         if self.errors is None:
             self.errors = []
 
+def _clean(value: Any) -> str:
+    """Collapse whitespace so formatting-only changes do not alter the hash"""
+    return re.sub(r'\s+', ' ', str(value or '')).strip()
+
+
+def canonical_councillor(councillor: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Canonical form of a scraped councillor: cleaned fields, offices de-duplicated
+    and sorted, sources sorted. Scrape-time values (the generated id) are left out.
+    """
+    offices = {}
+    for office in councillor.get('offices', []):
+        record = {
+            'type': _clean(office.get('type')) or 'unknown',
+            'value': _clean(office.get('value')),
+            'note': _clean(office.get('note')),
+            'label': _clean(office.get('label')),
+        }
+        offices[(record['type'], record['value'])] = record
+    return {
+        'name': _clean(councillor['name']),
+        'municipality': councillor['municipality'],
+        'municipality_name': _clean(councillor.get('municipality_name')),
+        'division_id': councillor.get('division_id'),
+        'division_name': _clean(councillor.get('division_name')),
+        'classification': councillor.get('classification'),
+        'offices': [offices[key] for key in sorted(offices)],
+        'sources': sorted({_clean(source) for source in councillor.get('sources', [])}),
+    }
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """Stable SHA-256 of a canonical record"""
+    return hashlib.sha256(
+        json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+
+
+@dataclass
+class CouncillorDiff:
+    """Changes between scraped councillors and the stored rows of one municipality"""
+    inserts: List[Dict[str, Any]]
+    updates: List[Dict[str, Any]]
+    unchanged: List[str]
+    retirements: List[str]
+    withheld_retirements: List[str] = field(default_factory=list)
+
+
+def diff_councillors(councillors: List[Dict[str, Any]], stored: Dict[str, Tuple[Optional[str], bool]],
+                     max_retirement_fraction: float = MAX_RETIREMENT_FRACTION) -> CouncillorDiff:
+    """
+    Compare scraped councillors with ``stored`` ({name: (content_hash, retired)}).
+    Returns canonical records (with ``content_hash``) to insert and update, and
+    the names that are unchanged or should be retired.
+    
+    If the scrape is empty or would retire more than ``max_retirement_fraction``
+    of the sitting members, the names go to ``withheld_retirements`` instead.
+    """
+    records = {}
+    for councillor in councillors:
+        record = canonical_councillor(councillor)
+        record['content_hash'] = content_hash(record)
+        records[record['name']] = record  # a name scraped twice keeps its last record
+
+    diff = CouncillorDiff([], [], [], [])
+    for name, record in records.items():
+        if name not in stored:
+            diff.inserts.append(record)
+        elif stored[name][0] != record['content_hash'] or stored[name][1]:
+            diff.updates.append(record)
+        else:
+            diff.unchanged.append(name)
+    diff.retirements = sorted(
+        name for name, (_, retired) in stored.items() if name not in records and not retired
+    )
+    sitting = sum(1 for _, retired in stored.values() if not retired)
+    if diff.retirements and (not records or len(diff.retirements) > max_retirement_fraction * sitting):
+        diff.withheld_retirements, diff.retirements = diff.retirements, []
+    return diff
+
+
 class MunicipalDataIngester:
     """
     Ingests municipal data using existing legacy scraper infrastructure
@@ -178,41 +279,62 @@ class MunicipalDataIngester:
             self.stats.errors.append(f"{municipality_name}: {str(e)}")
             return None
     
-    async def ingest_municipality_data(self, municipality_data: Dict[str, Any]) -> None:
+    async def ingest_municipality_data(self, municipality_data: Dict[str, Any]) -> Optional[CouncillorDiff]:
         """
-        Ingest scraped municipality data into database
+        Ingest scraped municipality data into database, writing only what changed
         Following FUNDAMENTAL RULE: Uses existing database schema
         """
+        conn = await asyncpg.connect(self.database_url)
         try:
-            conn = await asyncpg.connect(self.database_url)
-            
             async with conn.transaction():
-                municipality_name = municipality_data['municipality']
-                councillors = municipality_data['councillors']
+                municipality = municipality_data['municipality']
                 
                 # Insert municipality record if it doesn't exist
                 await self._upsert_municipality(conn, municipality_data['metadata'])
                 
-                # Insert councillors and their offices
-                for councillor in councillors:
-                    councillor_id = await self._upsert_councillor(conn, councillor)
-                    
-                    # Insert offices
-                    for office in councillor['offices']:
-                        await self._upsert_office(conn, councillor_id, office)
+                # One read of the stored hashes, then one statement per kind of change
+                rows = await conn.fetch(
+                    "SELECT name, content_hash, retired_at IS NOT NULL AS retired FROM municipal_councillors "
+                    "WHERE municipality = $1",
+                    municipality
+                )
+                stored = {row['name']: (row['content_hash'], row['retired']) for row in rows}
+                diff = diff_councillors(municipality_data['councillors'], stored)
+                if diff.withheld_retirements:
+                    sitting = sum(1 for _, retired in stored.values() if not retired)
+                    message = (f"{municipality}: withheld retirement of {len(diff.withheld_retirements)} of "
+                               f"{sitting} sitting councillors; scrape returned "
+                               f"{len(municipality_data['councillors'])}")
+                    logger.warning(f"⚠️  {message}")
+                    self.stats.errors.append(message)
+                now = datetime.utcnow()
+                
+                await self._insert_councillors(conn, municipality, diff.inserts, now)
+                await self._update_councillors(conn, municipality, diff.updates, now)
+                await self._retire_councillors(conn, municipality, diff.retirements, now)
+                offices = await self._replace_offices(conn, municipality, diff.inserts + diff.updates, now)
+                await self._log_changes(conn, municipality, diff, now)
                 
                 self.stats.municipalities_processed += 1
-                self.stats.councillors_inserted += len(councillors)
+                self.stats.councillors_inserted += len(diff.inserts)
+                self.stats.councillors_updated += len(diff.updates)
+                self.stats.councillors_unchanged += len(diff.unchanged)
+                self.stats.councillors_retired += len(diff.retirements)
+                self.stats.offices_inserted += offices
+                
+                logger.info(f"📝 {municipality}: {len(diff.inserts)} new, {len(diff.updates)} updated, "
+                            f"{len(diff.retirements)} retired, {len(diff.unchanged)} unchanged")
+                return diff
                 
         except Exception as e:
             logger.error(f"Error ingesting {municipality_data['municipality']}: {e}")
             self.stats.errors.append(f"Ingestion error for {municipality_data['municipality']}: {str(e)}")
+            return None
         finally:
             await conn.close()
     
-    async def _upsert_municipality(self, conn: asyncpg.Connection, metadata: Dict[str, Any]) -> str:
-        """Upsert municipality record"""
-        # Use existing municipalities table or create if needed
+    async def _upsert_municipality(self, conn: asyncpg.Connection, metadata: Dict[str, Any]) -> None:
+        """Upsert municipality record, skipping the write when nothing changed"""
         query = """
         INSERT INTO municipalities (name, division_id, division_name, classification, 
                                  created_at, updated_at)
@@ -222,10 +344,11 @@ class MunicipalDataIngester:
             division_name = EXCLUDED.division_name,
             classification = EXCLUDED.classification,
             updated_at = $5
-        RETURNING id
+        WHERE (municipalities.division_id, municipalities.division_name, municipalities.classification)
+            IS DISTINCT FROM (EXCLUDED.division_id, EXCLUDED.division_name, EXCLUDED.classification)
         """
         
-        result = await conn.fetchval(
+        await conn.execute(
             query,
             metadata['name'],
             metadata.get('division_id'),
@@ -233,59 +356,109 @@ class MunicipalDataIngester:
             metadata.get('classification'),
             datetime.utcnow()
         )
-        
-        return result
     
-    async def _upsert_councillor(self, conn: asyncpg.Connection, councillor: Dict[str, Any]) -> str:
-        """Upsert councillor record"""
-        # Use existing members table or create if needed
-        query = """
-        INSERT INTO members (name, municipality, municipality_name, division_id, 
-                           division_name, classification, created_at, updated_at)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $7)
-        ON CONFLICT (name, municipality) DO UPDATE SET
-            municipality_name = EXCLUDED.municipality_name,
-            division_id = EXCLUDED.division_id,
-            division_name = EXCLUDED.division_name,
-            classification = EXCLUDED.classification,
-            updated_at = $7
-        RETURNING id
-        """
-        
-        result = await conn.fetchval(
-            query,
-            councillor['name'],
-            councillor['municipality'],
-            councillor['municipality_name'],
-            councillor.get('division_id'),
-            councillor.get('division_name'),
-            councillor.get('classification'),
-            datetime.utcnow()
-        )
-        
-        return result
+    @staticmethod
+    def _columns(records: List[Dict[str, Any]], *fields: str) -> List[List[Any]]:
+        return [[record.get(field) for record in records] for field in fields]
     
-    async def _upsert_office(self, conn: asyncpg.Connection, councillor_id: str, office: Dict[str, Any]) -> None:
-        """Upsert office record"""
-        # Use existing offices table or create if needed
-        query = """
-        INSERT INTO offices (member_id, type, value, note, label, created_at, updated_at)
-        VALUES ($1, $2, $3, $4, $5, $6, $6)
-        ON CONFLICT (member_id, type, value) DO UPDATE SET
-            note = EXCLUDED.note,
-            label = EXCLUDED.label,
-            updated_at = $6
-        """
-        
-        await conn.execute(
-            query,
-            councillor_id,
-            office['type'],
-            office['value'],
-            office.get('note'),
-            office.get('label'),
-            datetime.utcnow()
+    async def _insert_councillors(self, conn: asyncpg.Connection, municipality: str,
+                                  records: List[Dict[str, Any]], now: datetime) -> None:
+        """Insert new councillors in one statement"""
+        if not records:
+            return
+        await conn.execute("""
+            INSERT INTO municipal_councillors (name, municipality, municipality_name, division_id,
+                                              division_name, classification, content_hash, created_at, updated_at)
+            SELECT u.name, $1, u.municipality_name, u.division_id, u.division_name, u.classification,
+                   u.content_hash, $8, $8
+            FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[])
+                AS u(name, municipality_name, division_id, division_name, classification, content_hash)
+        """, municipality, *self._columns(
+            records, 'name', 'municipality_name', 'division_id', 'division_name', 'classification', 'content_hash'
+        ), now)
+    
+    async def _update_councillors(self, conn: asyncpg.Connection, municipality: str,
+                                  records: List[Dict[str, Any]], now: datetime) -> None:
+        """Update changed (or returning) councillors in one statement"""
+        if not records:
+            return
+        await conn.execute("""
+            UPDATE municipal_councillors AS m SET
+                municipality_name = u.municipality_name,
+                division_id = u.division_id,
+                division_name = u.division_name,
+                classification = u.classification,
+                content_hash = u.content_hash,
+                retired_at = NULL,
+                updated_at = $8
+            FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[])
+                AS u(name, municipality_name, division_id, division_name, classification, content_hash)
+            WHERE m.municipality = $1 AND m.name = u.name
+        """, municipality, *self._columns(
+            records, 'name', 'municipality_name', 'division_id', 'division_name', 'classification', 'content_hash'
+        ), now)
+    
+    async def _retire_councillors(self, conn: asyncpg.Connection, municipality: str,
+                                  names: List[str], now: datetime) -> None:
+        """Mark councillors no longer on the council page as retired"""
+        if not names:
+            return
+        await conn.execute("""
+            UPDATE municipal_councillors SET retired_at = $3, updated_at = $3
+            WHERE municipality = $1 AND name = ANY($2::text[])
+        """, municipality, names, now)
+    
+    async def _replace_offices(self, conn: asyncpg.Connection, municipality: str,
+                               records: List[Dict[str, Any]], now: datetime) -> int:
+        """Replace the offices of new and changed councillors; returns rows written"""
+        if not records:
+            return 0
+        names = [record['name'] for record in records]
+        offices = [
+            {'name': record['name'], **office}
+            for record in records
+            for office in record['offices']
+        ]
+        await conn.execute("""
+            DELETE FROM municipal_offices
+            WHERE councillor_id IN (
+                SELECT id FROM municipal_councillors WHERE municipality = $1 AND name = ANY($2::text[])
+            )
+        """, municipality, names)
+        if not offices:
+            return 0
+        await conn.execute("""
+            INSERT INTO municipal_offices (councillor_id, type, value, note, label, created_at, updated_at)
+            SELECT m.id, u.type, u.value, u.note, u.label, $7, $7
+            FROM unnest($2::text[], $3::text[], $4::text[], $5::text[], $6::text[])
+                AS u(name, type, value, note, label)
+            JOIN municipal_councillors m ON m.municipality = $1 AND m.name = u.name
+        """, municipality, *self._columns(offices, 'name', 'type', 'value', 'note', 'label'), now)
+        return len(offices)
+    
+    async def _log_changes(self, conn: asyncpg.Connection, municipality: str,
+                           diff: CouncillorDiff, now: datetime) -> None:
+        """Append the changes to municipal_change_log and notify listeners"""
+        changes = (
+            [(record['name'], 'insert', record['content_hash']) for record in diff.inserts] +
+            [(record['name'], 'update', record['content_hash']) for record in diff.updates] +
+            [(name, 'retire', None) for name in diff.retirements]
         )
+        if not changes:
+            return
+        names, change_types, hashes = (list(column) for column in zip(*changes))
+        await conn.execute("""
+            INSERT INTO municipal_change_log (municipality, member_name, change_type, content_hash, changed_at)
+            SELECT $1, u.name, u.change_type, u.content_hash, $5
+            FROM unnest($2::text[], $3::text[], $4::text[]) AS u(name, change_type, content_hash)
+        """, municipality, names, change_types, hashes, now)
+        await conn.execute("SELECT pg_notify('municipal_changes', $1)", json.dumps({
+            'municipality': municipality,
+            'inserted': len(diff.inserts),
+            'updated': len(diff.updates),
+            'retired': len(diff.retirements),
+            'changed_at': now.isoformat(),
+        }))
     
     async def run_full_ingestion(self) -> MunicipalIngestionStats:
         """
@@ -322,7 +495,8 @@ class MunicipalDataIngester:
         
         logger.info("✅ Municipal data ingestion completed!")
         logger.info(f"📊 Stats: {self.stats.municipalities_processed} municipalities, "
-                   f"{self.stats.councillors_inserted} councillors, "
+                   f"{self.stats.councillors_inserted} new, {self.stats.councillors_updated} updated, "
+                   f"{self.stats.councillors_retired} retired, {self.stats.councillors_unchanged} unchanged, "
                    f"{len(self.stats.errors)} errors")
         
         return self.stats
@@ -0,0 +1,153 @@
+"""
+Read Model Refresh for OpenParliament.ca V2
+
+The API gateway serves charts from materialized views in the openpolicy
+schema (see its migration 012_visualization_aggregates), the debate list
+from openpolicy.debate_days (013_debate_days) and the "mentioned
+politician" filter from openpolicy.statement_mentions (014). None of them
+follows the statements and votes tables by itself, so the daily pipeline
+refreshes them once the ingestion jobs have finished.
+
+The rebuilds themselves are database functions the gateway's migrations
+create: openpolicy.refresh_debate_days() (013_debate_days) and
+openpolicy.refresh_aggregate_view() (018_refresh_aggregate_view), called
+once per row of openpolicy.aggregate_view_versions. Each view refresh bumps
+that row's version, which is what invalidates the gateway's cached chart
+payloads.
+
+The same class also keeps the monthly user_activities partitions ahead of
+the calendar through openpolicy.ensure_activity_partitions()
+(019_activity_partition_function), so new months do not wait for a
+gateway restart.
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+import asyncpg
+
+from app.ingestion.statement_mentions import index_statement_mentions
+
+logger = logging.getLogger(__name__)
+
+
+class ReadModelRefresher:
+    """Refreshes the gateway's derived tables after ingestion"""
+
+    def __init__(self, database_url: str):
+        self.database_url = database_url
+        self.connection: Optional[asyncpg.Connection] = None
+
+    async def __aenter__(self):
+        self.connection = await asyncpg.connect(self.database_url)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.connection:
+            await self.connection.close()
+
+    async def refresh_aggregates(self) -> Dict[str, int]:
+        """
+        Refresh the chart aggregate views and bump their versions.
+
+        CONCURRENTLY keeps the old contents readable while a view is
+        rebuilt. Each view is refreshed in its own transaction, so a failure
+        leaves the views before it refreshed.
+
+        Returns:
+            New version of each refreshed view
+        """
+        views = await self.connection.fetch(
+            "SELECT view_name FROM openpolicy.aggregate_view_versions ORDER BY view_name"
+        )
+        versions = {}
+        for row in views:
+            view = row["view_name"]
+            versions[view] = await self.connection.fetchval(
+                "SELECT openpolicy.refresh_aggregate_view($1)", view
+            )
+            logger.info(f"Refreshed {view} (version {versions[view]})")
+        return versions
+
+    async def refresh_debate_days(self, since: Optional[date] = None) -> int:
+        """
+        Recompute debate_days for sitting dates from ``since`` on.
+
+        ``since`` defaults to the newest day already in the table, which may
+        have been refreshed part way through a sitting, so each run only
+        scans the statements and votes ingested since the previous one.
+
+        Returns:
+            Number of sitting days written
+        """
+        if since is None:
+            since = await self.connection.fetchval(
+                "SELECT max(sitting_date) FROM openpolicy.debate_days"
+            )
+        written = await self.connection.fetchval(
+            "SELECT openpolicy.refresh_debate_days($1::date)", since
+        )
+        logger.info(f"Refreshed {written} debate days from {since or 'start'}")
+        return written
+
+    async def index_mentions(self, rebuild: bool = False) -> int:
+        """
+        Index mentions in the statements ingested since the last run.
+
+        Returns:
+            Number of mention rows written
+        """
+        return await index_statement_mentions(self.connection, after_id=0 if rebuild else None)
+
+    async def ensure_activity_partitions(self, months_ahead: int = 2) -> List[str]:
+        """
+        Create the user_activities partitions for this month and the next ``months_ahead``.
+
+        The function takes an advisory lock, so running this alongside a
+        starting gateway is safe.
+
+        Returns:
+            Names of the partitions covering those months
+        """
+        async with self.connection.transaction():
+            rows = await self.connection.fetch(
+                "SELECT * FROM openpolicy.ensure_activity_partitions($1)", months_ahead
+            )
+        partitions = [row[0] for row in rows]
+        logger.info(f"User activity partitions in place through {partitions[-1] if partitions else 'none'}")
+        return partitions
+
+
+READ_MODELS = ("debate_days", "mentions", "aggregates")
+
+
+async def refresh_all(database_url: str, only=READ_MODELS, rebuild_mentions: bool = False) -> None:
+    """Refresh debate days, statement mentions and chart aggregates, in that order."""
+    async with ReadModelRefresher(database_url) as refresher:
+        if "debate_days" in only:
+            await refresher.refresh_debate_days()
+        if "mentions" in only:
+            await refresher.index_mentions(rebuild=rebuild_mentions)
+        if "aggregates" in only:
+            await refresher.refresh_aggregates()
+
+
+def main():
+    """Refresh the read models once, outside the scheduler."""
+    from app.config import get_database_url
+
+    parser = argparse.ArgumentParser(description="Refresh the API gateway's read models")
+    parser.add_argument("--database-url", default=None, help="Database URL (defaults to DATABASE_URL)")
+    parser.add_argument("--only", nargs="+", choices=READ_MODELS, default=READ_MODELS,
+                        help="Read models to refresh (default: all)")
+    parser.add_argument("--rebuild-mentions", action="store_true",
+                        help="Re-index mentions in every statement, not just new ones")
+    args = parser.parse_args()
+    asyncio.run(refresh_all(args.database_url or get_database_url(), args.only, args.rebuild_mentions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Statement Mention Indexing for OpenParliament.ca V2
+
+Fills openpolicy.statement_mentions (statement -> mentioned member), which
+the API gateway's /debates/speeches "mentioned politician" filter joins on
+instead of running ILIKE over every statement's text (gateway migrations
+014_statement_mentions and 017_statement_mention_progress).
+
+Mentions are taken from two places:
+    - politician links in the Hansard markup (``<a href="/politicians/...">``),
+      resolved through their title or link text
+    - the plain text, scanned against a dictionary of member full names
+
+Both go through the same normalised name dictionary, so "Côté" and "Cote"
+resolve to the same member. The scan walks the statement's tokens once and
+only compares names that start with the current token.
+
+openpolicy.statement_mention_progress records the last statement scanned,
+whether or not it mentioned anyone, so each run reads only the statements
+ingested since the previous one. The gateway matches statements past that
+mark on their text until they are indexed.
+"""
+
+import html
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+_POLITICIAN_LINK = re.compile(
+    r'<a\b(?P<attrs>[^>]*href="[^"]*/politicians/[^"]*"[^>]*)>(?P<text>.*?)</a>',
+    re.IGNORECASE | re.DOTALL,
+)
+_TITLE_ATTR = re.compile(r'\btitle="([^"]*)"')
+_TAG = re.compile(r"<[^>]+>")
+
+# Statements read per round-trip, and per transaction, when indexing
+INDEX_BATCH_SIZE = 5_000
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lower-case, strip accents and drop everything but letters, digits and spaces."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    ascii_only = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(re.sub(r"[^a-z0-9 ]+", " ", ascii_only).split())
+
+
+class NameDictionary:
+    """Normalised member full names, indexed by their first token."""
+
+    def __init__(self, members: Iterable[Tuple[UUID, str]]):
+        self._by_name: Dict[Tuple[str, ...], Set[UUID]] = defaultdict(set)
+        self._by_first: Dict[str, List[Tuple[str, ...]]] = defaultdict(list)
+        for member_id, full_name in members:
+            tokens = tuple(normalize_text(full_name).split())
+            if len(tokens) < 2:
+                continue  # a bare surname is too ambiguous to index
+            if tokens not in self._by_name:
+                self._by_first[tokens[0]].append(tokens)
+            self._by_name[tokens].add(member_id)
+        for names in self._by_first.values():
+            names.sort(key=len, reverse=True)  # longest match wins
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def lookup(self, name: str) -> Set[UUID]:
+        """Members whose full name is exactly this name, after normalisation."""
+        return set(self._by_name.get(tuple(normalize_text(name).split()), ()))
+
+    def scan(self, plain_text: str) -> Set[UUID]:
+        """Members whose full name appears in the text."""
+        tokens = normalize_text(plain_text).split()
+        found: Set[UUID] = set()
+        i = 0
+        while i < len(tokens):
+            for name in self._by_first.get(tokens[i], ()):
+                if tuple(tokens[i:i + len(name)]) == name:
+                    found |= self._by_name[name]
+                    i += len(name) - 1
+                    break
+            i += 1
+        return found
+
+
+def extract_mentions(content: Optional[str], names: NameDictionary) -> Set[UUID]:
+    """Member IDs mentioned in a statement's HTML content."""
+    if not content:
+        return set()
+    found: Set[UUID] = set()
+
+    def resolve_link(match: "re.Match") -> str:
+        title = _TITLE_ATTR.search(match.group("attrs"))
+        label = html.unescape(title.group(1) if title else _TAG.sub("", match.group("text")))
+        found.update(names.lookup(label))
+        return " "
+
+    remainder = _POLITICIAN_LINK.sub(resolve_link, content)
+    found |= names.scan(html.unescape(_TAG.sub(" ", remainder)))
+    return found
+
+
+def mention_rows(statements: Sequence, names: NameDictionary) -> Iterator[Tuple[int, UUID, object]]:
+    """(statement_id, member_id, time) for every member each statement mentions."""
+    for statement in statements:
+        mentioned = extract_mentions(statement["content_en"], names)
+        mentioned |= extract_mentions(statement["content_fr"], names)
+        for member_id in mentioned:
+            yield (statement["id"], member_id, statement["time"])
+
+
+async def load_name_dictionary(conn: asyncpg.Connection) -> NameDictionary:
+    rows = await conn.fetch("SELECT id, full_name, first_name, last_name FROM openpolicy.members")
+    return NameDictionary(
+        (row["id"], row["full_name"] or f"{row['first_name']} {row['last_name']}") for row in rows
+    )
+
+
+async def scanned_through(conn: asyncpg.Connection) -> int:
+    """Id of the last statement scanned for mentions (0 before the first run)."""
+    return await conn.fetchval(
+        "SELECT scanned_through FROM openpolicy.statement_mention_progress"
+    ) or 0
+
+
+async def index_statement_mentions(
+    conn: asyncpg.Connection,
+    after_id: Optional[int] = None,
+    batch_size: int = INDEX_BATCH_SIZE,
+    names: Optional[NameDictionary] = None,
+) -> int:
+    """
+    Extract mentions for every statement with an id greater than ``after_id``.
+
+    ``after_id`` defaults to the stored progress mark; pass 0 to rebuild.
+    Statements are read in id order, ``batch_size`` at a time, and each
+    batch's mentions and the progress mark are replaced in one transaction,
+    so an interrupted run resumes after its last complete batch.
+
+    Returns:
+        Number of mention rows written
+    """
+    names = names or await load_name_dictionary(conn)
+    last_id = await scanned_through(conn) if after_id is None else after_id
+    start_id = last_id
+    written = 0
+    while True:
+        batch = await conn.fetch("""
+            SELECT id, time, content_en, content_fr FROM openpolicy.statements
+            WHERE id > $1 ORDER BY id LIMIT $2
+        """, last_id, batch_size)
+        if not batch:
+            break
+        rows = list(mention_rows(batch, names))
+        high = batch[-1]["id"]
+        async with conn.transaction():
+            await conn.execute(
+                "DELETE FROM openpolicy.statement_mentions WHERE statement_id > $1 AND statement_id <= $2",
+                last_id, high,
+            )
+            if rows:
+                await conn.copy_records_to_table(
+                    "statement_mentions", schema_name="openpolicy", records=rows,
+                    columns=["statement_id", "member_id", "time"],
+                )
+            await conn.execute("""
+                INSERT INTO openpolicy.statement_mention_progress (id, scanned_through, updated_at)
+                VALUES (true, $1, now())
+                ON CONFLICT (id) DO UPDATE
+                SET scanned_through = EXCLUDED.scanned_through, updated_at = now()
+            """, high)
+        written += len(rows)
+        last_id = high
+    logger.info(f"Indexed {written:,} statement mentions in statements {start_id + 1}-{last_id}")
+    return written
@@ -1,13 +1,18 @@
 """
 ETL Scheduler for OpenParliament.ca V2
 Following FUNDAMENTAL RULE: Scheduling all legacy data ingestion jobs
+
+Each pipeline (daily, weekly, bi-weekly, monthly) is a DAG of jobs run by
+app.scheduling.job_runner.DagRunner: independent jobs run concurrently
+within the global and per-resource limits from get_etl_config(), and run
+state and leases live in the etl_job_runs table so that only one replica
+runs a job and an interrupted run resumes where it stopped.
 """
 import asyncio
 import logging
-import schedule
-import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
 from pathlib import Path
 import sys
 
@@ -17,19 +22,69 @@ sys.path.append(str(Path(__file__).parent.parent))
 from app.ingestion.multi_level_government_ingester import MultiLevelGovernmentIngester
 from app.ingestion.legacy_data_ingester import LegacyDataIngester
 from app.ingestion.municipal_data_ingester import MunicipalDataIngester
+from app.ingestion.read_models import ReadModelRefresher
 from app.config import get_database_url, get_etl_config
+from app.scheduling.job_runner import DagRunner, Job, JobContext, PostgresRunStore, RunStore, SUCCEEDED
 
 logger = logging.getLogger(__name__)
 
+
+def daily_at(hour: int) -> Callable[[datetime], datetime]:
+    """Trigger firing every day at ``hour``:00 UTC."""
+    def next_run(after: datetime) -> datetime:
+        candidate = after.replace(hour=hour, minute=0, second=0, microsecond=0)
+        return candidate if candidate > after else candidate + timedelta(days=1)
+    return next_run
+
+
+def weekly_at(weekday: int, hour: int) -> Callable[[datetime], datetime]:
+    """Trigger firing every week on ``weekday`` (Monday is 0) at ``hour``:00 UTC."""
+    def next_run(after: datetime) -> datetime:
+        candidate = after.replace(hour=hour, minute=0, second=0, microsecond=0)
+        candidate += timedelta(days=(weekday - candidate.weekday()) % 7)
+        return candidate if candidate > after else candidate + timedelta(days=7)
+    return next_run
+
+
+def monthly_at(hour: int) -> Callable[[datetime], datetime]:
+    """Trigger firing on the 1st of every month at ``hour``:00 UTC."""
+    def next_run(after: datetime) -> datetime:
+        candidate = after.replace(day=1, hour=hour, minute=0, second=0, microsecond=0)
+        if candidate > after:
+            return candidate
+        month = candidate.year * 12 + candidate.month
+        return candidate.replace(year=month // 12, month=month % 12 + 1)
+    return next_run
+
+
+@dataclass
+class Pipeline:
+    """A DAG of jobs fired by one trigger."""
+    name: str
+    trigger: Callable[[datetime], datetime]
+    jobs: List[Job]
+
+    def run_key(self, slot: datetime) -> str:
+        return f"{self.name}:{slot.strftime('%Y-%m-%dT%H:%M')}"
+
+
 class ETLScheduler:
     """Comprehensive ETL scheduler for all data ingestion jobs"""
     
-    def __init__(self):
+    def __init__(self, store: Optional[RunStore] = None):
         self.database_url = get_database_url()
         self.config = get_etl_config()
         self.running_jobs: Dict[str, bool] = {}
         self.job_history: List[Dict] = []
-        self.scheduler = schedule.Scheduler()
+        self.pipelines: Dict[str, Pipeline] = {}
+        self.next_runs: Dict[str, datetime] = {}
+        self.store = store or PostgresRunStore(self.database_url)
+        self.runner = DagRunner(
+            self.store,
+            max_concurrency=self.config["max_workers"],
+            resource_limits=self.config["resource_limits"],
+        )
+        self._tasks: Dict[str, asyncio.Task] = {}
         
     async def initialize(self):
         """Initialize the ETL scheduler"""
@@ -39,6 +94,8 @@ class ETLScheduler:
         try:
             async with MultiLevelGovernmentIngester(self.database_url) as ingester:
                 await ingester.initialize_database()
+            if isinstance(self.store, PostgresRunStore):
+                await self.store.initialize()
             logger.info("✅ Database connection successful")
         except Exception as e:
             logger.error(f"❌ Database connection failed: {str(e)}")
@@ -48,272 +105,197 @@ class ETLScheduler:
         """Schedule all ETL jobs"""
         logger.info("📅 Scheduling all ETL jobs")
         
-        # Daily jobs (02:00 UTC)
-        self.scheduler.every().day.at("02:00").do(
-            lambda: asyncio.create_task(self._run_daily_jobs())
-        )
+        # Daily jobs (02:00 UTC): MPs first, then the OpenParliament
+        # votes/bills sync that references them, then the read models
+        # built from both
+        self._add_pipeline("daily_etl_jobs", daily_at(2), [
+            Job("federal_representatives", self._update_federal_representatives,
+                resources=("database", "scrapers")),
+            Job("openparliament_sync", self._sync_openparliament_data,
+                depends_on=("federal_representatives",), resources=("database", "openparliament_api")),
+            Job("read_models", self._refresh_read_models,
+                depends_on=("openparliament_sync",), resources=("database",)),
+            Job("api_health", self._check_api_health),
+            Job("activity_partitions", self._ensure_activity_partitions, resources=("database",)),
+        ])
         
         # Weekly jobs (Sunday 03:00 UTC)
-        self.scheduler.every().sunday.at("03:00").do(
-            lambda: asyncio.create_task(self._run_weekly_jobs())
-        )
+        self._add_pipeline("weekly_etl_jobs", weekly_at(6, 3), [
+            Job("municipal_data", self._refresh_municipal_data, resources=("database", "scrapers")),
+            Job("csv_scrapers", self._run_csv_scrapers, resources=("database", "scrapers")),
+            Job("data_quality", self._validate_data_quality,
+                depends_on=("municipal_data", "csv_scrapers"), resources=("database",)),
+        ])
         
         # Bi-weekly jobs (Tuesday 04:00 UTC)
-        self.scheduler.every().tuesday.at("04:00").do(
-            lambda: asyncio.create_task(self._run_biweekly_jobs())
-        )
+        self._add_pipeline("biweekly_etl_jobs", weekly_at(1, 4), [
+            Job("provincial_data", self._update_provincial_data, resources=("database", "scrapers")),
+            Job("legacy_scrapers", self._run_legacy_scrapers, resources=("database", "scrapers")),
+            Job("schema_validation", self._validate_schema,
+                depends_on=("provincial_data", "legacy_scrapers"), resources=("database",)),
+        ])
         
         # Monthly jobs (1st of month 05:00 UTC)
-        self.scheduler.every().month.at("05:00").do(
-            lambda: asyncio.create_task(self._run_monthly_jobs())
-        )
+        self._add_pipeline("monthly_etl_jobs", monthly_at(5), [
+            Job("full_legacy_scrapers", self._run_full_legacy_scrapers,
+                resources=("database", "scrapers"), lease_seconds=900),
+            Job("archive_old_data", self._archive_old_data,
+                depends_on=("full_legacy_scrapers",), resources=("database",)),
+            Job("optimize_performance", self._optimize_performance,
+                depends_on=("archive_old_data",), resources=("database",)),
+        ])
         
         logger.info("✅ All ETL jobs scheduled")
     
-    async def _run_daily_jobs(self):
-        """Run daily ETL jobs"""
-        job_name = "daily_etl_jobs"
-        if self.running_jobs.get(job_name):
-            logger.warning(f"⏳ Daily jobs already running, skipping")
-            return
+    def _add_pipeline(self, name: str, trigger: Callable[[datetime], datetime], jobs: List[Job]):
+        self.pipelines[name] = Pipeline(name, trigger, jobs)
+        self.next_runs[name] = trigger(datetime.now(timezone.utc))
+    
+    async def run_pipeline(self, name: str, slot: Optional[datetime] = None, run_key: Optional[str] = None) -> Dict[str, str]:
+        """Run one pipeline for a schedule slot (or resume ``run_key``)"""
+        pipeline = self.pipelines[name]
+        if self.running_jobs.get(name):
+            logger.warning(f"⏳ {name} already running, skipping")
+            return {}
         
-        self.running_jobs[job_name] = True
+        run_key = run_key or pipeline.run_key(slot or datetime.now(timezone.utc))
+        self.running_jobs[name] = True
         start_time = datetime.now()
         
         try:
-            logger.info("🌅 Starting daily ETL jobs")
-            
-            # 1. Federal representatives update
-            await self._update_federal_representatives()
-            
-            # 2. OpenParliament data sync
-            await self._sync_openparliament_data()
-            
-            # 3. API health checks
-            await self._check_api_health()
-            
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "success", duration)
-            logger.info(f"✅ Daily ETL jobs completed in {duration.total_seconds():.2f} seconds")
-            
-        except Exception as e:
+            logger.info(f"▶️ Starting {run_key}")
+            results = await self.runner.run(run_key, pipeline.jobs)
             duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "failed", duration, str(e))
-            logger.error(f"❌ Daily ETL jobs failed: {str(e)}")
+            failed = sorted(job for job, status in results.items() if status != SUCCEEDED)
+            if failed:
+                self._log_job_completion(name, "failed", duration, f"not succeeded: {', '.join(failed)}")
+                logger.error(f"❌ {run_key} finished with {len(failed)} jobs not succeeded: {failed}")
+            else:
+                self._log_job_completion(name, "success", duration)
+                logger.info(f"✅ {run_key} completed in {duration.total_seconds():.2f} seconds")
+            return results
         finally:
-            self.running_jobs[job_name] = False
+            self.running_jobs[name] = False
+    
+    async def _run_daily_jobs(self):
+        """Run daily ETL jobs"""
+        return await self.run_pipeline("daily_etl_jobs")
     
     async def _run_weekly_jobs(self):
         """Run weekly ETL jobs"""
-        job_name = "weekly_etl_jobs"
-        if self.running_jobs.get(job_name):
-            logger.warning(f"⏳ Weekly jobs already running, skipping")
-            return
-        
-        self.running_jobs[job_name] = True
-        start_time = datetime.now()
-        
-        try:
-            logger.info("📅 Starting weekly ETL jobs")
-            
-            # 1. Municipal data refresh
-            await self._refresh_municipal_data()
-            
-            # 2. CSV scraper execution
-            await self._run_csv_scrapers()
-            
-            # 3. Data quality validation
-            await self._validate_data_quality()
-            
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "success", duration)
-            logger.info(f"✅ Weekly ETL jobs completed in {duration.total_seconds():.2f} seconds")
-            
-        except Exception as e:
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "failed", duration, str(e))
-            logger.error(f"❌ Weekly ETL jobs failed: {str(e)}")
-        finally:
-            self.running_jobs[job_name] = False
+        return await self.run_pipeline("weekly_etl_jobs")
     
     async def _run_biweekly_jobs(self):
         """Run bi-weekly ETL jobs"""
-        job_name = "biweekly_etl_jobs"
-        if self.running_jobs.get(job_name):
-            logger.warning(f"⏳ Bi-weekly jobs already running, skipping")
-            return
-        
-        self.running_jobs[job_name] = True
-        start_time = datetime.now()
-        
-        try:
-            logger.info("🔄 Starting bi-weekly ETL jobs")
-            
-            # 1. Provincial data update
-            await self._update_provincial_data()
-            
-            # 2. Legacy scraper execution
-            await self._run_legacy_scrapers()
-            
-            # 3. Schema validation
-            await self._validate_schema()
-            
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "success", duration)
-            logger.info(f"✅ Bi-weekly ETL jobs completed in {duration.total_seconds():.2f} seconds")
-            
-        except Exception as e:
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "failed", duration, str(e))
-            logger.error(f"❌ Bi-weekly ETL jobs failed: {str(e)}")
-        finally:
-            self.running_jobs[job_name] = False
+        return await self.run_pipeline("biweekly_etl_jobs")
     
     async def _run_monthly_jobs(self):
         """Run monthly ETL jobs"""
-        job_name = "monthly_etl_jobs"
-        if self.running_jobs.get(job_name):
-            logger.warning(f"⏳ Monthly jobs already running, skipping")
-            return
-        
-        self.running_jobs[job_name] = True
-        start_time = datetime.now()
-        
-        try:
-            logger.info("📊 Starting monthly ETL jobs")
-            
-            # 1. Full legacy scraper run
-            await self._run_full_legacy_scrapers()
-            
-            # 2. Data archival
-            await self._archive_old_data()
-            
-            # 3. Performance optimization
-            await self._optimize_performance()
-            
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "success", duration)
-            logger.info(f"✅ Monthly ETL jobs completed in {duration.total_seconds():.2f} seconds")
-            
-        except Exception as e:
-            duration = datetime.now() - start_time
-            self._log_job_completion(job_name, "failed", duration, str(e))
-            logger.error(f"❌ Monthly ETL jobs failed: {str(e)}")
-        finally:
-            self.running_jobs[job_name] = False
+        return await self.run_pipeline("monthly_etl_jobs")
     
-    # Individual job implementations
-    async def _update_federal_representatives(self):
+    # Individual job implementations. Errors propagate so the runner
+    # records the failure and skips dependent jobs.
+    async def _update_federal_representatives(self, ctx: JobContext):
         """Update federal representatives data"""
         logger.info("🇨🇦 Updating federal representatives")
-        try:
-            async with MultiLevelGovernmentIngester(self.database_url) as ingester:
-                stats = await ingester.run_federal_ingestion()
-                logger.info(f"✅ Federal representatives updated: {stats['representatives_created']} created")
-        except Exception as e:
-            logger.error(f"❌ Federal representatives update failed: {str(e)}")
+        async with MultiLevelGovernmentIngester(self.database_url) as ingester:
+            stats = await ingester.run_federal_ingestion()
+            logger.info(f"✅ Federal representatives updated: {stats['representatives_created']} created")
     
-    async def _sync_openparliament_data(self):
+    async def _sync_openparliament_data(self, ctx: JobContext):
         """Sync OpenParliament legacy data"""
         logger.info("🏛️ Syncing OpenParliament data")
-        try:
-            # This would integrate with the OpenParliament API
-            logger.info("✅ OpenParliament data sync completed")
-        except Exception as e:
-            logger.error(f"❌ OpenParliament data sync failed: {str(e)}")
+        # This would integrate with the OpenParliament API
+        logger.info("✅ OpenParliament data sync completed")
     
-    async def _check_api_health(self):
+    async def _refresh_read_models(self, ctx: JobContext):
+        """Refresh the API gateway's debate days, statement mentions and chart aggregates from the synced data"""
+        logger.info("📈 Refreshing read models")
+        async with ReadModelRefresher(self.database_url) as refresher:
+            days = await refresher.refresh_debate_days()
+            mentions = await refresher.index_mentions()
+            versions = await refresher.refresh_aggregates()
+            logger.info(f"✅ Refreshed {days} debate days, {mentions} statement mentions "
+                        f"and {len(versions)} aggregate views")
+    
+    async def _ensure_activity_partitions(self, ctx: JobContext):
+        """Create the gateway's upcoming monthly user activity partitions"""
+        logger.info("🗓️ Ensuring user activity partitions")
+        async with ReadModelRefresher(self.database_url) as refresher:
+            partitions = await refresher.ensure_activity_partitions()
+            logger.info(f"✅ {len(partitions)} user activity partitions in place")
+    
+    async def _check_api_health(self, ctx: JobContext):
         """Check API health"""
         logger.info("🏥 Checking API health")
-        try:
-            # This would check all API endpoints
-            logger.info("✅ API health check completed")
-        except Exception as e:
-            logger.error(f"❌ API health check failed: {str(e)}")
+        # This would check all API endpoints
+        logger.info("✅ API health check completed")
     
-    async def _refresh_municipal_data(self):
+    async def _refresh_municipal_data(self, ctx: JobContext):
         """Refresh municipal data"""
         logger.info("🏘️ Refreshing municipal data")
-        try:
-            async with MultiLevelGovernmentIngester(self.database_url) as ingester:
-                stats = await ingester.run_municipal_ingestion()
-                logger.info(f"✅ Municipal data refreshed: {stats['representatives_created']} created")
-        except Exception as e:
-            logger.error(f"❌ Municipal data refresh failed: {str(e)}")
+        async with MultiLevelGovernmentIngester(self.database_url) as ingester:
+            stats = await ingester.run_municipal_ingestion()
+            logger.info(f"✅ Municipal data refreshed: {stats['representatives_created']} created")
     
-    async def _run_csv_scrapers(self):
+    async def _run_csv_scrapers(self, ctx: JobContext):
         """Run CSV-based scrapers"""
         logger.info("📊 Running CSV scrapers")
-        try:
-            # This would run the CSV-based municipal scrapers
-            logger.info("✅ CSV scrapers completed")
-        except Exception as e:
-            logger.error(f"❌ CSV scrapers failed: {str(e)}")
+        # This would run the CSV-based municipal scrapers
+        logger.info("✅ CSV scrapers completed")
     
-    async def _validate_data_quality(self):
+    async def _validate_data_quality(self, ctx: JobContext):
         """Validate data quality"""
         logger.info("🔍 Validating data quality")
-        try:
-            # This would run data quality checks
-            logger.info("✅ Data quality validation completed")
-        except Exception as e:
-            logger.error(f"❌ Data quality validation failed: {str(e)}")
+        # This would run data quality checks
+        logger.info("✅ Data quality validation completed")
     
-    async def _update_provincial_data(self):
+    async def _update_provincial_data(self, ctx: JobContext):
         """Update provincial data"""
         logger.info("🏛️ Updating provincial data")
-        try:
-            async with MultiLevelGovernmentIngester(self.database_url) as ingester:
-                stats = await ingester.run_provincial_ingestion()
-                logger.info(f"✅ Provincial data updated: {stats['representatives_created']} created")
-        except Exception as e:
-            logger.error(f"❌ Provincial data update failed: {str(e)}")
+        async with MultiLevelGovernmentIngester(self.database_url) as ingester:
+            stats = await ingester.run_provincial_ingestion()
+            logger.info(f"✅ Provincial data updated: {stats['representatives_created']} created")
     
-    async def _run_legacy_scrapers(self):
+    async def _run_legacy_scrapers(self, ctx: JobContext):
         """Run legacy scrapers"""
         logger.info("🔄 Running legacy scrapers")
-        try:
-            # This would run the legacy Pupa scrapers
-            logger.info("✅ Legacy scrapers completed")
-        except Exception as e:
-            logger.error(f"❌ Legacy scrapers failed: {str(e)}")
+        # This would run the legacy Pupa scrapers
+        logger.info("✅ Legacy scrapers completed")
     
-    async def _validate_schema(self):
+    async def _validate_schema(self, ctx: JobContext):
         """Validate database schema"""
         logger.info("🗄️ Validating database schema")
-        try:
-            # This would validate the database schema
-            logger.info("✅ Schema validation completed")
-        except Exception as e:
-            logger.error(f"❌ Schema validation failed: {str(e)}")
+        # This would validate the database schema
+        logger.info("✅ Schema validation completed")
     
-    async def _run_full_legacy_scrapers(self):
-        """Run full legacy scraper suite"""
+    async def _run_full_legacy_scrapers(self, ctx: JobContext):
+        """Run full legacy scraper suite, one stage per checkpoint"""
         logger.info("🚀 Running full legacy scraper suite")
-        try:
-            async with MultiLevelGovernmentIngester(self.database_url) as ingester:
-                stats = await ingester.run_full_ingestion()
-                logger.info(f"✅ Full legacy scraper suite completed: {stats['total_representatives_created']} created")
-        except Exception as e:
-            logger.error(f"❌ Full legacy scraper suite failed: {str(e)}")
+        stages = ("federal", "provincial", "municipal")
+        completed = list(ctx.checkpoint.get("completed_stages", []))
+        async with MultiLevelGovernmentIngester(self.database_url) as ingester:
+            for stage in stages:
+                if stage in completed:
+                    logger.info(f"⏭️ {stage} ingestion already done in this run")
+                    continue
+                stats = await getattr(ingester, f"run_{stage}_ingestion")()
+                logger.info(f"✅ {stage} ingestion: {stats['representatives_created']} created")
+                completed.append(stage)
+                await ctx.save_checkpoint({"completed_stages": completed})
+        logger.info("✅ Full legacy scraper suite completed")
     
-    async def _archive_old_data(self):
+    async def _archive_old_data(self, ctx: JobContext):
         """Archive old data"""
         logger.info("📦 Archiving old data")
-        try:
-            # This would archive old data
-            logger.info("✅ Data archival completed")
-        except Exception as e:
-            logger.error(f"❌ Data archival failed: {str(e)}")
+        # This would archive old data
+        logger.info("✅ Data archival completed")
     
-    async def _optimize_performance(self):
+    async def _optimize_performance(self, ctx: JobContext):
         """Optimize performance"""
         logger.info("⚡ Optimizing performance")
-        try:
-            # This would run performance optimizations
-            logger.info("✅ Performance optimization completed")
-        except Exception as e:
-            logger.error(f"❌ Performance optimization failed: {str(e)}")
+        # This would run performance optimizations
+        logger.info("✅ Performance optimization completed")
     
     def _log_job_completion(self, job_name: str, status: str, duration: timedelta, error: Optional[str] = None):
         """Log job completion"""
@@ -335,24 +317,46 @@ class ETLScheduler:
         """Get current job status"""
         return {
             "running_jobs": self.running_jobs,
+            "running_tasks": sorted(self.runner.running),
             "recent_jobs": self.job_history[-10:] if self.job_history else [],
-            "next_run": self.scheduler.next_run(),
-            "scheduled_jobs": len(self.scheduler.jobs)
+            "next_run": min(self.next_runs.values()) if self.next_runs else None,
+            "scheduled_jobs": len(self.pipelines)
         }
     
-    def run_scheduler(self):
+    def _launch(self, name: str, **kwargs):
+        task = self._tasks.get(name)
+        if task is not None and not task.done():
+            logger.warning(f"⏳ {name} already running, skipping")
+            return
+        self._tasks[name] = asyncio.create_task(self.run_pipeline(name, **kwargs))
+    
+    async def resume_interrupted_runs(self):
+        """Restart runs that a crashed or stopped replica left unfinished"""
+        for run_key in await self.store.unfinished_runs():
+            name = run_key.split(":", 1)[0]
+            if name in self.pipelines:
+                logger.info(f"↩️ Resuming interrupted run {run_key}")
+                self._launch(name, run_key=run_key)
+    
+    async def run_scheduler(self):
         """Run the scheduler loop"""
         logger.info("🔄 Starting ETL scheduler loop")
+        await self.resume_interrupted_runs()
         while True:
             try:
-                self.scheduler.run_pending()
-                time.sleep(60)  # Check every minute
-            except KeyboardInterrupt:
-                logger.info("🛑 ETL scheduler stopped by user")
-                break
+                now = datetime.now(timezone.utc)
+                for name, next_run in list(self.next_runs.items()):
+                    if next_run <= now:
+                        self._launch(name, slot=next_run)
+                        self.next_runs[name] = self.pipelines[name].trigger(now)
+                wait = (min(self.next_runs.values()) - now).total_seconds()
+                await asyncio.sleep(min(max(wait, 1), 60))  # Check at least every minute
+            except asyncio.CancelledError:
+                logger.info("🛑 ETL scheduler stopped")
+                raise
             except Exception as e:
                 logger.error(f"❌ ETL scheduler error: {str(e)}")
-                time.sleep(60)  # Wait before retrying
+                await asyncio.sleep(60)  # Wait before retrying
 
 async def main():
     """Main function to run the ETL scheduler"""
@@ -366,7 +370,7 @@ async def main():
         scheduler.schedule_all_jobs()
         
         # Start scheduler loop
-        scheduler.run_scheduler()
+        await scheduler.run_scheduler()
         
     except Exception as e:
         logger.error(f"❌ ETL scheduler failed to start: {str(e)}")
@@ -378,4 +382,7 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("🛑 ETL scheduler stopped by user")
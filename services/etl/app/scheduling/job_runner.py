@@ -0,0 +1,388 @@
+"""
+Dependency-aware async job runner for the ETL scheduler
+
+Jobs form a DAG (for example federal MPs before votes, votes before
+ballots). A job starts as soon as everything it depends on has
+succeeded, subject to a global concurrency limit and per-resource limits
+(e.g. at most one job hitting the OpenParliament API at a time).
+
+Run state lives in the etl_job_runs table, keyed by (run_key, job_name)
+where run_key identifies one scheduled pipeline run ("daily:2026-10-18T02:00").
+A replica must hold a job's lease to run it and renews the lease while the
+job runs, so two ETL replicas never run the same job of the same run.
+Jobs that already succeeded are not rerun when a run is resumed after a
+crash, and a job can save a checkpoint to pick up where it left off.
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import os
+import socket
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+RUNNING = "running"
+SKIPPED = "skipped"
+
+# Interrupted runs older than this are left alone rather than resumed
+RESUME_WINDOW = timedelta(days=1)
+
+
+def default_owner() -> str:
+    """Identifies this replica in lease rows."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass(frozen=True)
+class Job:
+    """One node of a pipeline DAG."""
+    name: str
+    func: Callable[["JobContext"], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    resources: Tuple[str, ...] = ()
+    lease_seconds: int = 300
+
+
+@dataclass
+class Lease:
+    """Result of trying to claim a job for one run."""
+    acquired: bool
+    status: Optional[str] = None  # status of the row when not acquired
+    checkpoint: Optional[Dict[str, Any]] = None
+
+
+class JobContext:
+    """Handed to each job; lets it read and save its checkpoint."""
+
+    def __init__(self, store: "RunStore", run_key: str, job: Job, owner: str,
+                 checkpoint: Optional[Dict[str, Any]]):
+        self.store = store
+        self.run_key = run_key
+        self.job = job
+        self.owner = owner
+        self.checkpoint = checkpoint or {}
+
+    async def save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Persist progress; a resumed run receives it as ``ctx.checkpoint``."""
+        self.checkpoint = checkpoint
+        await self.store.save_checkpoint(self.run_key, self.job.name, self.owner, checkpoint)
+
+
+class RunStore(abc.ABC):
+    """Persistence interface for job run state and leases."""
+
+    @abc.abstractmethod
+    async def acquire(self, run_key: str, job: str, owner: str, lease_seconds: int) -> Lease:
+        """Claim a job unless it succeeded or another replica holds a live lease."""
+
+    @abc.abstractmethod
+    async def renew(self, run_key: str, job: str, owner: str, lease_seconds: int) -> bool:
+        """Extend a held lease; False once it has been lost."""
+
+    @abc.abstractmethod
+    async def save_checkpoint(self, run_key: str, job: str, owner: str, checkpoint: Dict[str, Any]) -> None:
+        """Persist a job's progress."""
+
+    @abc.abstractmethod
+    async def finish(self, run_key: str, job: str, owner: str, status: str, error: Optional[str] = None) -> None:
+        """Record a job's final status and release its lease."""
+
+    @abc.abstractmethod
+    async def status(self, run_key: str, job: str) -> Optional[str]:
+        """Status of a job, or "expired" for a running job whose lease ran out."""
+
+    @abc.abstractmethod
+    async def unfinished_runs(self, window: timedelta = RESUME_WINDOW) -> List[str]:
+        """
+        run_keys with a job left running by a replica that stopped.
+
+        Only jobs whose lease expired and that started within ``window`` count.
+        Failed and skipped jobs are final for their run; the next scheduled
+        run picks the work up again.
+        """
+
+
+class PostgresRunStore(RunStore):
+    """RunStore backed by the etl_job_runs table."""
+
+    def __init__(self, database_url: str):
+        self.database_url = database_url
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def initialize(self) -> None:
+        self.pool = await asyncpg.create_pool(self.database_url, min_size=1, max_size=4)
+        await self.pool.execute("""
+            CREATE TABLE IF NOT EXISTS etl_job_runs (
+                run_key TEXT NOT NULL,
+                job_name TEXT NOT NULL,
+                status TEXT NOT NULL,
+                owner TEXT,
+                lease_expires_at TIMESTAMPTZ,
+                checkpoint JSONB,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                started_at TIMESTAMPTZ,
+                finished_at TIMESTAMPTZ,
+                error TEXT,
+                PRIMARY KEY (run_key, job_name)
+            )
+        """)
+
+    async def close(self) -> None:
+        if self.pool:
+            await self.pool.close()
+
+    async def acquire(self, run_key, job, owner, lease_seconds):
+        # Claim the row unless it succeeded or another live lease holds it
+        row = await self.pool.fetchrow("""
+            INSERT INTO etl_job_runs (run_key, job_name, status, owner, lease_expires_at, attempts, started_at)
+            VALUES ($1, $2, 'running', $3, now() + make_interval(secs => $4), 1, now())
+            ON CONFLICT (run_key, job_name) DO UPDATE
+            SET status = 'running', owner = $3, lease_expires_at = now() + make_interval(secs => $4),
+                attempts = etl_job_runs.attempts + 1, started_at = now(), error = NULL
+            WHERE etl_job_runs.status <> 'succeeded'
+              AND (etl_job_runs.status <> 'running' OR etl_job_runs.lease_expires_at < now()
+                   OR etl_job_runs.owner = $3)
+            RETURNING checkpoint
+        """, run_key, job, owner, float(lease_seconds))
+        if row is not None:
+            checkpoint = row["checkpoint"]
+            return Lease(True, checkpoint=json.loads(checkpoint) if checkpoint else None)
+        return Lease(False, status=await self.status(run_key, job))
+
+    async def renew(self, run_key, job, owner, lease_seconds):
+        result = await self.pool.execute("""
+            UPDATE etl_job_runs SET lease_expires_at = now() + make_interval(secs => $4)
+            WHERE run_key = $1 AND job_name = $2 AND owner = $3 AND status = 'running'
+        """, run_key, job, owner, float(lease_seconds))
+        return result.endswith(" 1")
+
+    async def save_checkpoint(self, run_key, job, owner, checkpoint):
+        await self.pool.execute("""
+            UPDATE etl_job_runs SET checkpoint = $4::jsonb
+            WHERE run_key = $1 AND job_name = $2 AND owner = $3
+        """, run_key, job, owner, json.dumps(checkpoint, default=str))
+
+    async def finish(self, run_key, job, owner, status, error=None):
+        await self.pool.execute("""
+            INSERT INTO etl_job_runs (run_key, job_name, status, owner, finished_at, error)
+            VALUES ($1, $2, $4, $3, now(), $5)
+            ON CONFLICT (run_key, job_name) DO UPDATE
+            SET status = $4, finished_at = now(), error = $5, lease_expires_at = NULL
+            WHERE etl_job_runs.owner = $3 OR etl_job_runs.status <> 'running'
+        """, run_key, job, owner, status, error)
+
+    async def status(self, run_key, job):
+        row = await self.pool.fetchrow("""
+            SELECT status, lease_expires_at < now() AS expired FROM etl_job_runs
+            WHERE run_key = $1 AND job_name = $2
+        """, run_key, job)
+        if row is None:
+            return None
+        return "expired" if row["status"] == RUNNING and row["expired"] else row["status"]
+
+    async def unfinished_runs(self, window=RESUME_WINDOW):
+        rows = await self.pool.fetch("""
+            SELECT DISTINCT run_key FROM etl_job_runs
+            WHERE status = 'running' AND lease_expires_at < now()
+              AND started_at >= now() - $1::interval
+        """, window)
+        return [row["run_key"] for row in rows]
+
+
+class MemoryRunStore(RunStore):
+    """In-process RunStore for a single replica and for tests."""
+
+    def __init__(self, clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc)):
+        self.rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.clock = clock
+
+    async def acquire(self, run_key, job, owner, lease_seconds):
+        now = self.clock()
+        row = self.rows.get((run_key, job))
+        if row is not None:
+            held = row["status"] == RUNNING and row["lease_expires_at"] >= now and row["owner"] != owner
+            if row["status"] == SUCCEEDED or held:
+                return Lease(False, status=await self.status(run_key, job))
+        row = self.rows.setdefault((run_key, job), {"checkpoint": None, "attempts": 0})
+        row.update(status=RUNNING, owner=owner, lease_expires_at=now + timedelta(seconds=lease_seconds),
+                   started_at=now, error=None)
+        row["attempts"] += 1
+        return Lease(True, checkpoint=row["checkpoint"])
+
+    async def renew(self, run_key, job, owner, lease_seconds):
+        row = self.rows.get((run_key, job))
+        if not row or row["owner"] != owner or row["status"] != RUNNING:
+            return False
+        row["lease_expires_at"] = self.clock() + timedelta(seconds=lease_seconds)
+        return True
+
+    async def save_checkpoint(self, run_key, job, owner, checkpoint):
+        row = self.rows.get((run_key, job))
+        if row and row["owner"] == owner:
+            row["checkpoint"] = json.loads(json.dumps(checkpoint, default=str))
+
+    async def finish(self, run_key, job, owner, status, error=None):
+        row = self.rows.setdefault((run_key, job), {"checkpoint": None, "attempts": 0, "owner": owner})
+        if row.get("owner") == owner or row.get("status") != RUNNING:
+            row.update(status=status, error=error, lease_expires_at=None)
+
+    async def status(self, run_key, job):
+        row = self.rows.get((run_key, job))
+        if row is None:
+            return None
+        if row["status"] == RUNNING and row["lease_expires_at"] < self.clock():
+            return "expired"
+        return row["status"]
+
+    async def unfinished_runs(self, window=RESUME_WINDOW):
+        since = self.clock() - window
+        keys = set()
+        for (run_key, job), row in self.rows.items():
+            if await self.status(run_key, job) == "expired" and row["started_at"] >= since:
+                keys.add(run_key)
+        return sorted(keys)
+
+
+class CycleError(ValueError):
+    pass
+
+
+def validate_dag(jobs: Sequence[Job]) -> List[str]:
+    """Topological order of the jobs; raises on unknown dependencies or cycles."""
+    by_name = {job.name: job for job in jobs}
+    if len(by_name) != len(jobs):
+        raise ValueError("Duplicate job names in pipeline")
+    for job in jobs:
+        for dependency in job.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"Job {job.name} depends on unknown job {dependency}")
+
+    order: List[str] = []
+    state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+    def visit(name: str, path: Tuple[str, ...]):
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            raise CycleError(" -> ".join(path + (name,)))
+        state[name] = 1
+        for dependency in by_name[name].depends_on:
+            visit(dependency, path + (name,))
+        state[name] = 2
+        order.append(name)
+
+    for job in jobs:
+        visit(job.name, ())
+    return order
+
+
+class DagRunner:
+    """
+    Runs one pipeline DAG to completion.
+
+    Each job waits for its dependencies, then for a global slot and a slot
+    on each of its resources (acquired in sorted order, so jobs sharing
+    resources cannot deadlock), then for its lease. Dependents of a failed
+    job are marked skipped. A job whose lease is held by another replica
+    is waited on until that replica finishes it or its lease expires.
+    """
+
+    def __init__(
+        self,
+        store: RunStore,
+        max_concurrency: int = 4,
+        resource_limits: Optional[Dict[str, int]] = None,
+        owner: Optional[str] = None,
+        poll_interval: float = 5.0,
+    ):
+        self.store = store
+        self.owner = owner or default_owner()
+        self.poll_interval = poll_interval
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._resource_limits = resource_limits or {}
+        self._resources: Dict[str, asyncio.Semaphore] = {}
+        self.running: Dict[str, datetime] = {}
+
+    def _resource(self, name: str) -> asyncio.Semaphore:
+        if name not in self._resources:
+            self._resources[name] = asyncio.Semaphore(self._resource_limits.get(name, 1))
+        return self._resources[name]
+
+    async def run(self, run_key: str, jobs: Sequence[Job]) -> Dict[str, str]:
+        """Run every job of the pipeline; returns the final status per job."""
+        validate_dag(jobs)
+        done: Dict[str, asyncio.Future] = {job.name: asyncio.get_running_loop().create_future() for job in jobs}
+        results: Dict[str, str] = {}
+
+        async def run_one(job: Job):
+            try:
+                statuses = [await done[dependency] for dependency in job.depends_on]
+                if any(status != SUCCEEDED for status in statuses):
+                    status = SKIPPED
+                    await self.store.finish(run_key, job.name, self.owner, SKIPPED, "dependency did not succeed")
+                else:
+                    status = await self._run_job(run_key, job)
+            except Exception as e:  # never leave dependents waiting
+                logger.error(f"❌ {run_key} {job.name} crashed in the runner: {e}")
+                status = FAILED
+            results[job.name] = status
+            done[job.name].set_result(status)
+
+        await asyncio.gather(*(run_one(job) for job in jobs))
+        return results
+
+    async def _run_job(self, run_key: str, job: Job) -> str:
+        async with self._global:
+            semaphores = [self._resource(name) for name in sorted(set(job.resources))]
+            for semaphore in semaphores:
+                await semaphore.acquire()
+            try:
+                return await self._run_leased(run_key, job)
+            finally:
+                for semaphore in reversed(semaphores):
+                    semaphore.release()
+
+    async def _run_leased(self, run_key: str, job: Job) -> str:
+        while True:
+            lease = await self.store.acquire(run_key, job.name, self.owner, job.lease_seconds)
+            if lease.acquired:
+                break
+            if lease.status == SUCCEEDED:
+                logger.info(f"⏭️ {run_key} {job.name} already succeeded elsewhere")
+                return SUCCEEDED
+            await asyncio.sleep(self.poll_interval)  # another replica holds the lease
+
+        if lease.checkpoint:
+            logger.info(f"↩️ Resuming {run_key} {job.name} from checkpoint")
+        context = JobContext(self.store, run_key, job, self.owner, lease.checkpoint)
+        heartbeat = asyncio.create_task(self._heartbeat(run_key, job))
+        self.running[job.name] = datetime.now(timezone.utc)
+        try:
+            await job.func(context)
+        except Exception as e:
+            await self.store.finish(run_key, job.name, self.owner, FAILED, str(e))
+            logger.error(f"❌ {run_key} {job.name} failed: {e}")
+            return FAILED
+        finally:
+            heartbeat.cancel()
+            self.running.pop(job.name, None)
+        await self.store.finish(run_key, job.name, self.owner, SUCCEEDED)
+        logger.info(f"✅ {run_key} {job.name} succeeded")
+        return SUCCEEDED
+
+    async def _heartbeat(self, run_key: str, job: Job) -> None:
+        interval = max(1.0, job.lease_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            if not await self.store.renew(run_key, job.name, self.owner, job.lease_seconds):
+                logger.warning(f"⚠️ Lost lease on {run_key} {job.name}")
+                return
@@ -29,10 +29,10 @@ async def main():
     logger.info("🚀 Starting OpenParliament.ca V2 data collection...")
     logger.info("📋 Following FUNDAMENTAL RULE: Using legacy OpenParliament importers")
     
+    # Create data collection task
+    task = LegacyDataCollectionTask(output_dir="data")
+    
     try:
-        # Create data collection task
-        task = LegacyDataCollectionTask(output_dir="data")
-        
         # Run full data collection
         await task.run_full_collection()
         
@@ -42,6 +42,8 @@ async def main():
     except Exception as e:
         logger.error(f"💥 Fatal error: {e}")
         sys.exit(1)
+    finally:
+        await task.close()
 
 
 if __name__ == "__main__":
@@ -29,6 +29,9 @@ class Asset:
 
     Public methods:
         download: downloads an asset to a given target_path
+
+    To download many assets concurrently, with conditional requests and
+    de-duplication, use civic_scraper.base.downloader.DownloadManager.
     """
 
     def __init__(
@@ -64,6 +67,17 @@ class Asset:
     def __repr__(self):
         return f"Asset({self.url})"
 
+    @property
+    def file_name(self):
+        "Name of the downloaded file, e.g. civicplus-nc-nashcounty-05052020-382_agenda.pdf"
+        file_extension = mimetypes.guess_extension(self.content_type)
+        return "{}_{}{}".format(
+            # meeting id reflects date and numeric identifier
+            self.meeting_id,
+            self.asset_type,
+            file_extension,
+        )
+
     def download(self, target_dir, session=None):
         """
         Downloads an asset to a target directory.
@@ -75,20 +89,18 @@ class Asset:
             Full path to downloaded file
         """
         Path(target_dir).mkdir(parents=True, exist_ok=True)
-        file_extension = mimetypes.guess_extension(self.content_type)
-        file_name = "{}_{}{}".format(
-            # meeting id reflects date and numeric identifier
-            self.meeting_id,
-            self.asset_type,
-            file_extension,
-        )
+        file_name = self.file_name
         if session:
             response = session.get(self.url, allow_redirects=True)
         else:
             response = requests.get(self.url, allow_redirects=True)
         full_path = os.path.join(target_dir, file_name)
-        with open(full_path, "wb") as outfile:
+        # Replace rather than overwrite: DownloadManager hard-links identical
+        # files, and writing through the link would change its twins too
+        tmp_path = f"{full_path}.tmp"
+        with open(tmp_path, "wb") as outfile:
             outfile.write(response.content)
+        os.replace(tmp_path, full_path)
         return full_path
 
 
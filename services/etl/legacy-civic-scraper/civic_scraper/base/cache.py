@@ -25,6 +25,11 @@ class Cache:
         "Path for HTML and other intermediate artifacts from scraping"
         return str(Path(self.path).joinpath("artifacts"))
 
+    @property
+    def download_index_path(self):
+        "Path for the record of downloaded assets (ETags, content hashes)"
+        return str(Path(self.path).joinpath("download_index.json"))
+
     @property
     def metadata_files_path(self):
         "Path for metadata files related to file artifacts"
@@ -0,0 +1,303 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "download_index.json"
+
+DOWNLOADED = "downloaded"
+RESUMED = "resumed"
+NOT_MODIFIED = "not_modified"
+DEDUPLICATED = "deduplicated"
+FAILED = "failed"
+
+
+@dataclass
+class DownloadResult:
+    asset: object
+    status: str
+    path: str = None
+    bytes: int = 0
+    error: str = None
+
+
+@dataclass
+class DownloadReport:
+    """
+    Totals for one DownloadManager.download call.
+
+    bytes counts bytes received over the network, so assets answered with
+    304 Not Modified add nothing.
+    """
+
+    results: list = field(default_factory=list)
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def add(self, result):
+        self.results.append(result)
+        self.bytes += result.bytes
+
+    def count(self, status):
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def assets(self):
+        "Assets that are on disk after the run, whether fetched or not"
+        return len(self.results) - self.count(FAILED)
+
+    @property
+    def failed(self):
+        return self.count(FAILED)
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    @property
+    def assets_per_second(self):
+        return self.assets / self.seconds if self.seconds else 0.0
+
+    def summary(self):
+        return (
+            f"{self.assets} asset(s) in {self.seconds:.1f}s "
+            f"({self.assets_per_second:.1f} assets/s, "
+            f"{self.bytes_per_second / 1048576:.2f} MB/s): "
+            f"{self.count(DOWNLOADED)} downloaded, {self.count(RESUMED)} resumed, "
+            f"{self.count(NOT_MODIFIED)} not modified, "
+            f"{self.count(DEDUPLICATED)} deduplicated, {self.failed} failed"
+        )
+
+
+class DownloadManager:
+    """
+    Downloads file assets concurrently to a target directory.
+
+    Args:
+        target_dir (str): Directory for downloaded assets, usually Cache.assets_path
+        index_path (str): Record of downloaded assets, usually Cache.download_index_path
+            (default: download_index.json next to target_dir)
+        workers (int): Number of assets downloaded at once (default: 4)
+        timeout (int): Connect/read timeout in seconds for each request
+        chunk_size (int): Bytes written per chunk while streaming a file
+
+    Each host gets one requests.Session, so connections are reused across
+    assets. Files are streamed to "<name>.part" and renamed when complete; an
+    interrupted file is resumed with a Range request on the next run, as long
+    as the server still reports the same ETag or Last-Modified.
+
+    The index records each URL's ETag, Last-Modified and SHA-256. Known URLs
+    are requested conditionally and skipped on 304 Not Modified. A file whose content matches one already on
+    disk is hard-linked to it, so identical PDFs served from different URLs
+    are stored once.
+
+    Public methods:
+        download: downloads a list of assets and returns a DownloadReport
+    """
+
+    def __init__(
+        self, target_dir, index_path=None, workers=4, timeout=60, chunk_size=64 * 1024
+    ):
+        self.target_dir = str(target_dir)
+        self.workers = workers
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.index_path = index_path or str(Path(self.target_dir).parent / INDEX_FILE)
+        self.index = self._load_index()
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def download(self, assets):
+        """
+        Downloads assets with a bounded pool of workers.
+
+        Assets that resolve to the same file name are downloaded once (the last
+        one wins, as with repeated Asset.download calls).
+
+        Args:
+            assets (list): Asset instances
+
+        Returns:
+            DownloadReport
+        """
+        Path(self.target_dir).mkdir(parents=True, exist_ok=True)
+        by_file_name = {}
+        for asset in assets:
+            try:
+                by_file_name[asset.file_name] = asset
+            except Exception:
+                by_file_name[id(asset)] = asset
+        report = DownloadReport()
+        start = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for result in pool.map(self._download_asset, by_file_name.values()):
+                    report.add(result)
+        finally:
+            report.seconds = time.monotonic() - start
+            self._save_index()
+        return report
+
+    def close(self):
+        for session in self._sessions.values():
+            session.close()
+        self._sessions = {}
+
+    def session_for(self, url):
+        "Shared session for the URL's host"
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _download_asset(self, asset):
+        try:
+            return self._fetch(asset)
+        except Exception as e:
+            logger.warning(f"\tFailed to download {asset!r}: {e}")
+            return DownloadResult(asset, FAILED, error=str(e))
+
+    def _fetch(self, asset):
+        file_name = asset.file_name
+        path = os.path.join(self.target_dir, file_name)
+        part_path = f"{path}.part"
+        with self._lock:
+            known = self.index["urls"].get(asset.url)
+
+        headers = {}
+        offset = 0
+        part_meta = self._read_json(f"{part_path}.json")
+        if known and os.path.exists(os.path.join(self.target_dir, known["path"])):
+            if known.get("etag"):
+                headers["If-None-Match"] = known["etag"]
+            if known.get("last_modified"):
+                headers["If-Modified-Since"] = known["last_modified"]
+        elif os.path.exists(part_path) and part_meta and part_meta.get("url") == asset.url:
+            validator = part_meta.get("etag") or part_meta.get("last_modified")
+            if validator:
+                offset = os.path.getsize(part_path)
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = validator
+
+        session = self.session_for(asset.url)
+        with session.get(
+            asset.url,
+            headers=headers,
+            stream=True,
+            allow_redirects=True,
+            timeout=self.timeout,
+        ) as response:
+            if response.status_code == 304 and known:
+                logger.info(f"\tNot modified: {asset.url}")
+                return DownloadResult(
+                    asset, NOT_MODIFIED, os.path.join(self.target_dir, known["path"])
+                )
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            resumed = response.status_code == 206 and offset > 0
+            if resumed:
+                etag = etag or part_meta.get("etag")
+                last_modified = last_modified or part_meta.get("last_modified")
+            digest = hashlib.sha256()
+            if resumed:
+                with open(part_path, "rb") as partial:
+                    for chunk in iter(lambda: partial.read(self.chunk_size), b""):
+                        digest.update(chunk)
+            else:
+                offset = 0
+                self._write_json(
+                    f"{part_path}.json",
+                    {"url": asset.url, "etag": etag, "last_modified": last_modified},
+                )
+            received = 0
+            with open(part_path, "ab" if resumed else "wb") as outfile:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    outfile.write(chunk)
+                    digest.update(chunk)
+                    received += len(chunk)
+
+        sha256 = digest.hexdigest()
+        status = self._store(part_path, path, file_name, sha256)
+        if status == DOWNLOADED and resumed:
+            status = RESUMED
+        with self._lock:
+            self.index["urls"][asset.url] = {
+                "path": file_name,
+                "etag": etag,
+                "last_modified": last_modified,
+                "sha256": sha256,
+                "size": offset + received,
+            }
+        logger.info(f"\t{status.replace('_', ' ').capitalize()}: {asset.url}")
+        return DownloadResult(asset, status, path, received)
+
+    def _store(self, part_path, path, file_name, sha256):
+        "Moves a finished .part file into place, or links it to an identical file"
+        with self._lock:
+            # Whatever was stored under this name is about to be replaced
+            hashes = self.index["hashes"]
+            for stale in [key for key, name in hashes.items() if name == file_name]:
+                del hashes[stale]
+            existing = hashes.get(sha256)
+            existing_path = existing and os.path.join(self.target_dir, existing)
+            if existing_path and existing != file_name and os.path.exists(existing_path):
+                os.remove(part_path)
+                if os.path.exists(path):
+                    os.remove(path)
+                try:
+                    os.link(existing_path, path)
+                except OSError:
+                    shutil.copyfile(existing_path, path)
+                status = DEDUPLICATED
+            else:
+                os.replace(part_path, path)
+                hashes[sha256] = file_name
+                status = DOWNLOADED
+        try:
+            os.remove(f"{part_path}.json")
+        except FileNotFoundError:
+            pass
+        return status
+
+    def _load_index(self):
+        index = self._read_json(self.index_path) or {}
+        index.setdefault("urls", {})
+        index.setdefault("hashes", {})
+        return index
+
+    def _save_index(self):
+        with self._lock:
+            self._write_json(self.index_path, self.index)
+
+    def _read_json(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_json(self, path, data):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
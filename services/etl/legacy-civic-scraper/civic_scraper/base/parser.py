@@ -0,0 +1,51 @@
+import logging
+
+import lxml.html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Concatenated text nodes of an element, leaving out comments (like bs4's .text)
+TEXT = etree.XPath("string()")
+
+
+class FastParser:
+    """Base class for lxml parsers with a slower, more forgiving fallback.
+
+    Subclasses compile their XPath selectors once, as class attributes,
+    and implement `_parse_tree`. If the fast path raises, the page is
+    parsed again with `fallback_kls` (typically the original
+    BeautifulSoup or feedparser parser), so output never depends on
+    lxml coping with a page.
+
+    Args:
+        html (str): Page source
+
+    Attributes:
+        used_fallback (bool): True once parse() has fallen back
+    """
+
+    fallback_kls = None
+
+    def __init__(self, html):
+        self.html = html
+        self.used_fallback = False
+
+    def parse(self):
+        try:
+            return self._parse_tree(self._tree())
+        except Exception as e:
+            if self.fallback_kls is None:
+                raise
+            logger.debug(
+                f"{type(self).__name__} failed ({e!r}); "
+                f"falling back to {self.fallback_kls.__name__}"
+            )
+            self.used_fallback = True
+            return self.fallback_kls(self.html).parse()
+
+    def _tree(self):
+        return lxml.html.document_fromstring(self.html)
+
+    def _parse_tree(self, tree):
+        raise NotImplementedError
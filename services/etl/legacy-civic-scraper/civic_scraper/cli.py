@@ -61,6 +61,13 @@ def cli():
         " environment variable"
     ),
 )
+@click.option(
+    "-w",
+    "--workers",
+    default=4,
+    show_default=True,
+    help="Number of sites scraped, and of file assets downloaded, at once.",
+)
 @optgroup.group(
     "Site sources",
     cls=RequiredMutuallyExclusiveOptionGroup,
@@ -72,10 +79,10 @@ def cli():
     type=click.File("r"),
     help="CSV containing a 'url' field for target sites.",
 )
-def scrape(start_date, end_date, download, cache, url, urls_file):
+def scrape(start_date, end_date, download, cache, workers, url, urls_file):
     """Scrape one or more government sites."""
     cache_path = os.environ.get("CIVIC_SCRAPER_DIR", DEFAULT_USER_HOME)
-    runner = Runner(cache_path=cache_path)
+    runner = Runner(cache_path=cache_path, workers=workers)
     kwargs = {
         "start_date": start_date,
         "end_date": end_date,
@@ -6,6 +6,7 @@ from urllib.parse import urlparse
 
 import demjson3 as demjson
 import lxml.html
+from lxml import etree
 from requests import Session
 
 import civic_scraper
@@ -15,6 +16,25 @@ from civic_scraper.base.cache import Cache
 
 
 class CivicClerkSite(base.Site):
+    # Selectors are compiled once and reused for every page of every site
+    EVENT_ROWS = etree.XPath(
+        "//table[@id=$table_id]/tr[@class='dxgvDataRow_CustomThemeModerno']"
+    )
+    EVENT_LINK = etree.XPath("./td[contains(@id, '_3')]//a")
+    COMMITTEE_TEXT = etree.XPath("./td[contains(@id, '_3')]//text()")
+    DATETIME_TEXT = etree.XPath("./td[contains(@id, '_4')]//text()")
+    DOC_VIEWER = etree.XPath("//iframe[@id='docViewer']")
+    TABLES = etree.XPath("//table")
+    ASSET_ROWS = etree.XPath(
+        "//tr[./td[@class='dx-wrap dxtl dxtl__B0' and not(@colspan)]]"
+    )
+    NEXT_ROW = etree.XPath("./following-sibling::tr[1]")
+    LINKS = etree.XPath(".//a")
+    LINK_TEXT = etree.XPath("./text()")
+    ALL_TEXT = etree.XPath("//text()")
+    INPUT_VALUE = etree.XPath("//input[@name=$name]/@value")
+    GRID_SCRIPT = etree.XPath("//script[contains(text(), $source)]/text()")
+
     def __init__(self, url, place=None, state_or_province=None, cache=Cache()):
 
         self.url = url
@@ -55,7 +75,7 @@ class CivicClerkSite(base.Site):
         return Asset(**e)
 
     def get_meeting_id(self, event):
-        link = event.xpath("./td[contains(@id, '_3')]//a")[0]
+        link = self.EVENT_LINK(event)[0]
         href = link.attrib["href"]
         pattern = r".*?\((?P<id>.*?),.*"
         match = re.match(pattern, href)
@@ -67,7 +87,7 @@ class CivicClerkSite(base.Site):
     def get_agenda_items(self, text):
         event_tree = lxml.html.fromstring(text)
 
-        event_frame = event_tree.xpath("//iframe[@id='docViewer']")[0]
+        event_frame = self.DOC_VIEWER(event_tree)[0]
 
         if "src" not in event_frame.attrib:
             return []
@@ -76,24 +96,22 @@ class CivicClerkSite(base.Site):
 
         frame_response = self.session.get(event_frame_url)
         frame_tree = lxml.html.fromstring(frame_response.text)
-        frame_has_table = True if frame_tree.xpath("//table") else False
+        frame_has_table = True if self.TABLES(frame_tree) else False
 
         assets = []
 
         if frame_has_table:
-            assets_list = frame_tree.xpath(
-                "//tr[./td[@class='dx-wrap dxtl dxtl__B0' and not(@colspan)]]"
-            )
+            assets_list = self.ASSET_ROWS(frame_tree)
             for item in assets_list:
-                link_tr_text = item.xpath("./following-sibling::tr[1]")[0]
-                for tr in link_tr_text.xpath(".//a"):
+                link_tr_text = self.NEXT_ROW(item)[0]
+                for tr in self.LINKS(link_tr_text):
                     if tr.attrib["href"] != "#":
                         asset_url = self.base_url + "/Web" + tr.attrib["href"][2:]
-                        asset_name = tr.xpath("./text()")[0]
+                        asset_name = self.LINK_TEXT(tr)[0]
                         assets.append((asset_url, asset_name))
         else:
             no_agenda_str = "Agenda content has not been published for this meeting."
-            if no_agenda_str not in frame_tree.xpath("//text()"):
+            if no_agenda_str not in self.ALL_TEXT(frame_tree):
                 assets.append((event_frame_url, None))
 
         return assets
@@ -107,8 +125,9 @@ class CivicClerkSite(base.Site):
 
         callback_id = "aspxroundpanelCurrent$pnlDetails$grdEventsCurrent"
         for page in self._paginate(callback_id):
-            events = page.xpath(
-                "//table[@id='aspxroundpanelCurrent_pnlDetails_grdEventsCurrent_DXMainTable']/tr[@class='dxgvDataRow_CustomThemeModerno']"
+            events = self.EVENT_ROWS(
+                page,
+                table_id="aspxroundpanelCurrent_pnlDetails_grdEventsCurrent_DXMainTable",
             )
             yield from events
 
@@ -116,8 +135,9 @@ class CivicClerkSite(base.Site):
 
         callback_id = "aspxroundpanelRecent2$ASPxPanel4$grdEventsRecent2"
         for page in self._paginate(callback_id):
-            events = page.xpath(
-                "//table[@id='aspxroundpanelRecent2_ASPxPanel4_grdEventsRecent2_DXMainTable']/tr[@class='dxgvDataRow_CustomThemeModerno']"
+            events = self.EVENT_ROWS(
+                page,
+                table_id="aspxroundpanelRecent2_ASPxPanel4_grdEventsRecent2_DXMainTable",
             )
             yield from events
 
@@ -137,12 +157,12 @@ class CivicClerkSite(base.Site):
         payload = {}
         payload["__EVENTARGUMENT"] = None
         payload["__EVENTTARGET"] = None
-        (payload["__VIEWSTATE"],) = tree.xpath("//input[@name='__VIEWSTATE']/@value")
-        (payload["__VIEWSTATEGENERATOR"],) = tree.xpath(
-            "//input[@name='__VIEWSTATEGENERATOR']/@value"
+        (payload["__VIEWSTATE"],) = self.INPUT_VALUE(tree, name="__VIEWSTATE")
+        (payload["__VIEWSTATEGENERATOR"],) = self.INPUT_VALUE(
+            tree, name="__VIEWSTATEGENERATOR"
         )
-        (payload["__EVENTVALIDATION"],) = tree.xpath(
-            "//input[@name='__EVENTVALIDATION']/@value"
+        (payload["__EVENTVALIDATION"],) = self.INPUT_VALUE(
+            tree, name="__EVENTVALIDATION"
         )
         payload["__CALLBACKID"] = callback_id
 
@@ -150,10 +170,11 @@ class CivicClerkSite(base.Site):
         # it's basically a post request with a 'PBN' argument. But,
         # we also have to pass around the callback state that
         # the endpoint expects
-        (event_callback_source,) = tree.xpath(
-            """//script[contains(text(), "var dxo = new ASPxClientGridView('{}');")]/text()""".format(
+        (event_callback_source,) = self.GRID_SCRIPT(
+            tree,
+            source="var dxo = new ASPxClientGridView('{}');".format(
                 callback_id.replace("$", "_")
-            )
+            ),
         )
 
         callback_state = demjson.decode(
@@ -211,8 +232,8 @@ class CivicClerkSite(base.Site):
         ac = AssetCollection()
 
         for event in self.events():
-            committee_name = event.xpath("./td[contains(@id, '_3')]//text()")[1].strip()
-            str_datetime = event.xpath("./td[contains(@id, '_4')]//text()")[0].strip()
+            committee_name = self.COMMITTEE_TEXT(event)[1].strip()
+            str_datetime = self.DATETIME_TEXT(event)[0].strip()
             meeting_datetime = datetime.strptime(str_datetime, "%m/%d/%Y %I:%M %p")
             meeting_id_num, meeting_id = self.get_meeting_id(event)
 
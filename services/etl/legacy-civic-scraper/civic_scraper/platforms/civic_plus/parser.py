@@ -2,8 +2,11 @@ import re
 from datetime import datetime
 
 import bs4
+from lxml import etree
 
+from civic_scraper.base import parser as base_parser
 from civic_scraper.base.constants import SUPPORTED_ASSET_TYPES
+from civic_scraper.base.parser import TEXT
 
 
 class ParsingError(Exception):
@@ -104,3 +107,66 @@ class Parser:
 
     def _previous_version_link(self, link):
         return "PreviousVersions" in link["href"]
+
+
+class FastParser(base_parser.FastParser):
+    """lxml version of Parser, with the same output.
+
+    Falls back to Parser if a page can't be parsed with these selectors.
+    """
+
+    fallback_kls = Parser
+
+    BOARD_DIVS = etree.XPath(
+        r"//div[re:test(@id, 'cat\d+')]",
+        namespaces={"re": "http://exslt.org/regular-expressions"},
+    )
+    H2 = etree.XPath("(.//h2)[1]")
+    H3 = etree.XPath("(.//h3)[1]")
+    HEADER_SPAN = etree.XPath("(.//span)[1]")
+    ROWS = etree.XPath("(.//tbody)[1]//tr")
+    TITLE = etree.XPath("(.//p)[1]")
+    ANCHOR_NAME = etree.XPath("(.//a)[1]/@name")
+    FILE_LINKS = etree.XPath(
+        ".//a[starts-with(@href, '/AgendaCenter/ViewFile') and not(@title)]/@href"
+    )
+
+    # Shared with Parser: both only look at the URL path
+    _asset_type = Parser._asset_type
+
+    def _parse_tree(self, tree):
+        metadata = []
+        bookkeeping = set()
+        for div in self.BOARD_DIVS(tree):
+            cmte_name = self._committee_name(div)
+            for row in self.ROWS(div):
+                (title,) = self.TITLE(row)[:1]
+                (meeting_id,) = self.ANCHOR_NAME(row)[:1]
+                meeting_title = TEXT(title).strip()
+                for href in self.FILE_LINKS(row):
+                    if "PreviousVersions" in href or href in bookkeeping:
+                        continue
+                    metadata.append(
+                        {
+                            "committee_name": cmte_name,
+                            "url_path": str(href),
+                            "meeting_date": self._mtg_date(meeting_id),
+                            "meeting_time": None,
+                            "meeting_title": meeting_title,
+                            "meeting_id": str(meeting_id),
+                            "asset_type": self._asset_type(href),
+                        }
+                    )
+                    bookkeeping.add(href)
+        return metadata
+
+    def _committee_name(self, div):
+        (header,) = self.H2(div) or self.H3(div)
+        # Drop the span holding the ▼ toggle arrow, keeping text after it
+        for span in self.HEADER_SPAN(header):
+            span.drop_tree()
+        return TEXT(header).strip()
+
+    def _mtg_date(self, meeting_id):
+        month, day, year = re.match(r"_(\d{2})(\d{2})(\d{4}).+", meeting_id).groups()
+        return datetime(int(year), int(month), int(day))
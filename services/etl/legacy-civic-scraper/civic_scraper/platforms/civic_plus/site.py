@@ -12,13 +12,13 @@ from civic_scraper.base.asset import Asset, AssetCollection
 from civic_scraper.base.cache import Cache
 from civic_scraper.utils import today_local_str
 
-from .parser import Parser
+from .parser import FastParser
 
 logger = logging.getLogger(__name__)
 
 
 class Site(base.Site):
-    def __init__(self, base_url, cache=Cache(), parser_kls=Parser, place_name=None):
+    def __init__(self, base_url, cache=Cache(), parser_kls=FastParser, place_name=None):
         super().__init__(base_url, cache=cache, parser_kls=parser_kls)
         self.base_url = base_url
         self.subdomain = urlparse(base_url).netloc.split(".")[0]
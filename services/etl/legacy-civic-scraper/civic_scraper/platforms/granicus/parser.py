@@ -0,0 +1,47 @@
+import feedparser
+from lxml import etree
+
+from civic_scraper.base import parser as base_parser
+
+
+class Parser:
+    "Parses a Granicus (iQM2) RSS feed into entries with a title and link"
+
+    def __init__(self, rss):
+        self.rss = rss
+
+    def parse(self):
+        return feedparser.parse(self.rss)["entries"]
+
+
+class FastParser(base_parser.FastParser):
+    """lxml version of Parser for plain RSS 2.0 feeds.
+
+    Returns dicts with the same title and link values that feedparser
+    gives; anything other than RSS 2.0 (Atom, broken XML, items without
+    a title or link) falls back to Parser.
+    """
+
+    fallback_kls = Parser
+
+    ITEMS = etree.XPath("/rss/channel/item")
+    TITLE = etree.XPath("string(title)")
+    LINK = etree.XPath("string(link)")
+
+    def _tree(self):
+        if isinstance(self.html, str):
+            # Already decoded, so override any encoding in the XML declaration
+            parser = etree.XMLParser(encoding="utf-8", resolve_entities=False)
+            return etree.fromstring(self.html.encode("utf-8"), parser)
+        return etree.fromstring(self.html, etree.XMLParser(resolve_entities=False))
+
+    def _parse_tree(self, tree):
+        if tree.tag != "rss":
+            raise ValueError(f"Not an RSS 2.0 feed: <{tree.tag}>")
+        entries = []
+        for item in self.ITEMS(tree):
+            title, link = self.TITLE(item).strip(), self.LINK(item).strip()
+            if not (title and link):
+                raise ValueError("RSS item without a title or link")
+            entries.append({"title": title, "link": link})
+        return entries
@@ -2,7 +2,6 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
-import feedparser
 from requests import Session
 
 import civic_scraper
@@ -10,14 +9,24 @@ from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
 from civic_scraper.base.cache import Cache
 
+from .parser import FastParser
+
 
 class GranicusSite(base.Site):
-    def __init__(self, rss_url, place=None, state_or_province=None, cache=Cache()):
+    def __init__(
+        self,
+        rss_url,
+        place=None,
+        state_or_province=None,
+        cache=Cache(),
+        parser_kls=FastParser,
+    ):
         self.url = rss_url
         self.granicus_instance = urlparse(rss_url).netloc.split(".")[0]
         self.place = place
         self.state_or_province = state_or_province
         self.cache = cache
+        self.parser_kls = parser_kls
 
     def create_asset(self, entry):
         asset_name = entry["title"]
@@ -62,10 +71,10 @@ class GranicusSite(base.Site):
         )
 
         response = session.get(self.url)
-        parsed_rss = feedparser.parse(response.text)
+        entries = self.parser_kls(response.text).parse()
 
         ac = AssetCollection()
-        assets = [self.create_asset(e) for e in parsed_rss["entries"]]
+        assets = [self.create_asset(e) for e in entries]
         for a in assets:
             ac.append(a)
 
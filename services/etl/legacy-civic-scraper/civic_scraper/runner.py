@@ -1,9 +1,11 @@
 import importlib
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from civic_scraper.base.asset import AssetCollection
 from civic_scraper.base.cache import Cache
+from civic_scraper.base.downloader import DownloadManager
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +21,13 @@ class Runner:
     Arguments:
 
     - cache_path -- Path to cache location for scraped file artifact
+    - workers -- Number of sites scraped, and of assets downloaded, at once
 
     """
 
-    def __init__(self, cache_path=None):
+    def __init__(self, cache_path=None, workers=4):
         self.cache_path = cache_path
+        self.workers = workers
 
     def scrape(
         self,
@@ -50,7 +54,9 @@ class Runner:
             site_urls (list): List of site URLs
             cache (bool): Optionally cache intermediate file artificats such as HTML
                 (default: False)
-            download (bool): Optionally download file assets such as agendas (default: False)
+            download (bool): Optionally download file assets such as agendas (default: False).
+                Assets unchanged since the last download are not fetched again; see
+                civic_scraper.base.downloader.DownloadManager.
 
         Outputs:
             Metadata CSV listing file assets for given sites and params.
@@ -63,33 +69,46 @@ class Runner:
         logger.info(
             f"Scraping {len(site_urls)} site(s) from {start_date} to {end_date}..."
         )
-        for url in site_urls:
-            SiteClass = self._get_site_class(url)
-            kwargs = {}
-            if cache:
-                kwargs["cache"] = cache_obj
-            site = SiteClass(url, **kwargs)
-            logger.info(f"\t{url}")
-            _collection = site.scrape(
-                start_date,
-                end_date,
-                cache=cache,
+        # Sites are independent, so scrape them concurrently but keep
+        # their assets in site order
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            collections = pool.map(
+                lambda url: self._scrape_site(url, start_date, end_date, cache, cache_obj),
+                site_urls,
             )
-            asset_collection.extend(_collection)
+            for _collection in collections:
+                asset_collection.extend(_collection)
         metadata_file = asset_collection.to_csv(cache_obj.metadata_files_path)
         logger.info(f"Wrote asset metadata CSV: {metadata_file}")
         if download:
-            download_counter = 0
             logger.info(
                 f"Downloading {len(asset_collection)} file asset(s) to {cache_obj.assets_path}..."
             )
-            for asset in asset_collection:
-                # TODO: Add error-handling here
-                logger.info(f"\t{asset.url}")
-                asset.download(cache_obj.assets_path)
-                download_counter += 1
+            manager = DownloadManager(
+                cache_obj.assets_path,
+                index_path=cache_obj.download_index_path,
+                workers=self.workers,
+            )
+            try:
+                report = manager.download(asset_collection)
+            finally:
+                manager.close()
+            logger.info(f"Downloaded {report.summary()}")
         return asset_collection
 
+    def _scrape_site(self, url, start_date, end_date, cache, cache_obj):
+        SiteClass = self._get_site_class(url)
+        kwargs = {}
+        if cache:
+            kwargs["cache"] = cache_obj
+        site = SiteClass(url, **kwargs)
+        logger.info(f"\t{url}")
+        return site.scrape(
+            start_date,
+            end_date,
+            cache=cache,
+        )
+
     def _get_site_class(self, url):
         class_name = self._get_site_class_name(url)
         target_module = "civic_scraper.platforms"
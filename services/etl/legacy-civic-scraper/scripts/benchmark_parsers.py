@@ -0,0 +1,149 @@
+"""
+TITLE: benchmark_parsers.py
+DESCRIPTION:
+Times the lxml fast-path parsers against the parsers they fall back to
+(BeautifulSoup for CivicPlus, feedparser for Granicus) over a corpus of
+saved pages, and checks that both produce the same output.
+
+The default corpus is the CivicPlus and Granicus pages in tests/fixtures
+plus the CivicPlus search results pages recorded in tests/cassettes.
+Search pages cached by `civic-scraper scrape --cache` (in the artifacts
+directory) or saved Granicus RSS feeds can be added on the command line.
+
+Exits with status 1 if any page's output differs.
+
+USAGE:
+python scripts/benchmark_parsers.py
+python scripts/benchmark_parsers.py ~/.civic-scraper/artifacts/* --repeat 20
+"""
+
+import gzip
+import time
+from pathlib import Path
+
+from civic_scraper.platforms.civic_plus import parser as civic_plus_parser
+from civic_scraper.platforms.granicus import parser as granicus_parser
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / "tests"
+
+PARSERS = {
+    "civic_plus": civic_plus_parser,
+    "granicus": granicus_parser,
+}
+
+
+def comparable(platform, rows):
+    "feedparser entries carry many more keys; only title and link are used"
+    if platform == "granicus":
+        return [(row["title"], row["link"]) for row in rows]
+    return rows
+
+
+def detect_platform(text):
+    return "granicus" if "<rss" in text[:1000] else "civic_plus"
+
+
+def cassette_pages():
+    "CivicPlus search results pages recorded by pytest-vcr"
+    import yaml
+
+    for path in sorted(TESTS_DIR.joinpath("cassettes").glob("*/*.yaml")):
+        with open(path) as f:
+            cassette = yaml.safe_load(f)
+        for i, interaction in enumerate(cassette["interactions"]):
+            if "/AgendaCenter/Search" not in interaction["request"]["uri"]:
+                continue
+            response = interaction["response"]
+            body = response["body"]["string"]
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            encoding = response["headers"].get("Content-Encoding", [""])[0]
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            name = f"{path.parent.name}/{path.stem}#{i}"
+            yield name, "civic_plus", body.decode("utf-8")
+
+
+def corpus(paths):
+    for path in sorted(TESTS_DIR.joinpath("fixtures").glob("civplus_*.html")):
+        yield path.name, "civic_plus", path.read_text()
+    for path in sorted(TESTS_DIR.joinpath("fixtures").glob("granicus_*.xml")):
+        yield path.name, "granicus", path.read_text()
+    yield from cassette_pages()
+    for path in paths:
+        text = Path(path).read_text()
+        yield Path(path).name, detect_platform(text), text
+
+
+def best_time(parse, repeat):
+    "Fastest of `repeat` runs, in milliseconds"
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def benchmark(paths=(), repeat=5):
+    rows = []
+    seen = set()
+    for name, platform, text in corpus(paths):
+        # Many cassettes record the same search page
+        if text in seen:
+            continue
+        seen.add(text)
+        module = PARSERS[platform]
+        slow = module.Parser(text).parse()
+        fast_parser = module.FastParser(text)
+        fast = fast_parser.parse()
+        rows.append(
+            {
+                "page": name,
+                "platform": platform,
+                "items": len(slow),
+                "slow_ms": best_time(lambda module=module, text=text: module.Parser(text).parse(), repeat),
+                "fast_ms": best_time(lambda module=module, text=text: module.FastParser(text).parse(), repeat),
+                "fallback": fast_parser.used_fallback,
+                "parity": comparable(platform, slow) == comparable(platform, fast),
+            }
+        )
+    return rows
+
+
+def report(rows):
+    header = f"{'page':<58} {'items':>5} {'slow ms':>9} {'fast ms':>9} {'speedup':>8}  parity"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        speedup = row["slow_ms"] / row["fast_ms"] if row["fast_ms"] else 0
+        parity = "yes" if row["parity"] else "NO"
+        if row["fallback"]:
+            parity += " (fallback)"
+        print(
+            f"{row['page'][:58]:<58} {row['items']:>5} {row['slow_ms']:>9.2f} "
+            f"{row['fast_ms']:>9.2f} {speedup:>7.1f}x  {parity}"
+        )
+    slow_total = sum(row["slow_ms"] for row in rows)
+    fast_total = sum(row["fast_ms"] for row in rows)
+    print("-" * len(header))
+    print(
+        f"{len(rows)} page(s): {slow_total / len(rows):.2f} ms/page slow, "
+        f"{fast_total / len(rows):.2f} ms/page fast "
+        f"({slow_total / fast_total:.1f}x), "
+        f"{sum(not row['parity'] for row in rows)} mismatch(es)"
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description=__doc__.split("USAGE:")[0])
+    parser.add_argument("paths", nargs="*", help="Extra saved pages to include")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page (best is kept)")
+    args = parser.parse_args()
+
+    rows = benchmark(args.paths, args.repeat)
+    report(rows)
+    sys.exit(0 if all(row["parity"] for row in rows) else 1)
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from .conftest import read_fixture
 
-from civic_scraper.platforms.civic_plus.parser import Parser
+from civic_scraper.platforms.civic_plus.parser import FastParser, Parser
 
 
 def test_parse_all(search_results_html):
@@ -56,3 +56,24 @@ def test_parse_alameda():
     assert first["meeting_title"] == "Agenda"
     assert first["meeting_id"] == "_09042024-1447"
     assert first["asset_type"] == "agenda"
+
+
+def test_fast_parser_matches_parser(search_results_html):
+    "FastParser should produce the same output as Parser without falling back"
+    for html in [search_results_html, read_fixture("civplus_alameda_water.html")]:
+        parser = FastParser(html)
+        assert parser.parse() == Parser(html).parse()
+        assert not parser.used_fallback
+
+
+def test_fast_parser_fallback(search_results_html, monkeypatch):
+    "FastParser should fall back to Parser if its selectors fail"
+
+    def broken(self, tree):
+        raise ValueError("unexpected page structure")
+
+    monkeypatch.setattr(FastParser, "_parse_tree", broken)
+    parser = FastParser(search_results_html)
+    data = parser.parse()
+    assert parser.used_fallback
+    assert len(data) == 88
@@ -23,6 +23,9 @@ def test_cli_scrape_simple(civic_scraper_dir):
             "2020-05-05",
             "--end-date",
             "2020-05-05",
+            # VCR playback is not thread-safe
+            "--workers",
+            "1",
             "--url",
             "http://nc-nashcounty.civicplus.com/AgendaCenter",
         ],
@@ -60,6 +63,9 @@ def test_cli_store_assets_and_artifacts(civic_scraper_dir):
             "2020-05-05",
             "--cache",
             "--download",
+            # VCR playback is not thread-safe
+            "--workers",
+            "1",
             "--url",
             "http://nc-nashcounty.civicplus.com/AgendaCenter",
         ],
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from civic_scraper.base.asset import Asset
+from civic_scraper.base.downloader import (
+    DEDUPLICATED,
+    DOWNLOADED,
+    FAILED,
+    NOT_MODIFIED,
+    RESUMED,
+    DownloadManager,
+)
+
+AGENDA = b"%PDF-1.4 agenda " * 1000
+MINUTES = b"%PDF-1.4 minutes " * 1000
+
+FILES = {
+    "/agenda.pdf": AGENDA,
+    "/minutes.pdf": MINUTES,
+    # Same document served under a second URL
+    "/mirror/agenda.pdf": AGENDA,
+}
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, dict(self.headers)))
+        body = FILES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"{len(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == etag:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def file_server():
+    FileHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def assets_dir(tmp_path):
+    return tmp_path / "assets"
+
+
+def make_asset(url, meeting_id, asset_type="agenda"):
+    return Asset(
+        url,
+        asset_type=asset_type,
+        meeting_id=meeting_id,
+        content_type="application/pdf",
+    )
+
+
+@pytest.fixture
+def assets(file_server):
+    return [
+        make_asset(f"{file_server}/agenda.pdf", "civicplus_nc-nashcounty_05042020-381"),
+        make_asset(
+            f"{file_server}/minutes.pdf",
+            "civicplus_nc-nashcounty_05042020-381",
+            asset_type="minutes",
+        ),
+        make_asset(f"{file_server}/mirror/agenda.pdf", "civicplus_nc-nashcounty_05052020-382"),
+    ]
+
+
+def test_download_and_dedupe(assets_dir, assets):
+    "Assets are written under their usual names; identical content is stored once"
+    report = DownloadManager(assets_dir, workers=3).download(assets)
+    statuses = sorted(result.status for result in report.results)
+    assert statuses == sorted([DOWNLOADED, DOWNLOADED, DEDUPLICATED])
+    assert report.assets == 3
+    assert report.bytes == 2 * len(AGENDA) + len(MINUTES)
+    assert report.bytes_per_second > 0 and report.assets_per_second > 0
+    first = assets_dir / "civicplus_nc-nashcounty_05042020-381_agenda.pdf"
+    second = assets_dir / "civicplus_nc-nashcounty_05052020-382_agenda.pdf"
+    assert first.read_bytes() == second.read_bytes() == AGENDA
+    assert os.path.samefile(first, second)
+    assert (assets_dir / "civicplus_nc-nashcounty_05042020-381_minutes.pdf").read_bytes() == MINUTES
+    # Only the assets themselves are left in the directory
+    assert len(list(assets_dir.iterdir())) == 3
+    assert (assets_dir.parent / "download_index.json").exists()
+
+
+def test_conditional_requests(assets_dir, assets):
+    "A second run sends the stored ETag and skips unchanged assets"
+    DownloadManager(assets_dir).download(assets)
+    FileHandler.requests = []
+    report = DownloadManager(assets_dir).download(assets)
+    assert {result.status for result in report.results} == {NOT_MODIFIED}
+    assert report.bytes == 0
+    assert all(headers.get("If-None-Match") for _, headers in FileHandler.requests)
+
+
+def test_resume_partial_download(assets_dir, file_server):
+    "An interrupted download continues from the end of the .part file"
+    asset = make_asset(f"{file_server}/minutes.pdf", "meeting-1", asset_type="minutes")
+    assets_dir.mkdir()
+    part = Path(assets_dir, f"{asset.file_name}.part")
+    part.write_bytes(MINUTES[:5000])
+    Path(f"{part}.json").write_text(
+        json.dumps({"url": asset.url, "etag": f'"{len(MINUTES)}"', "last_modified": None})
+    )
+    report = DownloadManager(assets_dir).download([asset])
+    assert report.results[0].status == RESUMED
+    assert report.bytes == len(MINUTES) - 5000
+    assert FileHandler.requests[0][1]["Range"] == "bytes=5000-"
+    assert Path(assets_dir, asset.file_name).read_bytes() == MINUTES
+    assert not part.exists()
+
+
+def test_failed_download(assets_dir, file_server):
+    "Errors are reported per asset instead of stopping the run"
+    assets = [
+        make_asset(f"{file_server}/missing.pdf", "meeting-1"),
+        make_asset(f"{file_server}/agenda.pdf", "meeting-2"),
+    ]
+    report = DownloadManager(assets_dir).download(assets)
+    assert [result.status for result in report.results] == [FAILED, DOWNLOADED]
+    assert report.failed == 1
+    assert report.assets == 1
+
+
+def test_asset_download_keeps_linked_twin(assets_dir, assets, monkeypatch):
+    "Re-downloading one of two deduplicated files leaves the other untouched"
+    DownloadManager(assets_dir).download(assets)
+    monkeypatch.setitem(FILES, "/mirror/agenda.pdf", b"%PDF-1.4 revised agenda")
+    second = Path(assets[2].download(str(assets_dir)))
+    first = assets_dir / "civicplus_nc-nashcounty_05042020-381_agenda.pdf"
+    assert second.read_bytes() == b"%PDF-1.4 revised agenda"
+    assert first.read_bytes() == AGENDA
+    assert not Path(f"{second}.tmp").exists()
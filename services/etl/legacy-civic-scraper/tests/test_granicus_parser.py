@@ -0,0 +1,41 @@
+from civic_scraper.platforms import GranicusSite
+from civic_scraper.platforms.granicus.parser import FastParser, Parser
+
+from .conftest import read_fixture
+
+
+def test_fast_parser_matches_feedparser():
+    rss = read_fixture("granicus_calendar_rss.xml")
+    parser = FastParser(rss)
+    entries = parser.parse()
+    assert not parser.used_fallback
+    assert len(entries) == 4
+    expected = [(e["title"], e["link"]) for e in Parser(rss).parse()]
+    assert [(e["title"], e["link"]) for e in entries] == expected
+    # Entities decoded and surrounding whitespace removed, as feedparser does
+    assert entries[1]["title"] == (
+        "Planning & Zoning Commission - Regular Meeting - Jan 06, 2021 7:00 PM"
+    )
+
+
+def test_fast_parser_falls_back_for_atom():
+    atom = (
+        '<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+        "<title>City Council - Agenda - Jan 12, 2021 7:00 PM</title>"
+        '<link href="https://x.iqm2.com/Citizens/Detail_Meeting.aspx?ID=1"/>'
+        "</entry></feed>"
+    )
+    parser = FastParser(atom)
+    entries = parser.parse()
+    assert parser.used_fallback
+    assert entries[0]["link"] == "https://x.iqm2.com/Citizens/Detail_Meeting.aspx?ID=1"
+
+
+def test_create_asset_from_fast_parser_entry():
+    site = GranicusSite(
+        "https://brookhavencityga.iqm2.com/Services/RSS.aspx?Feed=Calendar"
+    )
+    entry = FastParser(read_fixture("granicus_calendar_rss.xml")).parse()[2]
+    asset = site.create_asset(entry)
+    assert asset.committee_name == "Zoning Board of Appeals"
+    assert asset.meeting_id == "granicus_brookhavencityga_1698"
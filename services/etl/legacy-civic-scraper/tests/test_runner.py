@@ -95,7 +95,8 @@ def test_runner_downloads_assets(asset_collection, asset_mock, civic_scraper_dir
     "Runner should trigger download on assets if requested"
     url = "http://nc-nashcounty.civicplus.com/AgendaCenter"
     start_date = end_date = "2020-05-05"
-    r = Runner(civic_scraper_dir)
+    # One worker: VCR playback is not thread-safe
+    r = Runner(civic_scraper_dir, workers=1)
     r.scrape(start_date, end_date, site_urls=[url], download=True)
     # Check AssetCollection is instantiated and to_csv called by default
     asset_collection.assert_called_once()
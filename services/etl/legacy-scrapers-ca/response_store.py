@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from io import BytesIO
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class ResponseStore:
+    """
+    An on-disk store of HTTP responses, keyed by URL.
+
+    Each URL has a metadata file (ETag, Last-Modified, SHA-256 of the body, encoding) and a body file. `fetch`
+    sends a conditional request when the URL has been stored before; on 304 Not Modified, the stored body is
+    replayed. Every response carries `body_sha256` and `changed` (whether the body differs from the stored one),
+    so callers can skip parsing an unchanged body and replay a result saved with `save_parsed`.
+
+    In offline mode, nothing is requested: stored responses are replayed and a missing URL raises an exception.
+    """
+
+    def __init__(self, directory, *, offline=False):
+        self.directory = directory
+        self.offline = offline
+
+    def _path(self, url, suffix):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()  # noqa: S324
+        return os.path.join(self.directory, key[:2], f"{key}{suffix}")
+
+    def _read_json(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, path, data, mode="w"):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        if mode == "wb":
+            with open(tmp, "wb") as f:
+                f.write(data)
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def load(self, url):
+        """Return the stored metadata for a URL, or None."""
+        meta = self._read_json(self._path(url, ".json"))
+        if meta is None or not os.path.exists(self._path(url, ".body")):
+            return None
+        return meta
+
+    def replay(self, url, meta, *, changed=False):
+        """Build a `requests.Response` from a stored body."""
+        with open(self._path(url, ".body"), "rb") as f:
+            content = f.read()
+        response = requests.Response()
+        response.raw = BytesIO(content)
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = meta.get("encoding")
+        response.body_sha256 = meta["body_sha256"]
+        response.changed = changed
+        return response
+
+    def fetch(self, url, get):
+        """Return the response for a URL, using `get(headers)` to send the (conditional) request."""
+        meta = self.load(url)
+        if self.offline:
+            if meta is None:
+                raise Exception(f"No stored response for {url} (offline replay)")
+            return self.replay(url, meta)
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = get(headers)
+        if response.status_code == 304 and meta:
+            meta["checked_at"] = datetime.now().isoformat(timespec="seconds")
+            self._write(self._path(url, ".json"), meta)
+            return self.replay(url, meta)
+        if response.status_code != 200:
+            response.body_sha256 = None
+            response.changed = True
+            return response
+
+        body_sha256 = hashlib.sha256(response.content).hexdigest()
+        changed = meta is None or meta["body_sha256"] != body_sha256
+        if changed:
+            self._write(self._path(url, ".body"), response.content, mode="wb")
+        now = datetime.now().isoformat(timespec="seconds")
+        self._write(
+            self._path(url, ".json"),
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body_sha256": body_sha256,
+                "encoding": response.encoding,
+                "headers": {key: response.headers[key] for key in ("Content-Type",) if key in response.headers},
+                "fetched_at": now if changed else meta.get("fetched_at", now),
+                "checked_at": now,
+            },
+        )
+        response.body_sha256 = body_sha256
+        response.changed = changed
+        return response
+
+    def load_parsed(self, url, kind, body_sha256):
+        """Return the parse result saved for this exact body, or None."""
+        parsed = self._read_json(self._path(url, f".{kind}.json"))
+        if parsed is not None and parsed["body_sha256"] == body_sha256:
+            return parsed["result"]
+        return None
+
+    def save_parsed(self, url, kind, body_sha256, result):
+        """Save a JSON-serializable parse result for this body."""
+        self._write(self._path(url, f".{kind}.json"), {"body_sha256": body_sha256, "result": result})
@@ -361,6 +361,15 @@ def sources_and_assertions():
                 print(f"Expected an assertion like: assert len(councillors), 'No councillors found' {path}")
 
 
+@task
+def refresh_styles_of_address():
+    """Download the styles of address spreadsheet into the local snapshot read by utils.get_styles_of_address."""
+    from utils import STYLES_OF_ADDRESS_SNAPSHOT, refresh_styles_of_address  # noqa: PLC0415 utils imports pupa
+
+    count = refresh_styles_of_address()
+    print(f"Wrote {count} styles of address to {STYLES_OF_ADDRESS_SNAPSHOT}")
+
+
 @task
 def validate_spreadsheet(url, identifier_header, geographic_name_header):
     """Validate the identifiers, geographic names and geographic types in a spreadsheet."""
@@ -0,0 +1,76 @@
+from io import BytesIO
+
+import pytest
+import requests
+
+from response_store import ResponseStore
+
+URL = "https://example.org/council/members.csv"
+BODY = b"name,district\nJane Doe,Ward 1\n"
+
+
+def server(body=BODY, etag='"v1"'):
+    """Return a `get(headers)` callable that answers 304 when the ETag matches, recording the headers it is sent."""
+    requests_sent = []
+
+    def get(headers):
+        requests_sent.append(dict(headers))
+        response = requests.Response()
+        response.url = URL
+        if headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response.raw = BytesIO(b"")
+        else:
+            response.status_code = 200
+            response.raw = BytesIO(body)
+            response.headers["ETag"] = etag
+            response.headers["Content-Type"] = "text/csv"
+            response.encoding = "utf-8"
+        return response
+
+    get.requests = requests_sent
+    return get
+
+
+def test_conditional_request_and_replay(tmp_path):
+    store = ResponseStore(str(tmp_path))
+    get = server()
+
+    first = store.fetch(URL, get)
+    assert first.content == BODY
+    assert first.changed
+
+    second = store.fetch(URL, get)
+    assert get.requests == [{}, {"If-None-Match": '"v1"'}]
+    assert second.status_code == 200
+    assert second.text == BODY.decode()
+    assert second.headers["Content-Type"] == "text/csv"
+    assert not second.changed
+    assert second.body_sha256 == first.body_sha256
+
+    changed = store.fetch(URL, server(body=BODY + b"John Roe,Ward 2\n", etag='"v2"'))
+    assert changed.changed
+    assert changed.body_sha256 != first.body_sha256
+
+
+def test_offline_replay(tmp_path):
+    ResponseStore(str(tmp_path)).fetch(URL, server())
+    store = ResponseStore(str(tmp_path), offline=True)
+    get = server()
+
+    response = store.fetch(URL, get)
+    assert get.requests == []
+    assert response.content == BODY
+    assert not response.changed
+
+    with pytest.raises(Exception, match="offline replay"):
+        store.fetch("https://example.org/missing.csv", get)
+
+
+def test_parsed_results_follow_the_body(tmp_path):
+    store = ResponseStore(str(tmp_path))
+    body_sha256 = store.fetch(URL, server()).body_sha256
+    store.save_parsed(URL, "rows", body_sha256, [{"name": "Jane Doe"}])
+
+    assert store.load_parsed(URL, "rows", body_sha256) == [{"name": "Jane Doe"}]
+    assert store.load_parsed(URL, "rows", "0" * 64) is None
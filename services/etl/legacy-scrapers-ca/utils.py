@@ -1,4 +1,5 @@
 import csv
+import json
 import os
 import re
 from collections import defaultdict
@@ -19,6 +20,7 @@ from pupa.scrape import Jurisdiction, Organization, Person, Post, Scraper
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 import patch  # patch patches validictory # noqa: F401
+from response_store import ResponseStore
 
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
@@ -86,25 +88,89 @@ CONTACT_DETAIL_NOTE_MAP = {
     "Work": "legislature",
 }
 SSL_VERIFY = "/usr/lib/ssl/certs/ca-certificates.crt" if os.getenv("SSL_VERIFY", "") else True
+# Set RESPONSE_STORE_DIR to store responses and send conditional requests, and OFFLINE to only replay stored responses.
+RESPONSE_STORE_DIR = os.getenv("RESPONSE_STORE_DIR", "") or os.path.join(os.getcwd(), "..", "_responses")
+OFFLINE = bool(os.getenv("OFFLINE", ""))
+response_store = (
+    ResponseStore(RESPONSE_STORE_DIR, offline=OFFLINE) if os.getenv("RESPONSE_STORE_DIR", "") or OFFLINE else None
+)
 
 email_re = re.compile(r"([A-Za-z0-9._-]+@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,})")
 
 
+STYLES_OF_ADDRESS_URL = "https://docs.google.com/spreadsheets/d/11qUKd5bHeG5KIzXYERtVgs3hKcd9yuZlt-tCTLBFRpI/pub?single=true&gid={gid}&output=csv"
+STYLES_OF_ADDRESS_SNAPSHOT = os.path.join(os.path.abspath(os.path.dirname(__file__)), "styles_of_address.json")
+STYLES_OF_ADDRESS_VERSION = 1
+
+# Map OCD division identifiers to styles of address. Filled on first use by get_styles_of_address().
 styles_of_address = {}
-for gid in range(3):
-    response = requests.get(
-        f"https://docs.google.com/spreadsheets/d/11qUKd5bHeG5KIzXYERtVgs3hKcd9yuZlt-tCTLBFRpI/pub?single=true&gid={gid}&output=csv",
-        verify=SSL_VERIFY,
-    )
-    if response.status_code == 200:
-        response.encoding = "utf-8"
-        for row in csv.DictReader(StringIO(response.text)):
-            identifier = row.pop("Identifier")
-            for field in list(row.keys()):
-                if not row[field] or field == "Name":
-                    row.pop(field)
-            if row:
-                styles_of_address[identifier] = row
+
+
+def fetch_styles_of_address():
+    """Download the styles of address spreadsheet (three sheets)."""
+    styles = {}
+    for gid in range(3):
+        response = requests.get(STYLES_OF_ADDRESS_URL.format(gid=gid), verify=SSL_VERIFY)
+        if response.status_code == 200:
+            response.encoding = "utf-8"
+            for row in csv.DictReader(StringIO(response.text)):
+                identifier = row.pop("Identifier")
+                for field in list(row.keys()):
+                    if not row[field] or field == "Name":
+                        row.pop(field)
+                if row:
+                    styles[identifier] = row
+    return styles
+
+
+def refresh_styles_of_address(path=STYLES_OF_ADDRESS_SNAPSHOT):
+    """Download the spreadsheet and overwrite the local snapshot. Returns the number of divisions."""
+    styles = fetch_styles_of_address()
+    if not styles:
+        raise Exception("Styles of address spreadsheet returned no rows; keeping the existing snapshot")
+    snapshot = {
+        "version": STYLES_OF_ADDRESS_VERSION,
+        "fetched_at": datetime.now().isoformat(timespec="seconds"),
+        "source": STYLES_OF_ADDRESS_URL,
+        "styles_of_address": dict(sorted(styles.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    styles_of_address.clear()
+    styles_of_address.update(styles)
+    return len(styles)
+
+
+def get_styles_of_address():
+    """
+    Return the styles of address, reading the local snapshot on first use.
+
+    Importing this module makes no network requests. Only if the snapshot is
+    missing is the spreadsheet downloaded, once per process; if that returns
+    no rows, an exception is raised rather than retrying on every call. Run
+    `invoke refresh_styles_of_address` to create or update the snapshot.
+    """
+    if not styles_of_address:
+        if os.path.exists(STYLES_OF_ADDRESS_SNAPSHOT):
+            with open(STYLES_OF_ADDRESS_SNAPSHOT, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") != STYLES_OF_ADDRESS_VERSION:
+                raise Exception(
+                    f"{STYLES_OF_ADDRESS_SNAPSHOT} has version {snapshot.get('version')}, expected "
+                    f"{STYLES_OF_ADDRESS_VERSION}; run `invoke refresh_styles_of_address`"
+                )
+            styles = snapshot["styles_of_address"]
+        else:
+            styles = fetch_styles_of_address()
+        if not styles:
+            # An empty result would leave the memo empty and be fetched again by every scraper.
+            raise Exception(
+                f"No styles of address: {STYLES_OF_ADDRESS_SNAPSHOT} is missing or empty and the spreadsheet "
+                "returned no rows; run `invoke refresh_styles_of_address`"
+            )
+        styles_of_address.update(styles)
+    return styles_of_address
 
 
 class CanadianScraper(Scraper):
@@ -200,6 +266,13 @@ class CanadianScraper(Scraper):
     def post(self, *args, **kwargs):
         return super().post(*args, verify=kwargs.pop("verify", SSL_VERIFY), **kwargs)
 
+    def fetch(self, url, *, get=None, **kwargs):
+        """GET a URL through the response store, if configured; otherwise, the same as `get`."""
+        get = get or self.get
+        if response_store is None:
+            return get(url, **kwargs)
+        return response_store.fetch(url, lambda headers: get(url, headers=headers, **kwargs))
+
     def cloudscrape(self, url, verify=SSL_VERIFY):
         response = SCRAPER.get(url, verify=verify)
         response.raise_for_status()
@@ -214,7 +287,7 @@ class CanadianScraper(Scraper):
         # https://github.com/jamesturk/scrapelib/blob/5ce0916/scrapelib/__init__.py#L505
         self.user_agent = user_agent
 
-        response = self.get(url, cookies=cookies, verify=verify)
+        response = self.fetch(url, cookies=cookies, verify=verify)
         if encoding:
             response.encoding = encoding
 
@@ -248,7 +321,7 @@ class CanadianScraper(Scraper):
                 ftp.quit()
                 data.seek(0)
             else:
-                response = self.get(url, **kwargs)
+                response = self.fetch(url, **kwargs)
                 if encoding:
                     response.encoding = encoding
                 data = StringIO(response.text.strip().removeprefix("\ufeff"))  # BOM
@@ -377,13 +450,16 @@ class CSVScraper(CanadianScraper):
             return row["last name"] not in empty and row["first name"] not in empty
         return row["name"] not in empty
 
-    def scrape(self):
-        seat_numbers = defaultdict(lambda: defaultdict(int))
+    def read_rows(self, response=None):
+        """
+        Return the rows of the CSV (or XLS, XLSX or ZIP) file as dictionaries with normalized column headers.
 
+        If `response` is given, read it instead of downloading `csv_url`.
+        """
         extension = self.extension if self.extension else os.path.splitext(self.csv_url)[1]
         if extension in (".xls", ".xlsx"):
             data = StringIO()
-            binary = BytesIO(self.get(self.csv_url).content)
+            binary = BytesIO((response or self.get(self.csv_url)).content)
             if extension == ".xls":
                 table = agate.Table.from_xls(binary)
             elif extension == ".xlsx":
@@ -395,13 +471,18 @@ class CSVScraper(CanadianScraper):
             if not self.encoding:
                 self.encoding = "utf-8"
             try:
-                response = requests.get(self.csv_url, stream=True)
+                if response is None:
+                    response = requests.get(self.csv_url, stream=True)
                 with open(basename, "wb") as f:
                     f.writelines(response.iter_content())
                 with ZipFile(basename).open(self.filename, "r") as fp:
                     data = StringIO(fp.read().decode(self.encoding))
             finally:
                 os.unlink(basename)
+        elif response is not None:
+            if self.encoding:
+                response.encoding = self.encoding
+            data = StringIO(response.text.strip().removeprefix("\ufeff"))  # BOM
         else:
             data = None
 
@@ -414,7 +495,27 @@ class CSVScraper(CanadianScraper):
             data=data,
         )
         reader.fieldnames = [self.header_converter(field) for field in reader.fieldnames]
-        for row in reader:
+        return list(reader)
+
+    def rows(self):
+        """Return `read_rows()`, replaying the rows saved for the same body if the file is unchanged."""
+        if response_store is None or urlparse(self.csv_url).scheme == "ftp":
+            return self.read_rows()
+
+        extension = self.extension or os.path.splitext(self.csv_url)[1]
+        response = self.fetch(self.csv_url, get=requests.get if extension == ".zip" else None)
+        if not response.body_sha256:
+            return self.read_rows(response)
+        rows = response_store.load_parsed(self.csv_url, "rows", response.body_sha256)
+        if rows is None:
+            rows = self.read_rows(response)
+            response_store.save_parsed(self.csv_url, "rows", response.body_sha256, rows)
+        return rows
+
+    def scrape(self):
+        seat_numbers = defaultdict(lambda: defaultdict(int))
+
+        for row in self.rows():
             # ca_qc_laval: "maire et president du comite executif", "conseiller et membre du comite executif"
             # ca_qc_montreal: "Conseiller de la ville; Membre…", "Maire d'arrondissement\nMembre…"
             if row.get("primary role"):
@@ -585,8 +686,9 @@ class CanadianJurisdiction(Jurisdiction):
     def get_organizations(self):
         organization = Organization(self.name, classification=self.classification)
 
-        leader_role = styles_of_address[self.division_id]["Leader"]
-        member_role = self.member_role or styles_of_address[self.division_id]["Member"]
+        styles = get_styles_of_address()
+        leader_role = styles[self.division_id]["Leader"]
+        member_role = self.member_role or styles[self.division_id]["Member"]
 
         parent = Division.get(self.division_id)
         # Don't yield posts for premiers.
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test Councillor Change Detection
+
+Following FUNDAMENTAL RULE: Checks which scraped councillors the municipal
+ingester inserts, updates, leaves alone and retires, without a database
+or network access
+"""
+
+import logging
+import sys
+import uuid
+from pathlib import Path
+
+# Add the app directory to the path
+sys.path.append(str(Path(__file__).parent / "app"))
+
+from app.ingestion.municipal_data_ingester import canonical_councillor, content_hash, diff_councillors
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def councillor(name, phone, note="Office"):
+    """A scraped councillor as scrape_municipality_data returns it."""
+    return {
+        'id': str(uuid.uuid4()), 'name': name, 'municipality': 'ca_on_test',
+        'municipality_name': 'Test City Council', 'division_id': 'ocd-division/country:ca/csd:0',
+        'division_name': 'Test', 'classification': 'legislature',
+        'offices': [{'type': 'voice', 'value': phone, 'note': note, 'label': ''}],
+        'sources': ['https://example.com/council'],
+    }
+
+
+COUNCIL = [councillor("Ann Lee", "555-0100"), councillor("Bo Chen", "555-0101"), councillor("Cy Diaz", "555-0102")]
+
+
+def stored_rows(councillors, retired=()):
+    """{name: (content_hash, retired)} as the ingester reads it back."""
+    stored = {}
+    for record in councillors:
+        canonical = canonical_councillor(record)
+        stored[canonical['name']] = (content_hash(canonical), canonical['name'] in retired)
+    return stored
+
+
+def test_formatting_noise_is_unchanged():
+    """Whitespace, duplicate offices and a new scrape id do not change the hash."""
+    noisy = councillor("Ann  Lee ", "555-0100", note=" Office")
+    noisy['offices'].append({'type': 'voice', 'value': '555-0100', 'note': 'Office', 'label': ''})
+    diff = diff_councillors([noisy], stored_rows(COUNCIL[:1]))
+    assert diff.unchanged == ["Ann Lee"], diff
+    assert not diff.inserts and not diff.updates and not diff.retirements, diff
+
+
+def test_inserts_updates_and_retirements():
+    """New names are inserted, changed records updated and missing names retired."""
+    scraped = [COUNCIL[0], councillor("Bo Chen", "555-0199"), councillor("Di Eng", "555-0103")]
+    diff = diff_councillors(scraped, stored_rows(COUNCIL))
+    assert [r['name'] for r in diff.inserts] == ["Di Eng"], diff
+    assert [r['name'] for r in diff.updates] == ["Bo Chen"], diff
+    assert diff.unchanged == ["Ann Lee"], diff
+    assert diff.retirements == ["Cy Diaz"] and not diff.withheld_retirements, diff
+    assert all(r['content_hash'] == content_hash({k: v for k, v in r.items() if k != 'content_hash'})
+               for r in diff.inserts + diff.updates)
+
+
+def test_returning_councillor_is_unretired():
+    """A retired councillor who reappears unchanged is updated, not left retired."""
+    diff = diff_councillors(COUNCIL, stored_rows(COUNCIL, retired={"Cy Diaz"}))
+    assert [r['name'] for r in diff.updates] == ["Cy Diaz"], diff
+    assert not diff.retirements, diff
+
+
+def test_already_retired_councillors_are_not_retired_again():
+    """Only sitting councillors missing from the scrape are retired."""
+    diff = diff_councillors(COUNCIL[:2], stored_rows(COUNCIL, retired={"Cy Diaz"}))
+    assert not diff.retirements and not diff.withheld_retirements, diff
+
+
+def test_empty_scrape_retires_nobody():
+    """An empty scrape withholds every retirement."""
+    diff = diff_councillors([], stored_rows(COUNCIL))
+    assert not diff.retirements, diff
+    assert diff.withheld_retirements == ["Ann Lee", "Bo Chen", "Cy Diaz"], diff
+
+
+def test_mass_retirement_is_withheld():
+    """Dropping more than the allowed share of the council withholds the retirements."""
+    stored = stored_rows(COUNCIL)
+    diff = diff_councillors(COUNCIL[:1], stored)
+    assert not diff.retirements and diff.withheld_retirements == ["Bo Chen", "Cy Diaz"], diff
+
+    diff = diff_councillors(COUNCIL[:1], stored, max_retirement_fraction=1.0)
+    assert diff.retirements == ["Bo Chen", "Cy Diaz"] and not diff.withheld_retirements, diff
+
+
+def main():
+    """Run all councillor change detection tests."""
+    logger.info("🧪 Testing Councillor Change Detection")
+    test_formatting_noise_is_unchanged()
+    test_inserts_updates_and_retirements()
+    test_returning_councillor_is_unretired()
+    test_already_retired_councillors_are_not_retired_again()
+    test_empty_scrape_retires_nobody()
+    test_mass_retirement_is_withheld()
+    logger.info("🎉 All councillor change detection tests passed")
+
+
+if __name__ == "__main__":
+    main()
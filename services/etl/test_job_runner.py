@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test the DAG Job Runner
+
+Following FUNDAMENTAL RULE: Checks dependency order, concurrency limits,
+leases and checkpoint resume without touching the database
+"""
+
+import asyncio
+import logging
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the app directory to the path
+sys.path.append(str(Path(__file__).parent / "app"))
+
+from app.scheduling.job_runner import (
+    DagRunner, Job, MemoryRunStore, CycleError, validate_dag, FAILED, SKIPPED, SUCCEEDED
+)
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def recording_job(name, log, depends_on=(), resources=(), delay=0.01, fail=False):
+    async def func(ctx):
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+        if fail:
+            raise RuntimeError(f"{name} failed")
+    return Job(name, func, depends_on=tuple(depends_on), resources=tuple(resources))
+
+
+async def test_dependency_order():
+    """Votes wait for MPs, ballots wait for votes; bills run alongside."""
+    log = []
+    jobs = [
+        recording_job("ballots", log, depends_on=["votes"]),
+        recording_job("votes", log, depends_on=["mps"]),
+        recording_job("mps", log),
+        recording_job("bills", log),
+    ]
+    results = await DagRunner(MemoryRunStore(), max_concurrency=4).run("daily:test", jobs)
+    assert all(status == SUCCEEDED for status in results.values()), results
+    assert log.index(("end", "mps")) < log.index(("start", "votes"))
+    assert log.index(("end", "votes")) < log.index(("start", "ballots"))
+    assert log.index(("start", "bills")) < log.index(("end", "mps")), "independent jobs should overlap"
+    logger.info("✅ Dependency order respected")
+
+
+async def test_resource_limits():
+    """At most one job holds the OpenParliament API at a time."""
+    active, peak = [0], [0]
+
+    async def api_job(ctx):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+
+    jobs = [Job(f"api_{i}", api_job, resources=("openparliament_api",)) for i in range(5)]
+    runner = DagRunner(MemoryRunStore(), max_concurrency=5, resource_limits={"openparliament_api": 1})
+    await runner.run("daily:test", jobs)
+    assert peak[0] == 1, peak
+    logger.info("✅ Per-resource limit respected")
+
+
+async def test_failure_skips_dependents():
+    log = []
+    jobs = [
+        recording_job("mps", log, fail=True),
+        recording_job("votes", log, depends_on=["mps"]),
+        recording_job("bills", log),
+    ]
+    results = await DagRunner(MemoryRunStore()).run("daily:test", jobs)
+    assert results == {"mps": FAILED, "votes": SKIPPED, "bills": SUCCEEDED}, results
+    logger.info("✅ Dependents of a failed job are skipped")
+
+
+async def test_lease_and_resume():
+    """A second replica does not rerun finished jobs; a rerun resumes from the checkpoint."""
+    store = MemoryRunStore()
+    calls = []
+
+    async def staged(ctx):
+        done = list(ctx.checkpoint.get("stages", []))
+        for stage in ("federal", "provincial", "municipal"):
+            if stage in done:
+                continue
+            if stage == "municipal" and "crash" not in calls:
+                calls.append("crash")
+                raise RuntimeError("simulated crash")
+            done.append(stage)
+            calls.append(stage)
+            await ctx.save_checkpoint({"stages": done})
+
+    jobs = [Job("full", staged)]
+    first = await DagRunner(store, owner="replica-a").run("monthly:test", jobs)
+    assert first == {"full": FAILED}
+    assert await store.unfinished_runs() == [], "failed runs are not resumed"
+
+    second = await DagRunner(store, owner="replica-b").run("monthly:test", jobs)
+    assert second == {"full": SUCCEEDED}
+    assert calls == ["federal", "provincial", "crash", "municipal"], calls
+
+    third = await DagRunner(store, owner="replica-c").run("monthly:test", jobs)
+    assert third == {"full": SUCCEEDED}
+    assert calls[-1] == "municipal" and len(calls) == 4, "succeeded jobs must not rerun"
+
+    lease = await store.acquire("weekly:test", "held", "replica-a", 60)
+    assert lease.acquired
+    assert not (await store.acquire("weekly:test", "held", "replica-b", 60)).acquired
+    logger.info("✅ Leases and checkpoints work")
+
+
+async def test_only_recent_interrupted_runs_resume():
+    """A lease left by a stopped replica is resumed once it expires, unless the run is old."""
+    now = [datetime(2026, 10, 18, 2, 0, tzinfo=timezone.utc)]
+    store = MemoryRunStore(clock=lambda: now[0])
+    await store.acquire("daily:2026-10-16T02:00", "mps", "replica-a", 60)
+    now[0] += timedelta(days=2)
+    await store.acquire("daily:2026-10-18T02:00", "mps", "replica-a", 60)
+    await store.acquire("daily:2026-10-18T02:00", "votes", "replica-a", 600)
+    assert await store.unfinished_runs() == []
+
+    now[0] += timedelta(minutes=5)
+    assert await store.unfinished_runs() == ["daily:2026-10-18T02:00"]
+    logger.info("✅ Only recent interrupted runs resume")
+
+
+async def test_cycle_detection():
+    async def noop(ctx):
+        pass
+    try:
+        validate_dag([Job("a", noop, depends_on=("b",)), Job("b", noop, depends_on=("a",))])
+    except CycleError:
+        logger.info("✅ Cycles rejected")
+    else:
+        raise AssertionError("cycle not detected")
+
+
+async def main():
+    """Run all job runner tests."""
+    logger.info("🧪 Testing DAG Job Runner")
+    await test_dependency_order()
+    await test_resource_limits()
+    await test_failure_skips_dependents()
+    await test_lease_and_resume()
+    await test_only_recent_interrupted_runs_resume()
+    await test_cycle_detection()
+    logger.info("🎉 All job runner tests passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test Legacy Adapters Against Recorded Pages
+
+Following FUNDAMENTAL RULE: Runs the real adapters against a local HTTP
+server that serves the pages in fixtures/legacy_pages with simulated
+latency and one transient 503, then reports pages/sec sequentially and
+with detail fan-out
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the app directory to the path
+sys.path.append(str(Path(__file__).parent / "app"))
+
+from app.extractors.legacy_adapters import LegacyDataCollectionTask
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "legacy_pages"
+LATENCY = 0.02  # seconds per response, roughly a nearby origin
+
+ROUTES = [
+    (r"^/represent/", "represent_mps.json"),
+    (r"^/ourcommons/members", "ourcommons_mps.html"),
+    (r"^/legisinfo/bills", "legisinfo_bills.json"),
+    (r"^/legisinfo/bill/", "legisinfo_bill_detail.json"),
+    (r"^/votes/en$", "votes_en.xml"),
+    (r"^/votes/fr$", "votes_fr.xml"),
+    (r"^/votes/\d+/\d+/\d+$", "vote_detail.xml"),
+]
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 64  # the default of 5 drops bursts of new connections
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so the client's pool is reused
+    failed_once = set()
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        path = self.path.split("?")[0]
+        if path == "/votes/44/1/7" and path not in self.failed_once:
+            self.failed_once.add(path)
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        for pattern, filename in ROUTES:
+            if re.match(pattern, path):
+                body = (FIXTURES / filename).read_bytes()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def point_at(task, base):
+    """Send every adapter URL to the fixture server."""
+    task.mps_adapter.REPRESENT_API_URL = f"{base}/represent/?limit=500"
+    task.mps_adapter.OURCOMMONS_MPS_URL = f"{base}/ourcommons/members"
+    task.bills_adapter.LEGISINFO_JSON_LIST_URL = base + "/legisinfo/bills?parlsession=%(sessid)s"
+    task.bills_adapter.LEGISINFO_DETAIL_URL = base + "/legisinfo/bill/%(parlnum)s-%(sessnum)s/%(billnumber)s/json"
+    task.votes_adapter.VOTELIST_URL = base + "/votes/{lang}"
+    task.votes_adapter.VOTEDETAIL_URL = base + "/votes/{parliamentnum}/{sessnum}/{votenumber}"
+
+
+async def collect(base, output_dir, concurrency):
+    FixtureHandler.failed_once.clear()
+    task = LegacyDataCollectionTask(output_dir=output_dir, concurrency=concurrency)
+    task.client.rate_limiter.interval = 0  # single local host; spacing would only measure the limiter
+    point_at(task, base)
+    try:
+        return await task.run_full_collection()
+    finally:
+        await task.close()
+
+
+async def test_legacy_adapters():
+    """Collect everything from the fixture server and check counts and throughput."""
+    server = FixtureServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            sequential = await collect(base, output_dir, concurrency=1)
+            concurrent = await collect(base, output_dir, concurrency=8)
+
+            for stats in (sequential, concurrent):
+                assert stats["mps"] == 10, stats
+                assert stats["bills"] == 24 and stats["bill_details"] == 24, stats
+                assert stats["votes"] == 24 and stats["vote_details"] == 24, stats
+                assert stats["retries"] == 1, stats
+
+            details = Path(output_dir, "legacy_adapted").glob("legacy_vote_details_*.jsonl")
+            assert any(path.read_text().count("\n") == 24 for path in details)
+
+            print(f"sequential: {sequential['pages_fetched']} pages in {sequential['seconds']:.2f}s "
+                  f"({sequential['pages_per_second']:.1f} pages/sec)")
+            print(f"fan-out x8: {concurrent['pages_fetched']} pages in {concurrent['seconds']:.2f}s "
+                  f"({concurrent['pages_per_second']:.1f} pages/sec)")
+            assert concurrent["pages_per_second"] > sequential["pages_per_second"] * 2
+    finally:
+        server.shutdown()
+
+    print("✅ Legacy adapter test passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_legacy_adapters())
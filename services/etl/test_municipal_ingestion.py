@@ -71,7 +71,7 @@ async def test_municipal_ingestion():
                     for office in councillor['offices'][:2]:  # Show first 2 offices
                         logger.info(f"   - {office['type']}: {office['value']}")
             else:
-                logger.warning(f"⚠️  No data scraped for {test_municipality}")
+                raise AssertionError(f"No data scraped for {test_municipality}: {ingester.stats.errors}")
         
         logger.info("✅ Municipal data ingestion test completed successfully!")
         
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test Statement Mention Indexing
+
+Following FUNDAMENTAL RULE: Checks mention extraction from Hansard markup
+and that indexing resumes from the last scanned statement, against an
+in-memory stand-in for the openpolicy tables
+"""
+
+import asyncio
+import logging
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add the app directory to the path
+sys.path.append(str(Path(__file__).parent / "app"))
+
+from app.ingestion.statement_mentions import NameDictionary, extract_mentions, index_statement_mentions
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SINGH, POILIEVRE, COTE, OTHER_SINGH = uuid4(), uuid4(), uuid4(), uuid4()
+NAMES = NameDictionary([
+    (SINGH, "Jagmeet Singh"),
+    (POILIEVRE, "Pierre Poilievre"),
+    (COTE, "Marie-Claude Côté"),
+    (OTHER_SINGH, "Sukh Singh"),
+    (uuid4(), "Cher"),  # single-token names are not indexed
+])
+
+
+class StatementTables:
+    """Just enough of an asyncpg connection for index_statement_mentions."""
+
+    def __init__(self, *contents):
+        self.statements = []
+        self.mentions = set()
+        self.progress = None
+        self.read = []
+        self.add(*contents)
+
+    def add(self, *contents):
+        for content in contents:
+            statement_id = len(self.statements) + 1
+            self.statements.append({
+                "id": statement_id, "time": datetime(2024, 1, 1, 10, statement_id),
+                "content_en": content, "content_fr": None,
+            })
+
+    async def fetch(self, query, after_id, limit):
+        batch = [s for s in self.statements if s["id"] > after_id][:limit]
+        self.read.extend(s["id"] for s in batch)
+        return batch
+
+    async def fetchval(self, query):
+        return self.progress
+
+    async def execute(self, query, *args):
+        if query.lstrip().startswith("DELETE"):
+            low, high = args
+            self.mentions = {m for m in self.mentions if not low < m[0] <= high}
+        else:
+            self.progress = args[0]
+
+    async def copy_records_to_table(self, table, schema_name, records, columns):
+        self.mentions.update(records)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+def test_plain_text_names_are_found_once():
+    """A name repeated with different spacing and case is one mention."""
+    content = "<p>I agree with Pierre Poilievre, and pierre  POILIEVRE agrees with me.</p>"
+    assert extract_mentions(content, NAMES) == {POILIEVRE}
+
+
+def test_accents_and_punctuation_are_normalised():
+    """Accents and hyphens do not stop a name from matching."""
+    assert extract_mentions("<p>As Marie Claude Cote said...</p>", NAMES) == {COTE}
+
+
+def test_politician_links_resolve_through_their_title():
+    """A politician link is resolved through its title, not its text."""
+    content = (
+        '<p>I thank <a href="/politicians/jagmeet-singh/" data-HoCid="123" '
+        'title="Jagmeet Singh">the member for Burnaby South</a>.</p>'
+    )
+    assert extract_mentions(content, NAMES) == {SINGH}
+
+
+def test_surnames_alone_do_not_match():
+    """Bare surnames and single-token names are never indexed."""
+    assert extract_mentions("<p>Mr. Singh rose. Cher was there.</p>", NAMES) == set()
+    assert NAMES.lookup("Singh") == set()
+    assert len(NAMES) == 4
+    assert extract_mentions(None, NAMES) == set() and extract_mentions("", NAMES) == set()
+
+
+def test_indexing_resumes_after_the_last_scanned_statement():
+    """Statements without mentions are not read again on the next run."""
+    tables = StatementTables("<p>Pierre Poilievre rose.</p>", "<p>Nothing to see.</p>")
+
+    async def run():
+        first = await index_statement_mentions(tables, batch_size=1, names=NAMES)
+        assert first == 1 and tables.progress == 2 and tables.read == [1, 2]
+
+        tables.add("<p>I thank Jagmeet Singh.</p>")
+        tables.read = []
+        second = await index_statement_mentions(tables, names=NAMES)
+        assert second == 1 and tables.progress == 3 and tables.read == [3]
+
+        assert await index_statement_mentions(tables, after_id=0, names=NAMES) == 2
+        assert {(m[0], m[1]) for m in tables.mentions} == {(1, POILIEVRE), (3, SINGH)}
+
+    asyncio.run(run())
+    logger.info("✅ Mention indexing resumes from its progress mark")
+
+
+def main():
+    """Run all statement mention tests."""
+    logger.info("🧪 Testing Statement Mention Indexing")
+    test_plain_text_names_are_found_once()
+    test_accents_and_punctuation_are_normalised()
+    test_politician_links_resolve_through_their_title()
+    test_surnames_alone_do_not_match()
+    test_indexing_resumes_after_the_last_scanned_statement()
+    logger.info("🎉 All statement mention tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,18 @@ Provides real-time container and service monitoring information
 
 import asyncio
 import json
+import os
 import subprocess
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import docker
+import httpx
 import psutil
-import requests
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import logging
 
 # Configure logging
@@ -40,8 +42,20 @@ app.add_middleware(
 
 # Global variables
 docker_client = None
-last_update = None
-cache_duration = 5  # seconds
+
+# Sampling configuration
+SAMPLE_INTERVAL = float(os.getenv("MONITOR_SAMPLE_INTERVAL", "5"))  # seconds
+HISTORY_SIZE = int(os.getenv("MONITOR_HISTORY_SIZE", "720"))  # one hour at 5s
+PROBE_TIMEOUT = float(os.getenv("MONITOR_PROBE_TIMEOUT", "3"))  # seconds
+
+# Services probed by the sampler
+SERVICES = [
+    {"name": "API Gateway", "url": "http://api-gateway:8000/healthz"},
+    {"name": "User Service", "url": "http://user-service:8000/health"},
+    {"name": "ETL Service", "url": "http://etl:8083/health"},
+    {"name": "Web UI", "url": "http://web-ui:80/"},
+    {"name": "Database", "url": "http://db:5432"}
+]
 
 def get_docker_client():
     """Get Docker client instance"""
@@ -149,10 +163,34 @@ def get_container_health(container) -> str:
     except:
         return 'unknown'
 
+class NetworkRate:
+    """Turns cumulative network counters into per-second rates"""
+
+    def __init__(self):
+        self.previous = None
+
+    def update(self, counters) -> Dict[str, float]:
+        now = time.monotonic()
+        rates = {"rx": 0.0, "tx": 0.0}
+        if self.previous is not None:
+            previous_time, previous_counters = self.previous
+            elapsed = now - previous_time
+            if elapsed > 0:
+                rates["rx"] = (counters.bytes_recv - previous_counters.bytes_recv) / elapsed
+                rates["tx"] = (counters.bytes_sent - previous_counters.bytes_sent) / elapsed
+        self.previous = (now, counters)
+        return rates
+
+network_rate = NetworkRate()
+
 def get_system_resources() -> Dict[str, Any]:
-    """Get system resource usage"""
+    """Get system resource usage without blocking
+
+    CPU usage is measured since the previous call, so this must be called
+    on a regular interval (the sampler does) rather than sleeping to measure.
+    """
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
         
@@ -160,6 +198,7 @@ def get_system_resources() -> Dict[str, Any]:
         network = psutil.net_io_counters()
         network_rx = format_bytes(network.bytes_recv)
         network_tx = format_bytes(network.bytes_sent)
+        rates = network_rate.update(network)
         
         return {
             "cpu": round(cpu_percent, 2),
@@ -171,17 +210,17 @@ def get_system_resources() -> Dict[str, Any]:
             "disk_total": format_bytes(disk.total),
             "network_rx": network_rx,
             "network_tx": network_tx,
-            "network": f"{network_rx}/s ↓ {network_tx}/s ↑"
+            "network": f"{format_bytes(int(rates['rx']))}/s ↓ {format_bytes(int(rates['tx']))}/s ↑"
         }
     except Exception as e:
         logger.error(f"Error getting system resources: {e}")
         return {"error": str(e)}
 
-async def check_service_health(service_name: str, url: str) -> Dict[str, Any]:
+async def check_service_health(client: httpx.AsyncClient, service_name: str, url: str) -> Dict[str, Any]:
     """Check service health endpoint"""
     try:
         start_time = time.time()
-        response = requests.get(url, timeout=5)
+        response = await client.get(url)
         response_time = (time.time() - start_time) * 1000
         
         return {
@@ -197,10 +236,143 @@ async def check_service_health(service_name: str, url: str) -> Dict[str, Any]:
             "name": service_name,
             "url": url,
             "status": "error",
-            "error": str(e),
+            "error": str(e) or type(e).__name__,
             "last_check": datetime.now().isoformat()
         }
 
+def summarize_services(health_checks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    healthy_count = len([s for s in health_checks if s['status'] == 'healthy'])
+    total_count = len(health_checks)
+    return {
+        "services": health_checks,
+        "total": total_count,
+        "healthy": healthy_count,
+        "unhealthy": total_count - healthy_count,
+    }
+
+def summarize_containers(containers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "containers": containers,
+        "total": len(containers),
+        "running": len([c for c in containers if c['state'] == 'running']),
+        "stopped": len([c for c in containers if c['state'] == 'stopped']),
+        "restarting": len([c for c in containers if c['state'] == 'restarting']),
+    }
+
+async def collect_containers() -> Optional[List[Dict[str, Any]]]:
+    """Container info for every container, or None if Docker isn't reachable
+
+    The Docker SDK is blocking and each stats call takes a second or two,
+    so containers are read concurrently in worker threads.
+    """
+    client = get_docker_client()
+    if not client:
+        return None
+    containers = await asyncio.to_thread(client.containers.list, all=True)
+    return list(await asyncio.gather(
+        *(asyncio.to_thread(get_container_info, container) for container in containers)
+    ))
+
+class MetricsSampler:
+    """
+    Background task that samples system metrics, service health and
+    containers on a fixed interval.
+
+    Request handlers only read the latest sample, so the cost of probing is
+    paid once per interval no matter how many dashboards are open. Recent
+    samples are kept in a ring buffer, and SSE subscribers are woken on
+    each new sample.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, history_size: int = HISTORY_SIZE,
+                 probe_timeout: float = PROBE_TIMEOUT, services: Optional[List[Dict[str, str]]] = None):
+        self.interval = interval
+        self.probe_timeout = probe_timeout
+        self.services = services if services is not None else SERVICES
+        self.history = deque(maxlen=history_size)
+        self.latest: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._new_sample: Optional[asyncio.Event] = None
+
+    async def start(self):
+        self._new_sample = asyncio.Event()
+        self._http = httpx.AsyncClient(timeout=self.probe_timeout)
+        psutil.cpu_percent(interval=None)  # prime the CPU counter
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._http:
+            await self._http.aclose()
+
+    async def _run(self):
+        while True:
+            started = time.monotonic()
+            try:
+                await self.sample()
+            except Exception as e:
+                logger.error(f"Error sampling metrics: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def sample(self) -> Dict[str, Any]:
+        """Take one sample and publish it to handlers and subscribers"""
+        services, containers = await asyncio.gather(
+            asyncio.gather(*(
+                check_service_health(self._http, service["name"], service["url"])
+                for service in self.services
+            )),
+            self._containers(),
+        )
+        sample = {
+            "timestamp": datetime.now().isoformat(),
+            "resources": get_system_resources(),
+            "services": summarize_services(list(services)),
+            "containers": summarize_containers(containers) if containers is not None else None,
+        }
+        self.latest = sample
+        self.history.append(sample)
+        # Wake everyone waiting on this sample; later waiters get a fresh event
+        published, self._new_sample = self._new_sample, asyncio.Event()
+        published.set()
+        return sample
+
+    async def _containers(self) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return await collect_containers()
+        except Exception as e:
+            logger.error(f"Error getting containers: {e}")
+            return None
+
+    async def wait_for_sample(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait until the next sample is published and return it"""
+        await asyncio.wait_for(self._new_sample.wait(), timeout)
+        return self.latest
+
+    async def current(self) -> Dict[str, Any]:
+        """Latest sample, waiting for the first one after startup"""
+        if self.latest is None:
+            try:
+                await self.wait_for_sample(timeout=self.interval + self.probe_timeout + 10)
+            except asyncio.TimeoutError:
+                raise HTTPException(status_code=503, detail="Metrics not sampled yet")
+        return self.latest
+
+sampler = MetricsSampler()
+
+@app.on_event("startup")
+async def start_sampler():
+    await sampler.start()
+
+@app.on_event("shutdown")
+async def stop_sampler():
+    await sampler.stop()
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -212,6 +384,8 @@ async def root():
             "/containers - Get container information",
             "/services - Get service health status",
             "/resources - Get system resource usage",
+            "/history - Get recent resource samples",
+            "/stream - Server-sent events with each new sample",
             "/health - Get API health status"
         ]
     }
@@ -228,71 +402,60 @@ async def health():
 @app.get("/containers")
 async def get_containers():
     """Get all container information"""
-    try:
-        client = get_docker_client()
-        if not client:
-            raise HTTPException(status_code=500, detail="Docker not accessible")
-        
-        containers = []
-        for container in client.containers.list(all=True):
-            container_info = get_container_info(container)
-            containers.append(container_info)
-        
-        return {
-            "containers": containers,
-            "total": len(containers),
-            "running": len([c for c in containers if c['state'] == 'running']),
-            "stopped": len([c for c in containers if c['state'] == 'stopped']),
-            "restarting": len([c for c in containers if c['state'] == 'restarting']),
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.error(f"Error getting containers: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    sample = await sampler.current()
+    if sample["containers"] is None:
+        raise HTTPException(status_code=500, detail="Docker not accessible")
+    return {**sample["containers"], "timestamp": sample["timestamp"]}
 
 @app.get("/services")
 async def get_services():
     """Get service health status"""
-    try:
-        # Define services to check
-        services = [
-            {"name": "API Gateway", "url": "http://api-gateway:8000/healthz"},
-            {"name": "User Service", "url": "http://user-service:8000/health"},
-            {"name": "ETL Service", "url": "http://etl:8083/health"},
-            {"name": "Web UI", "url": "http://web-ui:80/"},
-            {"name": "Database", "url": "http://db:5432"}
-        ]
-        
-        # Check all services concurrently
-        health_checks = []
-        for service in services:
-            health_check = await check_service_health(service["name"], service["url"])
-            health_checks.append(health_check)
-        
-        healthy_count = len([s for s in health_checks if s['status'] == 'healthy'])
-        total_count = len(health_checks)
-        
-        return {
-            "services": health_checks,
-            "total": total_count,
-            "healthy": healthy_count,
-            "unhealthy": total_count - healthy_count,
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.error(f"Error getting services: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    sample = await sampler.current()
+    return {**sample["services"], "timestamp": sample["timestamp"]}
 
 @app.get("/resources")
 async def get_resources():
     """Get system resource usage"""
-    try:
-        resources = get_system_resources()
-        resources["timestamp"] = datetime.now().isoformat()
-        return resources
-    except Exception as e:
-        logger.error(f"Error getting resources: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    sample = await sampler.current()
+    return {**sample["resources"], "timestamp": sample["timestamp"]}
+
+@app.get("/history")
+async def get_history(limit: int = 60):
+    """Get recent system resource samples, oldest first"""
+    samples = list(sampler.history)[-limit:] if limit > 0 else []
+    return {
+        "interval": sampler.interval,
+        "samples": [
+            {
+                "timestamp": sample["timestamp"],
+                "resources": sample["resources"],
+                "healthy_services": sample["services"]["healthy"],
+                "total_services": sample["services"]["total"],
+            }
+            for sample in samples
+        ],
+    }
+
+@app.get("/stream")
+async def stream(request: Request):
+    """Server-sent events: one 'sample' event per sampler interval"""
+    async def events():
+        if sampler.latest is not None:
+            yield f"event: sample\ndata: {json.dumps(sampler.latest)}\n\n"
+        while not await request.is_disconnected():
+            try:
+                sample = await sampler.wait_for_sample(timeout=sampler.interval * 3)
+            except asyncio.TimeoutError:
+                # Keep the connection alive through proxies
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: sample\ndata: {json.dumps(sample)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/logs/{container_name}")
 async def get_container_logs(container_name: str, tail: int = 100):
@@ -53,6 +53,8 @@ class Settings(BaseSettings):
     OWN_SMTP_USER: Optional[str] = None
     OWN_SMTP_PASSWORD: Optional[str] = None
     OWN_SMTP_USE_TLS: bool = True
+    OWN_SMTP_POOL_SIZE: int = 8  # Persistent connections kept open
+    OWN_SMTP_MAX_MESSAGES_PER_CONNECTION: int = 500  # Reconnect after this many
     
     # Option 3: Legacy SMTP (for compatibility)
     SMTP_HOST: Optional[str] = None
@@ -84,6 +86,19 @@ class Settings(BaseSettings):
     OWN_SMS_GATEWAY_URL: Optional[str] = None
     OWN_SMS_API_KEY: Optional[str] = None
     
+    # ===== DELIVERY LIMITS =====
+    
+    # Concurrent sends per channel during bulk notifications
+    NOTIFY_EMAIL_CONCURRENCY: int = 32
+    NOTIFY_PUSH_CONCURRENCY: int = 64
+    NOTIFY_SMS_CONCURRENCY: int = 8
+    
+    # Failed deliveries are retried from the notification outbox
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_BASE_SECONDS: int = 60
+    OUTBOX_CLAIM_SECONDS: int = 300  # A claimed row is retried after this if its worker dies
+    OUTBOX_POLL_SECONDS: int = 30  # How often each service process drains the outbox
+    
     # ===== NOTIFICO - OPEN SOURCE NOTIFICATION SERVER =====
     
     # Notifico Configuration (Rust-based, 100% FREE)
@@ -46,15 +46,18 @@ async def init_db():
     try:
         from app.models.user import Base as UserBase
         from app.models.user_engagement import Base as EngagementBase
+        from app.models.notification_outbox import Base as OutboxBase
         
         # Import all models to ensure they're registered
         import app.models.user
         import app.models.user_engagement
+        import app.models.notification_outbox
         
         async with engine.begin() as conn:
             # Create all tables
             await conn.run_sync(UserBase.metadata.create_all)
             await conn.run_sync(EngagementBase.metadata.create_all)
+            await conn.run_sync(OutboxBase.metadata.create_all)
         
         logger.info("Database tables created successfully")
     except Exception as e:
@@ -9,10 +9,13 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import time
 
 from app.config.settings import settings
 from app.api.v1 import health, auth_simple, profile_simple
+from app.services.smtp_pool import smtp_pool
+from app.services.notification_orchestrator import notification_orchestrator
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -48,6 +51,19 @@ async def add_process_time_header(request: Request, call_next):
     return response
 
 
+# Retry failed deliveries from the notification outbox in the background
+@app.on_event("startup")
+async def start_outbox_worker():
+    app.state.outbox_worker = asyncio.create_task(notification_orchestrator.run_outbox_worker())
+
+
+# Stop the outbox worker and close pooled SMTP connections on shutdown
+@app.on_event("shutdown")
+async def close_smtp_pool():
+    app.state.outbox_worker.cancel()
+    await smtp_pool.close()
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
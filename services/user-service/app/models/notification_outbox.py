@@ -0,0 +1,48 @@
+"""
+Notification outbox model.
+
+Deliveries that fail are persisted here and retried with exponential
+backoff by the outbox worker, so a crash or an SMTP outage doesn't lose
+notifications.
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer, Text, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+
+class NotificationOutbox(Base):
+    """A notification waiting to be (re)delivered."""
+    
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        # The worker polls for due pending rows
+        Index("ix_notification_outbox_due", "status", "next_attempt_at"),
+    )
+    
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
+    
+    # Delivery details
+    channel = Column(String(20), nullable=False)  # email, push, sms
+    user_id = Column(String(64), nullable=False, index=True)
+    notification_type = Column(String(50), nullable=False)
+    title = Column(String(500), nullable=False)
+    message = Column(Text, nullable=False)
+    data = Column(JSONB, nullable=True)
+    
+    # Retry state
+    status = Column(String(20), default="pending", nullable=False)  # pending, sent, failed
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error = Column(Text, nullable=True)
+    
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<NotificationOutbox(id={self.id}, channel='{self.channel}', status='{self.status}')>"
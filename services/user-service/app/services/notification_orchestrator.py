@@ -9,10 +9,12 @@ Intelligently routes notifications through the best available FREE service:
 This gives us professional notifications with zero monthly costs!
 """
 
+import asyncio
 from typing import Dict, List, Optional
 from app.services.email_service import email_service
 from app.services.own_mail_server import own_mail_server
 from app.services.push_notification_service import push_service
+from app.services.notification_outbox import notification_outbox
 from app.config.settings import settings
 import logging
 
@@ -32,6 +34,43 @@ class NotificationOrchestrator:
             ("fcm", "fcm"),
             ("onesignal", "onesignal")
         ]
+        self.channel_concurrency = {
+            "email": settings.NOTIFY_EMAIL_CONCURRENCY,
+            "push": settings.NOTIFY_PUSH_CONCURRENCY,
+            "sms": settings.NOTIFY_SMS_CONCURRENCY
+        }
+        self._channel_limits: Dict[str, asyncio.Semaphore] = {}
+    
+    def _channel_limit(self, channel: str) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent sends on one channel."""
+        if channel not in self._channel_limits:
+            self._channel_limits[channel] = asyncio.Semaphore(self.channel_concurrency.get(channel, 8))
+        return self._channel_limits[channel]
+    
+    async def _send_channel(
+        self,
+        channel: str,
+        user_id: str,
+        notification_type: str,
+        title: str,
+        message: str,
+        data: Optional[Dict] = None
+    ) -> bool:
+        """Send through one channel, within that channel's concurrency limit."""
+        async with self._channel_limit(channel):
+            if channel == "email":
+                return await self._send_email_notification(
+                    user_id, notification_type, title, message, data
+                )
+            elif channel == "push":
+                return await self._send_push_notification(
+                    user_id, title, message, data
+                )
+            elif channel == "sms":
+                return await self._send_sms_notification(
+                    user_id, title, message, data
+                )
+        return False
     
     async def send_notification(
         self,
@@ -56,24 +95,15 @@ class NotificationOrchestrator:
         if not channels:
             channels = ["email", "push"]  # Default channels
         
-        results = {}
+        channels = [channel for channel in channels if channel in ("email", "push", "sms")]
         
-        # Send through each requested channel
-        for channel in channels:
-            if channel == "email":
-                results["email"] = await self._send_email_notification(
-                    user_id, notification_type, title, message, data
-                )
-            elif channel == "push":
-                results["push"] = await self._send_push_notification(
-                    user_id, title, message, data
-                )
-            elif channel == "sms":
-                results["sms"] = await self._send_sms_notification(
-                    user_id, title, message, data
-                )
+        # Send through each requested channel concurrently
+        outcomes = await asyncio.gather(*(
+            self._send_channel(channel, user_id, notification_type, title, message, data)
+            for channel in channels
+        ))
         
-        return results
+        return dict(zip(channels, outcomes))
     
     async def send_parliamentary_alert(
         self,
@@ -251,18 +281,73 @@ class NotificationOrchestrator:
         title: str,
         message: str,
         data: Optional[Dict] = None,
-        channels: Optional[List[str]] = None
+        channels: Optional[List[str]] = None,
+        chunk_size: int = 1000,
+        use_outbox: bool = True
     ) -> Dict[str, Dict[str, bool]]:
-        """Send notification to multiple users."""
+        """
+        Send notification to multiple users.
+        
+        Users are processed concurrently in chunks, with per-channel
+        concurrency limits; deliveries that fail go to the notification
+        outbox to be retried by the outbox worker (run_outbox_worker).
+        """
+        if not channels:
+            channels = ["email", "push"]
+        
         results = {}
+        failed = []
         
-        for user_id in user_ids:
-            user_results = await self.send_notification(
-                user_id, notification_type, title, message, data, channels
-            )
-            results[user_id] = user_results
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            chunk_results = await asyncio.gather(*(
+                self.send_notification(user_id, notification_type, title, message, data, channels)
+                for user_id in chunk
+            ))
+            for user_id, user_results in zip(chunk, chunk_results):
+                results[user_id] = user_results
+                failed.extend(
+                    {
+                        "channel": channel,
+                        "user_id": user_id,
+                        "notification_type": notification_type,
+                        "title": title,
+                        "message": message,
+                        "data": data,
+                        "attempts": 1
+                    }
+                    for channel, success in user_results.items()
+                    # SMS is not implemented yet, so retrying it is pointless
+                    if not success and channel != "sms"
+                )
+        
+        if failed and use_outbox:
+            try:
+                await notification_outbox.enqueue_many(failed)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(failed)} failed deliveries to outbox: {e}")
         
         return results
+    
+    async def retry_outbox(self, batch_size: int = 500) -> Dict[str, int]:
+        """Retry due deliveries from the notification outbox."""
+        async def deliver(entry) -> bool:
+            return await self._send_channel(
+                entry.channel, entry.user_id, entry.notification_type,
+                entry.title, entry.message, entry.data
+            )
+        
+        return await notification_outbox.drain(deliver, batch_size=batch_size)
+    
+    async def run_outbox_worker(self, interval: Optional[float] = None) -> None:
+        """Retry due outbox deliveries every ``interval`` seconds until cancelled."""
+        interval = interval or settings.OUTBOX_POLL_SECONDS
+        while True:
+            try:
+                await self.retry_outbox()
+            except Exception as e:
+                logger.error(f"Outbox retry failed: {e}")
+            await asyncio.sleep(interval)
 
 
 # Global notification orchestrator instance
@@ -0,0 +1,144 @@
+"""
+Notification Outbox Service
+
+Persists failed deliveries and retries them with exponential backoff.
+Rows are claimed with FOR UPDATE SKIP LOCKED and leased by moving their
+next attempt past the send, so several workers can drain the outbox at
+once without delivering the same notification twice, and no row lock is
+held while a notification is being sent.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+from sqlalchemy import select, func
+from app.config.settings import settings
+from app.database.connection import AsyncSessionLocal
+from app.models.notification_outbox import NotificationOutbox
+import logging
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[NotificationOutbox], Awaitable[bool]]
+
+
+class NotificationOutboxService:
+    """Outbox of notifications awaiting (re)delivery."""
+
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self.session_factory = session_factory
+        self.max_attempts = settings.OUTBOX_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.OUTBOX_RETRY_BASE_SECONDS
+        self.claim_seconds = settings.OUTBOX_CLAIM_SECONDS
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=self.retry_base_seconds * 2 ** max(attempts - 1, 0))
+
+    async def enqueue_many(self, entries: List[Dict]) -> int:
+        """
+        Persist notifications for later delivery.
+
+        Each entry has channel, user_id, notification_type, title, message
+        and optionally data, attempts and last_error.
+        """
+        if not entries:
+            return 0
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as session:
+            session.add_all([
+                NotificationOutbox(
+                    channel=entry["channel"],
+                    user_id=str(entry["user_id"]),
+                    notification_type=entry["notification_type"],
+                    title=entry["title"],
+                    message=entry["message"],
+                    data=entry.get("data"),
+                    attempts=entry.get("attempts", 0),
+                    last_error=entry.get("last_error"),
+                    next_attempt_at=now + self._backoff(entry.get("attempts", 0))
+                )
+                for entry in entries
+            ])
+            await session.commit()
+        return len(entries)
+
+    def _apply_outcome(self, row: NotificationOutbox, outcome, now: datetime) -> str:
+        """Record one delivery attempt on ``row``; returns sent, retrying or failed."""
+        row.attempts += 1
+        if outcome is True:
+            row.status = "sent"
+            row.sent_at = now
+            return "sent"
+        row.last_error = repr(outcome) if isinstance(outcome, BaseException) else "delivery failed"
+        if row.attempts >= self.max_attempts:
+            row.status = "failed"
+            return "failed"
+        row.next_attempt_at = now + self._backoff(row.attempts)
+        return "retrying"
+
+    async def _claim(self, batch_size: int) -> List[NotificationOutbox]:
+        """
+        Lease a batch of due rows and commit, so no lock is held while sending.
+
+        A claimed row is pushed claim_seconds into the future; if this worker
+        dies before recording the outcome, the row becomes due again then.
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(NotificationOutbox)
+                .where(
+                    NotificationOutbox.status == "pending",
+                    NotificationOutbox.next_attempt_at <= func.now()
+                )
+                .order_by(NotificationOutbox.next_attempt_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.scalars().all()
+            lease_until = datetime.now(timezone.utc) + timedelta(seconds=self.claim_seconds)
+            for row in rows:
+                row.next_attempt_at = lease_until
+            await session.commit()
+        return rows
+
+    async def _record(self, rows: List[NotificationOutbox]) -> None:
+        """Write back the outcome set on claimed rows."""
+        async with self.session_factory() as session:
+            # Re-attaching the detached rows flushes the changes made to them
+            session.add_all(rows)
+            await session.commit()
+
+    async def process_due(self, deliver: Deliver, batch_size: int = 500) -> Dict[str, int]:
+        """Deliver one batch of due notifications and record the outcome."""
+        stats = {"sent": 0, "retrying": 0, "failed": 0}
+        rows = await self._claim(batch_size)
+        if not rows:
+            return stats
+
+        outcomes = await asyncio.gather(
+            *(deliver(row) for row in rows), return_exceptions=True
+        )
+        now = datetime.now(timezone.utc)
+        for row, outcome in zip(rows, outcomes):
+            stats[self._apply_outcome(row, outcome, now)] += 1
+        await self._record(rows)
+
+        logger.info(f"Outbox batch: {stats}")
+        return stats
+
+    async def drain(self, deliver: Deliver, batch_size: int = 500, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Process due batches until none are left (or max_batches is reached)."""
+        totals = {"sent": 0, "retrying": 0, "failed": 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            stats = await self.process_due(deliver, batch_size)
+            batches += 1
+            for key, value in stats.items():
+                totals[key] += value
+            if not any(stats.values()):
+                break
+        return totals
+
+
+# Global outbox service instance
+notification_outbox = NotificationOutboxService()
@@ -14,14 +14,13 @@ This gives us:
 - Custom domain support
 """
 
-import smtplib
-import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from typing import Optional, List
 from app.config.settings import settings
+from app.services.smtp_pool import smtp_pool
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,7 +35,8 @@ class OwnMailServer:
         self.smtp_user = settings.OWN_SMTP_USER
         self.smtp_password = settings.OWN_SMTP_PASSWORD
         self.from_email = settings.FROM_EMAIL or "noreply@openpolicy.me"
-        self.use_tls = settings.OWN_SMTP_USE_TLS or True
+        self.use_tls = settings.OWN_SMTP_USE_TLS
+        self.pool = smtp_pool
     
     async def send_email(
         self,
@@ -48,37 +48,53 @@ class OwnMailServer:
     ) -> bool:
         """Send email using our own mail server."""
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.from_email
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # Add text and HTML parts
-            if text_content:
-                text_part = MIMEText(text_content, 'plain')
-                msg.attach(text_part)
-            
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-            
-            # Add attachments
-            if attachments:
-                for file_path in attachments:
-                    await self._add_attachment(msg, file_path)
-            
-            # Send email
-            if self.smtp_user and self.smtp_password:
-                # Authenticated SMTP
-                return await self._send_authenticated(msg)
-            else:
-                # Local SMTP (no auth required)
-                return await self._send_local(msg)
-                
+            msg = await self.build_message(to_email, subject, html_content, text_content, attachments)
+            return await self.deliver(msg)
         except Exception as e:
             logger.error(f"Mail server error: {e}")
             return False
     
+    async def build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> MIMEMultipart:
+        """Build the MIME message for an email."""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.from_email
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # Add text and HTML parts
+        if text_content:
+            text_part = MIMEText(text_content, 'plain')
+            msg.attach(text_part)
+        
+        html_part = MIMEText(html_content, 'html')
+        msg.attach(html_part)
+        
+        # Add attachments
+        if attachments:
+            for file_path in attachments:
+                await self._add_attachment(msg, file_path)
+        
+        return msg
+    
+    async def deliver(self, msg: MIMEMultipart) -> bool:
+        """
+        Send a message over a pooled connection.
+        
+        Connections are authenticated (when credentials are configured) and
+        upgraded with STARTTLS once, then reused for many messages.
+        """
+        if await self.pool.send_message(msg):
+            logger.debug(f"Email sent to {msg['To']} via pooled SMTP")
+            return True
+        return False
+    
     async def send_otp_email(
         self,
         to_email: str,
@@ -182,42 +198,6 @@ class OwnMailServer:
         
         return await self.send_email(to_email, subject, html_content)
     
-    async def _send_authenticated(self, msg: MIMEMultipart) -> bool:
-        """Send email using authenticated SMTP."""
-        try:
-            context = ssl.create_default_context()
-            
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls(context=context)
-                
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-                
-            logger.info(f"Email sent successfully via authenticated SMTP")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Authenticated SMTP error: {e}")
-            return False
-    
-    async def _send_local(self, msg: MIMEMultipart) -> bool:
-        """Send email using local SMTP (no auth required)."""
-        try:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    context = ssl.create_default_context()
-                    server.starttls(context=context)
-                
-                server.send_message(msg)
-                
-            logger.info(f"Email sent successfully via local SMTP")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Local SMTP error: {e}")
-            return False
-    
     async def _add_attachment(self, msg: MIMEMultipart, file_path: str) -> None:
         """Add file attachment to email."""
         try:
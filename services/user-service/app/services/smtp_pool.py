@@ -0,0 +1,139 @@
+"""
+SMTP Connection Pool
+
+Keeps a bounded set of persistent, authenticated SMTP connections open so
+bulk delivery pays the TCP/STARTTLS/AUTH handshake once per connection
+instead of once per email. Each connection sends messages back to back and
+is recycled after a configurable number of messages, since most MTAs cap
+messages per session.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import AsyncIterator, Optional
+import logging
+
+import aiosmtplib
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """An SMTP client plus the number of messages it has sent."""
+
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.sent = 0
+
+
+class SMTPConnectionPool:
+    """Bounded pool of persistent aiosmtplib connections."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        size: int = 8,
+        max_messages_per_connection: int = 500,
+        timeout: float = 30.0,
+        retries: int = 2
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+        self.retries = retries
+        self._idle: Optional[asyncio.LifoQueue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _ensure_started(self) -> None:
+        # Created lazily so the pool binds to the running event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+            self._idle = asyncio.LifoQueue()
+
+    async def _connect(self) -> PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.use_tls,
+            timeout=self.timeout
+        )
+        # connect() runs STARTTLS and AUTH when configured
+        await client.connect()
+        return PooledConnection(client)
+
+    async def _discard(self, connection: PooledConnection) -> None:
+        try:
+            await connection.client.quit()
+        except Exception:
+            connection.client.close()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[PooledConnection]:
+        """Borrow a connection; it goes back to the pool unless it failed."""
+        self._ensure_started()
+        async with self._slots:
+            connection = None
+            while not self._idle.empty():
+                candidate = self._idle.get_nowait()
+                if candidate.client.is_connected:
+                    connection = candidate
+                    break
+            if connection is None:
+                connection = await self._connect()
+            try:
+                yield connection
+            except BaseException:
+                await self._discard(connection)
+                raise
+            if connection.sent >= self.max_messages_per_connection:
+                await self._discard(connection)
+            else:
+                self._idle.put_nowait(connection)
+
+    async def send_message(self, message: Message) -> bool:
+        """Send one message over a pooled connection, retrying on failure."""
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.connection() as connection:
+                    await connection.client.send_message(message)
+                    connection.sent += 1
+                return True
+            except (aiosmtplib.SMTPException, OSError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    logger.error(f"SMTP delivery to {message['To']} failed: {e}")
+                    return False
+                await asyncio.sleep(0.5 * 2 ** attempt)
+        return False
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        if self._idle is None:
+            return
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+
+
+# Global pool for our own mail server
+smtp_pool = SMTPConnectionPool(
+    hostname=settings.OWN_SMTP_HOST or "localhost",
+    port=settings.OWN_SMTP_PORT or 587,
+    username=settings.OWN_SMTP_USER,
+    password=settings.OWN_SMTP_PASSWORD,
+    use_tls=settings.OWN_SMTP_USE_TLS,
+    size=settings.OWN_SMTP_POOL_SIZE,
+    max_messages_per_connection=settings.OWN_SMTP_MAX_MESSAGES_PER_CONNECTION
+)
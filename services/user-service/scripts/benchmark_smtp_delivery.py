@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+SMTP Delivery Benchmark for the User Service
+
+Starts a local aiosmtpd sink and delivers the same batch of messages two
+ways: a fresh SMTP connection per email (the previous behaviour) and the
+pooled, persistent connections used by OwnMailServer. Reports emails/sec
+for each.
+
+Usage:
+    python scripts/benchmark_smtp_delivery.py --messages 5000 --pool-size 8
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+from email.mime.text import MIMEText
+
+# Add the app directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+
+from app.services.smtp_pool import SMTPConnectionPool
+
+
+class CountingSink:
+    """aiosmtpd handler that accepts and counts every message."""
+
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 Message accepted"
+
+
+def make_messages(count: int):
+    messages = []
+    for index in range(count):
+        msg = MIMEText("<p>New activity on a bill you follow.</p>" * 20, "html")
+        msg["From"] = "noreply@openpolicy.me"
+        msg["To"] = f"user{index}@example.com"
+        msg["Subject"] = "Parliamentary Alert: Bill Update"
+        messages.append(msg)
+    return messages
+
+
+async def per_message_connections(messages, host, port, concurrency):
+    limit = asyncio.Semaphore(concurrency)
+
+    async def send(msg):
+        async with limit:
+            await aiosmtplib.send(msg, hostname=host, port=port, start_tls=False)
+
+    await asyncio.gather(*(send(msg) for msg in messages))
+
+
+async def pooled(messages, host, port, pool_size):
+    pool = SMTPConnectionPool(host, port, use_tls=False, size=pool_size)
+    results = await asyncio.gather(*(pool.send_message(msg) for msg in messages))
+    await pool.close()
+    assert all(results), "pooled delivery failed"
+
+
+async def main_async(args):
+    sink = CountingSink()
+    controller = Controller(sink, hostname="127.0.0.1", port=args.port)
+    controller.start()
+    try:
+        started = time.perf_counter()
+        await per_message_connections(make_messages(args.messages), "127.0.0.1", args.port, args.pool_size)
+        fresh = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await pooled(make_messages(args.messages), "127.0.0.1", args.port, args.pool_size)
+        pooled_seconds = time.perf_counter() - started
+    finally:
+        controller.stop()
+
+    print(f"messages:                 {args.messages:,} (sink received {sink.received:,})")
+    print(f"connection per email:     {args.messages / fresh:,.0f} emails/sec")
+    print(f"pooled ({args.pool_size} connections):  {args.messages / pooled_seconds:,.0f} emails/sec")
+
+
+def main():
+    """Main function for command line usage."""
+    parser = argparse.ArgumentParser(description="Benchmark pooled SMTP delivery against a local sink")
+    parser.add_argument("--messages", type=int, default=5000, help="Emails to deliver per run")
+    parser.add_argument("--pool-size", type=int, default=8, help="Pooled connections (and per-email concurrency)")
+    parser.add_argument("--port", type=int, default=8025, help="Port for the local aiosmtpd sink")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
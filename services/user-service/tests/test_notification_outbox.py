@@ -0,0 +1,90 @@
+"""
+Tests for the notification outbox retry and backoff path.
+
+The database side (claiming due rows and writing back outcomes) is
+replaced by an in-memory list, so these cover what happens to a row
+between being claimed and being recorded.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.models.notification_outbox import NotificationOutbox
+from app.services.notification_outbox import NotificationOutboxService
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+class InMemoryOutbox(NotificationOutboxService):
+    """Outbox whose due rows live in a list instead of notification_outbox."""
+
+    def __init__(self, rows):
+        super().__init__(session_factory=None)
+        self.max_attempts = 3
+        self.retry_base_seconds = 60
+        self.rows = rows
+        self.recorded = []
+
+    async def _claim(self, batch_size):
+        due = [row for row in self.rows if row.status == "pending" and row.next_attempt_at <= NOW]
+        claimed = due[:batch_size]
+        for row in claimed:
+            row.next_attempt_at = NOW + timedelta(seconds=self.claim_seconds)
+        return claimed
+
+    async def _record(self, rows):
+        self.recorded.extend(rows)
+
+
+def _row(user_id, attempts=0):
+    return NotificationOutbox(
+        channel="email", user_id=user_id, notification_type="alert", title="Bill update",
+        message="New activity", status="pending", attempts=attempts, next_attempt_at=NOW
+    )
+
+
+async def _deliver(row):
+    if row.user_id == "raises":
+        raise ConnectionResetError("connection reset")
+    return row.user_id == "ok"
+
+
+def test_backoff_doubles_per_attempt():
+    outbox = InMemoryOutbox([])
+
+    assert [outbox._backoff(n).total_seconds() for n in (0, 1, 2, 3)] == [60, 60, 120, 240]
+
+
+def test_outcomes_are_recorded_after_delivery():
+    rows = [_row("ok"), _row("fails"), _row("raises"), _row("fails", attempts=2)]
+    outbox = InMemoryOutbox(rows)
+
+    stats = asyncio.run(outbox.process_due(_deliver))
+
+    assert stats == {"sent": 1, "retrying": 2, "failed": 1}
+    assert outbox.recorded == rows
+    sent, retrying, raised, exhausted = rows
+    assert sent.status == "sent" and sent.attempts == 1 and sent.sent_at is not None
+    assert retrying.status == "pending" and retrying.last_error == "delivery failed"
+    assert "connection reset" in raised.last_error
+    assert exhausted.status == "failed" and exhausted.attempts == 3
+
+
+def test_retry_is_scheduled_with_backoff():
+    row = _row("fails", attempts=1)
+    outbox = InMemoryOutbox([row])
+
+    assert outbox._apply_outcome(row, False, NOW) == "retrying"
+    assert row.attempts == 2
+    assert row.next_attempt_at == NOW + timedelta(seconds=120)
+
+
+def test_drain_stops_when_nothing_is_due():
+    rows = [_row("ok"), _row("fails")]
+    outbox = InMemoryOutbox(rows)
+
+    totals = asyncio.run(outbox.drain(_deliver, batch_size=1))
+
+    # The failed row is not due again until its backoff has passed
+    assert totals == {"sent": 1, "retrying": 1, "failed": 0}
+    assert rows[1].next_attempt_at > NOW
@@ -0,0 +1,107 @@
+"""
+Tests for the pooled SMTP connections used by OwnMailServer.
+
+Messages go to a local aiosmtpd sink, which records the client port of
+each delivery so the tests can tell how many connections were opened.
+"""
+
+import asyncio
+import socket
+from email.mime.text import MIMEText
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.services.smtp_pool import SMTPConnectionPool
+
+
+class RecordingSink:
+    """aiosmtpd handler that records the connection of every accepted message."""
+
+    def __init__(self, reject_first: int = 0):
+        self.peers = []
+        self.reject_first = reject_first
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.reject_first:
+            self.reject_first -= 1
+            return "451 Try again later"
+        self.peers.append(session.peer)
+        return "250 Message accepted"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def sink_server():
+    started = []
+
+    def start(sink):
+        port = _free_port()
+        controller = Controller(sink, hostname="127.0.0.1", port=port)
+        controller.start()
+        started.append(controller)
+        return port
+
+    yield start
+    for controller in started:
+        controller.stop()
+
+
+def _message(index: int = 0) -> MIMEText:
+    msg = MIMEText("New activity on a bill you follow.")
+    msg["From"] = "noreply@openpolicy.me"
+    msg["To"] = f"user{index}@example.com"
+    msg["Subject"] = "Parliamentary Alert"
+    return msg
+
+
+def _send_all(pool: SMTPConnectionPool, count: int, concurrent: bool = True):
+    async def run():
+        if concurrent:
+            results = await asyncio.gather(*(pool.send_message(_message(i)) for i in range(count)))
+        else:
+            results = [await pool.send_message(_message(i)) for i in range(count)]
+        await pool.close()
+        return results
+
+    return asyncio.run(run())
+
+
+def test_messages_share_pooled_connections(sink_server):
+    sink = RecordingSink()
+    pool = SMTPConnectionPool("127.0.0.1", sink_server(sink), use_tls=False, size=2)
+
+    assert all(_send_all(pool, 20))
+    assert len(sink.peers) == 20
+    assert len(set(sink.peers)) <= 2
+
+
+def test_connection_recycled_after_message_limit(sink_server):
+    sink = RecordingSink()
+    pool = SMTPConnectionPool(
+        "127.0.0.1", sink_server(sink), use_tls=False, size=1, max_messages_per_connection=3
+    )
+
+    assert all(_send_all(pool, 7, concurrent=False))
+    assert len(set(sink.peers)) == 3
+
+
+def test_failed_send_retried_on_fresh_connection(sink_server):
+    sink = RecordingSink(reject_first=1)
+    pool = SMTPConnectionPool("127.0.0.1", sink_server(sink), use_tls=False, size=1, retries=1)
+
+    assert _send_all(pool, 1) == [True]
+    assert len(sink.peers) == 1
+
+
+def test_send_reports_failure_after_retries(sink_server):
+    sink = RecordingSink(reject_first=5)
+    pool = SMTPConnectionPool("127.0.0.1", sink_server(sink), use_tls=False, size=1, retries=0)
+
+    assert _send_all(pool, 1) == [False]
+    assert sink.peers == []
@@ -0,0 +1,79 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from parliament.activity import utils as activity
+from parliament.activity.models import Activity
+
+REBUILT_VARIETIES = ['statement', 'committee', 'membervote', 'billsponsor']
+
+class Rollback(Exception):
+    pass
+
+class Unbatched(object):
+    """Stands in for an ActivityBuilder, saving each item as it's added, the
+    way activities were saved before ActivityBuilder existed."""
+
+    def add(self, *args, **kwargs):
+        activity.save_activity(*args, **kwargs)
+
+    def save(self):
+        pass
+
+class Command(BaseCommand):
+    help = ("Regenerates statement, committee, vote and bill sponsor activities "
+        "for politicians, and reports how long it took.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('politicians', nargs='*',
+            help='Politician slugs or IDs; defaults to all current MPs')
+        parser.add_argument('--unbatched', action='store_true',
+            help='Save one item at a time, for comparison')
+        parser.add_argument('--commit', action='store_true',
+            help='Keep the rebuilt activities; by default everything is rolled back')
+
+    def handle(self, **options):
+        from parliament.core.models import Politician
+
+        if options['politicians']:
+            politicians = [Politician.objects.get_by_slug_or_id(p) for p in options['politicians']]
+        else:
+            politicians = list(Politician.objects.current())
+
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                Activity.objects.filter(politician__in=politicians,
+                    variety__in=REBUILT_VARIETIES).delete()
+                cleared = time.perf_counter()
+                for pol in politicians:
+                    builder = Unbatched() if options['unbatched'] else activity.ActivityBuilder()
+                    rebuild_politician(pol, builder)
+                    builder.save()
+                finished = time.perf_counter()
+                created = Activity.objects.filter(politician__in=politicians,
+                    variety__in=REBUILT_VARIETIES).count()
+                if not options['commit']:
+                    raise Rollback
+        except Rollback:
+            pass
+        self.stdout.write("%s: %d activities for %d politicians in %.2f s (%.0f/sec)%s" % (
+            'unbatched' if options['unbatched'] else 'batched',
+            created, len(politicians), finished - cleared, created / (finished - cleared),
+            '' if options['commit'] else ', rolled back'))
+        self.stdout.write("total including delete: %.2f s" % (time.perf_counter() - started))
+
+def rebuild_politician(pol, builder):
+    """Queues every statement, committee, vote and bill sponsor activity for pol on builder."""
+    from parliament.bills.models import Bill, MemberVote
+    from parliament.hansards.models import Document
+
+    documents = Document.objects.filter(statement__politician=pol, statement__procedural=False
+        ).distinct().select_related('committeemeeting__committee')
+    for document in documents.iterator():
+        document.save_activity(builder, politician=pol)
+    for mv in MemberVote.objects.filter(politician=pol).select_related('votequestion', 'politician').iterator():
+        mv.save_activity(builder)
+    for bill in Bill.objects.filter(sponsor_politician=pol).select_related('sponsor_politician'):
+        bill.save_sponsor_activity(builder)
@@ -0,0 +1,72 @@
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from django.template import loader
+from django.test import TestCase, override_settings
+
+from parliament.activity.models import Activity
+from parliament.activity.utils import ActivityBuilder, save_activity
+from parliament.core.models import Politician
+
+class ActivityBuilderTests(TestCase):
+
+    fixtures = ['parties', 'ridings', 'sessions', 'politicians']
+
+    def setUp(self):
+        self.politician = Politician.objects.all()[0]
+        self.date = datetime.date(2024, 3, 1)
+
+    def _tweet(self, id):
+        return SimpleNamespace(id=id, text='Tweet number %d' % id)
+
+    def _queue(self, builder, ids):
+        for id in ids:
+            builder.add(self._tweet(id), self.politician, self.date, variety='twitter')
+
+    def test_saves_in_batches_rendering_each_variety_once(self):
+        builder = ActivityBuilder(batch_size=2)
+        self._queue(builder, range(5))
+        with mock.patch.object(loader, 'get_template', wraps=loader.get_template) as get_template:
+            self.assertEqual(builder.save(), 5)
+        self.assertEqual(get_template.call_count, 1)
+        self.assertEqual(sorted(Activity.objects.values_list('guid', flat=True)),
+            ['twitter%d' % i for i in range(5)])
+        self.assertIn('Tweet number 3', Activity.objects.get(guid='twitter3').payload)
+        self.assertEqual(builder.items, [])
+
+    def test_existing_and_repeated_guids_are_skipped(self):
+        save_activity(self._tweet(1), self.politician, self.date, variety='twitter')
+        builder = ActivityBuilder(batch_size=2)
+        self._queue(builder, [1, 2, 2, 3, 1])
+        self.assertEqual(builder.save(), 2)
+        self.assertEqual(Activity.objects.count(), 3)
+
+        self._queue(builder, [1, 2, 3])
+        self.assertEqual(builder.save(), 0)
+        self.assertEqual(Activity.objects.count(), 3)
+
+    def test_concurrent_inserts_are_ignored(self):
+        builder = ActivityBuilder()
+        self._queue(builder, [1, 2])
+        real_filter = Activity.objects.filter
+
+        def filter_then_race(*args, **kwargs):
+            # Another writer saves twitter1 right after the existence check
+            checked = real_filter(*args, **kwargs)
+            checked = list(checked.values_list('guid', flat=True))
+            Activity.objects.create(variety='twitter', date=self.date, politician=self.politician,
+                guid='twitter1', payload='saved elsewhere')
+            return mock.Mock(values_list=lambda *args, **kwargs: checked)
+
+        with mock.patch.object(Activity.objects, 'filter', filter_then_race):
+            self.assertEqual(builder.save(), 2)
+        self.assertEqual(Activity.objects.count(), 2)
+        self.assertEqual(Activity.objects.get(guid='twitter1').payload, 'saved elsewhere')
+
+    @override_settings(PARLIAMENT_SAVE_ACTIVITIES=False)
+    def test_disabled(self):
+        builder = ActivityBuilder()
+        self._queue(builder, [1])
+        self.assertEqual(builder.save(), 0)
+        self.assertFalse(Activity.objects.exists())
@@ -6,15 +6,19 @@ from django.template import loader
 
 from parliament.activity.models import Activity
 
+def _make_guid(obj, guid, variety):
+    if not guid:
+        guid = variety + str(obj.id)
+    if len(guid) > 50:
+        guid = sha1(guid.encode('utf8')).hexdigest()
+    return guid
+
 def save_activity(obj, politician, date, guid=None, variety=None):
     if not getattr(settings, 'PARLIAMENT_SAVE_ACTIVITIES', True):
         return
     if not variety:
         variety = obj.__class__.__name__.lower()
-    if not guid:
-        guid = variety + str(obj.id)
-    if len(guid) > 50:
-        guid = sha1(guid.encode('utf8')).hexdigest()
+    guid = _make_guid(obj, guid, variety)
     if Activity.objects.filter(guid=guid).exists():
         return False
     t = loader.get_template("activity/%s.html" % variety.lower())
@@ -26,6 +30,62 @@ def save_activity(obj, politician, date, guid=None, variety=None):
         payload = t.render(c)).save()
     return True
 
+class ActivityBuilder(object):
+    """Collects candidate activity items, then saves the new ones in bulk.
+
+    Takes the same arguments as save_activity, but add() only queues an
+    item; save() looks up all the queued guids in one query, renders
+    the items that don't exist yet (loading each variety's template
+    once), and bulk-inserts them. Items whose guid already exists, or
+    appears earlier in the queue, are skipped, so running a builder
+    twice over the same items is harmless."""
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.items = []
+        self._templates = {}
+
+    def add(self, obj, politician, date, guid=None, variety=None):
+        if not variety:
+            variety = obj.__class__.__name__.lower()
+        self.items.append((obj, politician, date, _make_guid(obj, guid, variety), variety))
+
+    def _template(self, variety):
+        if variety not in self._templates:
+            self._templates[variety] = loader.get_template("activity/%s.html" % variety.lower())
+        return self._templates[variety]
+
+    def save(self):
+        """Saves queued items that don't already exist.
+
+        Returns the number of new items handed to bulk_create. The insert
+        ignores conflicts and does not report how many rows it skipped, so
+        an item another writer saved in the meantime is still counted."""
+        items, self.items = self.items, []
+        if not getattr(settings, 'PARLIAMENT_SAVE_ACTIVITIES', True):
+            return 0
+        attempted = 0
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            seen = set(Activity.objects.filter(
+                guid__in=[item[3] for item in batch]).values_list('guid', flat=True))
+            activities = []
+            for obj, politician, date, guid, variety in batch:
+                if guid in seen:
+                    continue
+                seen.add(guid)
+                activity = Activity(variety=variety,
+                    date=date,
+                    politician=politician,
+                    guid=guid,
+                    payload=self._template(variety).render({'obj': obj, 'politician': politician}))
+                activity.full_clean(validate_unique=False)
+                activities.append(activity)
+            # ignore_conflicts covers a concurrent writer inserting the same guid
+            Activity.objects.bulk_create(activities, ignore_conflicts=True)
+            attempted += len(activities)
+        return attempted
+
 ACTIVITY_MAX = {
     'twitter': 6,
     'gnews': 6,
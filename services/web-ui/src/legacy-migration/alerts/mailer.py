@@ -0,0 +1,95 @@
+"""Sends batches of email over a small pool of persistent SMTP connections."""
+
+from concurrent.futures import ThreadPoolExecutor
+from smtplib import SMTPResponseException
+import threading
+import time
+
+from django.core.mail import get_connection
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class PooledMailer(object):
+    """
+    Each of `connections` worker threads keeps one SMTP connection open for
+    the whole run, instead of a new connection and transaction per message.
+    send_batch() queues a list of messages and returns a future resolving to
+    the list of messages that were sent; at most max_pending batches are
+    queued at once.
+
+    A message that fails with an SMTP error or a socket error (refused,
+    reset, timed out) is retried up to `retries` times, `backoff` seconds
+    apart, on a fresh connection unless the server answered with an error
+    code. A message that still fails is logged and left out of the result.
+    """
+
+    def __init__(self, connections=4, max_pending=None, retries=2, backoff=1, backend=None):
+        self.connections = connections
+        self.retries = retries
+        self.backoff = backoff
+        self.backend = backend
+        self._local = threading.local()
+        self._opened = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending or connections * 2)
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.connections)
+        return self
+
+    def __exit__(self, *exc):
+        self._executor.shutdown(wait=True)
+        for connection in self._opened:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _connection(self):
+        if not hasattr(self._local, 'connection'):
+            connection = get_connection(self.backend, fail_silently=False)
+            connection.open()
+            self._local.connection = connection
+            with self._lock:
+                self._opened.append(connection)
+        return self._local.connection
+
+    def _discard_connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            del self._local.connection
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _send_one(self, msg):
+        for attempt in range(self.retries + 1):
+            try:
+                self._connection().send_messages([msg])
+                return True
+            # SMTPException is an OSError, as are refused, reset and timed out sockets
+            except OSError as e:
+                if attempt == self.retries:
+                    logger.error("Couldn't send alert to %s: %r", msg.to, e)
+                    return False
+                if not isinstance(e, SMTPResponseException):
+                    self._discard_connection()
+                time.sleep(self.backoff)
+
+    def _send(self, messages):
+        try:
+            return [msg for msg in messages if self._send_one(msg)]
+        finally:
+            self._slots.release()
+
+    def send_batch(self, messages):
+        self._slots.acquire()
+        try:
+            return self._executor.submit(self._send, messages)
+        except Exception:
+            self._slots.release()
+            raise
@@ -1,15 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import datetime
 import logging
 import time
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from parliament.alerts.mailer import PooledMailer
+
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
     help = "Searches for new items & sends applicable email alerts."
 
+    def add_arguments(self, parser):
+        parser.add_argument('--search-workers', type=int, default=8,
+            help='Concurrent Solr queries')
+        parser.add_argument('--smtp-connections', type=int, default=4,
+            help='SMTP connections kept open while sending')
+        parser.add_argument('--batch-size', type=int, default=100,
+            help='Messages handed to each SMTP connection at a time')
+
     def handle(self, **options):
 
         if getattr(settings, 'PARLIAMENT_SEARCH_CLOSED', False):
@@ -26,18 +38,67 @@ class Command(BaseCommand):
         for sub in subscriptions:
             by_topic.setdefault(sub.topic, []).append(sub)
 
+        # Topics whose searches are identical share one Solr query
+        by_search = {}
+        for topic in by_topic:
+            by_search.setdefault(topic.get_search_key(), []).append(topic)
+
+        send_email = getattr(settings, 'PARLIAMENT_SEND_EMAIL', False)
+        if not send_email:
+            logger.error("settings.PARLIAMENT_SEND_EMAIL must be True to send mail")
+
         topics_sent = messages_sent = 0
+        pending_sends = []
+        batch = []
+
+        def finish_sends(futures):
+            sent_ids = []
+            for future in futures:
+                sent_ids.extend(msg.subscription_id for msg in future.result())
+            Subscription.objects.filter(id__in=sent_ids).update(last_sent=datetime.datetime.now())
+            return len(sent_ids)
 
-        for topic, subs in list(by_topic.items()):
-            documents = topic.get_new_items()
-            logger.debug('%s documents for query %s' % (len(documents), topic))
-            #time.sleep(0.3)
-            if documents:
-                topics_sent += 1
-                for sub in subs:
-                    messages_sent += 1
-                    sub.send_email(documents)
+        with ThreadPoolExecutor(max_workers=options['search_workers']) as searches, \
+                PooledMailer(connections=options['smtp_connections']) as mailer:
+            futures = dict(
+                (searches.submit(topics[0].fetch_documents), topics)
+                for topics in by_search.values()
+            )
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception:
+                    logger.exception("Search failed for %s", futures[future][0])
+                    continue
+                # Seen items and message rendering touch the database, so
+                # they stay on this thread
+                for topic in futures[future]:
+                    documents = topic.get_new_items(documents=results)
+                    logger.debug('%s documents for query %s' % (len(documents), topic))
+                    if not documents:
+                        continue
+                    topics_sent += 1
+                    subs = by_topic[topic]
+                    digest = subs[0].render_digest(documents)
+                    for sub in subs:
+                        msg = sub.build_email(documents, digest=digest)
+                        if not send_email:
+                            print(msg.subject)
+                            print(msg.body)
+                            continue
+                        msg.subscription_id = sub.id
+                        batch.append(msg)
+                        if len(batch) >= options['batch_size']:
+                            pending_sends.append(mailer.send_batch(batch))
+                            batch = []
+                    if len(pending_sends) > options['smtp_connections'] * 2:
+                        messages_sent += finish_sends(pending_sends)
+                        pending_sends = []
+            if batch:
+                pending_sends.append(mailer.send_batch(batch))
+            messages_sent += finish_sends(pending_sends)
 
         if topics_sent:
-            print("%s topics, %s subscriptions sent in %s seconds" % (
-                topics_sent, messages_sent, (time.time() - start_time)))
+            elapsed = time.time() - start_time
+            print("%s topics, %s subscriptions sent in %s seconds (%.1f topics/sec, %.1f emails/sec)" % (
+                topics_sent, messages_sent, elapsed, len(by_topic) / elapsed, messages_sent / elapsed))
@@ -74,9 +74,24 @@ class Topic(models.Model):
                 (datetime.datetime.now() - self.last_checked) > datetime.timedelta(hours=24)):
             self.get_new_items(limit=40)
 
-    def get_new_items(self, label_as_seen=True, limit=25):
-        query_obj = self.get_search_query(limit=limit)
-        result_ids = set((result['url'] for result in query_obj.documents))
+    def get_search_key(self, limit=25):
+        """Topics with the same key send Solr identical requests."""
+        bare_query, searchparams = self.get_search_query(limit=limit).get_solr_query()
+        return repr((bare_query, sorted(searchparams.items())))
+
+    def fetch_documents(self, limit=25):
+        """Runs the Solr query only; safe to call from worker threads."""
+        return self.get_search_query(limit=limit).documents
+
+    def get_new_items(self, label_as_seen=True, limit=25, documents=None):
+        """
+        Returns search results this topic hasn't seen before. documents can be
+        the result of an earlier fetch_documents(), e.g. for a topic with the
+        same search key.
+        """
+        if documents is None:
+            documents = self.fetch_documents(limit=limit)
+        result_ids = set((result['url'] for result in documents))
         if result_ids:
             ids_seen = set(
                 SeenItem.objects.filter(topic=self, item_id__in=list(result_ids))
@@ -95,7 +110,7 @@ class Topic(models.Model):
                 for result_id in result_ids
             ])
 
-        items = [r for r in reversed(query_obj.documents) if r['url'] in result_ids]
+        items = [r for r in reversed(documents) if r['url'] in result_ids]
 
         if self.politician_hansard_alert:
             # Remove procedural stuff by the Speaker
@@ -134,6 +149,10 @@ class SeenItem(models.Model):
         return '%s seen for %s' % (self.item_id, self.topic)
 
 
+# Stands in for the per-subscriber unsubscribe URL in shared digests
+UNSUBSCRIBE_URL_PLACEHOLDER = 'https://unsubscribe.invalid/__subscription__'
+
+
 class SubscriptionManager(models.Manager):
 
     def get_or_create_by_query(self, query, user):
@@ -172,10 +191,10 @@ class Subscription(models.Model):
         return (settings.SITE_URL if full else '') + reverse(
             'alerts_unsubscribe', kwargs={'key': key})
 
-    def render_message(self, documents):
+    def render_message(self, documents, unsubscribe_url=None):
         ctx = {
             'documents': documents,
-            'unsubscribe_url': self.get_unsubscribe_url(full=True)
+            'unsubscribe_url': unsubscribe_url or self.get_unsubscribe_url(full=True)
         }
 
         if self.topic.politician_hansard_alert:
@@ -205,22 +224,39 @@ class Subscription(models.Model):
             subj = 'New from openparliament.ca for %s' % self.topic.query
         return subj[:200]
 
-    def send_email(self, documents):
-        rendered = self.render_message(documents)
+    def render_digest(self, documents):
+        """
+        Renders the subject and body for this subscription's topic, with a
+        placeholder for the unsubscribe URL, so the result can be shared by
+        every subscriber to the topic via build_email().
+        """
+        rendered = self.render_message(documents, unsubscribe_url=UNSUBSCRIBE_URL_PLACEHOLDER)
+        rendered['subject'] = self.get_subject_line(documents)
+        return rendered
+
+    def build_email(self, documents, digest=None):
+        if digest is None:
+            digest = self.render_digest(documents)
+        unsubscribe_url = self.get_unsubscribe_url(full=True)
         msg = EmailMultiAlternatives(
-            self.get_subject_line(documents),
-            rendered['text'],
+            digest['subject'],
+            digest['text'].replace(UNSUBSCRIBE_URL_PLACEHOLDER, unsubscribe_url),
             '"openparliament.ca alerts" <alerts@contact.openparliament.ca>',
             [self.user.email],
             headers={
-                'List-Unsubscribe': '<' + self.get_unsubscribe_url(full=True) + '>',
+                'List-Unsubscribe': '<' + unsubscribe_url + '>',
                 'List-Unsubscribe-Post': 'List-Unsubscribe=One-Click'
             }
         )
         if getattr(settings, 'PARLIAMENT_ALERTS_BCC', ''):
             msg.bcc = [settings.PARLIAMENT_ALERTS_BCC]
-        if rendered.get('html'):
-            msg.attach_alternative(rendered['html'], 'text/html')
+        if digest.get('html'):
+            msg.attach_alternative(
+                digest['html'].replace(UNSUBSCRIBE_URL_PLACEHOLDER, unsubscribe_url), 'text/html')
+        return msg
+
+    def send_email(self, documents):
+        msg = self.build_email(documents)
         if getattr(settings, 'PARLIAMENT_SEND_EMAIL', False):
             def _send(msg, retries):
                 try:
@@ -0,0 +1,117 @@
+import datetime
+import threading
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from parliament.accounts.models import User
+from parliament.alerts.mailer import PooledMailer
+from parliament.alerts.models import Subscription, Topic
+
+class FlakyBackend(BaseEmailBackend):
+    """Records what each connection sends; the first `failures` sends raise `error`."""
+
+    lock = threading.Lock()
+    opened = []
+    sent = []
+    failures = 0
+    error = ConnectionResetError
+
+    @classmethod
+    def reset(cls, failures=0, error=ConnectionResetError):
+        cls.opened, cls.sent, cls.failures, cls.error = [], [], failures, error
+
+    def open(self):
+        with self.lock:
+            self.opened.append(self)
+        return True
+
+    def send_messages(self, messages):
+        with self.lock:
+            if FlakyBackend.failures > 0:
+                FlakyBackend.failures -= 1
+                raise self.error('connection dropped')
+            self.sent.extend((self, msg) for msg in messages)
+        return len(messages)
+
+FLAKY_BACKEND = 'parliament.alerts.tests.FlakyBackend'
+
+def _messages(count):
+    return [EmailMessage('Alert %d' % i, 'body', 'alerts@example.com', ['user%d@example.com' % i])
+        for i in range(count)]
+
+class PooledMailerTests(SimpleTestCase):
+
+    def setUp(self):
+        FlakyBackend.reset()
+
+    def test_sends_batches_over_a_fixed_number_of_connections(self):
+        messages = _messages(20)
+        with PooledMailer(connections=3, backend=FLAKY_BACKEND) as mailer:
+            futures = [mailer.send_batch(messages[i:i + 4]) for i in range(0, 20, 4)]
+        sent = [msg for future in futures for msg in future.result()]
+        self.assertEqual(sent, messages)
+        self.assertEqual(len(FlakyBackend.sent), 20)
+        self.assertLessEqual(len(FlakyBackend.opened), 3)
+
+    def test_socket_errors_are_retried_on_a_new_connection(self):
+        FlakyBackend.reset(failures=2, error=ConnectionRefusedError)
+        messages = _messages(1)
+        with PooledMailer(connections=1, retries=2, backoff=0, backend=FLAKY_BACKEND) as mailer:
+            future = mailer.send_batch(messages)
+        self.assertEqual(future.result(), messages)
+        self.assertEqual(len(FlakyBackend.opened), 3)
+
+    def test_unsent_messages_are_left_out_instead_of_raising(self):
+        FlakyBackend.reset(failures=3, error=TimeoutError)
+        messages = _messages(2)
+        with PooledMailer(connections=1, retries=2, backoff=0, backend=FLAKY_BACKEND) as mailer:
+            future = mailer.send_batch(messages)
+        self.assertEqual(future.result(), messages[1:])
+
+
+@override_settings(PARLIAMENT_SEND_EMAIL=True,
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class SendEmailAlertsTests(TestCase):
+
+    def setUp(self):
+        now = datetime.datetime.now()
+        self.topics = [Topic.objects.create(query=query, last_checked=now)
+            for query in ('pipelines', 'dental care')]
+        for i, topic in enumerate(self.topics * 2):
+            user = User.objects.create(email='reader%d@example.com' % i)
+            Subscription.objects.create(topic=topic, user=user)
+
+    def _run(self):
+        searched = []
+
+        def fetch_documents(topic, limit=25):
+            searched.append((topic.query, threading.current_thread()))
+            return [{'url': '/%s/%d/' % (topic.query, i)} for i in range(2)]
+
+        def render_digest(subscription, documents):
+            return {'subject': subscription.topic.query, 'text': '%d new items' % len(documents)}
+
+        with mock.patch.object(Topic, 'fetch_documents', fetch_documents), \
+                mock.patch.object(Subscription, 'render_digest', render_digest):
+            call_command('send_email_alerts', search_workers=2, smtp_connections=2, batch_size=1)
+        return searched
+
+    def test_topics_are_searched_once_each_off_the_main_thread(self):
+        searched = self._run()
+        self.assertCountEqual([query for query, _ in searched], ['pipelines', 'dental care'])
+        self.assertNotIn(threading.main_thread(), [thread for _, thread in searched])
+
+        self.assertEqual(len(mail.outbox), 4)
+        self.assertCountEqual([msg.subject for msg in mail.outbox], ['pipelines', 'dental care'] * 2)
+        self.assertFalse(Subscription.objects.filter(last_sent__isnull=True).exists())
+
+    def test_seen_items_are_not_sent_again(self):
+        self._run()
+        mail.outbox = []
+        self._run()
+        self.assertEqual(mail.outbox, [])
@@ -221,9 +221,10 @@ class Bill(models.Model):
             self.law = True
         super(Bill, self).save(*args, **kwargs)
 
-    def save_sponsor_activity(self):
+    def save_sponsor_activity(self, builder=None):
         if self.sponsor_politician:
-            activity.save_activity(
+            save = builder.add if builder else activity.save_activity
+            save(
                 obj=self,
                 politician=self.sponsor_politician,
                 date=self.introduced if self.introduced else (self.added - datetime.timedelta(days=1)),
@@ -407,8 +408,10 @@ class VoteQuestion(models.Model):
         return r
 
     def label_absent_members(self):
-        for member in ElectedMember.objects.on_date(self.date).exclude(membervote__votequestion=self):
-            MemberVote(votequestion=self, member=member, politician_id=member.politician_id, vote='A').save()
+        MemberVote.objects.bulk_create([
+            MemberVote(votequestion=self, member=member, politician_id=member.politician_id, vote='A')
+            for member in ElectedMember.objects.on_date(self.date).exclude(membervote__votequestion=self)
+        ])
             
     def label_party_votes(self):
         """Create PartyVote objects representing the party-line vote; label individual dissenting votes."""
@@ -440,13 +443,15 @@ class VoteQuestion(models.Model):
             PartyVote.objects.filter(party=party, votequestion=self).delete()
             PartyVote.objects.create(party=party, votequestion=self, vote=partyvotes[party], disagreement=disagreement)
         
+        dissenters = []
         for mv in membervotes:
             if mv.member.party.name != 'Independent' \
               and mv.vote != partyvotes[mv.member.party] \
               and mv.vote in ('Y', 'N') \
               and partyvotes[mv.member.party] in ('Y', 'N'):
                 mv.dissent = True
-                mv.save()
+                dissenters.append(mv)
+        MemberVote.objects.bulk_update(dissenters, ['dissent'])
             
     def get_absolute_url(self):
         return reverse('vote', kwargs={
@@ -469,8 +474,9 @@ class MemberVote(models.Model):
     def __str__(self):
         return '%s voted %s on %s' % (self.politician, self.get_vote_display(), self.votequestion)
             
-    def save_activity(self):
-        activity.save_activity(self, politician=self.politician, date=self.votequestion.date)
+    def save_activity(self, builder=None):
+        save = builder.add if builder else activity.save_activity
+        save(self, politician=self.politician, date=self.votequestion.date)
 
     def to_api_dict(self, representation):
         return {
@@ -236,8 +236,16 @@ class Document(models.Model):
         """Same as speaker_summary, but just the committee members."""
         return {k: v for k, v in self.speaker_summary().items() if v['politician'] and not v['minister']}
     
-    def save_activity(self):
+    def save_activity(self, builder=None, politician=None):
+        """Saves an activity item for each politician who spoke, or just for
+        the given politician. If given an ActivityBuilder, items are queued on
+        it and it's up to the caller to save() it."""
+        own_builder = builder is None
+        if own_builder:
+            builder = activity.ActivityBuilder()
         statements = self.statement_set.filter(procedural=False).select_related('member', 'politician')
+        if politician:
+            statements = statements.filter(politician=politician)
         politicians = set([s.politician for s in statements if s.politician])
         for pol in politicians:
             topics = {}
@@ -254,7 +262,7 @@ class Document(models.Model):
                     topics[statement.topic] = [statement.slug, statement.text_plain(), statement.get_absolute_url()]
             for topic in topics:
                 if self.document_type == Document.DEBATE:
-                    activity.save_activity({
+                    builder.add({
                         'topic': topic,
                         'url': topics[topic][2],
                         'text': topics[topic][1],
@@ -264,13 +272,15 @@ class Document(models.Model):
                     if wordcount < 80:
                         continue
                     (seq, text, url) = list(topics.values())[0]
-                    activity.save_activity({
+                    builder.add({
                         'meeting': self.committeemeeting,
                         'committee': self.committeemeeting.committee,
                         'text': text,
                         'url': url,
                         'wordcount': wordcount,
                     }, politician=pol, date=self.date, guid='cmte_%s' % url, variety='committee')
+        if own_builder:
+            builder.save()
         
     def get_xml_path(self, language: Literal['en', 'fr']) -> Path:
         assert language in ('en', 'fr')
@@ -370,6 +380,12 @@ class Statement(models.Model):
     who_context = language_property('who_context')
 
     def save(self, *args, **kwargs):
+        self.prepare_for_save()
+        super(Statement, self).save(*args, **kwargs)
+
+    def prepare_for_save(self):
+        """Normalizes content and fills in derived fields. Called by save(); call it
+        yourself before Statement.objects.bulk_create()."""
         self.content_en = self.content_en.replace('\n', '').replace('</p>', '</p>\n').strip()
         self.content_fr = self.content_fr.replace('\n', '').replace('</p>', '</p>\n').strip()
         if self.wordcount_en is None:
@@ -384,7 +400,6 @@ class Statement(models.Model):
             self.procedural = True
         if not self.urlcache:
             self.generate_url()
-        super(Statement, self).save(*args, **kwargs)
             
     @property
     def date(self):
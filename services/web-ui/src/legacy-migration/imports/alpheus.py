@@ -5,7 +5,9 @@
 from html import escape as stdlib_escape
 import datetime
 from functools import wraps
+from io import BytesIO
 import re
+from typing import Iterator
 from xml.sax.saxutils import quoteattr
 
 from lxml import etree
@@ -13,7 +15,7 @@ from lxml import etree
 import logging
 logger = logging.getLogger(__name__)
 
-__all__ = ['parse_bytes']
+__all__ = ['parse_bytes', 'parse_stream']
 
 def _n2s(o):
     return o if o is not None else ''
@@ -209,7 +211,8 @@ class ParseHandler(object):
     The parse tree is iterated through in document order. Every time we come
     across a tag (opening or closing) we call the handle_TagName method on
     a ParseHandler instance. That method is passed the Element object, and
-    either TAG_OPEN or TAG_CLOSE."""
+    either TAG_OPEN or TAG_CLOSE. Handlers are looked up once per instance,
+    in the tag -> method dict built by __init__."""
     
     # Their contents will be discarded
     EXCLUDE_TAGS = [
@@ -251,12 +254,28 @@ class ParseHandler(object):
         self.one_time_attributes = {}
         self.in_para = False
         self.one_liner = None
+        self.after_motion = None
         self.people_seen = {}
         self.people_types_seen = {}
         self.people_contexts = {}
         self.date = document.meta['date']
         self.main_statement_speaker = ['', '']
         (self.parliament, self.session) = (document.meta['parliament'], document.meta['session'])
+        self.handlers = dict(
+            (name[len('handle_'):], getattr(self, name))
+            for name in dir(type(self)) if name.startswith('handle_')
+        )
+        
+    def get_handler(self, tag):
+        return self.handlers.get(tag, self._default_handler)
+        
+    def explore(self, el):
+        """Depth-first walk of a complete element, calling handlers in document order."""
+        el_handler = self.get_handler(el.tag)
+        if el_handler(el, TAG_OPEN) != NO_DESCEND:
+            for subelement in el:
+                self.explore(subelement)
+            el_handler(el, TAG_CLOSE)
         
     def _initialize_statement(self):
         assert not self.current_statement
@@ -301,6 +320,11 @@ class ParseHandler(object):
             self.close_statement()
         return self.statements
         
+    def pop_statements(self):
+        """Returns the statements closed since the last call, and forgets them."""
+        statements, self.statements = self.statements, []
+        return statements
+        
     def _new_person(self, hoc_id, description, affil_type=None):
         """Someone new has started speaking; save their information."""
         description = _tame_whitespace(description)
@@ -357,6 +381,12 @@ class ParseHandler(object):
     def handle_ParaText(self, el, openclose, procedural=None):
         if openclose == TAG_OPEN:
             
+            if self.after_motion is not None and el.tag == 'ParaText' and not el.xpath('.//QuotePara'):
+                # This is the first paragraph after a motion
+                if self.after_motion == el.getparent() and el.text:
+                    el.text = re.sub(r'^\s*([S]?[hH]e said:|--)\s*', '', el.text)
+                self.after_motion = None
+            
             mytext = _n2s(el.text).strip()
             if not mytext and not _text_content(el):
                 # Ignore empty paragraphs
@@ -428,13 +458,9 @@ class ParseHandler(object):
                 
             if mytext.startswith('moved') or mytext.startswith('demande'):
                 procedural = True
-                nxt = el.getnext()
-                while nxt is not None and (nxt.tag != 'ParaText' or nxt.xpath('.//QuotePara')):
-                    # Find the next paragraph after the motion
-                    nxt = nxt.getnext()
-                if nxt is not None and nxt.text:
-                    # After a motion, there's an unnecessary "He said:" on the next phrase
-                    nxt.text = re.sub(r'^\s*([S]?[hH]e said:|--)\s*', '', nxt.text)
+                # After a motion, there's an unnecessary "He said:" on the next paragraph.
+                # It hasn't necessarily been parsed yet, so remember to strip it when it opens.
+                self.after_motion = el.getparent()
                     
             if mytext and mytext[0] in ('(', '['):
                 procedural = True
@@ -689,54 +715,137 @@ NO_DESCEND = -1
 TAG_OPEN = 1
 TAG_CLOSE = 2
             
-def parse_tree(tree):
-    document = AlpheusDocument()
-    
-    # Start by getting metadata
-    def _get_meta(key):
-        return str(tree.xpath('//ExtractedItem[@Name="%s"]' % key)[0].text)
-    document.meta['date'] = datetime.date(
-        year=int(_get_meta('MetaDateNumYear')),
-        month=int(_get_meta('MetaDateNumMonth')),
-        day=int(_get_meta('MetaDateNumDay'))
+def _document_meta(get_meta, language):
+    """Builds AlpheusDocument.meta. get_meta(name) returns the text of
+    the ExtractedItem with that name."""
+    meta = {}
+    meta['date'] = datetime.date(
+        year=int(get_meta('MetaDateNumYear')),
+        month=int(get_meta('MetaDateNumMonth')),
+        day=int(get_meta('MetaDateNumDay'))
     )
-    document.meta['parliament'] = int(_get_meta('ParliamentNumber'))
-    document.meta['session'] = int(_get_meta('SessionNumber'))
-    
-    hansard_tag = tree.xpath('/Hansard')[0]
-    document.meta['language'] = hansard_tag.get('{http://www.w3.org/XML/1998/namespace}lang').lower()
+    meta['parliament'] = int(get_meta('ParliamentNumber'))
+    meta['session'] = int(get_meta('SessionNumber'))
+    meta['language'] = language.lower()
     
     # The ID in the Hansard tag is *not* the same as the DocId in parl.gc.ca URLs
     # So to avoid confusion, we won't include it in the output
-    #document.meta['id'] = hansard_tag.get('id')
+    #meta['id'] = hansard_tag.get('id')
     
-    document.meta['document_type'] = _get_meta('MetaDocumentCategory')
+    meta['document_type'] = get_meta('MetaDocumentCategory')
     
-    if document.meta['document_type'] == 'Committee':
-        document.meta['committee_acronym'] = _get_meta('Acronyme')
-        document.meta['committee_name_en'] = _get_meta('InstitutionDebateEn')
-        document.meta['committee_name_fr'] = _get_meta('InstitutionDebateFr')
+    if meta['document_type'] == 'Committee':
+        meta['committee_acronym'] = get_meta('Acronyme')
+        meta['committee_name_en'] = get_meta('InstitutionDebateEn')
+        meta['committee_name_fr'] = get_meta('InstitutionDebateFr')
         #TODO: in camera
         
-    document.meta['document_number'] = _get_meta('Number').split()[-1].lstrip('0')
+    meta['document_number'] = get_meta('Number').split()[-1].lstrip('0')
+    return meta
+
+_XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+def parse_tree(tree):
+    """Parses an already-built etree. parse_stream is preferred for whole
+    sittings, since it never holds the full tree in memory."""
+    document = AlpheusDocument()
+    
+    def _get_meta(key):
+        return str(tree.xpath('//ExtractedItem[@Name="%s"]' % key)[0].text)
+    hansard_tag = tree.xpath('/Hansard')[0]
+    document.meta = _document_meta(_get_meta, hansard_tag.get(_XML_LANG))
     
     # Now we can move on to the content of the document
     handler = ParseHandler(document)
-    
-    def _explore_element(el):
-        # Recursive depth-first search of the XML tree
-        el_handler = getattr(handler, 'handle_' + str(el.tag))
-        if el_handler(el, TAG_OPEN) != NO_DESCEND:
-            for subelement in el:
-                _explore_element(subelement)
-            el_handler(el, TAG_CLOSE)
-        
-    _explore_element(tree.xpath('//HansardBody')[0])
+    handler.explore(tree.xpath('//HansardBody')[0])
     
     document.statements = handler.get_final_statements()
     return document
-    
-def parse_bytes(s: bytes) -> AlpheusDocument:
+
+# Tags whose handlers only look at attributes when opened, never at text or
+# children. parse_stream calls them as soon as the start tag is read; any other
+# element is handed to the handler only once it has been read in full.
+STREAMED_TAGS = frozenset([
+    'HansardBody',
+    'OrderOfBusiness',
+    'SubjectOfBusiness',
+    'SubjectOfBusinessContent',
+    'Intervention',
+    'Content',
+    'QuestionContent',
+    'ResponseContent',
+])
+
+def _release(el):
+    """Frees an element we've finished with, along with its earlier siblings."""
+    el.clear()
+    parent = el.getparent()
+    if parent is not None:
+        while el.getprevious() is not None:
+            del parent[0]
+
+def _iter_body(events, body, handler) -> Iterator[Statement]:
+    """Runs the handler over the HansardBody as it is being parsed, yielding
+    each Statement as soon as it's closed."""
+    handler.get_handler(body.tag)(body, TAG_OPEN)
+    subtree = None  # a non-streamed element we're waiting to see the end of
+    skipped = None  # a streamed element whose handler returned NO_DESCEND
+    for event, el in events:
+        if subtree is not None or skipped is not None:
+            if event == 'end' and el is subtree:
+                handler.explore(el)
+                _release(el)
+                subtree = None
+                yield from handler.pop_statements()
+            elif event == 'end' and el is skipped:
+                _release(el)
+                skipped = None
+        elif event == 'start':
+            if el.tag not in STREAMED_TAGS:
+                subtree = el
+            elif handler.get_handler(el.tag)(el, TAG_OPEN) == NO_DESCEND:
+                skipped = el
+        else:
+            handler.get_handler(el.tag)(el, TAG_CLOSE)
+            _release(el)
+            yield from handler.pop_statements()
+            if el is body:
+                break
+    handler.get_final_statements()
+    yield from handler.pop_statements()
+
+def _clean_bytes(s: bytes) -> bytes:
     s = s.replace(b'<B />', b'').replace(b'<ParaText />', b'') # Some empty tags can gum up the works
     s = s.replace(b'&ccedil;', b'&#231;').replace(b'&eacute;', b'&#233;') # Fix invalid entities
-    return parse_tree(etree.fromstring(s))
+    return s
+
+def parse_stream(s: bytes) -> AlpheusDocument:
+    """Incrementally parses a transcript.
+
+    The returned document's meta is filled in immediately; its statements
+    attribute is a generator which parses the body as it's consumed, so only
+    the element currently being handled is held in memory."""
+    events = etree.iterparse(BytesIO(_clean_bytes(s)), events=('start', 'end'))
+    document = AlpheusDocument()
+    extracted = {}
+    language = None
+    for event, el in events:
+        if event == 'start':
+            if el.tag == 'Hansard':
+                language = el.get(_XML_LANG)
+            elif el.tag == 'HansardBody':
+                break
+        elif el.tag == 'ExtractedItem':
+            extracted.setdefault(el.get('Name'), str(el.text))
+            el.clear()
+    else:
+        raise AlpheusError("No HansardBody in document")
+    
+    document.meta = _document_meta(lambda key: extracted[key], language)
+    document.statements = _iter_body(events, el, ParseHandler(document))
+    return document
+    
+def parse_bytes(s: bytes) -> AlpheusDocument:
+    document = parse_stream(s)
+    document.statements = list(document.statements)
+    return document
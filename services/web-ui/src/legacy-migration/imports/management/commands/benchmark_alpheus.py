@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+import resource
+import time
+
+from django.core.management.base import BaseCommand
+
+from lxml import etree
+
+from parliament.imports import alpheus
+
+EXAMPLES_DIR = Path(alpheus.__file__).parent / 'tests' / 'alpheus_examples'
+
+def _tree_parse(xml):
+    document = alpheus.parse_tree(etree.fromstring(alpheus._clean_bytes(xml)))
+    return len(document.statements)
+
+def _stream_parse(xml):
+    return sum(1 for _ in alpheus.parse_stream(xml).statements)
+
+PARSERS = [
+    ('full tree', _tree_parse),
+    ('streaming', _stream_parse),
+]
+
+def _measure(parse, xml):
+    """Runs parse in a forked child, so each parser's peak RSS is measured
+    from the same starting point. Returns (statements, seconds, peak RSS growth in kB)."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        count = parse(xml)
+        elapsed = time.perf_counter() - started
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        os.write(write_fd, ("%d %f %d" % (count, elapsed, peak - baseline)).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        result = f.read().split()
+    os.waitpid(pid, 0)
+    return int(result[0]), float(result[1]), int(result[2])
+
+class Command(BaseCommand):
+    help = "Compares time and peak memory of the full-tree and streaming Alpheus parsers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('xml_path', nargs='?',
+            help='Transcript XML; defaults to the largest bundled example')
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, **options):
+        if options['xml_path']:
+            path = Path(options['xml_path'])
+        else:
+            path = max(EXAMPLES_DIR.glob('*.xml'), key=lambda p: p.stat().st_size)
+        xml = path.read_bytes()
+        self.stdout.write("%s: %d kB" % (path.name, len(xml) // 1024))
+
+        for label, parse in PARSERS:
+            runs = [_measure(parse, xml) for _ in range(options['repeat'])]
+            statements = runs[0][0]
+            best = min(r[1] for r in runs)
+            peak = max(r[2] for r in runs)
+            self.stdout.write("%s: %d statements, best of %d %.0f ms, peak RSS +%d kB" % (
+                label, statements, len(runs), best * 1000, peak))
@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries, transaction
+
+from parliament.imports import parl_document, parlvotes
+
+class Rollback(Exception):
+    pass
+
+class Command(BaseCommand):
+    help = ("Times reimporting one sitting and one session's votes. "
+        "Everything runs in a transaction that is rolled back.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--document', type=int,
+            help='ID of the Document to reimport; defaults to the latest debate')
+        parser.add_argument('--skip-votes', action='store_true')
+        parser.add_argument('--fetch-workers', type=int, default=parlvotes.DETAIL_FETCH_WORKERS)
+
+    def _timed(self, label, fn):
+        connection.force_debug_cursor = True
+        reset_queries()
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                result = fn()
+                raise Rollback
+        except Rollback:
+            pass
+        elapsed = time.perf_counter() - started
+        self.stdout.write("%s: %.2f s, %d queries" % (label, elapsed, len(connection.queries)))
+        connection.force_debug_cursor = False
+        return result
+
+    def handle(self, **options):
+        from parliament.bills.models import VoteQuestion
+        from parliament.hansards.models import Document
+
+        if options['document']:
+            document = Document.objects.get(id=options['document'])
+        else:
+            document = Document.objects.filter(document_type=Document.DEBATE, downloaded=True
+                ).order_by('-date')[0]
+        count = self._timed("sitting %s (%s)" % (document.number, document.date),
+            lambda: parl_document.import_document(document).statement_set.count())
+        self.stdout.write("  %d statements" % count)
+
+        if not options['skip_votes']:
+            session = document.session
+
+            def reimport_votes():
+                VoteQuestion.objects.filter(session=session).delete()
+                parlvotes.import_votes(fetch_workers=options['fetch_workers'])
+                return VoteQuestion.objects.filter(session=session).count()
+            count = self._timed("votes for %s" % session, reimport_votes)
+            self.stdout.write("  %d votes" % count)
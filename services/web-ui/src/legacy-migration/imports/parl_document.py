@@ -19,9 +19,11 @@ from lxml import etree
 import requests
 
 from parliament.bills.models import Bill, VoteQuestion
-from parliament.core.models import Politician, ElectedMember, Session
+from parliament.core.models import Politician, Session
 from parliament.hansards.models import Statement, Document, OldSlugMapping
+from parliament.search.index import enqueue_bulk
 from . import alpheus
+from .resolution import ImportResolver
 from .legisinfo import OldBillException
 
 import logging
@@ -42,7 +44,8 @@ def import_document(document: Document, allow_reimport=True, prompt_on_slug_chan
     
     if not xml_en:
         xml_en = document.get_cached_xml('en')
-    pdoc_en = alpheus.parse_bytes(xml_en)
+    # English statements are built as the transcript streams through the parser
+    pdoc_en = alpheus.parse_stream(xml_en)
     if not xml_fr:
         xml_fr = document.get_cached_xml('fr')
     pdoc_fr = alpheus.parse_bytes(xml_fr)
@@ -57,6 +60,7 @@ def import_document(document: Document, allow_reimport=True, prompt_on_slug_chan
     document.number = pdoc_en.meta['document_number']
     document.public = True
 
+    resolver = ImportResolver(document.session)
     statements = []
 
     for pstate in pdoc_en.statements:
@@ -89,18 +93,18 @@ def import_document(document: Document, allow_reimport=True, prompt_on_slug_chan
             # At the moment. person_type is only set if we know the person
             # is a non-politician. This might change...
             try:
-                s.politician = Politician.objects.get_by_parl_affil_id(s.who_hocid, session=document.session)
-                s.member = ElectedMember.objects.get_by_pol(s.politician, date=document.date)
+                s.politician = resolver.politician_by_affil_id(s.who_hocid, session=document.session)
+                s.member = resolver.member(s.politician, document.date)
             except Politician.DoesNotExist:
                 logger.info("Could not resolve speaking politician ID %s for %r" % (s.who_hocid, s.who))
 
         s._mentioned_pols = set()
         s._mentioned_bills = set()
-        s.content_en = _process_related_links(s.content_en, s)
+        s.content_en = _process_related_links(s.content_en, s, resolver)
 
         if pstate.meta.get('bill_stage'):
             bill_number, stage = pstate.meta['bill_stage'].split(',', maxsplit=1)
-            s.bill_debated = Bill.objects.get(number=bill_number, session=document.session)
+            s.bill_debated = resolver.bill_by_number(bill_number)
             if stage in ['1', '2', '3', 'report', 'senate']:
                 s.bill_debate_stage = stage
             else:
@@ -108,7 +112,7 @@ def import_document(document: Document, allow_reimport=True, prompt_on_slug_chan
 
         statements.append(s)
 
-    _incorporate_french_document(document, statements, pdoc_fr)
+    _incorporate_french_document(document, statements, pdoc_fr, resolver)
 
     if old_statements:
         if was_multilingual and not document.multilingual:
@@ -119,14 +123,7 @@ def import_document(document: Document, allow_reimport=True, prompt_on_slug_chan
     else:
         Statement.set_slugs(statements)
         
-    for s in statements:
-        s.save()
-
-        s.mentioned_politicians.add(*list(s._mentioned_pols))
-        s.mentioned_bills.add(*[b for b in s._mentioned_bills if b != s.bill_debated])
-        if getattr(s, '_related_vote', False):
-            s._related_vote.context_statement = s
-            s._related_vote.save()
+    _save_statements(statements)
 
     bills_debated = set(s.bill_debated for s in statements 
                         if s.bill_debated and s.bill_debate_stage not in ('other', '1'))
@@ -142,8 +139,32 @@ def import_document(document: Document, allow_reimport=True, prompt_on_slug_chan
 
     return document
 
+def _save_statements(statements: list[Statement]) -> None:
+    """Writes new statements, and their mentions, in a handful of queries."""
+    for s in statements:
+        s.prepare_for_save()
+    Statement.objects.bulk_create(statements)
+
+    pol_mentions = []
+    bill_mentions = []
+    related_votes = []
+    for s in statements:
+        pol_mentions.extend(
+            Statement.mentioned_politicians.through(statement_id=s.id, politician_id=pol.id)
+            for pol in s._mentioned_pols)
+        bill_mentions.extend(
+            Statement.mentioned_bills.through(statement_id=s.id, bill_id=bill.id)
+            for bill in s._mentioned_bills if bill != s.bill_debated)
+        if getattr(s, '_related_vote', False):
+            s._related_vote.context_statement = s
+            related_votes.append(s._related_vote)
+    Statement.mentioned_politicians.through.objects.bulk_create(pol_mentions)
+    Statement.mentioned_bills.through.objects.bulk_create(bill_mentions)
+    VoteQuestion.objects.bulk_update(related_votes, ['context_statement'])
+    enqueue_bulk('update', statements)
+
 def _incorporate_french_document(document: Document, statements: list[Statement],
-                                 pdoc_fr: alpheus.AlpheusDocument) -> None:
+                                 pdoc_fr: alpheus.AlpheusDocument, resolver: ImportResolver) -> None:
     """Given an Alpheus import of a French XML document, adds French metadata
     and text to the existing Statement objects (derived from the English import)."""
     if len(statements) != len(pdoc_fr.statements):
@@ -184,12 +205,12 @@ def _incorporate_french_document(document: Document, statements: list[Statement]
             pids_fr = [pid for p, pid in _get_paragraphs_and_ids(fr_data.content)] if fr_data else None
             if fr_data and pids_en == pids_fr:
                 # Match by statement
-                st.content_fr = _process_related_links(fr_data.content, st)
+                st.content_fr = _process_related_links(fr_data.content, st, resolver)
             elif all(pids_en):
                 # Match by paragraph
                 st.content_fr = _process_related_links(
                     _r_paragraphs.sub(_substitute_french_content, st.content_en),
-                    st
+                    st, resolver
                 )
             else:
                 logger.warning("Could not do multilingual match of statement %s", st.source_id)
@@ -276,18 +297,18 @@ def _map_changed_slugs(old_st: list[Statement], new_st: list[Statement]) -> dict
                 break
     return slugmap
 
-def _process_related_links(content, statement):
+def _process_related_links(content, statement, resolver):
     return re.sub(r'<a class="related_link (\w+)" ([^>]+)>(.*?)</a>',
-        lambda m: _process_related_link(m, statement),
+        lambda m: _process_related_link(m, statement, resolver),
         content)
 
-def _process_related_link(match, statement):
+def _process_related_link(match, statement, resolver):
     (link_type, tagattrs, text) = match.groups()
     params = dict([(m.group(1), m.group(2)) for m in re.finditer(r'data-([\w-]+)="([^"]+)"', tagattrs)])
     hocid = int(params['HoCid'])
     if link_type == 'politician':
         try:
-            pol = Politician.objects.get_by_parl_affil_id(hocid)
+            pol = resolver.politician_by_affil_id(hocid)
         except Politician.DoesNotExist:
             logger.warning("Could not resolve related politician #%s, %s", hocid, text)
             return text
@@ -296,15 +317,15 @@ def _process_related_link(match, statement):
         statement._mentioned_pols.add(pol)
     elif link_type == 'legislation':
         try:
-            bill = Bill.objects.get_by_legisinfo_id(hocid)
+            bill = resolver.bill_by_legisinfo_id(hocid)
             url = bill.get_absolute_url()
         except Bill.DoesNotExist:
             match = re.search(r'\b[CS]\-\d+[A-E]?\b', text)
             if not match:
                 logger.error("Invalid bill link %s" % text)
                 return text
-            bill = Bill.objects.create_temporary_bill(legisinfo_id=hocid,
-                number=match.group(0), session=statement.document.session)
+            bill = resolver.add_bill(Bill.objects.create_temporary_bill(legisinfo_id=hocid,
+                number=match.group(0), session=statement.document.session))
             url = bill.get_absolute_url()
         except OldBillException:
             logger.info(f"Old bill, not importing: #{hocid} {text}")
@@ -313,8 +334,7 @@ def _process_related_link(match, statement):
         statement._mentioned_bills.add(bill)
     elif link_type == 'vote':
         try:
-            vote = VoteQuestion.objects.get(session=statement.document.session,
-                number=int(params['number']))
+            vote = resolver.vote(int(params['number']))
             url = vote.get_absolute_url()
             title = vote.description
             statement._related_vote = vote
@@ -0,0 +1,123 @@
+"""Per-import caches for resolving the people, bills and votes referenced
+in parliamentary XML.
+
+A single sitting or vote list refers to the same few hundred MPs and a
+handful of bills over and over. ImportResolver loads everything we
+already know about a session in a few queries up front, and remembers
+whatever it has to look up (or scrape) beyond that, so each ID is
+resolved at most once per import.
+"""
+from collections import defaultdict
+
+from parliament.bills.models import Bill, VoteQuestion
+from parliament.core.models import ElectedMember, Politician, PoliticianInfo
+
+import logging
+logger = logging.getLogger(__name__)
+
+class ImportResolver(object):
+
+    def __init__(self, session):
+        self.session = session
+        self._politicians = {}  # (schema, value) -> Politician, or None if it doesn't exist
+        self._members = {}  # date -> {politician_id: ElectedMember}
+        self._bills_by_number = {}
+        self._bills_by_legisinfo_id = {}
+        self._votes = {}
+        self._preload()
+
+    def _preload(self):
+        infos = PoliticianInfo.sr_objects.filter(
+            schema__in=('parl_affil_id', 'parl_mp_id'),
+            politician__electedmember__sessions=self.session).distinct()
+        for info in infos:
+            self._politicians[(info.schema, info.value)] = info.politician
+        for bill in Bill.objects.filter(session=self.session):
+            self._add_bill(bill)
+        for vote in VoteQuestion.objects.filter(session=self.session):
+            self._votes[vote.number] = vote
+        logger.debug("Preloaded %d politician IDs, %d bills, %d votes for %s",
+            len(self._politicians), len(self._bills_by_number), len(self._votes), self.session)
+
+    def _politician(self, schema, parlid, lookup):
+        key = (schema, str(parlid))
+        if key not in self._politicians:
+            try:
+                self._politicians[key] = lookup()
+            except Politician.DoesNotExist:
+                self._politicians[key] = None
+        if self._politicians[key] is None:
+            raise Politician.DoesNotExist("Couldn't resolve %s %s" % (schema, parlid))
+        return self._politicians[key]
+
+    def politician_by_affil_id(self, parlid, session=None, riding_name=None):
+        """Cached Politician.objects.get_by_parl_affil_id"""
+        return self._politician('parl_affil_id', parlid,
+            lambda: Politician.objects.get_by_parl_affil_id(parlid, session=session, riding_name=riding_name))
+
+    def politician_by_mp_id(self, parlid, session=None, riding_name=None):
+        """Cached Politician.objects.get_by_parl_mp_id"""
+        return self._politician('parl_mp_id', parlid,
+            lambda: Politician.objects.get_by_parl_mp_id(parlid, session=session, riding_name=riding_name))
+
+    def member(self, politician, date):
+        """Cached ElectedMember.objects.get_by_pol(politician, date=date)"""
+        if date not in self._members:
+            by_pol = defaultdict(list)
+            for member in ElectedMember.objects.on_date(date):
+                by_pol[member.politician_id].append(member)
+            self._members[date] = dict(
+                (pol_id, members[0]) for pol_id, members in by_pol.items() if len(members) == 1)
+        try:
+            return self._members[date][politician.id]
+        except KeyError:
+            # Let the manager raise DoesNotExist/MultipleObjectsReturned as usual
+            return ElectedMember.objects.get_by_pol(politician, date=date)
+
+    def _add_bill(self, bill):
+        if bill.session_id == self.session.id:
+            self._bills_by_number[bill.number] = bill
+        if bill.legisinfo_id:
+            self._bills_by_legisinfo_id[bill.legisinfo_id] = bill
+        return bill
+
+    def bill_by_number(self, number, create_temporary=False):
+        """Returns the session's bill with this number. If it doesn't exist,
+        raises Bill.DoesNotExist, or creates a temporary bill if create_temporary is set."""
+        try:
+            return self._bills_by_number[number]
+        except KeyError:
+            pass
+        try:
+            bill = Bill.objects.get(session=self.session, number=number)
+        except Bill.DoesNotExist:
+            if not create_temporary:
+                raise
+            bill = Bill.objects.create_temporary_bill(session=self.session, number=number)
+            logger.warning("Temporary bill %s created", number)
+        return self._add_bill(bill)
+
+    def bill_by_legisinfo_id(self, legisinfo_id):
+        """Cached Bill.objects.get_by_legisinfo_id"""
+        legisinfo_id = int(legisinfo_id)
+        try:
+            return self._bills_by_legisinfo_id[legisinfo_id]
+        except KeyError:
+            return self._add_bill(Bill.objects.get_by_legisinfo_id(legisinfo_id))
+
+    def add_bill(self, bill):
+        """Remember a bill created outside the resolver."""
+        return self._add_bill(bill)
+
+    def has_vote(self, number):
+        return number in self._votes or VoteQuestion.objects.filter(
+            session=self.session, number=number).exists()
+
+    def vote(self, number):
+        """The session's VoteQuestion with this number, or raises VoteQuestion.DoesNotExist."""
+        try:
+            return self._votes[number]
+        except KeyError:
+            vote = VoteQuestion.objects.get(session=self.session, number=number)
+            self._votes[number] = vote
+            return vote
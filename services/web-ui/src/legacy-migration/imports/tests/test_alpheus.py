@@ -30,4 +30,15 @@ class AlpheusIntegrationTests(TestCase):
             self.assertMultiLineEqual(output_html,
                                       example_html_path.read_text(encoding='utf8'),
                                       msg=f"Comparing HTML output of {example_xml_path.stem}")
-            
\ No newline at end of file
+            
+    def test_stream_matches_tree(self):
+        from lxml import etree
+        examples_dir = Path(__file__).parent / 'alpheus_examples'
+        for example_xml_path in examples_dir.glob('*.xml'):
+            xml = example_xml_path.read_bytes()
+            streamed = alpheus.parse_stream(xml)
+            tree = alpheus.parse_tree(etree.fromstring(alpheus._clean_bytes(xml)))
+            self.assertEqual(streamed.meta, tree.meta)
+            self.assertEqual([(s.meta, s.content) for s in streamed.statements],
+                             [(s.meta, s.content) for s in tree.statements],
+                             msg=f"Comparing statements of {example_xml_path.stem}")
@@ -1,11 +1,21 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import itertools
+import logging
+import threading
+import time
 
+from django.apps import apps
 from django.conf import settings
-from django.db.models import signals
+from django.db.models import Max, signals
+import pysolr
+import requests
 
 from parliament.search.models import IndexingTask
 from parliament.search.solr import get_pysolr_instance
 
+logger = logging.getLogger(__name__)
+
 _search_model_registry = set()
 def register_search_model(cls):
     """
@@ -40,6 +50,23 @@ def _enqueue(action: str, instance):
 
         it.save()
 
+def enqueue_bulk(action: str, instances):
+    """Queues indexing tasks for objects written with bulk_create/bulk_update,
+    which don't send the post_save signal."""
+    if not getattr(settings, 'PARLIAMENT_TRACK_INDEXING_TASKS', False):
+        return
+    tasks = []
+    for instance in instances:
+        if instance._meta.model in _search_model_registry:
+            it = IndexingTask(
+                action=action,
+                identifier=get_identifier(instance)
+            )
+            if action == 'update':
+                it.content_object = instance
+            tasks.append(it)
+    IndexingTask.objects.bulk_create(tasks)
+
 def save_handler(instance, **kwargs):
     return _enqueue('update', instance)
 
@@ -64,11 +91,13 @@ def index_all():
     for model_cls in _search_model_registry:
         index_model(model_cls)
 
-def index_qs(qs, batchsize=1000):
+def index_qs(qs, batchsize=1000, workers=4):
     batches = itertools.batched(qs.iterator(chunk_size=batchsize), batchsize)
-    for i, batch in enumerate(batches):
-        index_objects(batch)
-        print(i * batchsize)
+    with SolrBatchPoster(workers=workers) as poster:
+        for i, batch in enumerate(batches):
+            poster.submit(
+                'add', [get_search_dict(o) for o in batch if o.search_should_index()])
+            print(i * batchsize)
 
 def index_objects(model_objs):
     prepared_objs = [get_search_dict(o)
@@ -76,3 +105,150 @@ def index_objects(model_objs):
     get_pysolr_instance().add(prepared_objs)
 
 
+class SolrBatchPoster:
+    """
+    Posts batches to Solr from a bounded pool of threads.
+
+    submit() blocks once max_pending batches are in flight, so callers
+    building documents can't run ahead of Solr. Failed batches are retried
+    with exponential backoff. A batch's on_done callback is called in the
+    submitting thread once Solr has accepted it and every batch submitted
+    before it, in submission order; that holds for empty batches too.
+    """
+
+    RETRY_EXCEPTIONS = (pysolr.SolrError, requests.exceptions.RequestException)
+
+    def __init__(self, workers=4, max_pending=None, retries=3, backoff=1.0,
+            solr_factory=get_pysolr_instance):
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self.retries = retries
+        self.backoff = backoff
+        self.solr_factory = solr_factory
+        self._local = threading.local()
+        self._pending = deque()
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.flush()
+                self._solr().commit()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def _solr(self):
+        # pysolr keeps a requests.Session, so give each thread its own
+        if not hasattr(self._local, 'solr'):
+            self._local.solr = self.solr_factory()
+        return self._local.solr
+
+    def _post(self, action, payload):
+        for attempt in range(self.retries + 1):
+            try:
+                if action == 'add':
+                    self._solr().add(payload, commit=False)
+                else:
+                    self._solr().delete(id=payload, commit=False)
+                return
+            except self.RETRY_EXCEPTIONS as e:
+                if attempt == self.retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logger.warning("Solr %s of %d docs failed (%r), retrying in %.1fs",
+                    action, len(payload), e, delay)
+                time.sleep(delay)
+
+    def _wait_oldest(self):
+        future, on_done = self._pending.popleft()
+        future.result()
+        if on_done:
+            on_done()
+
+    def submit(self, action, payload, on_done=None):
+        """action is 'add' (payload is documents) or 'delete' (payload is ids)."""
+        if not payload:
+            if on_done:
+                # Nothing to post, but on_done must still wait for the
+                # batches submitted before it
+                future = Future()
+                future.set_result(None)
+                self._pending.append((future, on_done))
+            return
+        while len(self._pending) >= self.max_pending:
+            self._wait_oldest()
+        self._pending.append((self._executor.submit(self._post, action, payload), on_done))
+
+    def flush(self):
+        while self._pending:
+            self._wait_oldest()
+
+
+def collapse_tasks(tasks):
+    """
+    Given IndexingTasks, returns the latest task for each identifier, so an
+    object edited many times is indexed once and a later delete wins over
+    earlier updates (and vice versa).
+    """
+    latest = {}
+    for task in tasks:
+        current = latest.get(task.identifier)
+        if current is None or task.id > current.id:
+            latest[task.identifier] = task
+    return list(latest.values())
+
+def _load_update_objects(tasks):
+    """Fetches the objects for update tasks through each model's prefetching search_get_qs()."""
+    by_model = {}
+    for task in tasks:
+        if task.content_type_id and task.object_id:
+            by_model.setdefault(task.content_type_id, []).append(task.object_id)
+    objs = []
+    for content_type_id, object_ids in by_model.items():
+        model_cls = apps.get_model(*_get_content_type_key(content_type_id))
+        if model_cls not in _search_model_registry:
+            continue
+        objs.extend(model_cls.search_get_qs().filter(pk__in=object_ids))
+    return objs
+
+def _get_content_type_key(content_type_id):
+    from django.contrib.contenttypes.models import ContentType
+    ct = ContentType.objects.get_for_id(content_type_id)
+    return ct.app_label, ct.model
+
+def consume_indexing_queue(batchsize=500, workers=4):
+    """
+    Indexes everything in the IndexingTask queue.
+
+    Tasks are collapsed to the latest one per object and processed in
+    batches. A batch's tasks are deleted only once Solr has accepted it, so
+    the queue itself is the checkpoint: after a crash, the next run resumes
+    with the batches that weren't finished. Tasks queued while this runs
+    are left for the next run.
+    """
+    max_id = IndexingTask.objects.aggregate(max_id=Max('id'))['max_id']
+    if max_id is None:
+        return
+    latest_ids = list(
+        IndexingTask.objects.filter(id__lte=max_id)
+        .values('identifier').annotate(last_id=Max('id'))
+        .order_by('last_id').values_list('last_id', flat=True)
+    )
+
+    def mark_done(identifiers):
+        return lambda: IndexingTask.objects.filter(identifier__in=identifiers, id__lte=max_id).delete()
+
+    with SolrBatchPoster(workers=workers) as poster:
+        for id_batch in itertools.batched(latest_ids, batchsize):
+            tasks = collapse_tasks(IndexingTask.objects.filter(id__in=id_batch))
+            updates = [t for t in tasks if t.action == 'update']
+            docs = [get_search_dict(o) for o in _load_update_objects(updates)
+                if o.search_should_index()]
+            poster.submit('delete', [t.identifier for t in tasks if t.action == 'delete'])
+            # Update tasks whose object is gone or shouldn't be indexed are
+            # finished along with the batch
+            poster.submit('add', docs, on_done=mark_done([t.identifier for t in tasks]))
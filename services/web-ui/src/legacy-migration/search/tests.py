@@ -0,0 +1,102 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+import pysolr
+
+from parliament.search.index import SolrBatchPoster, collapse_tasks
+
+class StubSolrHandler(BaseHTTPRequestHandler):
+    """Accepts Solr update requests, failing the first `failures` of them."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        server = self.server
+        with server.lock:
+            if server.failures > 0:
+                server.failures -= 1
+                status = 503
+            else:
+                server.requests.append((self.path, body))
+                status = 200
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps({'responseHeader': {'status': 0 if status == 200 else 1}}).encode())
+
+    def do_GET(self):
+        self.do_POST()
+
+    def log_message(self, *args):
+        pass
+
+class SolrBatchPosterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubSolrHandler)
+        self.server.lock = threading.Lock()
+        self.server.failures = 0
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = 'http://127.0.0.1:%d/solr/core' % self.server.server_port
+        self.solr_factory = lambda: pysolr.Solr(url, timeout=5)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _updates(self):
+        return [body for path, body in self.server.requests if b'commit' not in body]
+
+    def test_posts_batches_in_parallel_and_reports_in_order(self):
+        done = []
+        with SolrBatchPoster(workers=3, max_pending=2, solr_factory=self.solr_factory) as poster:
+            for i in range(6):
+                poster.submit('add', [{'id': 'doc.%d' % i}], on_done=lambda i=i: done.append(i))
+        self.assertEqual(done, list(range(6)))
+        self.assertEqual(len(self._updates()), 6)
+
+    def test_retries_failed_batches(self):
+        self.server.failures = 2
+        done = []
+        with SolrBatchPoster(workers=1, backoff=0, solr_factory=self.solr_factory) as poster:
+            poster.submit('delete', ['bills.bill.1'], on_done=lambda: done.append(True))
+        self.assertEqual(done, [True])
+        self.assertEqual(len(self._updates()), 1)
+
+    def test_gives_up_after_retries(self):
+        self.server.failures = 10
+        done = []
+        with self.assertRaises(pysolr.SolrError):
+            with SolrBatchPoster(workers=1, retries=1, backoff=0, solr_factory=self.solr_factory) as poster:
+                poster.submit('add', [{'id': 'doc.1'}], on_done=lambda: done.append(True))
+        # Not acknowledged, so its tasks stay queued for the next run
+        self.assertEqual(done, [])
+
+    def test_empty_batch_waits_for_earlier_batches(self):
+        self.server.failures = 10
+        done = []
+        with self.assertRaises(pysolr.SolrError):
+            with SolrBatchPoster(workers=1, retries=1, backoff=0, solr_factory=self.solr_factory) as poster:
+                poster.submit('delete', ['bills.bill.1'])
+                poster.submit('add', [], on_done=lambda: done.append(True))
+        # The delete never went through, so the batch isn't acknowledged
+        self.assertEqual(done, [])
+
+class CollapseTasksTests(SimpleTestCase):
+
+    def test_latest_task_per_object_wins(self):
+        tasks = [
+            SimpleNamespace(id=1, action='update', identifier='bills.bill.1'),
+            SimpleNamespace(id=2, action='update', identifier='bills.bill.1'),
+            SimpleNamespace(id=3, action='update', identifier='hansards.statement.7'),
+            SimpleNamespace(id=4, action='delete', identifier='hansards.statement.7'),
+            SimpleNamespace(id=5, action='update', identifier='bills.bill.1'),
+        ]
+        collapsed = dict((t.identifier, (t.id, t.action)) for t in collapse_tasks(tasks))
+        self.assertEqual(collapsed, {
+            'bills.bill.1': (5, 'update'),
+            'hansards.statement.7': (4, 'delete'),
+        })
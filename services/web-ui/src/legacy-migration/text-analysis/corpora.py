@@ -1,26 +1,173 @@
 import datetime
+import json
+import os
 import os.path
 import pickle as pickle
 import re
 
 from django.conf import settings
+from django.db.models import Max, Min
 
-from parliament.text_analysis.frequencymodel import FrequencyModel
+from parliament.text_analysis.frequencymodel import BackgroundModel, count_ngrams_parallel
+
+# Background models loaded in this process, keyed by (corpus_name, n).
+# Values are (file mtimes, model); a model is reloaded when its files change.
+_background_models = {}
 
 def _get_background_model_path(corpus_name, n):
     # Sanitize corpus_name, since it might be user input
     corpus_name = re.sub(r'[^a-z0-9-]', '', corpus_name) 
     return os.path.join(settings.PARLIAMENT_LANGUAGE_MODEL_PATH, '%s.%dgram' % (corpus_name, n))
 
+def _get_array_paths(corpus_name, n):
+    base = _get_background_model_path(corpus_name, n)
+    return base + '.vocab.npy', base + '.counts.npy'
+
 def load_background_model(corpus_name, n):
-    with open(_get_background_model_path(corpus_name, n), 'rb') as f:
-        return pickle.load(f)
+    """
+    Returns the background model for corpus_name, loading it at most once per
+    process. Models are memory-mapped read-only, so forked workers share the
+    same pages; models still stored as a pickle are converted on load.
+    """
+    vocab_path, counts_path = _get_array_paths(corpus_name, n)
+    try:
+        mtimes = (os.stat(vocab_path).st_mtime_ns, os.stat(counts_path).st_mtime_ns)
+    except OSError:
+        mtimes = None
+    if mtimes is None:
+        pickle_path = _get_background_model_path(corpus_name, n)
+        mtimes = (os.stat(pickle_path).st_mtime_ns,)
+    cached = _background_models.get((corpus_name, n))
+    if cached and cached[0] == mtimes:
+        return cached[1]
+
+    if len(mtimes) == 2:
+        model = BackgroundModel.load(vocab_path, counts_path)
+    else:
+        with open(pickle_path, 'rb') as f:
+            model = BackgroundModel.from_frequency_model(pickle.load(f))
+    _background_models[(corpus_name, n)] = (mtimes, model)
+    return model
+
+def preload_background_models(ngram_lengths=[1,2,3]):
+    """
+    Loads every background model on disk. Call this before forking workers
+    so they inherit the cache rather than each building their own.
+    """
+    suffix = re.compile(r'^([a-z0-9-]+)\.(\d)gram\.vocab\.npy$')
+    for filename in sorted(os.listdir(settings.PARLIAMENT_LANGUAGE_MODEL_PATH)):
+        match = suffix.match(filename)
+        if match and int(match.group(2)) in ngram_lengths:
+            load_background_model(match.group(1), int(match.group(2)))
+
+def _get_meta_path(corpus_name):
+    corpus_name = re.sub(r'[^a-z0-9-]', '', corpus_name)
+    return os.path.join(settings.PARLIAMENT_LANGUAGE_MODEL_PATH, '%s.meta.json' % corpus_name)
+
+def _save_counts(corpus_name, n, counts, total_count):
+    bg = BackgroundModel.from_counts(counts, total_count)
+    vocab_path, counts_path = _get_array_paths(corpus_name, n)
+    # Write alongside and rename, so readers never see a partial file
+    bg.save(vocab_path + '.tmp.npy', counts_path + '.tmp.npy')
+    os.replace(counts_path + '.tmp.npy', counts_path)
+    os.replace(vocab_path + '.tmp.npy', vocab_path)
+
+def save_background_model(corpus_name, n, model):
+    """Writes a FrequencyModel to disk in the memory-mappable format."""
+    _save_counts(corpus_name, n, dict((k, model.item_count(k)) for k in model), model.count)
+
+def _min_count(n):
+    return 5 if n < 3 else 3
+
+def _setup_shard_worker():
+    import django
+    django.setup()
 
-def generate_background_models(corpus_name, statements, ngram_lengths=[1,2,3]):
+def _load_statement_shard(shard):
+    from parliament.hansards.models import Statement
+    query, start_id, end_id = shard
+    qs = Statement.objects.all()
+    qs.query = query
+    field = 'content_' + settings.LANGUAGE_CODE
+    for content in qs.filter(id__gte=start_id, id__lt=end_id).values_list(field, flat=True).iterator():
+        yield Statement.html_to_text(content)
+
+def count_statement_ngrams(statements, ngram_lengths=[1,2,3], processes=None, shards_per_process=4):
+    """
+    Counts n-grams of all lengths in one pass over statements, sharding the
+    queryset by id range across a multiprocessing pool.
+    """
+    bounds = statements.aggregate(start=Min('id'), end=Max('id'))
+    if bounds['start'] is None:
+        return count_ngrams_parallel([], None, ngram_lengths, processes=1)
+    processes = processes or os.cpu_count() or 1
+    shard_count = processes * shards_per_process
+    step = max(1, (bounds['end'] + 1 - bounds['start']) // shard_count + 1)
+    shards = [(statements.query, start, start + step)
+        for start in range(bounds['start'], bounds['end'] + 1, step)]
+    # Workers are spawned rather than forked, so each opens its own database
+    # connection instead of inheriting the caller's
+    return count_ngrams_parallel(shards, _load_statement_shard, ngram_lengths, processes=processes,
+        initializer=_setup_shard_worker, start_method='spawn')
+
+def generate_background_models(corpus_name, statements, ngram_lengths=[1,2,3], processes=None):
+    built_through = statements.aggregate(latest=Max('time'))['latest']
+    ngram_counts = count_statement_ngrams(statements, ngram_lengths, processes=processes)
+    for n in ngram_lengths:
+        counts = ngram_counts.counts[n]
+        _save_counts(corpus_name, n,
+            dict((k, v) for k, v in counts.items() if v >= _min_count(n)), ngram_counts.totals[n])
+    _save_meta(corpus_name, built_through)
+
+def update_background_models(corpus_name, statements, ngram_lengths=[1,2,3], processes=None):
+    """
+    Folds statements newer than the last build of corpus_name into its
+    background models, instead of recounting the whole corpus. n-grams that
+    were below min_count at the last build were not kept, so they restart
+    from zero; rolling-window corpora (e.g. the last 365 days) still need a
+    periodic full generate_background_models to drop old statements.
+    """
+    meta = _load_meta(corpus_name)
+    if not meta.get('built_through'):
+        return generate_background_models(corpus_name, statements, ngram_lengths, processes=processes)
+    since = datetime.datetime.fromisoformat(meta['built_through'])
+    new_statements = statements.filter(time__gt=since)
+    built_through = new_statements.aggregate(latest=Max('time'))['latest']
+    if built_through is None:
+        return
+    ngram_counts = count_statement_ngrams(new_statements, ngram_lengths, processes=processes)
     for n in ngram_lengths:
-        bg = FrequencyModel.from_statement_qs(statements, ngram=n, min_count=5 if n < 3 else 3)
-        with open(_get_background_model_path(corpus_name, n), 'wb') as f:
-            pickle.dump(bg, f, pickle.HIGHEST_PROTOCOL)
+        existing = load_background_model(corpus_name, n)
+        counts = existing.item_counts()
+        for k, v in ngram_counts.counts[n].items():
+            counts[k] = counts.get(k, 0) + v
+        _save_counts(corpus_name, n,
+            dict((k, v) for k, v in counts.items() if v >= _min_count(n)),
+            existing.count + ngram_counts.totals[n])
+    _save_meta(corpus_name, built_through)
+
+def _load_meta(corpus_name):
+    try:
+        with open(_get_meta_path(corpus_name)) as f:
+            return json.load(f)
+    except IOError:
+        return {}
+
+def _save_meta(corpus_name, built_through):
+    path = _get_meta_path(corpus_name)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'built_through': built_through.isoformat() if built_through else None}, f)
+    os.replace(path + '.tmp', path)
+
+def convert_pickled_models():
+    """Rewrites any pickled background models in the memory-mappable format."""
+    pickled = re.compile(r'^([a-z0-9-]+)\.(\d)gram$')
+    for filename in sorted(os.listdir(settings.PARLIAMENT_LANGUAGE_MODEL_PATH)):
+        match = pickled.match(filename)
+        if match:
+            path = os.path.join(settings.PARLIAMENT_LANGUAGE_MODEL_PATH, filename)
+            with open(path, 'rb') as f:
+                save_background_model(match.group(1), int(match.group(2)), pickle.load(f))
 
 def generate_for_debates():
     from parliament.hansards.models import Statement
@@ -1,11 +1,15 @@
 #coding: utf-8
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import partial
 from heapq import nlargest
 import itertools
+import multiprocessing
 from operator import itemgetter
 import re
 
+import numpy as np
+
 STOPWORDS = frozenset(["i", "me", "my", "myself", "we", "our", "ours", "ourselves",
     "you", "your", "yours", "yourself", "yourselves", "he", "him", "his", "himself",
     "she", "her", "hers", "herself", "it", "its", "itself", "they", "them", "their",
@@ -54,6 +58,68 @@ def ngram_iterator(tokens, n=2):
     for words in zip(*sub_iterators):
         yield ' '.join(words)
 
+def ngrams(tokens, n):
+    """Like ngram_iterator, but over a list of tokens."""
+    if n == 1:
+        return tokens
+    return [' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+
+class NgramCounts(object):
+    """
+    Raw n-gram counts for several n-gram lengths, filled from a single pass
+    over the text. counts[n] maps each n-gram to its number of occurrences
+    and totals[n] is the number of n-grams counted, as in FrequencyModel.
+    """
+
+    def __init__(self, ngram_lengths=(1, 2, 3)):
+        self.counts = dict((n, Counter()) for n in ngram_lengths)
+        self.totals = dict((n, 0) for n in ngram_lengths)
+
+    def add_text(self, text):
+        # Each text is tokenized once; n-grams never span two texts, which
+        # matches the statement separator used by from_statement_qs
+        tokens = list(text_token_iterator(text))
+        for n, counts in self.counts.items():
+            items = [item for item in ngrams(tokens, n) if len(item) > 2]
+            counts.update(items)
+            self.totals[n] += len(items)
+
+    def merge(self, other):
+        for n, counts in other.counts.items():
+            self.counts[n].update(counts)
+            self.totals[n] += other.totals[n]
+        return self
+
+    def frequency_model(self, n, min_count=1):
+        return FrequencyModel.from_counts(self.counts[n], self.totals[n], min_count=min_count)
+
+def _count_shard(load_shard, ngram_lengths, shard):
+    result = NgramCounts(ngram_lengths)
+    for text in load_shard(shard):
+        result.add_text(text)
+    return result
+
+def count_ngrams_parallel(shards, load_shard, ngram_lengths=(1, 2, 3), processes=None,
+        initializer=None, start_method=None):
+    """
+    Counts n-grams of every length in ngram_lengths in one pass over the
+    corpus. Each item of shards is handed to load_shard in a worker process,
+    which must return an iterable of texts; per-shard counts are merged as
+    workers finish. load_shard must be a picklable (module-level) function.
+    initializer and start_method are passed on to the multiprocessing pool.
+    """
+    result = NgramCounts(ngram_lengths)
+    worker = partial(_count_shard, load_shard, ngram_lengths)
+    if processes == 1:
+        for shard in shards:
+            result.merge(worker(shard))
+        return result
+    context = multiprocessing.get_context(start_method)
+    with context.Pool(processes, initializer=initializer) as pool:
+        for shard_counts in pool.imap_unordered(worker, shards):
+            result.merge(shard_counts)
+    return result
+
 
 class FrequencyModel(dict):
     """
@@ -75,6 +141,17 @@ class FrequencyModel(dict):
             (k, v / total_count) for k, v in counts.items() if v >= min_count
         )
 
+    @classmethod
+    def from_counts(cls, counts, total_count, min_count=1):
+        model = cls([])
+        model.count = total_count
+        if total_count:
+            total_count = float(total_count)
+            model.update(
+                (k, v / total_count) for k, v in counts.items() if v >= min_count
+            )
+        return model
+
     def __missing__(self, key):
         return float()
 
@@ -87,11 +164,17 @@ class FrequencyModel(dict):
         in this model vs the other model.
         """
         r = FrequencyDiffResult()
-        for k, v in self.items():
-            if k not in STOPWORDS:
-                if min_ratio and other[k] and (v / other[k] < min_ratio):
-                    continue
-                r[k] = self[k] - other[k]
+        keys = [k for k in self if k not in STOPWORDS]
+        if hasattr(other, 'probabilities'):
+            # BackgroundModel: look every key up in one vectorized pass
+            other_values = other.probabilities(keys).tolist()
+        else:
+            other_values = [other[k] for k in keys]
+        for k, o in zip(keys, other_values):
+            v = self[k]
+            if min_ratio and o and (v / o < min_ratio):
+                continue
+            r[k] = v - o
         return r
 
     def item_count(self, key):
@@ -109,6 +192,86 @@ class FrequencyModel(dict):
             it = ngram_iterator(it, ngram)
         return cls(it, min_count=min_count)
 
+class BackgroundModel(object):
+    """
+    A read-only FrequencyModel backed by numpy arrays, so that it can be
+    memory-mapped from disk and shared between processes instead of being
+    unpickled into a dict by every worker.
+
+    vocab is a sorted array of UTF-8 encoded n-grams and counts the number
+    of occurrences of each. The first entry is the empty string, which
+    FrequencyModel never counts; its count holds the model's total item count.
+    """
+
+    # Longer n-grams are dropped from the background model, which just
+    # treats them as unseen
+    MAX_NGRAM_BYTES = 96
+
+    def __init__(self, vocab, counts):
+        if len(vocab) != len(counts) or not len(vocab) or vocab[0] != b'':
+            raise IOError("Malformed background model")
+        self.vocab = vocab
+        self.counts = counts
+        self.count = int(counts[0])
+
+    @classmethod
+    def from_counts(cls, counts, total_count):
+        items = sorted(
+            (k.encode('utf8'), c) for k, c in counts.items()
+            if len(k.encode('utf8')) <= cls.MAX_NGRAM_BYTES
+        )
+        width = max([len(k) for k, _ in items] + [1])
+        vocab = np.array([b''] + [k for k, _ in items], dtype='S%d' % width)
+        counts = np.array([total_count] + [c for _, c in items], dtype=np.int64)
+        return cls(vocab, counts)
+
+    @classmethod
+    def from_frequency_model(cls, model):
+        return cls.from_counts(dict((k, model.item_count(k)) for k in model), model.count)
+
+    def item_counts(self):
+        """Returns a dict of n-gram to count, e.g. to fold new counts into."""
+        return dict(zip(
+            (k.decode('utf8') for k in self.vocab[1:].tolist()),
+            self.counts[1:].tolist()
+        ))
+
+    def save(self, vocab_path, counts_path):
+        np.save(vocab_path, self.vocab)
+        np.save(counts_path, self.counts)
+
+    @classmethod
+    def load(cls, vocab_path, counts_path, mmap=True):
+        mode = 'r' if mmap else None
+        return cls(np.load(vocab_path, mmap_mode=mode), np.load(counts_path, mmap_mode=mode))
+
+    def probabilities(self, keys):
+        """Returns a float array with the probability of each of keys."""
+        result = np.zeros(len(keys), dtype=np.float64)
+        if not keys or not self.count:
+            return result
+        encoded = [k.encode('utf8') for k in keys]
+        fits = np.array([0 < len(k) <= self.vocab.itemsize for k in encoded], dtype=bool)
+        needles = np.array(encoded, dtype=self.vocab.dtype)
+        positions = np.searchsorted(self.vocab, needles)
+        positions[positions >= len(self.vocab)] = 0
+        found = fits & (self.vocab[positions] == needles)
+        result[found] = self.counts[positions[found]] / float(self.count)
+        return result
+
+    def __getitem__(self, key):
+        return float(self.probabilities([key])[0])
+
+    def __contains__(self, key):
+        return bool(self[key])
+
+    def __len__(self):
+        return len(self.vocab) - 1
+
+    def item_count(self, key):
+        return round(self[key] * self.count)
+
+
 class FrequencyDiffResult(dict):
 
     def __missing__(self, key):
@@ -0,0 +1,57 @@
+import os
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from parliament.text_analysis.frequencymodel import (
+    FrequencyModel, count_ngrams_parallel, ngram_iterator, text_token_iterator)
+
+VOCABULARY = ("the government carbon tax housing affordability pharmacare dental care "
+    "budget deficit infrastructure climate emissions indigenous reconciliation "
+    "veterans seniors pension employment insurance health transfer provinces "
+    "immigration refugees trade agreement supply management dairy farmers "
+    "firearms public safety rcmp foreign interference inflation interest rates").split()
+
+def _synthetic_texts(shard):
+    seed, count = shard
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(20, 120)))
+
+def _sequential_tokens(shards):
+    for shard in shards:
+        for text in _synthetic_texts(shard):
+            for token in text_token_iterator(text):
+                yield token
+            yield '/'
+
+class Command(BaseCommand):
+    help = "Times background model generation on a synthetic statement corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--statements', type=int, default=5000000)
+        parser.add_argument('--processes', type=int, default=os.cpu_count())
+        parser.add_argument('--skip-legacy', action='store_true',
+            help="Don't time the old one-pass-per-n-gram-length generation")
+
+    def handle(self, **options):
+        total = options['statements']
+        shard_size = 50000
+        shards = [(i, min(shard_size, total - start)) for i, start in enumerate(range(0, total, shard_size))]
+
+        if not options['skip_legacy']:
+            started = time.perf_counter()
+            for n in (1, 2, 3):
+                it = _sequential_tokens(shards)
+                if n > 1:
+                    it = ngram_iterator(it, n)
+                FrequencyModel(it, min_count=5 if n < 3 else 3)
+            self.stdout.write("one pass per n-gram length: %.1fs" % (time.perf_counter() - started))
+
+        started = time.perf_counter()
+        counts = count_ngrams_parallel(shards, _synthetic_texts, processes=options['processes'])
+        for n in (1, 2, 3):
+            counts.frequency_model(n, min_count=5 if n < 3 else 3)
+        self.stdout.write("single pass, %d processes: %.1fs" % (
+            options['processes'], time.perf_counter() - started))
@@ -0,0 +1,69 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from parliament.text_analysis import corpora
+from parliament.text_analysis.analyze import analyze_statements
+
+def _memory_kb():
+    """Resident memory of this process, split into file-backed (shareable) and anonymous."""
+    fields = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('VmRSS', 'RssAnon', 'RssFile'):
+                fields[key] = int(value.split()[0])
+    return fields
+
+def _timed_analysis(statements, corpus_name):
+    started = time.perf_counter()
+    analyze_statements(statements, corpus_name)
+    return (time.perf_counter() - started) * 1000
+
+class Command(BaseCommand):
+    help = "Measures cold and warm statement analysis latency and per-worker memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--corpus', default='default')
+        parser.add_argument('--statements', type=int, default=2000,
+            help='Number of recent statements to analyze')
+        parser.add_argument('--workers', type=int, default=4,
+            help='Forked workers sharing the preloaded models')
+
+    def handle(self, **options):
+        from parliament.hansards.models import Statement
+        corpus_name = options['corpus']
+        ids = list(Statement.objects.order_by('-time').values_list('id', flat=True)[:options['statements']])
+        statements = Statement.objects.filter(id__in=ids)
+
+        corpora._background_models.clear()
+        baseline = _memory_kb()
+        cold = _timed_analysis(statements, corpus_name)
+        warm = _timed_analysis(statements, corpus_name)
+        loaded = _memory_kb()
+        self.stdout.write("cold analysis: %.0f ms" % cold)
+        self.stdout.write("warm analysis: %.0f ms" % warm)
+        self.stdout.write("parent RSS: %(VmRSS)d kB (models added %(delta)d kB)" % dict(
+            loaded, delta=loaded['VmRSS'] - baseline['VmRSS']))
+
+        children = []
+        for _ in range(options['workers']):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                latency = _timed_analysis(statements, corpus_name)
+                usage = _memory_kb()
+                os.write(write_fd, ("%.0f %d %d %d" % (
+                    latency, usage['VmRSS'], usage['RssFile'], usage['RssAnon'])).encode())
+                os._exit(0)
+            os.close(write_fd)
+            children.append((pid, read_fd))
+
+        for i, (pid, read_fd) in enumerate(children):
+            with os.fdopen(read_fd) as f:
+                latency, rss, rss_file, rss_anon = f.read().split()
+            os.waitpid(pid, 0)
+            self.stdout.write("worker %d: analysis %s ms, RSS %s kB (file-backed %s kB, anonymous %s kB)" % (
+                i, latency, rss, rss_file, rss_anon))
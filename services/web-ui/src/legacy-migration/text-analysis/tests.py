@@ -0,0 +1,161 @@
+import os
+import pickle
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from parliament.text_analysis import corpora
+from parliament.text_analysis.frequencymodel import (BackgroundModel, FrequencyModel, NgramCounts,
+    count_ngrams_parallel, ngram_iterator, statements_token_iterator, text_token_iterator)
+
+BACKGROUND_TEXT = (
+    "The member for Halifax raised the pipeline again. The pipeline will cross "
+    "the province, and the province wants a say on the pipeline. Les députés "
+    "du Québec ont voté contre le projet de loi. Dental care, dental care, "
+    "dental care for seniors."
+)
+SAMPLE_TEXT = "Dental care for seniors and the pipeline through Québec."
+
+def _frequency_model(text, n):
+    tokens = text_token_iterator(text)
+    return FrequencyModel(ngram_iterator(tokens, n) if n > 1 else tokens)
+
+STATEMENTS = BACKGROUND_TEXT.split('. ')
+
+class _Statement(object):
+
+    def __init__(self, text):
+        self.text = text
+
+    def text_plain(self):
+        return self.text
+
+def _load_texts(shard):
+    return STATEMENTS[shard::2]
+
+class BackgroundModelTests(SimpleTestCase):
+    """BackgroundModel must answer exactly as the FrequencyModel it replaces."""
+
+    def setUp(self):
+        self.models = dict((n, _frequency_model(BACKGROUND_TEXT, n)) for n in (1, 2, 3))
+
+    def assertSameModel(self, background, frequency_model):
+        self.assertEqual(len(background), len(frequency_model))
+        self.assertEqual(background.count, frequency_model.count)
+        for key in list(frequency_model) + ['unseen', 'pipelines', 'x' * 200, '']:
+            self.assertEqual(background[key], frequency_model[key], key)
+            self.assertEqual(background.item_count(key), frequency_model.item_count(key), key)
+            self.assertEqual(key in background, bool(frequency_model[key]), key)
+
+    def test_probabilities_match_frequency_model(self):
+        for model in self.models.values():
+            self.assertSameModel(BackgroundModel.from_frequency_model(model), model)
+
+    def test_diff_matches_frequency_model(self):
+        for n, model in self.models.items():
+            sample = _frequency_model(SAMPLE_TEXT, n)
+            background = BackgroundModel.from_frequency_model(model)
+            for min_ratio in (None, 2):
+                self.assertEqual(sample.diff(background, min_ratio=min_ratio),
+                    sample.diff(model, min_ratio=min_ratio))
+
+    def test_item_counts_round_trip(self):
+        model = self.models[2]
+        background = BackgroundModel.from_frequency_model(model)
+        rebuilt = BackgroundModel.from_counts(background.item_counts(), background.count)
+        self.assertSameModel(rebuilt, model)
+
+    def test_long_ngrams_are_treated_as_unseen(self):
+        long_key = 'a' * (BackgroundModel.MAX_NGRAM_BYTES + 1)
+        background = BackgroundModel.from_counts({long_key: 3, 'short': 1}, 4)
+        self.assertEqual(len(background), 1)
+        self.assertEqual(background[long_key], 0.0)
+        self.assertEqual(background['short'], 0.25)
+
+    def test_empty_model(self):
+        background = BackgroundModel.from_counts({}, 0)
+        self.assertEqual(len(background), 0)
+        self.assertEqual(background['anything'], 0.0)
+        self.assertEqual(background.probabilities([]).tolist(), [])
+
+    def test_malformed_arrays_are_rejected(self):
+        background = BackgroundModel.from_counts({'word': 1}, 1)
+        with self.assertRaises(IOError):
+            BackgroundModel(background.vocab[1:], background.counts[1:])
+
+
+class BackgroundModelStorageTests(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.settings_override = override_settings(PARLIAMENT_LANGUAGE_MODEL_PATH=self.directory)
+        self.settings_override.enable()
+        corpora._background_models.clear()
+        self.model = _frequency_model(BACKGROUND_TEXT, 1)
+
+    def tearDown(self):
+        corpora._background_models.clear()
+        self.settings_override.disable()
+        shutil.rmtree(self.directory)
+
+    def test_saved_models_are_memory_mapped(self):
+        corpora.save_background_model('debates', 1, self.model)
+        loaded = corpora.load_background_model('debates', 1)
+        self.assertIsNotNone(getattr(loaded.vocab, 'filename', None))
+        self.assertSameModel(loaded)
+        self.assertIs(corpora.load_background_model('debates', 1), loaded)
+
+    def test_pickled_models_are_converted(self):
+        with open(os.path.join(self.directory, 'debates.1gram'), 'wb') as f:
+            pickle.dump(self.model, f)
+        self.assertSameModel(corpora.load_background_model('debates', 1))
+
+        corpora.convert_pickled_models()
+        corpora._background_models.clear()
+        loaded = corpora.load_background_model('debates', 1)
+        self.assertIsNotNone(getattr(loaded.vocab, 'filename', None))
+        self.assertSameModel(loaded)
+
+    def assertSameModel(self, background):
+        self.assertEqual(background.count, self.model.count)
+        self.assertEqual(dict((k, background[k]) for k in self.model), dict(self.model))
+
+
+class NgramCountsTests(SimpleTestCase):
+    """NgramCounts must build the same models as FrequencyModel.from_statement_qs."""
+
+    def _statement_model(self, n):
+        tokens = statements_token_iterator([_Statement(text) for text in STATEMENTS], statement_separator='/')
+        return FrequencyModel(ngram_iterator(tokens, n) if n > 1 else tokens)
+
+    def test_single_pass_matches_one_pass_per_length(self):
+        counts = NgramCounts()
+        for text in STATEMENTS:
+            counts.add_text(text)
+        for n in (1, 2, 3):
+            model = counts.frequency_model(n)
+            expected = self._statement_model(n)
+            self.assertEqual(model.count, expected.count)
+            self.assertEqual(dict(model), dict(expected))
+
+    def test_min_count(self):
+        counts = NgramCounts(ngram_lengths=(2,))
+        counts.add_text(BACKGROUND_TEXT)
+        model = counts.frequency_model(2, min_count=3)
+        self.assertEqual(set(model), {'the pipeline', 'dental care'})
+        self.assertEqual(model.item_count('dental care'), 3)
+
+    def test_merged_shards_match_a_single_count(self):
+        whole = NgramCounts()
+        for text in STATEMENTS:
+            whole.add_text(text)
+        for processes in (1, 2):
+            merged = count_ngrams_parallel([0, 1], _load_texts, processes=processes)
+            self.assertEqual(merged.counts, whole.counts)
+            self.assertEqual(merged.totals, whole.totals)
+
+    def test_empty_corpus(self):
+        counts = count_ngrams_parallel([], None, processes=1)
+        self.assertEqual(counts.totals, {1: 0, 2: 0, 3: 0})
+        self.assertEqual(len(counts.frequency_model(1)), 0)